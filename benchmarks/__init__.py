@@ -0,0 +1,12 @@
+"""
+성능 벤치마크 패키지
+
+이 패키지는 디스플레이 없이(offscreen Qt 플랫폼 + 합성 캡처 백엔드)
+실행할 수 있는 캡처 경로 벤치마크를 제공합니다.
+
+Modules:
+    common: 측정/통계/기준선 비교 공용 함수
+    bench_capture: grab, 변환, 인코딩, 클립보드, 저장 단계 벤치마크
+    bench_rpc: 동시 클라이언트 캡처 RPC 지연/처리량 벤치마크
+    bench_resize: 윈도우 크기 조절 드래그 재생 및 이벤트 처리 지연 벤치마크
+"""
@@ -0,0 +1,239 @@
+"""
+캡처 파이프라인 벤치마크
+
+ScreenCapture의 각 단계(grab, BGRA→RGB 변환, 파일 저장, 클립보드 복사,
+capture_and_save 전체)를 200x200부터 7680x4320까지 여러 영역 크기로 측정합니다.
+offscreen Qt 플랫폼과 합성 캡처 백엔드를 사용하므로 디스플레이 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_capture
+    python -m benchmarks.bench_capture --sizes 200x200 1920x1080 --iterations 10
+    python -m benchmarks.bench_capture --update-baseline
+
+기준선(benchmarks/baseline.json)이 있으면 p50 지연을 비교하여
+허용치를 넘는 회귀가 있을 때 종료 코드 1을 반환합니다.
+"""
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.common import (
+    BENCH_DIR, compare_to_baseline, environment, measure, save_results, setup_offscreen_qt
+)
+
+DEFAULT_SIZES: List[str] = [
+    '200x200', '640x480', '1280x720', '1920x1080', '3840x2160', '7680x4320'
+]
+STAGES: List[str] = [
+    'grab', 'convert', 'capture_region', 'save_capture',
+    'copy_to_clipboard', 'clipboard_frame', 'capture_and_save',
+]
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """
+    'WxH' 문자열을 (너비, 높이)로 변환합니다.
+
+    Args:
+        text: 예) '1920x1080'
+
+    Returns:
+        Tuple[int, int]: (너비, 높이)
+    """
+    width, height = text.lower().split('x')
+    return (int(width), int(height))
+
+
+def default_iterations(pixels: int) -> int:
+    """
+    영역 크기에 따른 기본 반복 횟수 (큰 영역일수록 적게).
+
+    Args:
+        pixels: 픽셀 수
+
+    Returns:
+        int: 반복 횟수 (3~50)
+    """
+    return max(3, min(50, int(1e8 / pixels)))
+
+
+def _require(func: Callable[[], Any], ok: Callable[[Any], bool], stage: str) -> Callable[[], Any]:
+    """
+    결과가 실패면 예외를 내는 측정 함수로 감쌉니다.
+
+    클립보드 실패 경로는 오류 로그만 남기고 바로 반환하므로
+    그대로 측정하면 실패 경로의 시간이 결과와 기준선에 섞입니다.
+
+    Args:
+        func: 측정 함수
+        ok: 결과 성공 여부 판정 함수
+        stage: 단계 이름 (오류 메시지용)
+
+    Returns:
+        Callable[[], Any]: 감싼 측정 함수
+    """
+    def call() -> Any:
+        result = func()
+        if not ok(result):
+            raise RuntimeError(f"{stage} 실패 (QApplication/클립보드 확인)")
+        return result
+    return call
+
+
+def build_cases(
+    capturer,
+    bbox: Tuple[int, int, int, int],
+    stages: List[str]
+) -> Dict[str, Callable[[], Any]]:
+    """
+    한 영역 크기에 대한 단계별 측정 함수를 만듭니다.
+
+    Args:
+        capturer: 합성 백엔드를 쓰는 ScreenCapture
+        bbox: 캡처 영역
+        stages: 측정할 단계 이름
+
+    Returns:
+        Dict[str, Callable[[], Any]]: 단계 이름 → 측정 함수
+    """
+    from core.frame import CaptureFrame
+
+    frame = capturer.grab_frame(bbox)
+    image = frame.to_pil()
+    width, height = frame.size
+
+    cases: Dict[str, Callable[[], Any]] = {
+        # 순수 픽셀 grab (합성 백엔드의 프레임 생성 비용)
+        'grab': lambda: capturer.grab_frame(bbox),
+        # BGRA → RGB 변환 (캐시를 피하려고 매번 새 프레임 객체로 감쌈)
+        'convert': lambda: CaptureFrame(frame.buffer, width, height).to_pil(),
+        'capture_region': lambda: capturer.capture_region(bbox),
+        'save_capture': lambda: capturer.save_capture(image),
+        # 기존 PIL 경로 (BGRX 패킹 + QImage memcpy)
+        'copy_to_clipboard': _require(
+            lambda: capturer.copy_to_clipboard(image), bool, 'copy_to_clipboard'
+        ),
+        # BGRA 버퍼 직결 경로 (memcpy 1회)
+        'clipboard_frame': _require(
+            lambda: capturer.set_clipboard_image(
+                CaptureFrame(frame.buffer, width, height).to_qimage()
+            ),
+            lambda mime: mime is not None,
+            'clipboard_frame'
+        ),
+        'capture_and_save': _require(
+            lambda: capturer.capture_and_save(bbox),
+            lambda result: result[0] is not None and result[1],
+            'capture_and_save'
+        ),
+    }
+    return {name: cases[name] for name in stages}
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    벤치마크를 실행하고 결과를 저장/비교합니다.
+
+    Args:
+        args: 명령행 인자
+
+    Returns:
+        int: 종료 코드 (회귀 또는 단계 실패가 있으면 1)
+    """
+    # 반환값을 버리면 QApplication이 GC로 파괴되어 클립보드 단계가 실패하므로 참조 유지
+    app = setup_offscreen_qt()
+
+    from core.backends import SyntheticBackend
+    from core.capture import ScreenCapture
+
+    results: Dict[str, Any] = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment(),
+        'cases': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='capture-bench-') as tmp:
+        for size in args.sizes:
+            width, height = parse_size(size)
+            backend = SyntheticBackend(monitors=[(0, 0, width, height)])
+            capturer = ScreenCapture(output_dir=Path(tmp), backend=backend)
+            bbox = (0, 0, width, height)
+            pixels = width * height
+            iterations = args.iterations or default_iterations(pixels)
+
+            for stage, func in build_cases(capturer, bbox, args.stages).items():
+                name = f"{stage}/{size}"
+                try:
+                    stats = measure(func, iterations, pixels=pixels)
+                except RuntimeError as e:
+                    print(f"{name:<32} {e}")
+                    capturer.close()
+                    return 1
+                results['cases'][name] = stats
+                print(
+                    f"{name:<32} p50={stats['p50_ms']:9.2f}ms "
+                    f"p95={stats['p95_ms']:9.2f}ms "
+                    f"{stats['mpix_per_sec']:8.1f}MP/s "
+                    f"peak={stats['peak_python_bytes'] / 1e6:7.1f}MB"
+                )
+            capturer.close()
+
+            # 저장 단계에서 생긴 파일 정리
+            for path in Path(tmp).glob('*.png'):
+                path.unlink()
+
+    save_results(results, args.output)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.update_baseline:
+        save_results(results, args.baseline)
+        print(f"기준선 갱신: {args.baseline}")
+        return 0
+
+    regressions = compare_to_baseline(results, args.baseline, args.tolerance)
+    if regressions is None:
+        print(f"기준선 없음: {args.baseline} (--update-baseline으로 생성)")
+        return 0
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (허용치 +{args.tolerance * 100:.0f}%):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("기준선 대비 회귀 없음")
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    명령행 진입점.
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv)
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description="캡처 파이프라인 벤치마크")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="영역 크기 (WxH)")
+    parser.add_argument('--stages', nargs='+', default=STAGES, choices=STAGES, help="측정 단계")
+    parser.add_argument('--iterations', type=int, default=0, help="반복 횟수 (0이면 크기별 자동)")
+    parser.add_argument(
+        '--output', type=Path, default=BENCH_DIR / 'results' / 'capture.json', help="결과 JSON"
+    )
+    parser.add_argument(
+        '--baseline', type=Path, default=BENCH_DIR / 'baseline.json', help="기준선 JSON"
+    )
+    parser.add_argument('--tolerance', type=float, default=0.2, help="허용 p50 증가율")
+    parser.add_argument('--update-baseline', action='store_true', help="결과를 기준선으로 저장")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    return run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
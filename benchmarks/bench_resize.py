@@ -0,0 +1,211 @@
+"""
+윈도우 크기 조절 드래그 벤치마크
+
+offscreen Qt에서 FinalCaptureWindow의 오른쪽 아래 모서리를 드래그하는 마우스
+이동 기록을 실제 시간 간격대로 재생하여 이벤트 처리 지연과
+geometry/마스크/그리기 횟수를 측정합니다.
+
+드래그 기록은 [[t_ms, dx, dy], ...] 형식의 JSON입니다
+(t_ms: 드래그 시작 후 경과 시간, dx/dy: 시작점 대비 이동량).
+기록을 주지 않으면 1000Hz 마우스로 2초간 대각선으로 끄는 기록을 생성합니다.
+
+사용법:
+    python -m benchmarks.bench_resize
+    python -m benchmarks.bench_resize --compare
+    python -m benchmarks.bench_resize --trace drag.json
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import BENCH_DIR, environment, percentile, save_results, setup_offscreen_qt
+
+Trace = List[List[float]]
+
+
+def synthetic_trace(duration_ms: float = 2000.0, rate_hz: float = 1000.0) -> Trace:
+    """
+    고속 마우스로 모서리를 끄는 드래그 기록을 생성합니다.
+
+    Args:
+        duration_ms: 드래그 시간 (밀리초)
+        rate_hz: 마우스 보고율 (Hz)
+
+    Returns:
+        Trace: [[t_ms, dx, dy], ...]
+    """
+    count = int(duration_ms * rate_hz / 1000.0)
+    trace: Trace = []
+    for i in range(1, count + 1):
+        t = i * 1000.0 / rate_hz
+        phase = t / duration_ms
+        # 가속 후 감속하는 대각선 드래그 + 약간의 흔들림
+        progress = (1.0 - math.cos(math.pi * phase)) / 2.0
+        dx = round(400 * progress + 3 * math.sin(t / 7.0))
+        dy = round(250 * progress + 3 * math.cos(t / 11.0))
+        trace.append([t, dx, dy])
+    return trace
+
+
+def replay(trace: Trace, coalesce: bool) -> Dict[str, Any]:
+    """
+    드래그 기록을 재생하고 측정 결과를 반환합니다.
+
+    Args:
+        trace: 드래그 기록
+        coalesce: 프레임 단위 geometry 묶음 사용 여부
+
+    Returns:
+        Dict[str, Any]: 이벤트 지연(ms) 통계와 geometry/마스크/그리기 횟수
+    """
+    app = setup_offscreen_qt()
+
+    from PyQt5.QtCore import QEvent, QObject, QPoint, Qt
+    from PyQt5.QtGui import QMouseEvent
+
+    from constants import CaptureConfig, WindowConfig
+
+    # 디스플레이가 없으므로 합성 백엔드 사용, 묶음 여부는 비교 대상
+    CaptureConfig.BACKEND = 'synthetic'
+    WindowConfig.COALESCE_GEOMETRY = coalesce
+
+    from ui.capture_window import FinalCaptureWindow
+
+    class PaintCounter(QObject):
+        """윈도우 Paint 이벤트 수를 셉니다."""
+
+        paints = 0
+
+        def eventFilter(self, obj, event) -> bool:
+            if event.type() == QEvent.Paint:
+                PaintCounter.paints += 1
+            return False
+
+    window = FinalCaptureWindow()
+    window.move(100, 100)
+    window.show()
+    app.processEvents()
+
+    counts = {'geometry': 0, 'mask': 0}
+    set_geometry, set_mask = window.setGeometry, window.setMask
+
+    def counted_geometry(*args: Any) -> None:
+        counts['geometry'] += 1
+        set_geometry(*args)
+
+    def counted_mask(*args: Any) -> None:
+        counts['mask'] += 1
+        set_mask(*args)
+
+    window.setGeometry = counted_geometry
+    window.setMask = counted_mask
+    counter = PaintCounter()
+    window.installEventFilter(counter)
+    PaintCounter.paints = 0
+
+    cap_h = window.height() - window.bottom_height
+    start_local = QPoint(window.width() - 2, cap_h - 2)
+    start_global = window.mapToGlobal(start_local)
+
+    def send(event_type: QEvent.Type, offset: QPoint, buttons) -> None:
+        global_pos = start_global + offset
+        event = QMouseEvent(
+            event_type, window.mapFromGlobal(global_pos), global_pos,
+            Qt.LeftButton, buttons, Qt.NoModifier
+        )
+        app.sendEvent(window, event)
+
+    send(QEvent.MouseButtonPress, QPoint(0, 0), Qt.LeftButton)
+
+    latencies: List[float] = []
+    begin = time.perf_counter()
+    for t_ms, dx, dy in trace:
+        due = begin + t_ms / 1000.0
+        while time.perf_counter() < due:
+            pass
+        start = time.perf_counter()
+        send(QEvent.MouseMove, QPoint(int(dx), int(dy)), Qt.LeftButton)
+        app.processEvents()
+        latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - begin
+
+    last = trace[-1] if trace else [0, 0, 0]
+    send(QEvent.MouseButtonRelease, QPoint(int(last[1]), int(last[2])), Qt.NoButton)
+    app.processEvents()
+    final = window.geometry()
+
+    window.removeEventFilter(counter)
+    window.close()
+    app.processEvents()
+
+    return {
+        'events': len(latencies),
+        'elapsed_s': elapsed,
+        'mean_ms': sum(latencies) / len(latencies) * 1000.0 if latencies else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000.0,
+        'p95_ms': percentile(latencies, 95) * 1000.0,
+        'p99_ms': percentile(latencies, 99) * 1000.0,
+        'max_ms': max(latencies) * 1000.0 if latencies else 0.0,
+        'geometry_updates': counts['geometry'],
+        'mask_updates': counts['mask'],
+        'paints': PaintCounter.paints,
+        'final_size': [final.width(), final.height()],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령행 진입점.
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv)
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description="윈도우 크기 조절 드래그 벤치마크")
+    parser.add_argument('--trace', type=Path, help="드래그 기록 JSON ([[t_ms, dx, dy], ...])")
+    parser.add_argument('--rate', type=float, default=1000.0, help="생성 기록의 마우스 보고율 (Hz)")
+    parser.add_argument(
+        '--compare', action='store_true', help="프레임 단위 묶음 사용/미사용 비교"
+    )
+    parser.add_argument(
+        '--output', type=Path, default=BENCH_DIR / 'results' / 'resize.json', help="결과 JSON"
+    )
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        trace = json.loads(args.trace.read_text(encoding='utf-8'))
+    else:
+        trace = synthetic_trace(rate_hz=args.rate)
+
+    modes = [True, False] if args.compare else [True]
+    cases: Dict[str, Dict[str, Any]] = {}
+    for coalesce in modes:
+        name = f"resize/{'coalesced' if coalesce else 'immediate'}"
+        stats = replay(trace, coalesce)
+        cases[name] = stats
+        print(
+            f"{name}: {stats['events']}이벤트, p50={stats['p50_ms']:.3f}ms "
+            f"p95={stats['p95_ms']:.3f}ms p99={stats['p99_ms']:.3f}ms, "
+            f"geometry {stats['geometry_updates']} / mask {stats['mask_updates']} / "
+            f"paint {stats['paints']}, 최종 {stats['final_size'][0]}x{stats['final_size'][1]}"
+        )
+
+    save_results(
+        {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'environment': environment(),
+            'cases': cases,
+        },
+        args.output
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
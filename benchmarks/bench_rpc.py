@@ -0,0 +1,158 @@
+"""
+캡처 RPC 벤치마크
+
+합성 캡처 백엔드로 CaptureRpcServer를 띄우고 여러 RpcClient가 동시에
+배치 캡처를 요청하여 프레임별 응답 지연(요청 전송 → 해당 프레임 수신)과
+전체 처리량을 측정합니다. 디스플레이 없이 실행됩니다.
+
+사용법:
+    python -m benchmarks.bench_rpc
+    python -m benchmarks.bench_rpc --clients 4 --batch 5 --format raw
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.common import BENCH_DIR, environment, percentile, save_results, setup_offscreen_qt
+
+
+def run_client(
+    address: str,
+    regions: List[List[int]],
+    fmt: str,
+    requests: int,
+    latencies: List[float],
+    errors: List[str]
+) -> None:
+    """
+    클라이언트 하나가 배치 요청을 반복하며 프레임별 지연을 기록합니다.
+
+    Args:
+        address: 서버 소켓 경로
+        regions: 배치 영역 목록
+        fmt: 응답 형식
+        requests: 요청 횟수
+        latencies: 프레임별 지연(초)을 추가할 목록
+        errors: 오류 메시지를 추가할 목록
+    """
+    from core.rpc import RpcClient
+
+    with RpcClient(address) as client:
+        for _ in range(requests):
+            sent = time.perf_counter()
+            for response in client.capture(regions, fmt=fmt):
+                if response.get('done'):
+                    break
+                if not response.get('ok'):
+                    errors.append(str(response.get('error')))
+                    continue
+                latencies.append(time.perf_counter() - sent)
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    벤치마크를 실행합니다.
+
+    Args:
+        args: 명령행 인자
+
+    Returns:
+        int: 종료 코드 (오류 응답이 있으면 1)
+    """
+    # 반환값을 버리면 QApplication이 GC로 파괴되므로 실행 내내 참조를 유지
+    app = setup_offscreen_qt()
+
+    from core.backends import SyntheticBackend
+    from core.capture import ScreenCapture
+    from core.rpc import CaptureRpcServer
+
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    regions = [[i * 16, i * 16, width, height] for i in range(args.batch)]
+
+    with tempfile.TemporaryDirectory(prefix='rpc-bench-') as tmp:
+        capturer = ScreenCapture(
+            output_dir=Path(tmp),
+            backend=SyntheticBackend(monitors=[(0, 0, 7680, 4320)])
+        )
+        address = str(Path(tmp) / 'rpc.sock')
+        server = CaptureRpcServer(
+            capturer, address=address, rate_limit=float('inf'), burst=10 ** 9
+        )
+        server.start()
+
+        latencies: List[float] = []
+        errors: List[str] = []
+        threads = [
+            threading.Thread(
+                target=run_client,
+                args=(address, regions, args.format, args.requests, latencies, errors)
+            )
+            for _ in range(args.clients)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        server.stop()
+        capturer.close()
+
+    frames = len(latencies)
+    stats: Dict[str, Any] = {
+        'frames': frames,
+        'errors': len(errors),
+        'frames_per_sec': frames / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000.0,
+        'p95_ms': percentile(latencies, 95) * 1000.0,
+        'p99_ms': percentile(latencies, 99) * 1000.0,
+    }
+    name = f"rpc/{args.format}/{args.size}/c{args.clients}xb{args.batch}"
+    print(
+        f"{name}: {frames}프레임, {stats['frames_per_sec']:.1f}fps, "
+        f"p50={stats['p50_ms']:.2f}ms p95={stats['p95_ms']:.2f}ms "
+        f"p99={stats['p99_ms']:.2f}ms, 오류 {len(errors)}건"
+    )
+
+    save_results(
+        {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'environment': environment(),
+            'cases': {name: stats},
+        },
+        args.output
+    )
+    return 1 if errors else 0
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    명령행 진입점.
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv)
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description="캡처 RPC 벤치마크")
+    parser.add_argument('--clients', type=int, default=4, help="동시 클라이언트 수")
+    parser.add_argument('--batch', type=int, default=5, help="요청당 영역 수")
+    parser.add_argument('--requests', type=int, default=20, help="클라이언트당 요청 수")
+    parser.add_argument('--size', default='640x480', help="영역 크기 (WxH)")
+    parser.add_argument(
+        '--format', default='png', choices=('png', 'jpeg', 'raw', 'file'), help="응답 형식"
+    )
+    parser.add_argument(
+        '--output', type=Path, default=BENCH_DIR / 'results' / 'rpc.json', help="결과 JSON"
+    )
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+벤치마크 공용 모듈
+
+offscreen Qt 초기화, 반복 측정, 백분위수 계산,
+결과 JSON 저장 및 기준선(baseline) 비교 기능을 제공합니다.
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR: Path = Path(__file__).resolve().parent
+REPO_ROOT: Path = BENCH_DIR.parent
+
+
+def setup_offscreen_qt():
+    """
+    offscreen 플랫폼으로 QApplication을 준비합니다.
+
+    PyQt5 import 전에 QT_QPA_PLATFORM을 설정해야 하므로
+    벤치마크 모듈은 이 함수를 가장 먼저 호출해야 합니다.
+
+    Returns:
+        QApplication: 애플리케이션 인스턴스
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from PyQt5.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([sys.argv[0]])
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """
+    선형 보간 백분위수를 계산합니다.
+
+    Args:
+        samples: 표본 (정렬 불필요)
+        q: 0~100 사이 백분위
+
+    Returns:
+        float: 백분위수 값
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * q / 100.0
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+def measure(
+    func: Callable[[], Any],
+    iterations: int,
+    warmup: int = 1,
+    pixels: int = 0
+) -> Dict[str, float]:
+    """
+    함수를 반복 실행하여 지연/처리량/최대 메모리를 측정합니다.
+
+    시간 측정과 메모리 측정(tracemalloc)은 서로 간섭하지 않도록
+    별도 실행으로 분리합니다. tracemalloc은 Python 할당만 추적하므로
+    Pillow/Qt 내부 버퍼는 포함되지 않습니다.
+
+    Args:
+        func: 측정할 함수 (인자 없음)
+        iterations: 측정 반복 횟수
+        warmup: 측정 전 워밍업 횟수
+        pixels: 1회 처리 픽셀 수 (처리량 계산용)
+
+    Returns:
+        Dict[str, float]: 지연(ms) 통계, ops/s, MP/s, peak_python_bytes
+    """
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    mean = statistics.fmean(samples)
+    return {
+        'iterations': iterations,
+        'mean_ms': mean * 1000.0,
+        'p50_ms': percentile(samples, 50) * 1000.0,
+        'p95_ms': percentile(samples, 95) * 1000.0,
+        'p99_ms': percentile(samples, 99) * 1000.0,
+        'min_ms': min(samples) * 1000.0,
+        'max_ms': max(samples) * 1000.0,
+        'ops_per_sec': 1.0 / mean if mean else 0.0,
+        'mpix_per_sec': pixels / mean / 1e6 if mean and pixels else 0.0,
+        'peak_python_bytes': peak,
+    }
+
+
+def environment() -> Dict[str, str]:
+    """
+    결과 비교에 필요한 실행 환경 정보를 수집합니다.
+
+    Returns:
+        Dict[str, str]: Python/플랫폼/주요 라이브러리 버전
+    """
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+    try:
+        import PIL
+        info['pillow'] = PIL.__version__
+    except ImportError:
+        pass
+    try:
+        from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+        info['pyqt'] = PYQT_VERSION_STR
+        info['qt'] = QT_VERSION_STR
+    except ImportError:
+        pass
+    try:
+        import mss
+        info['mss'] = mss.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    """
+    결과를 JSON으로 저장합니다.
+
+    Args:
+        results: 벤치마크 결과
+        path: 저장 경로
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline_path: Path,
+    tolerance: float,
+    metric: str = 'p50_ms'
+) -> Optional[List[str]]:
+    """
+    결과를 기준선과 비교하여 회귀 항목을 찾습니다.
+
+    Args:
+        results: 이번 결과 ({'cases': {이름: 통계}})
+        baseline_path: 기준선 JSON 경로
+        tolerance: 허용 증가율 (0.2 = 20%)
+        metric: 비교할 지표
+
+    Returns:
+        Optional[List[str]]: 회귀 설명 목록 (기준선이 없으면 None)
+    """
+    if not baseline_path.exists():
+        return None
+
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+    regressions: List[str] = []
+    for name, stats in results['cases'].items():
+        base = baseline.get('cases', {}).get(name)
+        if not base or metric not in base:
+            continue
+        before, after = base[metric], stats[metric]
+        if before > 0 and after > before * (1.0 + tolerance):
+            regressions.append(
+                f"{name}: {metric} {before:.3f} → {after:.3f} "
+                f"(+{(after / before - 1.0) * 100:.1f}%)"
+            )
+    return regressions
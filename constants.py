@@ -5,6 +5,7 @@
 매직 넘버 사용을 방지하고 유지보수성을 높이기 위해 사용됩니다.
 """
 from enum import Enum, auto
+from typing import Tuple
 
 
 class WindowConfig:
@@ -21,6 +22,7 @@ class WindowConfig:
         DEFAULT_WIDTH: 기본 윈도우 너비 (픽셀)
         DEFAULT_HEIGHT: 기본 윈도우 높이 (픽셀)
         RESIZE_DETECTION_ZONE: 리사이즈 감지 영역 크기 (픽셀)
+        COALESCE_GEOMETRY: 드래그 중 크기/위치 변경을 화면 프레임당 한 번으로 묶을지 여부
     """
 
     BORDER_WIDTH: int = 5
@@ -30,6 +32,7 @@ class WindowConfig:
     DEFAULT_WIDTH: int = 600
     DEFAULT_HEIGHT: int = 500
     RESIZE_DETECTION_ZONE: int = 10
+    COALESCE_GEOMETRY: bool = True
 
 
 class InputConfig:
@@ -89,6 +92,12 @@ class CaptureConfig:
         SAVE_TO_FILE: 파일 저장 여부
         SHOW_NOTIFICATION: 알림 표시 여부
         NOTIFICATION_DURATION: 알림 표시 시간 (밀리초)
+        WORKER_COUNT: 인코딩/저장 작업 스레드 수
+        MAX_PENDING: 대기 가능한 최대 캡처 작업 수 (초과 시 요청 거부)
+        CLIPBOARD_JPEG_QUALITY: 클립보드 JPEG 형식 요청 시 인코딩 품질
+        BACKEND: 캡처 백엔드 ('auto': 시작 시 측정 후 가장 빠른 백엔드, 'mss', 'qt', 'synthetic')
+        PROBE_DELAY_MS: 'auto' 백엔드 측정을 시작할 때까지의 지연 (밀리초, 첫 화면 표시 이후)
+        UNMASK_TIMEOUT_MS: 캡처 전 십자선이 화면에서 사라졌는지 확인하는 최대 대기 시간 (밀리초)
     """
 
     DEFAULT_MODE: CaptureMode = CaptureMode.BOTH
@@ -96,3 +105,282 @@ class CaptureConfig:
     SAVE_TO_FILE: bool = True
     SHOW_NOTIFICATION: bool = True
     NOTIFICATION_DURATION: int = 2000
+    WORKER_COUNT: int = 2
+    MAX_PENDING: int = 8
+    CLIPBOARD_JPEG_QUALITY: int = 90
+    BACKEND: str = "auto"
+    PROBE_DELAY_MS: int = 1000
+    UNMASK_TIMEOUT_MS: int = 100
+
+
+class StoreConfig:
+    """
+    내용 주소 기반 중복 제거 저장소 관련 설정 상수.
+
+    Attributes:
+        ENABLED: 중복 제거 저장 사용 여부 (같은 픽셀이면 인코딩 생략 후 하드링크)
+        DIR_NAME: 저장 폴더 안의 인덱스 디렉토리 이름
+        MANIFEST_FILE: 하드링크 불가 시 별칭을 기록할 파일명
+        STATS_FILE: 누적 통계 파일명
+    """
+
+    ENABLED: bool = False
+    DIR_NAME: str = ".capture_store"
+    MANIFEST_FILE: str = "manifest.jsonl"
+    STATS_FILE: str = "stats.json"
+
+
+class CatalogConfig:
+    """
+    SQLite 캡처 카탈로그 관련 설정 상수.
+
+    Attributes:
+        ENABLED: 저장한 캡처를 카탈로그에 기록할지 여부
+        FILE_NAME: 저장 폴더 안의 카탈로그 파일명
+        HASH_CONTENT: 중복 제거 저장소가 꺼져 있어도 내용 해시를 계산하여 기록할지 여부
+        BATCH_SIZE: 한 트랜잭션에 기록할 최대 항목 수
+        FLUSH_INTERVAL: 첫 항목 이후 묶음을 기다릴 최대 시간 (초)
+        BUSY_TIMEOUT: 다른 연결이 잠근 동안 기다릴 최대 시간 (초)
+        QUERY_LIMIT: 조회 결과 기본 최대 개수
+        PERCEPTUAL_HASH: 저장 시 축소 프레임의 지각 해시(dHash)를 계산하여 비슷한 캡처 검색에 색인할지 여부
+        SIMILAR_DISTANCE: 비슷한 캡처 검색의 기본 최대 해밍 거리 (64비트 중)
+        WORKERS: rebuild/index 디코딩 프로세스 수 (0이면 CPU 수)
+        CHUNK_SIZE: 프로세스 풀에 한 번에 넘길 최대 파일 수
+    """
+
+    ENABLED: bool = True
+    FILE_NAME: str = "captures.sqlite3"
+    HASH_CONTENT: bool = True
+    BATCH_SIZE: int = 64
+    FLUSH_INTERVAL: float = 0.5
+    BUSY_TIMEOUT: float = 5.0
+    QUERY_LIMIT: int = 200
+    PERCEPTUAL_HASH: bool = True
+    SIMILAR_DISTANCE: int = 10
+    WORKERS: int = 0
+    CHUNK_SIZE: int = 32
+
+
+class BurstConfig:
+    """
+    버스트 캡처 관련 설정 상수.
+
+    Attributes:
+        FRAME_COUNT: 한 번에 캡처할 프레임 수
+        FPS: 목표 프레임 속도
+    """
+
+    FRAME_COUNT: int = 30
+    FPS: float = 20.0
+
+
+class RegionsConfig:
+    """
+    다중 영역 캡처 관련 설정 상수.
+
+    Attributes:
+        SET_FILE: 이름 붙인 영역 목록 파일명 (저장 폴더 기준)
+    """
+
+    SET_FILE: str = "region_set.json"
+
+
+class ScrollConfig:
+    """
+    스크롤 캡처(긴 이미지 이어 붙이기) 관련 설정 상수.
+
+    Attributes:
+        INTERVAL: grab 주기 (초)
+        HASH_WINDOW: 겹침 탐색 rolling hash 기준 구간 길이 (행)
+        MIN_OVERLAP: 연속 프레임 사이 최소 겹침 (행, 더 빨리 스크롤하면 프레임 건너뜀)
+        MAX_CANDIDATES: 프레임당 확인할 최대 겹침 후보 수
+        EDGE_IGNORE: 행 비교에서 제외할 좌우 픽셀 수 (스크롤바)
+        MEMORY_LIMIT: 이어 붙인 strip을 메모리에 둘 최대 바이트 수 (초과 시 임시 파일)
+    """
+
+    INTERVAL: float = 0.1
+    HASH_WINDOW: int = 24
+    MIN_OVERLAP: int = 32
+    MAX_CANDIDATES: int = 64
+    EDGE_IGNORE: int = 24
+    MEMORY_LIMIT: int = 64 * 1024 * 1024
+
+
+class DiffConfig:
+    """
+    캡처 비교(visual diff) 관련 설정 상수.
+
+    Attributes:
+        TILE_SIZE: 해시 비교 타일 한 변 크기 (픽셀)
+        TOLERANCE: 변화로 보지 않을 채널별 최대 차이 (안티에일리어싱 잡음, 0~255)
+        MIN_TILE_PIXELS: 타일을 변화로 볼 최소 변화 픽셀 수 (미만은 잡음으로 무시)
+        OVERLAY_ALPHA: 히트맵에서 변화 픽셀을 칠할 불투명도 (0~255)
+        HIGHLIGHT_COLOR: 변화 픽셀 색 (RGB)
+        REGION_COLOR: 변화 영역 테두리 색 (RGB)
+        WORKERS: 디렉토리 비교 프로세스 수 (0이면 CPU 수)
+        CHUNK_SIZE: 프로세스 풀에 한 번에 넘길 최대 쌍 수
+        REPORT_FILE: 출력 디렉토리에 기록할 보고서 파일명
+    """
+
+    TILE_SIZE: int = 32
+    TOLERANCE: int = 16
+    MIN_TILE_PIXELS: int = 3
+    OVERLAY_ALPHA: int = 170
+    HIGHLIGHT_COLOR: Tuple[int, int, int] = (255, 40, 40)
+    REGION_COLOR: Tuple[int, int, int] = (255, 220, 0)
+    WORKERS: int = 0
+    CHUNK_SIZE: int = 16
+    REPORT_FILE: str = "diff_report.json"
+
+
+class TimelapseConfig:
+    """
+    타임랩스(주기 캡처) 관련 설정 상수.
+
+    Attributes:
+        INTERVAL: 기본 캡처 주기 (초)
+        MIN_INTERVAL: 입력 가능한 최소 주기 (초)
+        MAX_PENDING: 최대 인코딩 대기 수 (초과 시 해당 틱 저장 건너뜀)
+        SUMMARY_EVERY: 통계 파일을 갱신할 틱 간격
+        DELTA_STORAGE: True면 프레임별 PNG 대신 델타 프레임 시퀀스(.cseq)로 저장
+    """
+
+    INTERVAL: float = 60.0
+    MIN_INTERVAL: float = 0.1
+    MAX_PENDING: int = 4
+    SUMMARY_EVERY: int = 60
+    DELTA_STORAGE: bool = True
+
+
+class SequenceConfig:
+    """
+    델타 프레임 시퀀스 컨테이너(.cseq) 관련 설정 상수.
+
+    Attributes:
+        FILE_NAME: 타임랩스 디렉토리 안의 컨테이너 파일명
+        TILE_SIZE: 변화 비교/패치 단위 타일 한 변 크기 (픽셀)
+        KEYFRAME_INTERVAL: 전체 프레임(keyframe)을 기록할 간격 (프레임)
+        KEY_THRESHOLD: 바뀐 타일 비율이 이 값을 넘으면 delta 대신 keyframe 기록 (0~1)
+        ZLIB_LEVEL: 레코드 압축 수준 (0~9)
+        FSYNC: 레코드마다 디스크 동기화 여부 (전원 차단 대비, 느려짐)
+    """
+
+    FILE_NAME: str = "frames.cseq"
+    TILE_SIZE: int = 64
+    KEYFRAME_INTERVAL: int = 60
+    KEY_THRESHOLD: float = 0.5
+    ZLIB_LEVEL: int = 6
+    FSYNC: bool = False
+
+
+class WatchConfig:
+    """
+    변화 감지(watch) 캡처 관련 설정 상수.
+
+    Attributes:
+        POLL_INTERVAL: 기본 폴링 주기 (초)
+        GRID_COLS: 가로 타일 수
+        GRID_ROWS: 세로 타일 수
+        PIXEL_TOLERANCE: 변화 픽셀로 보지 않을 채널별 최대 차이 (0~255, 안티에일리어싱 잡음)
+        MIN_TILE_PIXELS: 타일을 변화로 볼 최소 변화 픽셀 수 (미만은 잡음으로 무시)
+        AREA_THRESHOLD: 저장을 트리거할 최소 변화 타일 비율 (0~1, 0이면 변화 타일 1개로 충분)
+        SAMPLE_ROWS: 변화 타일을 좁히는 표본 해시에 쓸 타일당 행 수
+            (폴링의 Python 수준 비용은 GRID_COLS x GRID_ROWS x SAMPLE_ROWS에 비례)
+    """
+
+    POLL_INTERVAL: float = 1.0
+    GRID_COLS: int = 16
+    GRID_ROWS: int = 16
+    PIXEL_TOLERANCE: float = 8.0
+    MIN_TILE_PIXELS: int = 4
+    AREA_THRESHOLD: float = 0.0
+    SAMPLE_ROWS: int = 4
+
+
+class TelemetryConfig:
+    """
+    캡처 단계 계측(telemetry) 관련 설정 상수.
+
+    Attributes:
+        ENABLED: 시작 시 계측 활성 여부 (HUD를 켜면 자동 활성)
+        CAPACITY: 메모리 링 버퍼에 보관할 최대 단계 기록 수
+        ROLLING_WINDOW: HUD p50/p95 계산에 사용할 최근 캡처 수
+    """
+
+    ENABLED: bool = False
+    CAPACITY: int = 4096
+    ROLLING_WINDOW: int = 100
+
+
+class InstanceConfig:
+    """
+    단일 인스턴스(명령 전달) 관련 설정 상수.
+
+    Attributes:
+        SERVER_NAME: 로컬 소켓 이름 접두사 (사용자 이름이 붙음)
+        CONNECT_TIMEOUT: 실행 중인 인스턴스 연결 제한 시간 (초)
+        MAX_MESSAGE_BYTES: 명령 메시지 최대 크기 (바이트)
+    """
+
+    SERVER_NAME: str = "screen-capture"
+    CONNECT_TIMEOUT: float = 0.2
+    MAX_MESSAGE_BYTES: int = 65536
+
+
+class RpcConfig:
+    """
+    로컬 캡처 RPC 서버 관련 설정 상수.
+
+    Attributes:
+        ENABLED: 시작 시 RPC 서버 실행 여부 (main.py --rpc로도 활성화)
+        SOCKET_NAME: Unix 소켓 파일 이름 접두사 (사용자 이름이 붙음)
+        TCP_PORT: Unix 소켓이 없는 플랫폼에서 사용할 127.0.0.1 포트
+        RATE_LIMIT: 클라이언트별 초당 허용 프레임 수
+        BURST: 클라이언트별 순간 최대 프레임 수
+        MAX_REGIONS: 요청 하나의 최대 영역 수
+        MAX_LINE_BYTES: 요청 한 줄의 최대 크기 (바이트)
+    """
+
+    ENABLED: bool = False
+    SOCKET_NAME: str = "screen-capture-rpc"
+    TCP_PORT: int = 47821
+    RATE_LIMIT: float = 60.0
+    BURST: int = 120
+    MAX_REGIONS: int = 64
+    MAX_LINE_BYTES: int = 65536
+
+
+class SharedRingConfig:
+    """
+    공유 메모리 프레임 링(게시 모드) 관련 설정 상수.
+
+    Attributes:
+        NAME: 공유 메모리 이름 (소비자가 연결할 때 사용)
+        SLOTS: 링 슬롯 수 (소비자가 프레임을 처리할 수 있는 시간 = (SLOTS - 1) / FPS)
+        FPS: 게시 주기 (초당 프레임)
+        MAX_SLOT_BYTES: 슬롯 하나의 최대 크기 (바이트, 이보다 큰 영역은 게시하지 않음)
+    """
+
+    NAME: str = "screen-capture-frames"
+    SLOTS: int = 4
+    FPS: float = 30.0
+    MAX_SLOT_BYTES: int = 64 * 1024 * 1024
+
+
+class PreviewConfig:
+    """
+    실시간 미리보기(MJPEG/HTTP) 관련 설정 상수.
+
+    Attributes:
+        PORT: localhost HTTP 포트
+        MAX_FPS: 최대 프레임 주기
+        MIN_FPS: 최소 프레임 주기 (인코딩/전송이 느려도 이 이상은 늦추지 않음)
+        JPEG_QUALITY: 스트림 JPEG 품질 (1~95)
+        CLIENT_TIMEOUT: 클라이언트 전송/대기 제한 시간 (초)
+    """
+
+    PORT: int = 47822
+    MAX_FPS: float = 15.0
+    MIN_FPS: float = 1.0
+    JPEG_QUALITY: int = 70
+    CLIENT_TIMEOUT: float = 5.0
@@ -2,11 +2,43 @@
 Core 비즈니스 로직 패키지
 
 이 패키지는 UI와 분리된 핵심 비즈니스 로직을 제공합니다.
+공개 클래스는 처음 접근할 때 해당 모듈을 import하므로 (PEP 562),
+`import core`만으로는 PyQt5/PIL/mss가 로드되지 않습니다.
 
 Modules:
+    backends: 캡처 백엔드 (MSS, Qt QScreen, 합성)
     capture: 스크린 캡처 기능
+    frame: 제로 카피 BGRA 캡처 프레임
+    pipeline: 비동기 캡처 처리 파이프라인
+    telemetry: 캡처 단계 계측
 """
+import importlib
+from typing import Any, Dict, List
 
-from core.capture import ScreenCapture
+# 공개 이름 → 정의 모듈
+_EXPORTS: Dict[str, str] = {
+    'ScreenCapture': 'core.capture',
+    'CaptureFrame': 'core.frame',
+    'CaptureBackend': 'core.backends',
+    'MssBackend': 'core.backends',
+    'QtScreenBackend': 'core.backends',
+    'SyntheticBackend': 'core.backends',
+    'CapturePipeline': 'core.pipeline',
+    'CaptureResult': 'core.pipeline',
+}
 
-__all__ = ['ScreenCapture']
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """공개 클래스를 처음 접근할 때 import합니다."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'core' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
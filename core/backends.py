@@ -0,0 +1,581 @@
+"""
+캡처 백엔드 모듈
+
+이 모듈은 bbox를 받아 BGRA 프레임을 반환하는 캡처 백엔드 인터페이스와
+MSS, Qt QScreen, 합성(synthetic) 백엔드 구현을 제공합니다.
+probe_backends()로 사용 가능한 백엔드의 grab 시간을 측정하여
+현재 디스플레이에서 가장 빠른 백엔드를 고를 수 있습니다.
+"""
+import logging
+import statistics
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple, Type
+
+from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+
+class CaptureBackend(ABC):
+    """
+    캡처 백엔드 인터페이스.
+
+    Attributes:
+        name: 백엔드 이름 (설정/로그용)
+        gui_thread_only: GUI 스레드에서만 grab할 수 있는지 여부
+        synthetic: 실제 화면이 아닌 생성 프레임을 반환하는지 여부
+    """
+
+    name: str = ""
+    gui_thread_only: bool = False
+    synthetic: bool = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        현재 환경에서 사용 가능한지 확인합니다.
+
+        Returns:
+            bool: 사용 가능 여부
+        """
+        return True
+
+    @abstractmethod
+    def grab(self, bbox: BBox) -> CaptureFrame:
+        """
+        영역의 BGRA 프레임을 반환합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            CaptureFrame: BGRA 프레임
+
+        Raises:
+            Exception: grab 실패 시
+        """
+
+    def grab_into(self, bbox: BBox, out: memoryview) -> float:
+        """
+        영역의 BGRA 픽셀을 미리 할당된 버퍼에 씁니다 (행 사이 여백 없음).
+
+        기본 구현은 grab()한 프레임을 out에 복사하므로 grab마다 백엔드 버퍼 할당과
+        복사가 한 번씩 일어납니다. 버퍼에 직접 쓸 수 있는 백엔드는 재정의합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            out: 쓰기 가능한 버퍼 (너비 * 높이 * 4 바이트)
+
+        Returns:
+            float: 캡처 시각 (epoch 초)
+
+        Raises:
+            ValueError: out 크기가 bbox와 맞지 않는 경우
+            Exception: grab 실패 시
+        """
+        frame = self.grab(bbox)
+        if frame.nbytes != len(out):
+            raise ValueError(f"버퍼 크기가 프레임과 다릅니다: {len(out)} != {frame.nbytes}")
+        if frame.is_contiguous:
+            out[:] = frame.buffer
+        else:
+            row_bytes = frame.width * CaptureFrame.BYTES_PER_PIXEL
+            for y in range(frame.height):
+                out[y * row_bytes:(y + 1) * row_bytes] = frame.row(y)
+        return frame.timestamp
+
+    @abstractmethod
+    def monitors(self) -> List[BBox]:
+        """
+        모니터별 영역 목록을 반환합니다.
+
+        Returns:
+            List[BBox]: 모니터 영역 (left, top, right, bottom)
+        """
+
+    def virtual_bounds(self) -> BBox:
+        """
+        전체 모니터를 감싸는 가상 화면 영역을 반환합니다.
+
+        Returns:
+            BBox: (left, top, right, bottom)
+        """
+        monitors = self.monitors()
+        return (
+            min(m[0] for m in monitors),
+            min(m[1] for m in monitors),
+            max(m[2] for m in monitors),
+            max(m[3] for m in monitors),
+        )
+
+    def invalidate(self) -> None:
+        """모니터 레이아웃 변경을 알립니다."""
+
+    def release_thread(self) -> None:
+        """현재 스레드가 가진 자원을 반환합니다."""
+
+    def close(self) -> None:
+        """모든 자원을 반환합니다."""
+
+
+# =============================================================================
+# MSS 백엔드
+# =============================================================================
+
+
+class _GrabSession:
+    """
+    스레드 전용 MSS 세션.
+
+    MSS 핸들은 스레드 간에 공유할 수 없으므로 스레드마다 하나씩 생성되며,
+    생성 시점의 모니터 레이아웃 세대(generation)를 기억합니다.
+
+    Attributes:
+        sct: MSS 인스턴스
+        generation: 세션 생성 시점의 레이아웃 세대
+        thread_id: 세션을 소유한 스레드 ID
+    """
+
+    def __init__(self, generation: int) -> None:
+        """
+        _GrabSession 인스턴스를 초기화합니다.
+
+        Args:
+            generation: 현재 모니터 레이아웃 세대
+        """
+        import mss
+
+        self.sct = mss.mss()
+        self.generation: int = generation
+        self.thread_id: int = threading.get_ident()
+        self.closed: bool = False
+
+        # 가상 화면 전체 영역 (monitors[0]은 MSS 내부에 캐시됨)
+        self.monitors: List[BBox] = [
+            (m['left'], m['top'], m['left'] + m['width'], m['top'] + m['height'])
+            for m in self.sct.monitors
+        ]
+        self._virtual: BBox = self.monitors[0]
+
+    def contains(self, bbox: BBox) -> bool:
+        """
+        영역이 세션 생성 시점의 가상 화면 안에 있는지 확인합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            bool: 가상 화면 안에 포함되면 True
+        """
+        left, top, right, bottom = bbox
+        v_left, v_top, v_right, v_bottom = self._virtual
+        return (
+            left >= v_left and top >= v_top
+            and right <= v_right and bottom <= v_bottom
+        )
+
+    def close(self) -> None:
+        """MSS 핸들을 닫습니다."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.sct.close()
+        except Exception as e:
+            logger.warning(f"MSS 세션 종료 실패: {e}")
+
+
+class MssBackend(CaptureBackend):
+    """
+    MSS 기반 캡처 백엔드.
+
+    MSS 세션은 스레드마다 한 번만 열어 재사용하며, 모니터 레이아웃이
+    바뀌면 무효화 후 다시 생성합니다. 음수 좌표의 멀티 모니터도 지원합니다.
+    MSS는 grab마다 새 버퍼를 만들므로 grab_into는 기본 구현(할당 후 복사)을 사용합니다.
+    """
+
+    name: str = "mss"
+
+    def __init__(self) -> None:
+        """MssBackend 인스턴스를 초기화합니다."""
+        self._local = threading.local()
+        self._sessions: List[_GrabSession] = []
+        self._sessions_lock = threading.Lock()
+        self._layout_generation: int = 0
+        self._closed: bool = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """mss 모듈 설치 여부를 반환합니다."""
+        try:
+            import mss  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _get_session(self) -> _GrabSession:
+        """
+        현재 스레드의 MSS 세션을 반환합니다.
+
+        세션이 없거나 모니터 레이아웃이 바뀐 경우 새로 생성합니다.
+
+        Returns:
+            _GrabSession: 현재 스레드 전용 세션
+
+        Raises:
+            RuntimeError: 이미 close()된 백엔드인 경우
+        """
+        if self._closed:
+            raise RuntimeError("MssBackend가 이미 종료되었습니다")
+
+        session: Optional[_GrabSession] = getattr(self._local, 'session', None)
+        if session is not None and (
+            session.closed or session.generation != self._layout_generation
+        ):
+            self._discard_session(session)
+            session = None
+
+        if session is None:
+            session = _GrabSession(self._layout_generation)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+            logger.debug(
+                f"MSS 세션 생성: thread={session.thread_id}, "
+                f"generation={session.generation}"
+            )
+        return session
+
+    def _discard_session(self, session: _GrabSession) -> None:
+        """
+        세션을 닫고 레지스트리에서 제거합니다.
+
+        Args:
+            session: 제거할 세션
+        """
+        session.close()
+        with self._sessions_lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        if getattr(self._local, 'session', None) is session:
+            self._local.session = None
+
+    def grab(self, bbox: BBox) -> CaptureFrame:
+        """
+        현재 스레드의 세션으로 픽셀을 가져옵니다.
+
+        영역이 캐시된 가상 화면을 벗어나거나 grab이 실패하면
+        레이아웃이 바뀐 것으로 보고 세션을 한 번 재생성한 뒤 재시도합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            CaptureFrame: MSS 버퍼를 복사 없이 감싼 프레임
+        """
+        left, top, right, bottom = bbox
+        region = {
+            'left': left,
+            'top': top,
+            'width': right - left,
+            'height': bottom - top
+        }
+        timestamp = time.time()
+
+        session = self._get_session()
+        screenshot = None
+        if session.contains(bbox):
+            try:
+                screenshot = session.sct.grab(region)
+            except Exception as e:
+                logger.warning(f"grab 실패, 세션 재생성 후 재시도: {e}")
+
+        if screenshot is None:
+            self._discard_session(session)
+            screenshot = self._get_session().sct.grab(region)
+
+        width, height = screenshot.size
+        return CaptureFrame(screenshot.raw, width, height, timestamp=timestamp, bbox=bbox)
+
+    def monitors(self) -> List[BBox]:
+        """MSS가 보고한 모니터 영역 목록 (가상 화면 제외)."""
+        return list(self._get_session().monitors[1:])
+
+    def invalidate(self) -> None:
+        """모든 스레드의 세션이 다음 grab 시점에 다시 생성되도록 합니다."""
+        with self._sessions_lock:
+            self._layout_generation += 1
+        logger.info(f"모니터 레이아웃 변경: generation={self._layout_generation}")
+
+    def release_thread(self) -> None:
+        """현재 스레드의 세션을 닫습니다."""
+        session: Optional[_GrabSession] = getattr(self._local, 'session', None)
+        if session is not None:
+            self._discard_session(session)
+
+    def close(self) -> None:
+        """모든 스레드의 MSS 세션을 닫습니다."""
+        self._closed = True
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+        logger.debug(f"MSS 세션 {len(sessions)}개 종료")
+
+
+# =============================================================================
+# Qt QScreen 백엔드
+# =============================================================================
+
+
+class QtScreenBackend(CaptureBackend):
+    """
+    Qt QScreen.grabWindow(0, ...) 기반 캡처 백엔드.
+
+    Qt 화면 캡처는 GUI 스레드에서만 호출할 수 있으며,
+    bbox가 한 모니터 안에 있어야 합니다 (여러 모니터에 걸치면 실패).
+    """
+
+    name: str = "qt"
+    gui_thread_only: bool = True
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """QGuiApplication 인스턴스 존재 여부를 반환합니다."""
+        try:
+            from PyQt5.QtGui import QGuiApplication
+        except ImportError:
+            return False
+        return QGuiApplication.instance() is not None
+
+    def grab(self, bbox: BBox) -> CaptureFrame:
+        """
+        bbox를 포함하는 QScreen에서 영역을 가져옵니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            CaptureFrame: RGB32 이미지 버퍼를 감싼 프레임
+
+        Raises:
+            RuntimeError: bbox를 포함하는 모니터가 없는 경우
+        """
+        from PyQt5.QtCore import QRect
+        from PyQt5.QtGui import QGuiApplication, QImage
+
+        left, top, right, bottom = bbox
+        width, height = right - left, bottom - top
+        target = QRect(left, top, width, height)
+        timestamp = time.time()
+
+        for screen in QGuiApplication.screens():
+            geometry = screen.geometry()
+            if geometry.contains(target):
+                pixmap = screen.grabWindow(
+                    0,
+                    left - geometry.x(),
+                    top - geometry.y(),
+                    width,
+                    height
+                )
+                image = pixmap.toImage().convertToFormat(QImage.Format_RGB32)
+                data = image.constBits().asstring(image.sizeInBytes())
+                return CaptureFrame(
+                    data,
+                    image.width(),
+                    image.height(),
+                    stride=image.bytesPerLine(),
+                    timestamp=timestamp,
+                    bbox=bbox
+                )
+        raise RuntimeError(f"bbox를 포함하는 모니터가 없습니다: {bbox}")
+
+    def monitors(self) -> List[BBox]:
+        """QScreen geometry 목록."""
+        from PyQt5.QtGui import QGuiApplication
+
+        result: List[BBox] = []
+        for screen in QGuiApplication.screens():
+            g = screen.geometry()
+            result.append((g.x(), g.y(), g.x() + g.width(), g.y() + g.height()))
+        return result
+
+
+# =============================================================================
+# 합성 백엔드 (헤드리스 테스트/벤치마크용)
+# =============================================================================
+
+
+class SyntheticBackend(CaptureBackend):
+    """
+    메모리에서 결정적인 프레임을 생성하는 백엔드.
+
+    같은 bbox와 같은 프레임 번호에 대해 항상 같은 픽셀을 반환하며,
+    grab마다 프레임 번호가 증가하여 패턴이 한 픽셀씩 이동합니다.
+    디스플레이 없이 캡처 경로를 실행할 때 사용합니다.
+
+    Example:
+        >>> backend = SyntheticBackend(monitors=[(0, 0, 1920, 1080)])
+        >>> capturer = ScreenCapture(backend=backend)
+    """
+
+    name: str = "synthetic"
+    synthetic: bool = True
+
+    _PATTERN_PIXELS: int = 256
+
+    def __init__(
+        self,
+        monitors: Optional[List[BBox]] = None,
+        animate: bool = True
+    ) -> None:
+        """
+        SyntheticBackend 인스턴스를 초기화합니다.
+
+        Args:
+            monitors: 가상 모니터 영역 목록 (None이면 7680x4320 한 개)
+            animate: grab마다 패턴을 이동할지 여부
+        """
+        self._monitors: List[BBox] = monitors or [(0, 0, 7680, 4320)]
+        self._animate: bool = animate
+        self._counter: int = 0
+        self._lock = threading.Lock()
+
+        # 256픽셀 주기의 BGRA 그라디언트 (행 생성 시 슬라이스로 재사용)
+        self._pattern: bytes = b''.join(
+            bytes((i, (i * 3) & 0xFF, 255 - i, 255)) for i in range(self._PATTERN_PIXELS)
+        )
+
+    def grab(self, bbox: BBox) -> CaptureFrame:
+        """
+        bbox 좌표와 프레임 번호로 결정되는 BGRA 프레임을 생성합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            CaptureFrame: 생성된 프레임
+        """
+        left, top, right, bottom = bbox
+        width, height = right - left, bottom - top
+        if width <= 0 or height <= 0:
+            raise ValueError(f"잘못된 bbox: {bbox}")
+
+        data = bytearray(width * height * 4)
+        timestamp = self.grab_into(bbox, memoryview(data))
+        return CaptureFrame(data, width, height, timestamp=timestamp, bbox=bbox)
+
+    def grab_into(self, bbox: BBox, out: memoryview) -> float:
+        """
+        패턴 행을 out에 직접 씁니다 (중간 프레임 버퍼 없음).
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            out: 쓰기 가능한 버퍼 (너비 * 높이 * 4 바이트)
+
+        Returns:
+            float: 생성 시각 (epoch 초)
+
+        Raises:
+            ValueError: bbox가 비었거나 out 크기가 맞지 않는 경우
+        """
+        left, top, right, bottom = bbox
+        width, height = right - left, bottom - top
+        if width <= 0 or height <= 0:
+            raise ValueError(f"잘못된 bbox: {bbox}")
+        row_bytes = width * 4
+        if len(out) != row_bytes * height:
+            raise ValueError(f"버퍼 크기가 프레임과 다릅니다: {len(out)} != {row_bytes * height}")
+
+        timestamp = time.time()
+        with self._lock:
+            seed = self._counter
+            if self._animate:
+                self._counter += 1
+
+        period = self._PATTERN_PIXELS
+        repeats = (width + 2 * period) // period + 1
+        line = memoryview(self._pattern * repeats)
+        offset = 0
+        for y in range(top, bottom):
+            start = ((left + y + seed) % period) * 4
+            out[offset:offset + row_bytes] = line[start:start + row_bytes]
+            offset += row_bytes
+        return timestamp
+
+    def monitors(self) -> List[BBox]:
+        """설정된 가상 모니터 목록."""
+        return list(self._monitors)
+
+
+BACKENDS: Dict[str, Type[CaptureBackend]] = {
+    MssBackend.name: MssBackend,
+    QtScreenBackend.name: QtScreenBackend,
+    SyntheticBackend.name: SyntheticBackend,
+}
+
+
+def create_backend(name: str) -> CaptureBackend:
+    """
+    이름으로 백엔드를 생성합니다.
+
+    Args:
+        name: 'mss', 'qt', 'synthetic'
+
+    Returns:
+        CaptureBackend: 생성된 백엔드
+
+    Raises:
+        ValueError: 알 수 없는 이름이거나 사용할 수 없는 경우
+    """
+    backend_cls = BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(f"알 수 없는 캡처 백엔드: {name}")
+    if not backend_cls.is_available():
+        raise ValueError(f"사용할 수 없는 캡처 백엔드: {name}")
+    return backend_cls()
+
+
+def probe_backends(
+    backends: List[CaptureBackend],
+    bbox: Optional[BBox] = None,
+    rounds: int = 5
+) -> Dict[str, float]:
+    """
+    각 백엔드의 grab 시간 중앙값을 측정합니다.
+
+    첫 grab은 세션 생성 비용을 제외하기 위해 워밍업으로 버립니다.
+    GUI 스레드 전용 백엔드는 호출 스레드가 GUI 스레드일 때만 측정해야 합니다.
+
+    Args:
+        backends: 측정할 백엔드 목록
+        bbox: 측정 영역 (None이면 첫 모니터 전체)
+        rounds: 측정 횟수
+
+    Returns:
+        Dict[str, float]: 백엔드 이름 → grab 시간 중앙값 (초), 실패한 백엔드는 제외
+    """
+    timings: Dict[str, float] = {}
+    for backend in backends:
+        try:
+            target = bbox or backend.monitors()[0]
+            backend.grab(target)
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                backend.grab(target)
+                samples.append(time.perf_counter() - start)
+            timings[backend.name] = statistics.median(samples)
+        except Exception as e:
+            logger.warning(f"백엔드 측정 실패 ({backend.name}): {e}")
+    logger.info(
+        "캡처 백엔드 측정: "
+        + ", ".join(f"{name}={t * 1000:.2f}ms" for name, t in timings.items())
+    )
+    return timings
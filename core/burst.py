@@ -0,0 +1,336 @@
+"""
+버스트 캡처 모듈
+
+이 모듈은 한 영역을 고정 주기로 N번 grab하여 미리 할당된 링 버퍼에 담고,
+인코딩은 캡처 루프가 끝난 뒤 작업 스레드 풀에서 수행하는 버스트 모드를 제공합니다.
+
+링 슬롯은 워밍업 때 한 번에 할당하며, 캡처 루프는 grab_into로 슬롯에 직접 씁니다.
+합성 백엔드는 슬롯에 바로 쓰므로 프레임 버퍼를 할당하지 않지만,
+MSS는 grab마다 자체 버퍼를 만들므로 프레임마다 백엔드 할당 1회와 슬롯 복사 1회가 남습니다
+(Qt 백엔드는 GUI 스레드 전용이라 버스트 스레드에서는 MSS로 대체됨).
+"""
+import datetime
+import json
+import logging
+import time
+from array import array
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from core.frame import CaptureFrame
+
+if TYPE_CHECKING:
+    from core.catalog import CaptureCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class FrameRing:
+    """
+    고정 크기 BGRA 프레임 링 버퍼.
+
+    모든 슬롯과 타임스탬프 배열을 생성 시점에 할당하며,
+    store()는 기존 슬롯에 memcpy만 수행합니다. 용량을 넘으면 가장 오래된 슬롯을 덮어씁니다.
+    slot()으로 슬롯에 직접 쓴 뒤 commit()으로 기록할 수도 있습니다.
+
+    Attributes:
+        capacity: 슬롯 수
+        width: 프레임 너비 (픽셀)
+        height: 프레임 높이 (픽셀)
+    """
+
+    def __init__(self, capacity: int, width: int, height: int) -> None:
+        """
+        FrameRing 인스턴스를 초기화합니다.
+
+        Args:
+            capacity: 슬롯 수
+            width: 프레임 너비 (픽셀)
+            height: 프레임 높이 (픽셀)
+        """
+        self.capacity: int = capacity
+        self.width: int = width
+        self.height: int = height
+        self.frame_bytes: int = width * height * CaptureFrame.BYTES_PER_PIXEL
+
+        self._slots: List[bytearray] = [bytearray(self.frame_bytes) for _ in range(capacity)]
+        self._views: List[memoryview] = [memoryview(slot) for slot in self._slots]
+        self._timestamps = array('d', [0.0] * capacity)
+        self._sequence = array('q', [-1] * capacity)
+
+    def store(self, sequence: int, data: memoryview, timestamp: float) -> bool:
+        """
+        프레임을 다음 슬롯에 복사합니다.
+
+        Args:
+            sequence: 프레임 순번 (슬롯 위치는 sequence % capacity)
+            data: BGRA 바이트 (frame_bytes 길이)
+            timestamp: 캡처 시각 (epoch 초)
+
+        Returns:
+            bool: 크기가 맞아 저장되었으면 True
+        """
+        if len(data) != self.frame_bytes:
+            return False
+        self._views[sequence % self.capacity][:] = data
+        self.commit(sequence, timestamp)
+        return True
+
+    def slot(self, sequence: int) -> memoryview:
+        """
+        순번이 쓰일 슬롯 버퍼를 반환하고, 다시 쓰는 동안 이전 프레임을 무효로 표시합니다.
+
+        Args:
+            sequence: 프레임 순번
+
+        Returns:
+            memoryview: 쓰기 가능한 슬롯 (frame_bytes 길이)
+        """
+        index = sequence % self.capacity
+        self._sequence[index] = -1
+        return self._views[index]
+
+    def commit(self, sequence: int, timestamp: float) -> None:
+        """
+        slot()에 다 쓴 프레임을 기록합니다.
+
+        Args:
+            sequence: 프레임 순번
+            timestamp: 캡처 시각 (epoch 초)
+        """
+        index = sequence % self.capacity
+        self._timestamps[index] = timestamp
+        self._sequence[index] = sequence
+
+    def frames(self) -> List[Tuple[int, CaptureFrame]]:
+        """
+        저장된 프레임을 순번 순서로 반환합니다 (슬롯 버퍼를 복사 없이 감쌈).
+
+        Returns:
+            List[Tuple[int, CaptureFrame]]: (순번, 프레임) 목록
+        """
+        stored = [
+            (self._sequence[i], i) for i in range(self.capacity)
+            if self._sequence[i] >= 0
+        ]
+        stored.sort()
+        return [
+            (seq, CaptureFrame(
+                self._slots[i], self.width, self.height,
+                timestamp=self._timestamps[i]
+            ))
+            for seq, i in stored
+        ]
+
+
+@dataclass
+class BurstResult:
+    """
+    버스트 캡처 결과.
+
+    Attributes:
+        bbox: 캡처 영역 (left, top, right, bottom)
+        requested: 요청한 프레임 수
+        fps: 목표 프레임 속도
+        ring: 캡처된 프레임이 담긴 링 버퍼
+        dropped: 주기를 놓쳐 건너뛴 프레임 순번
+        overwritten: 링 용량 초과로 덮어쓴 프레임 수
+        started_at: 루프 시작 시각 (epoch 초)
+        elapsed: 루프 소요 시간 (초)
+        files: 인코딩 후 저장된 파일 경로
+    """
+
+    bbox: Tuple[int, int, int, int]
+    requested: int
+    fps: float
+    ring: Optional[FrameRing] = None
+    dropped: List[int] = field(default_factory=list)
+    overwritten: int = 0
+    started_at: float = 0.0
+    elapsed: float = 0.0
+    files: List[Path] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def captured(self) -> int:
+        """실제로 grab한 프레임 수 (워밍업 실패 시 0)."""
+        if self.ring is None or self.error is not None:
+            return 0
+        return self.requested - len(self.dropped)
+
+    def timestamps(self) -> List[float]:
+        """링에 남아 있는 프레임의 실제 캡처 시각 (epoch 초)."""
+        if self.ring is None:
+            return []
+        return [frame.timestamp for _, frame in self.ring.frames()]
+
+
+class BurstRecorder:
+    """
+    고정 주기 버스트 캡처 루프.
+
+    목표 시각(start + i / fps)에 맞춰 grab하며, grab이 늦어져
+    다음 목표 시각을 넘기면 해당 프레임을 밀린 채 캡처하지 않고 dropped로 기록합니다.
+    grab_into가 주어지면 루프에서는 링 슬롯에 직접 쓰고, 없으면 grab한 프레임을 슬롯에 복사합니다.
+
+    Example:
+        >>> recorder = BurstRecorder(capturer.grab_frame, capturer.grab_into)
+        >>> result = recorder.record((0, 0, 800, 600), count=30, fps=20)
+        >>> print(result.captured, result.dropped)
+    """
+
+    # 목표 시각 직전까지는 sleep, 이후는 짧게 대기하여 타이머 해상도 오차를 줄임
+    SPIN_THRESHOLD: float = 0.002
+
+    def __init__(
+        self,
+        grab: Callable[[Tuple[int, int, int, int]], Optional[CaptureFrame]],
+        grab_into: Optional[
+            Callable[[Tuple[int, int, int, int], memoryview], Optional[float]]
+        ] = None
+    ) -> None:
+        """
+        BurstRecorder 인스턴스를 초기화합니다.
+
+        Args:
+            grab: bbox를 받아 CaptureFrame을 반환하는 함수 (ScreenCapture.grab_frame)
+            grab_into: bbox와 버퍼를 받아 픽셀을 쓰고 캡처 시각을 반환하는 함수
+                (ScreenCapture.grab_into, None이면 grab 후 복사)
+        """
+        self._grab = grab
+        self._grab_into = grab_into
+
+    def record(
+        self,
+        bbox: Tuple[int, int, int, int],
+        count: int,
+        fps: float,
+        capacity: Optional[int] = None
+    ) -> BurstResult:
+        """
+        버스트 캡처를 수행합니다 (호출 스레드에서 블로킹).
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            count: 프레임 수
+            fps: 목표 프레임 속도
+            capacity: 링 용량 (None이면 count)
+
+        Returns:
+            BurstResult: 캡처 결과
+        """
+        result = BurstResult(bbox=bbox, requested=count, fps=fps)
+
+        # 워밍업: 세션 생성과 실제 프레임 크기 확인 후 링 할당
+        warmup = self._grab(bbox)
+        if warmup is None:
+            result.error = "워밍업 grab 실패"
+            return result
+
+        ring = FrameRing(capacity or count, warmup.width, warmup.height)
+        result.ring = ring
+        del warmup
+
+        interval = 1.0 / fps
+        grab = self._grab
+        grab_into = self._grab_into
+        dropped = result.dropped
+        start = time.perf_counter()
+        result.started_at = time.time()
+
+        index = 0
+        while index < count:
+            deadline = start + index * interval
+            remaining = deadline - time.perf_counter()
+            if remaining > self.SPIN_THRESHOLD:
+                time.sleep(remaining - self.SPIN_THRESHOLD)
+            while time.perf_counter() < deadline:
+                pass
+
+            if grab_into is not None:
+                timestamp = grab_into(bbox, ring.slot(index))
+                if timestamp is None:
+                    dropped.append(index)
+                else:
+                    ring.commit(index, timestamp)
+            else:
+                frame = grab(bbox)
+                if frame is None or not ring.store(index, frame.buffer, frame.timestamp):
+                    dropped.append(index)
+                del frame
+
+            # 다음 목표 시각을 이미 지났다면 밀린 프레임은 건너뜀
+            next_index = index + 1
+            behind = int((time.perf_counter() - start) / interval)
+            while next_index < min(behind, count):
+                dropped.append(next_index)
+                next_index += 1
+            index = next_index
+
+        result.elapsed = time.perf_counter() - start
+        result.overwritten = max(0, result.captured - ring.capacity)
+        logger.info(
+            f"버스트 캡처 완료: {result.captured}/{count}프레임, "
+            f"dropped={len(dropped)}, {result.elapsed:.3f}s"
+        )
+        return result
+
+
+def encode_burst(
+    result: BurstResult,
+    output_dir: Path,
+    executor: Executor,
+    catalog: Optional['CaptureCatalog'] = None
+) -> List[Future]:
+    """
+    버스트 프레임을 작업 스레드 풀에서 PNG로 인코딩합니다.
+
+    프레임은 `burst_<시각>/frame_<순번>.png`로 저장되고,
+    실제 타임스탬프와 dropped 목록은 같은 폴더의 `burst.json`에 기록됩니다.
+
+    Args:
+        result: 버스트 캡처 결과
+        output_dir: 저장 상위 디렉토리
+        executor: 인코딩에 사용할 Executor
+        catalog: 저장한 프레임을 기록할 카탈로그 (None이면 기록 안 함)
+
+    Returns:
+        List[Future]: 프레임별 저장 작업 (결과는 저장된 Path)
+    """
+    if result.ring is None:
+        return []
+
+    stamp = datetime.datetime.fromtimestamp(result.started_at).strftime('%Y%m%d_%H%M%S')
+    burst_dir = output_dir / f"burst_{stamp}"
+    burst_dir.mkdir(parents=True, exist_ok=True)
+
+    frames = result.ring.frames()
+    manifest = {
+        'bbox': list(result.bbox),
+        'requested': result.requested,
+        'fps': result.fps,
+        'elapsed': result.elapsed,
+        'dropped': result.dropped,
+        'overwritten': result.overwritten,
+        'frames': [
+            {'index': seq, 'timestamp': frame.timestamp} for seq, frame in frames
+        ],
+    }
+    (burst_dir / 'burst.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+
+    def _save(seq: int, frame: CaptureFrame) -> Path:
+        path = burst_dir / f"frame_{seq:04d}.png"
+        start = time.perf_counter()
+        frame.to_pil().save(str(path), format='PNG')
+        if catalog is not None:
+            # 링 프레임은 영역 정보 없이 만들어지므로 버스트 영역을 기록
+            catalog.add(
+                path, frame.timestamp, result.bbox, 'burst', (frame.width, frame.height),
+                timings={'encode': (time.perf_counter() - start) * 1000.0},
+                frame=frame
+            )
+        return path
+
+    return [executor.submit(_save, seq, frame) for seq, frame in frames]
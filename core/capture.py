@@ -3,28 +3,56 @@
 
 이 모듈은 화면 캡처 기능을 제공합니다.
 UI 로직과 분리되어 독립적으로 사용할 수 있습니다.
-MSS를 사용하여 멀티 모니터 환경을 지원합니다.
+픽셀 grab은 교체 가능한 캡처 백엔드(기본값 MSS)에 위임합니다.
 """
 import datetime
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple, Optional
 
-import mss
-from PIL import Image as PILImage
-from PIL.Image import Image
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QImage
 
+from constants import CatalogConfig, StoreConfig
+from core.backends import BACKENDS, CaptureBackend, MssBackend, probe_backends
+from core.clipboard import DeferredImageMimeData
+from core.frame import CaptureFrame
+from core.regions import MultiRegionResult, plan_grabs
+from core.store import ContentStore
+from core.telemetry import telemetry
+
+if TYPE_CHECKING:
+    from core.catalog import CaptureCatalog
+    # PIL은 첫 변환(frame.to_pil) 시점에 로드됨
+    from PIL.Image import Image
+
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _stage(name: str, timings: Optional[Dict[str, float]]) -> Iterator[None]:
+    """telemetry span으로 계측하면서 소요 시간(ms)을 timings에도 기록합니다."""
+    start = time.perf_counter()
+    try:
+        with telemetry.span(name):
+            yield
+    finally:
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + (time.perf_counter() - start) * 1000.0
+
+
 class ScreenCapture:
     """
     스크린 캡처 기능을 제공하는 클래스.
 
     지정된 화면 영역을 캡처하고 파일로 저장하는 기능을 제공합니다.
+    픽셀 grab은 캡처 백엔드(MSS, Qt QScreen, 합성)에 위임하며,
+    probe_backends()로 현재 디스플레이에서 가장 빠른 백엔드를 고를 수 있습니다.
+    종료 시 close()를 호출해야 합니다.
 
     Attributes:
         DEFAULT_FORMAT: 기본 파일명 형식
@@ -40,23 +68,243 @@ class ScreenCapture:
     DEFAULT_FORMAT: str = "capture_{timestamp}.png"
     TIMESTAMP_FORMAT: str = "%Y%m%d_%H%M%S"
 
-    def __init__(self, output_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        backend: Optional[CaptureBackend] = None
+    ) -> None:
         """
         ScreenCapture 인스턴스를 초기화합니다.
 
         Args:
             output_dir: 캡처 이미지 저장 디렉토리 (None이면 현재 디렉토리)
+            backend: 캡처 백엔드 (None이면 MSS)
         """
         self.output_dir: Path = output_dir or Path.cwd()
+        self._backend: CaptureBackend = backend or MssBackend()
+
+        # GUI 스레드 전용 백엔드를 작업 스레드에서 쓸 때의 대체 백엔드
+        self._fallback: Optional[CaptureBackend] = None
+        self._fallback_lock = threading.Lock()
+
+        # 파일명 예약 (작업 스레드 간 충돌 방지)
+        self._path_lock = threading.Lock()
+
+        # 중복 제거 저장소 (None이면 매번 인코딩)
+        self.store: Optional[ContentStore] = None
+        if StoreConfig.ENABLED:
+            self.enable_store(True)
+
+        # 저장한 캡처의 SQLite 카탈로그 (첫 저장 시 생성, sqlite3 로드가 시작을 늦추지 않도록)
+        self._catalog: Optional['CaptureCatalog'] = None
+        self._catalog_enabled: bool = CatalogConfig.ENABLED
+        self._catalog_lock = threading.Lock()
+        self._monitor_layout: List[Tuple[int, int, int, int]] = []
+
+    # =========================================================================
+    # 백엔드 관리
+    # =========================================================================
+
+    @property
+    def backend(self) -> CaptureBackend:
+        """현재 캡처 백엔드."""
+        return self._backend
+
+    def set_backend(self, backend: CaptureBackend) -> None:
+        """
+        캡처 백엔드를 교체합니다. 이전 백엔드는 닫힙니다.
+
+        Args:
+            backend: 새 백엔드
+        """
+        previous = self._backend
+        self._backend = backend
+        if previous is not backend:
+            previous.close()
+        logger.info(f"캡처 백엔드: {backend.name}")
+
+    def probe_backends(
+        self,
+        bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> Dict[str, float]:
+        """
+        사용 가능한 실제 화면 백엔드의 grab 시간을 측정하고 가장 빠른 것을 선택합니다.
+
+        GUI 스레드 전용 백엔드가 포함되므로 GUI 스레드에서 호출해야 합니다.
+
+        Args:
+            bbox: 측정 영역 (None이면 첫 모니터 전체)
+
+        Returns:
+            Dict[str, float]: 백엔드 이름 → grab 시간 중앙값 (초)
+        """
+        candidates: List[CaptureBackend] = [
+            self._backend if isinstance(self._backend, backend_cls) else backend_cls()
+            for backend_cls in BACKENDS.values()
+            if not backend_cls.synthetic and backend_cls.is_available()
+        ]
+        timings = probe_backends(candidates, bbox)
+        if not timings:
+            return timings
+
+        fastest = min(timings, key=timings.get)
+        for candidate in candidates:
+            if candidate.name == fastest:
+                self.set_backend(candidate)
+            elif candidate is not self._backend:
+                candidate.close()
+        return timings
+
+    def _backend_for_thread(self) -> CaptureBackend:
+        """
+        현재 스레드에서 사용할 백엔드를 반환합니다.
+
+        GUI 스레드 전용 백엔드는 다른 스레드에서 MSS로 대체됩니다.
+
+        Returns:
+            CaptureBackend: 사용할 백엔드
+        """
+        backend = self._backend
+        if not backend.gui_thread_only or self._is_gui_thread():
+            return backend
+
+        with self._fallback_lock:
+            if self._fallback is None:
+                self._fallback = MssBackend()
+            return self._fallback
+
+    @staticmethod
+    def _is_gui_thread() -> bool:
+        """현재 스레드가 Qt GUI 스레드(메인 스레드)인지 여부."""
+        return threading.current_thread() is threading.main_thread()
+
+    def monitors(self) -> List[Tuple[int, int, int, int]]:
+        """
+        모니터 영역 목록을 반환합니다.
+
+        Returns:
+            List[Tuple[int, int, int, int]]: (left, top, right, bottom) 목록
+        """
+        return self._backend_for_thread().monitors()
+
+    def invalidate_sessions(self) -> None:
+        """
+        모니터 레이아웃 변경을 알립니다.
+
+        모든 스레드의 세션이 다음 캡처 시점에 다시 생성됩니다.
+        """
+        self._backend.invalidate()
+        if self._fallback is not None:
+            self._fallback.invalidate()
+
+    def release_thread_session(self) -> None:
+        """
+        현재 스레드의 세션을 닫습니다.
+
+        종료되는 작업 스레드에서 호출하여 핸들을 즉시 반환합니다.
+        """
+        self._backend.release_thread()
+        if self._fallback is not None:
+            self._fallback.release_thread()
+
+    def close(self) -> None:
+        """모든 백엔드 자원과 카탈로그를 닫습니다."""
+        self._backend.close()
+        if self._fallback is not None:
+            self._fallback.close()
+        if self._catalog is not None:
+            self._catalog.close()
+
+    def grab_frame(
+        self,
+        bbox: Tuple[int, int, int, int]
+    ) -> Optional[CaptureFrame]:
+        """
+        지정된 영역의 픽셀만 가져옵니다 (변환/인코딩 없음).
+
+        반환되는 프레임은 백엔드가 만든 BGRA 버퍼를 복사 없이 감싸며,
+        PIL/QImage 변환은 frame.to_pil(), frame.to_qimage() 호출 시에만 수행됩니다.
+        GUI 스레드에서는 이 단계만 수행하고 나머지는 작업 스레드로 넘깁니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+
+        Returns:
+            Optional[CaptureFrame]: BGRA 프레임 또는 None (실패 시)
+        """
+        try:
+            frame = self._backend_for_thread().grab(bbox)
+            logger.debug(f"grab 성공: bbox={bbox}")
+            return frame
+        except Exception as e:
+            logger.error(f"캡처 실패: {e}")
+            return None
+
+    def grab_into(
+        self,
+        bbox: Tuple[int, int, int, int],
+        out: memoryview
+    ) -> Optional[float]:
+        """
+        지정된 영역의 BGRA 픽셀을 미리 할당된 버퍼에 씁니다 (버스트 링 슬롯 등).
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            out: 쓰기 가능한 버퍼 (너비 * 높이 * 4 바이트)
+
+        Returns:
+            Optional[float]: 캡처 시각 (epoch 초) 또는 None (실패 시)
+        """
+        try:
+            return self._backend_for_thread().grab_into(bbox, out)
+        except Exception as e:
+            logger.error(f"캡처 실패: {e}")
+            return None
+
+    def grab_regions(self, regions: Dict[str, Tuple[int, int, int, int]]) -> MultiRegionResult:
+        """
+        여러 영역을 같은 순간에 캡처합니다.
+
+        모니터마다 소속 영역들을 덮는 최소 사각형을 한 번만 grab하고
+        각 영역은 복사 없는 crop으로 만들므로, 비용은 영역 수가 아니라
+        모니터별 합집합 grab 횟수에 비례합니다. 모든 영역은 첫 grab의 타임스탬프를 공유합니다.
+
+        Args:
+            regions: 이름 → 영역 (left, top, right, bottom)
+
+        Returns:
+            MultiRegionResult: 영역별 프레임 (grab에 실패한 영역은 missing)
+        """
+        result = MultiRegionResult(regions=dict(regions))
+        grabbed: List[Tuple[CaptureFrame, List[str]]] = []
+        for union, names in plan_grabs(regions, self.monitors()):
+            frame = self.grab_frame(union)
+            if frame is None:
+                result.missing.extend(names)
+                continue
+            result.grabs += 1
+            grabbed.append((frame, names))
+
+        if grabbed:
+            result.timestamp = grabbed[0][0].timestamp
+        for frame, names in grabbed:
+            for name in names:
+                crop = frame.crop(regions[name])
+                crop.timestamp = result.timestamp
+                result.frames[name] = crop
+        logger.debug(
+            f"다중 영역 grab: {len(result.frames)}개 영역, grab {result.grabs}회"
+        )
+        return result
 
     def capture_region(
         self,
         bbox: Tuple[int, int, int, int]
-    ) -> Optional[Image]:
+    ) -> Optional['Image']:
         """
         지정된 영역을 캡처합니다.
 
-        MSS 라이브러리를 사용하여 멀티 모니터 환경에서도
+        캡처 백엔드(기본값 MSS)를 사용하여 멀티 모니터 환경에서도
         음수 좌표를 정확히 처리합니다.
 
         Args:
@@ -65,83 +313,255 @@ class ScreenCapture:
         Returns:
             Optional[Image]: 캡처된 이미지 또는 None (실패 시)
         """
-        try:
-            left, top, right, bottom = bbox
-            region = {
-                'left': left,
-                'top': top,
-                'width': right - left,
-                'height': bottom - top
-            }
-
-            with mss.mss() as sct:
-                screenshot = sct.grab(region)
-                # BGRA → RGB 변환
-                img = PILImage.frombytes(
-                    'RGB',
-                    screenshot.size,
-                    screenshot.bgra,
-                    'raw',
-                    'BGRX'
-                )
+        frame = self.grab_frame(bbox)
+        if frame is None:
+            return None
 
+        try:
+            img = frame.to_pil()
             logger.debug(f"캡처 성공: bbox={bbox}")
             return img
         except Exception as e:
             logger.error(f"캡처 실패: {e}")
             return None
 
-    def save_capture(self, image: Image) -> Optional[Path]:
+    def _allocate_path(self, timestamp: datetime.datetime) -> Path:
+        """
+        저장할 파일 경로를 예약합니다.
+
+        같은 초에 여러 장이 저장될 수 있으므로 이미 존재하면
+        `_1`, `_2` 접미사를 붙이고, 빈 파일을 배타적으로 생성하여
+        다른 작업 스레드와 이름이 겹치지 않도록 합니다.
+
+        Args:
+            timestamp: 캡처 시각
+
+        Returns:
+            Path: 예약된 파일 경로
+        """
+        stamp = timestamp.strftime(self.TIMESTAMP_FORMAT)
+        filename = self.DEFAULT_FORMAT.format(timestamp=stamp)
+        filepath = self.output_dir / filename
+
+        suffix = 0
+        with self._path_lock:
+            while True:
+                try:
+                    with open(filepath, 'xb'):
+                        pass
+                    return filepath
+                except FileExistsError:
+                    suffix += 1
+                    filepath = filepath.with_name(
+                        self.DEFAULT_FORMAT.format(timestamp=f"{stamp}_{suffix}")
+                    )
+
+    def save_capture(
+        self,
+        image: 'Image',
+        timestamp: Optional[datetime.datetime] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Optional[Path]:
         """
         캡처된 이미지를 파일로 저장합니다.
 
         Args:
             image: 저장할 이미지
+            timestamp: 캡처 시각 (None이면 현재 시각)
+            timings: 단계별 소요 시간(ms)을 기록할 딕셔너리 (None이면 기록 안 함)
 
         Returns:
             Optional[Path]: 저장된 파일 경로 또는 None (실패 시)
         """
-        timestamp = datetime.datetime.now().strftime(self.TIMESTAMP_FORMAT)
-        filename = self.DEFAULT_FORMAT.format(timestamp=timestamp)
-        filepath = self.output_dir / filename
-
+        filepath: Optional[Path] = None
         try:
-            image.save(str(filepath))
+            filepath = self._allocate_path(timestamp or datetime.datetime.now())
+            # 인코딩과 디스크 쓰기를 분리하여 단계별로 계측
+            with _stage('encode', timings):
+                buffer = BytesIO()
+                image.save(buffer, format='PNG')
+            with _stage('write', timings):
+                filepath.write_bytes(buffer.getbuffer())
             logger.info(f"캡처 저장 완료: {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"저장 실패: {e}")
+            if filepath is not None:
+                filepath.unlink(missing_ok=True)
             return None
 
-    def copy_to_clipboard(self, image: Image) -> bool:
+    def enable_store(self, enabled: bool) -> None:
         """
-        PIL 이미지를 클립보드에 복사합니다.
+        중복 제거 저장을 켜거나 끕니다.
 
         Args:
-            image: 복사할 PIL Image 객체
+            enabled: True면 save_frame()이 같은 픽셀의 인코딩을 생략하고 하드링크를 만듦
+        """
+        self.store = ContentStore(self.output_dir) if enabled else None
+        logger.info(f"중복 제거 저장: {'사용' if enabled else '사용 안 함'}")
+
+    @property
+    def catalog(self) -> Optional['CaptureCatalog']:
+        """저장한 캡처의 SQLite 카탈로그 (비활성 또는 초기화 실패 시 None)."""
+        if self._catalog is None and self._catalog_enabled:
+            with self._catalog_lock:
+                if self._catalog is None and self._catalog_enabled:
+                    try:
+                        from core.catalog import CaptureCatalog
+                        catalog = CaptureCatalog(self.output_dir / CatalogConfig.FILE_NAME)
+                        catalog.set_monitors(self._monitor_layout)
+                        self._catalog = catalog
+                    except Exception as e:
+                        logger.warning(f"카탈로그 초기화 실패, 기록 안 함: {e}")
+                        self._catalog_enabled = False
+        return self._catalog
+
+    def set_monitor_layout(self, monitors: List[Tuple[int, int, int, int]]) -> None:
+        """
+        카탈로그의 모니터 번호 계산에 사용할 모니터 배치를 지정합니다.
+
+        Args:
+            monitors: 모니터 영역 (left, top, right, bottom) 목록
+        """
+        self._monitor_layout = list(monitors)
+        if self._catalog is not None:
+            self._catalog.set_monitors(self._monitor_layout)
+
+    def save_frame(
+        self,
+        frame: CaptureFrame,
+        mode: str = 'file',
+        timings: Optional[Dict[str, float]] = None
+    ) -> Optional[Path]:
+        """
+        프레임을 PNG 파일로 저장하고 카탈로그에 기록합니다 (내용 해시, 지각 해시 포함).
+
+        중복 제거 저장소가 켜져 있으면 인코딩 전에 픽셀 버퍼를 해시하고,
+        같은 내용이 이미 저장되어 있으면 인코딩 없이 새 파일명으로 연결합니다.
+
+        Args:
+            frame: 저장할 프레임
+            mode: 카탈로그에 기록할 캡처 모드
+            timings: 이전 단계(grab 등)의 소요 시간(ms), 저장 단계 시간이 이 딕셔너리에 추가됨
 
         Returns:
-            bool: 복사 성공 여부
+            Optional[Path]: 저장된 파일 경로 또는 None (실패 시)
         """
-        try:
-            # PIL Image → PNG 바이트로 변환
-            buffer = BytesIO()
-            image.save(buffer, format='PNG')
-            buffer.seek(0)
+        timings = {} if timings is None else timings
+        digest: Optional[str] = None
+        catalog = self.catalog
+        if self.store is not None or (catalog is not None and CatalogConfig.HASH_CONTENT):
+            with _stage('hash', timings):
+                digest = ContentStore.digest(frame)
+
+        path = self._save_frame(frame, digest, timings)
+        if path is not None and catalog is not None:
+            catalog.add(
+                path, frame.timestamp, frame.bbox, mode,
+                (frame.width, frame.height), digest, timings, frame=frame
+            )
+        return path
+
+    def _save_frame(
+        self,
+        frame: CaptureFrame,
+        digest: Optional[str],
+        timings: Dict[str, float]
+    ) -> Optional[Path]:
+        """save_frame의 저장 단계 (중복 제거 저장소 조회 포함)."""
+        store = self.store
+        if store is None or digest is None:
+            with _stage('convert', timings):
+                image = frame.to_pil()
+            return self.save_capture(image, frame.captured_at, timings)
+
+        with store.claim(digest) as existing:
+            if existing is not None:
+                filepath: Optional[Path] = None
+                try:
+                    filepath = self._allocate_path(frame.captured_at)
+                    with _stage('write', timings):
+                        return store.link(existing, filepath)
+                except Exception as e:
+                    logger.error(f"중복 캡처 연결 실패, 다시 인코딩: {e}")
+                    if filepath is not None:
+                        filepath.unlink(missing_ok=True)
+
+            with _stage('convert', timings):
+                image = frame.to_pil()
+            path = self.save_capture(image, frame.captured_at, timings)
+            if path is not None:
+                store.record(digest, path)
+            return path
+
+    @staticmethod
+    def to_qimage(image: 'Image') -> QImage:
+        """
+        PIL 이미지를 QImage로 변환합니다 (코덱 없음).
+
+        QImage는 GUI 스레드 밖에서도 생성할 수 있으므로
+        작업 스레드에서 미리 변환해 둘 수 있습니다.
+
+        Args:
+            image: 변환할 PIL Image 객체
 
-            # 바이트 → QImage 변환
-            qimage = QImage()
-            qimage.loadFromData(buffer.getvalue())
+        Returns:
+            QImage: RGB32 이미지 (자체 버퍼 소유)
+        """
+        rgb = image if image.mode == 'RGB' else image.convert('RGB')
+        data = rgb.tobytes('raw', 'BGRX')
+        width, height = rgb.size
+        qimage = QImage(data, width, height, width * 4, QImage.Format_RGB32)
+        return qimage.copy()
+
+    @staticmethod
+    def set_clipboard_image(
+        qimage: QImage,
+        file_path: Optional[Path] = None
+    ) -> Optional[DeferredImageMimeData]:
+        """
+        QImage를 클립보드에 설정합니다 (GUI 스레드 전용).
+
+        PNG/JPEG/파일 URI 형식은 붙여넣을 때 지연 생성됩니다.
+
+        Args:
+            qimage: 복사할 이미지
+            file_path: 이미 저장된 파일 경로 (있는 경우)
+
+        Returns:
+            Optional[DeferredImageMimeData]: 설정된 MIME 데이터 또는 None (실패 시)
+        """
+        try:
+            if qimage.isNull():
+                raise ValueError("빈 이미지")
 
             # 클립보드에 복사
+            mime = DeferredImageMimeData(qimage, file_path)
             clipboard = QApplication.clipboard()
-            clipboard.setImage(qimage)
+            clipboard.setMimeData(mime)
 
             logger.info("클립보드에 이미지 복사 완료")
-            return True
+            return mime
+        except Exception as e:
+            logger.error(f"클립보드 복사 실패: {e}")
+            return None
+
+    def copy_to_clipboard(self, image: 'Image') -> bool:
+        """
+        PIL 이미지를 클립보드에 복사합니다.
+
+        Args:
+            image: 복사할 PIL Image 객체
+
+        Returns:
+            bool: 복사 성공 여부
+        """
+        try:
+            qimage = self.to_qimage(image)
         except Exception as e:
             logger.error(f"클립보드 복사 실패: {e}")
             return False
+        return self.set_clipboard_image(qimage) is not None
 
     def capture_and_save(
         self,
@@ -160,19 +580,24 @@ class ScreenCapture:
         Returns:
             Tuple[Optional[Path], bool]: (저장된 파일 경로, 클립보드 복사 성공 여부)
         """
-        image = self.capture_region(bbox)
-        if image is None:
+        frame = self.grab_frame(bbox)
+        if frame is None:
             return (None, False)
 
         file_path: Optional[Path] = None
-        clipboard_ok: bool = False
+        mime: Optional[DeferredImageMimeData] = None
 
-        # 클립보드 복사
+        # 클립보드 복사 (BGRA 버퍼 → QImage, 코덱 없음)
         if copy_to_clipboard:
-            clipboard_ok = self.copy_to_clipboard(image)
+            mime = self.set_clipboard_image(frame.to_qimage())
 
         # 파일 저장
         if save_to_file:
-            file_path = self.save_capture(image)
-
-        return (file_path, clipboard_ok)
+            try:
+                file_path = self.save_frame(frame, 'both' if copy_to_clipboard else 'file')
+            except Exception as e:
+                logger.error(f"저장 실패: {e}")
+            if mime is not None and file_path is not None:
+                mime.set_file_path(file_path)
+
+        return (file_path, mime is not None)
@@ -0,0 +1,971 @@
+"""
+캡처 카탈로그 모듈
+
+이 모듈은 ScreenCapture가 저장한 캡처를 로컬 SQLite 카탈로그에 기록하고
+시간 범위, 영역 겹침, 내용 해시, 지각 해시 거리로 바로 조회하는 기능을 제공합니다.
+
+기록은 큐에 넣기만 하고 전용 스레드가 묶음 트랜잭션으로 씁니다 (WAL 모드).
+시간과 해시는 B-tree 인덱스, 영역은 R*Tree 가상 테이블(없으면 좌표 인덱스)로 조회하므로
+디렉토리를 훑거나 파일을 stat하지 않고 밀리초 단위로 결과를 얻습니다.
+비슷한 캡처는 dHash를 16비트 조각 4개로 나눈 다중 인덱스 해시 테이블로 찾습니다 (core.similar).
+이미 있는 캡처 디렉토리로부터 카탈로그를 다시 만드는 rebuild 명령과
+지각 해시가 없는 항목만 채우는 index 명령은 프로세스 풀에서 파일을 디코딩합니다.
+
+사용법:
+    python -m core.catalog rebuild <캡처 디렉토리>
+    python -m core.catalog query <캡처 디렉토리> --since 2025-01-01T09:00 --region 0,0,800,600
+    python -m core.catalog similar <캡처 디렉토리> <이미지 또는 16진 해시> --distance 10
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from constants import CatalogConfig
+from core import similar
+
+if TYPE_CHECKING:
+    from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    timestamp REAL NOT NULL,
+    left INTEGER,
+    top INTEGER,
+    right INTEGER,
+    bottom INTEGER,
+    monitor INTEGER,
+    mode TEXT,
+    width INTEGER,
+    height INTEGER,
+    size INTEGER,
+    hash TEXT,
+    timings TEXT
+);
+CREATE INDEX IF NOT EXISTS captures_timestamp ON captures (timestamp);
+CREATE INDEX IF NOT EXISTS captures_hash ON captures (hash);
+CREATE TABLE IF NOT EXISTS capture_phash (
+    id INTEGER PRIMARY KEY,
+    phash INTEGER NOT NULL,
+    b0 INTEGER NOT NULL,
+    b1 INTEGER NOT NULL,
+    b2 INTEGER NOT NULL,
+    b3 INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS capture_phash_b0 ON capture_phash (b0);
+CREATE INDEX IF NOT EXISTS capture_phash_b1 ON capture_phash (b1);
+CREATE INDEX IF NOT EXISTS capture_phash_b2 ON capture_phash (b2);
+CREATE INDEX IF NOT EXISTS capture_phash_b3 ON capture_phash (b3);
+"""
+_RTREE = "CREATE VIRTUAL TABLE IF NOT EXISTS captures_region USING rtree (id, min_x, max_x, min_y, max_y)"
+_REGION_FALLBACK = "CREATE INDEX IF NOT EXISTS captures_region_xy ON captures (left, right, top, bottom)"
+
+_COLUMNS = (
+    'path', 'timestamp', 'left', 'top', 'right', 'bottom', 'monitor', 'mode',
+    'width', 'height', 'size', 'hash', 'timings'
+)
+_UPSERT = (
+    f"INSERT INTO captures ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))}) "
+    f"ON CONFLICT (path) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}" for column in _COLUMNS[1:])
+)
+
+# 조각 후보 값이 이보다 많으면 인덱스 조회 대신 전체 해시를 훑음 (큰 거리)
+_FULL_SCAN_VARIANTS = 16384
+# IN 목록 한 번에 넘길 최대 값 수 (SQLITE_MAX_VARIABLE_NUMBER 기본값 999 이하)
+_IN_BATCH = 900
+
+_FILENAME = re.compile(r'^capture_(\d{8}_\d{6})(?:_\d+)?\.png$')
+
+_STOP = object()
+_FLUSH = object()
+
+
+@dataclass
+class CatalogEntry:
+    """
+    카탈로그 항목 하나.
+
+    Attributes:
+        path: 파일 경로 (카탈로그 디렉토리 기준 상대 경로로 저장)
+        timestamp: 캡처 시각 (epoch 초)
+        bbox: 캡처 영역 (left, top, right, bottom), rebuild로 만든 항목은 None
+        monitor: 영역과 가장 많이 겹치는 모니터 번호 (모르면 None)
+        mode: 캡처 모드 ('file', 'both', 'rpc', 'rebuild' 등)
+        width: 너비 (픽셀)
+        height: 높이 (픽셀)
+        size: 파일 크기 (바이트)
+        hash: 내용 해시 (ContentStore.digest와 같은 형식, 없으면 None)
+        timings: 단계 이름 → 소요 시간 (밀리초)
+        phash: 64비트 dHash (없으면 None)
+    """
+
+    path: str
+    timestamp: float
+    bbox: Optional[BBox] = None
+    monitor: Optional[int] = None
+    mode: Optional[str] = None
+    width: int = 0
+    height: int = 0
+    size: int = 0
+    hash: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    phash: Optional[int] = None
+
+    @property
+    def captured_at(self) -> datetime.datetime:
+        """캡처 시각 (로컬 datetime)."""
+        return datetime.datetime.fromtimestamp(self.timestamp)
+
+    def to_row(self) -> Tuple[Any, ...]:
+        """captures 테이블 행 값 (_COLUMNS 순서)."""
+        left, top, right, bottom = self.bbox if self.bbox is not None else (None,) * 4
+        return (
+            self.path, self.timestamp, left, top, right, bottom, self.monitor, self.mode,
+            self.width, self.height, self.size, self.hash,
+            json.dumps(self.timings) if self.timings else None,
+        )
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'CatalogEntry':
+        """captures 테이블 행으로부터 항목을 만듭니다."""
+        bbox = None
+        if row['left'] is not None:
+            bbox = (row['left'], row['top'], row['right'], row['bottom'])
+        return cls(
+            path=row['path'],
+            timestamp=row['timestamp'],
+            bbox=bbox,
+            monitor=row['monitor'],
+            mode=row['mode'],
+            width=row['width'] or 0,
+            height=row['height'] or 0,
+            size=row['size'] or 0,
+            hash=row['hash'],
+            timings=json.loads(row['timings']) if row['timings'] else {},
+            phash=similar.from_signed(row['phash']) if row['phash'] is not None else None,
+        )
+
+
+def monitor_index(bbox: BBox, monitors: List[BBox]) -> Optional[int]:
+    """
+    영역과 가장 많이 겹치는 모니터 번호를 반환합니다.
+
+    Args:
+        bbox: 캡처 영역
+        monitors: 모니터 영역 목록
+
+    Returns:
+        Optional[int]: 모니터 번호 (겹치는 모니터가 없으면 None)
+    """
+    best, best_area = None, 0
+    for index, monitor in enumerate(monitors):
+        width = min(bbox[2], monitor[2]) - max(bbox[0], monitor[0])
+        height = min(bbox[3], monitor[3]) - max(bbox[1], monitor[1])
+        if width > 0 and height > 0 and width * height > best_area:
+            best, best_area = index, width * height
+    return best
+
+
+class CaptureCatalog:
+    """
+    SQLite 캡처 카탈로그.
+
+    record()는 항목을 큐에 넣고 바로 반환하며, 전용 스레드가 batch_size개 또는
+    flush_interval초 단위로 한 트랜잭션에 기록합니다.
+    조회 메서드는 호출 스레드별 읽기 연결을 사용하므로 어느 스레드에서나 호출할 수 있습니다.
+
+    Example:
+        >>> catalog = CaptureCatalog(output_dir / 'captures.sqlite3')
+        >>> catalog.record(entry)
+        >>> catalog.flush()
+        >>> catalog.overlapping((0, 0, 800, 600), start=time.time() - 86400)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = CatalogConfig.BATCH_SIZE,
+        flush_interval: float = CatalogConfig.FLUSH_INTERVAL
+    ) -> None:
+        """
+        CaptureCatalog 인스턴스를 초기화하고 스키마를 만듭니다.
+
+        Args:
+            path: 카탈로그 파일 경로 (항목 경로는 이 파일의 디렉토리 기준)
+            batch_size: 한 트랜잭션에 기록할 최대 항목 수
+            flush_interval: 첫 항목 이후 묶음을 기다릴 최대 시간 (초)
+        """
+        self.path: Path = path
+        self.root: Path = path.parent
+        self.batch_size: int = max(1, batch_size)
+        self.flush_interval: float = flush_interval
+        self.monitors: List[BBox] = []
+        self._queue: 'queue.Queue[Any]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._local = threading.local()
+        self._closed: bool = False
+
+        with self._connect() as conn:
+            self.rtree: bool = self._create_schema(conn)
+
+    # =========================================================================
+    # 연결 / 스키마
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결을 엽니다 (WAL, 행 이름 접근)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=CatalogConfig.BUSY_TIMEOUT)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> bool:
+        """
+        테이블과 인덱스를 만듭니다.
+
+        Returns:
+            bool: 영역 조회에 R*Tree를 사용하는지 여부
+        """
+        conn.executescript(_SCHEMA)
+        try:
+            conn.execute(_RTREE)
+            return True
+        except sqlite3.OperationalError as e:
+            logger.info(f"R*Tree를 사용할 수 없어 좌표 인덱스 사용: {e}")
+            conn.execute(_REGION_FALLBACK)
+            return False
+
+    def _reader(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 연결."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _relative(self, path: Path) -> str:
+        """카탈로그 디렉토리 기준 경로 (밖이면 절대 경로)."""
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def resolve(self, entry: CatalogEntry) -> Path:
+        """
+        항목의 실제 파일 경로를 반환합니다.
+
+        Args:
+            entry: 카탈로그 항목
+
+        Returns:
+            Path: 파일 경로
+        """
+        return self.root / entry.path
+
+    # =========================================================================
+    # 기록
+    # =========================================================================
+
+    def set_monitors(self, monitors: List[BBox]) -> None:
+        """
+        모니터 번호 계산에 사용할 모니터 영역을 갱신합니다 (레이아웃 변경 시).
+
+        Args:
+            monitors: 모니터 영역 목록
+        """
+        self.monitors = list(monitors)
+
+    def add(
+        self,
+        path: Path,
+        timestamp: float,
+        bbox: Optional[BBox] = None,
+        mode: Optional[str] = None,
+        size: Tuple[int, int] = (0, 0),
+        content_hash: Optional[str] = None,
+        timings: Optional[Dict[str, float]] = None,
+        frame: Optional['CaptureFrame'] = None
+    ) -> None:
+        """
+        저장된 캡처 하나를 기록 큐에 넣습니다 (파일 크기와 지각 해시는 호출 스레드에서 계산).
+
+        Args:
+            path: 저장된 파일
+            timestamp: 캡처 시각 (epoch 초)
+            bbox: 캡처 영역
+            mode: 캡처 모드
+            size: 이미지 크기 (너비, 높이)
+            content_hash: 내용 해시
+            timings: 단계별 소요 시간 (밀리초)
+            frame: 지각 해시를 계산할 프레임 (None이면 계산 안 함, 격자 표본만 읽음)
+        """
+        try:
+            file_size = path.stat().st_size
+        except OSError:
+            file_size = 0
+        timings = dict(timings or {})
+        phash: Optional[int] = None
+        if frame is not None and CatalogConfig.PERCEPTUAL_HASH:
+            start = time.perf_counter()
+            try:
+                phash = similar.frame_dhash(frame)
+            except Exception as e:
+                logger.warning(f"지각 해시 계산 실패 ({path.name}): {e}")
+            timings['phash'] = (time.perf_counter() - start) * 1000.0
+        self.record(CatalogEntry(
+            path=self._relative(path),
+            timestamp=timestamp,
+            bbox=bbox,
+            monitor=monitor_index(bbox, self.monitors) if bbox is not None else None,
+            mode=mode,
+            width=size[0],
+            height=size[1],
+            size=file_size,
+            hash=content_hash,
+            timings=timings,
+            phash=phash,
+        ))
+
+    def record(self, entry: CatalogEntry) -> None:
+        """
+        항목을 기록 큐에 넣습니다 (즉시 반환).
+
+        Args:
+            entry: 카탈로그 항목
+        """
+        if self._closed:
+            return
+        self._ensure_writer()
+        self._queue.put(entry)
+
+    def flush(self) -> None:
+        """큐에 있는 항목이 모두 기록될 때까지 기다립니다."""
+        if self._thread is None:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        """남은 항목을 기록하고 기록 스레드와 현재 스레드의 읽기 연결을 닫습니다."""
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _ensure_writer(self) -> None:
+        """기록 스레드를 필요할 때 시작합니다."""
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_writer, name='capture-catalog', daemon=True
+                )
+                self._thread.start()
+
+    def _run_writer(self) -> None:
+        """기록 스레드 본체: 큐에서 묶음을 모아 한 트랜잭션으로 기록합니다."""
+        conn = self._connect()
+        try:
+            stop = False
+            while not stop:
+                item = self._queue.get()
+                consumed = 1
+                batch: List[CatalogEntry] = []
+                if item is _STOP:
+                    stop = True
+                elif item is not _FLUSH:
+                    batch.append(item)
+                    deadline = time.monotonic() + self.flush_interval
+                    while len(batch) < self.batch_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            item = self._queue.get(timeout=remaining)
+                        except queue.Empty:
+                            break
+                        consumed += 1
+                        if item is _STOP:
+                            stop = True
+                            break
+                        if item is _FLUSH:
+                            break
+                        batch.append(item)
+                if batch:
+                    try:
+                        self.write(batch, conn)
+                    except sqlite3.Error as e:
+                        logger.error(f"카탈로그 기록 실패 ({len(batch)}개): {e}")
+                for _ in range(consumed):
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+    def write(self, entries: Iterable[CatalogEntry], conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        항목들을 한 트랜잭션으로 기록합니다 (같은 경로는 갱신).
+
+        Args:
+            entries: 기록할 항목
+            conn: 사용할 연결 (None이면 현재 스레드의 연결)
+
+        Returns:
+            int: 기록한 항목 수
+        """
+        conn = conn or self._reader()
+        count = 0
+        with conn:
+            for entry in entries:
+                conn.execute(_UPSERT, entry.to_row())
+                row_id = conn.execute(
+                    "SELECT id FROM captures WHERE path = ?", (entry.path,)
+                ).fetchone()[0]
+                self._write_phash(conn, row_id, entry.phash)
+                if self.rtree:
+                    if entry.bbox is None:
+                        conn.execute("DELETE FROM captures_region WHERE id = ?", (row_id,))
+                    else:
+                        left, top, right, bottom = entry.bbox
+                        conn.execute(
+                            "INSERT OR REPLACE INTO captures_region VALUES (?, ?, ?, ?, ?)",
+                            (row_id, left, right, top, bottom)
+                        )
+                count += 1
+        return count
+
+    @staticmethod
+    def _write_phash(conn: sqlite3.Connection, row_id: int, phash: Optional[int]) -> None:
+        """항목의 지각 해시와 조각 인덱스를 기록합니다 (None이면 삭제)."""
+        if phash is None:
+            conn.execute("DELETE FROM capture_phash WHERE id = ?", (row_id,))
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO capture_phash VALUES (?, ?, ?, ?, ?, ?)",
+                (row_id, similar.to_signed(phash), *similar.split(phash))
+            )
+
+    def set_phashes(self, phashes: Dict[int, int]) -> int:
+        """
+        기존 항목들의 지각 해시를 한 트랜잭션으로 기록합니다.
+
+        Args:
+            phashes: 항목 id → 지각 해시
+
+        Returns:
+            int: 기록한 항목 수
+        """
+        conn = self._reader()
+        with conn:
+            for row_id, phash in phashes.items():
+                self._write_phash(conn, row_id, phash)
+        return len(phashes)
+
+    def missing_phashes(self) -> List[Tuple[int, str]]:
+        """
+        지각 해시가 없는 항목을 반환합니다.
+
+        Returns:
+            List[Tuple[int, str]]: (항목 id, 경로) 목록
+        """
+        return [
+            (row['id'], row['path']) for row in self._reader().execute(
+                "SELECT id, path FROM captures "
+                "WHERE id NOT IN (SELECT id FROM capture_phash) ORDER BY id"
+            )
+        ]
+
+    def clear(self) -> None:
+        """모든 항목을 지웁니다."""
+        conn = self._reader()
+        with conn:
+            conn.execute("DELETE FROM captures")
+            conn.execute("DELETE FROM capture_phash")
+            if self.rtree:
+                conn.execute("DELETE FROM captures_region")
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+
+    def _select(self, where: str, params: Tuple[Any, ...], limit: Optional[int]) -> List[CatalogEntry]:
+        """조건에 맞는 항목을 최신순으로 조회합니다."""
+        sql = (
+            f"SELECT captures.*, capture_phash.phash AS phash FROM captures "
+            f"LEFT JOIN capture_phash ON capture_phash.id = captures.id "
+            f"WHERE {where} ORDER BY timestamp DESC"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [CatalogEntry.from_row(row) for row in self._reader().execute(sql, params)]
+
+    def count(self) -> int:
+        """전체 항목 수."""
+        return self._reader().execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+
+    def by_time(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: Optional[int] = CatalogConfig.QUERY_LIMIT
+    ) -> List[CatalogEntry]:
+        """
+        시간 범위로 조회합니다 (timestamp 인덱스).
+
+        Args:
+            start: 시작 시각 (epoch 초, 포함, None이면 제한 없음)
+            end: 끝 시각 (epoch 초, 포함하지 않음, None이면 제한 없음)
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            List[CatalogEntry]: 최신순 항목
+        """
+        return self._select(
+            "timestamp >= ? AND timestamp < ?",
+            (start if start is not None else float('-inf'), end if end is not None else float('inf')),
+            limit
+        )
+
+    def overlapping(
+        self,
+        bbox: BBox,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: Optional[int] = CatalogConfig.QUERY_LIMIT
+    ) -> List[CatalogEntry]:
+        """
+        영역이 사각형과 겹치는 캡처를 조회합니다 (R*Tree).
+
+        Args:
+            bbox: 사각형 (left, top, right, bottom)
+            start: 시작 시각 (epoch 초, None이면 제한 없음)
+            end: 끝 시각 (epoch 초, None이면 제한 없음)
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            List[CatalogEntry]: 최신순 항목
+        """
+        left, top, right, bottom = bbox
+        time_range = (
+            start if start is not None else float('-inf'),
+            end if end is not None else float('inf'),
+        )
+        if self.rtree:
+            where = (
+                "captures.id IN (SELECT id FROM captures_region "
+                "WHERE min_x < ? AND max_x > ? AND min_y < ? AND max_y > ?) "
+                "AND timestamp >= ? AND timestamp < ?"
+            )
+        else:
+            where = (
+                "left < ? AND right > ? AND top < ? AND bottom > ? "
+                "AND timestamp >= ? AND timestamp < ?"
+            )
+        return self._select(where, (right, left, bottom, top) + time_range, limit)
+
+    def by_hash(self, content_hash: str, limit: Optional[int] = CatalogConfig.QUERY_LIMIT) -> List[CatalogEntry]:
+        """
+        내용 해시로 조회합니다 (hash 인덱스).
+
+        Args:
+            content_hash: 내용 해시
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            List[CatalogEntry]: 최신순 항목
+        """
+        return self._select("hash = ?", (content_hash,), limit)
+
+    def similar(
+        self,
+        phash: int,
+        distance: int = CatalogConfig.SIMILAR_DISTANCE,
+        limit: Optional[int] = CatalogConfig.QUERY_LIMIT
+    ) -> List[Tuple[int, CatalogEntry]]:
+        """
+        지각 해시가 해밍 거리 distance 이내인 캡처를 조회합니다 (다중 인덱스 해싱).
+
+        거리 d 이내인 해시는 적어도 한 조각이 d // 4 비트 이내로 같으므로,
+        조각마다 그 범위의 값만 인덱스로 찾아 후보를 모은 뒤 전체 거리로 거릅니다.
+        후보 값이 너무 많아지는 큰 거리에서는 해시 열만 순차로 훑습니다.
+
+        Args:
+            phash: 기준 지각 해시
+            distance: 최대 해밍 거리 (0~64)
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            List[Tuple[int, CatalogEntry]]: (거리, 항목) 목록, 가까운 순 (같으면 최신순)
+
+        Raises:
+            ValueError: distance가 범위를 벗어난 경우
+        """
+        if not 0 <= distance <= similar.HASH_BITS:
+            raise ValueError(f"해밍 거리는 0~{similar.HASH_BITS}이어야 합니다: {distance}")
+        conn = self._reader()
+        radius = distance // similar.CHUNK_COUNT
+        found: Set[int] = set()
+
+        def _collect(rows: Iterable[sqlite3.Row]) -> None:
+            for row_id, value in rows:
+                if similar.hamming(phash, similar.from_signed(value)) <= distance:
+                    found.add(row_id)
+
+        if similar.variant_count(radius) * similar.CHUNK_COUNT > _FULL_SCAN_VARIANTS:
+            _collect(conn.execute("SELECT id, phash FROM capture_phash"))
+        else:
+            for index, chunk in enumerate(similar.split(phash)):
+                variants = list(similar.chunk_variants(chunk, radius))
+                for i in range(0, len(variants), _IN_BATCH):
+                    batch = variants[i:i + _IN_BATCH]
+                    _collect(conn.execute(
+                        f"SELECT id, phash FROM capture_phash "
+                        f"WHERE b{index} IN ({', '.join('?' * len(batch))})",
+                        batch
+                    ))
+
+        entries: List[CatalogEntry] = []
+        ids = list(found)
+        for i in range(0, len(ids), _IN_BATCH):
+            batch = ids[i:i + _IN_BATCH]
+            entries.extend(self._select(
+                f"captures.id IN ({', '.join('?' * len(batch))})", tuple(batch), None
+            ))
+        results = sorted(
+            ((similar.hamming(phash, entry.phash), entry) for entry in entries),
+            key=lambda item: (item[0], -item[1].timestamp)
+        )
+        return results[:limit] if limit is not None else results
+
+
+# =============================================================================
+# rebuild
+# =============================================================================
+
+def image_digest(image) -> str:
+    """
+    저장된 이미지의 내용 해시를 계산합니다.
+
+    ContentStore.digest와 같은 형식(크기 + BGRA 픽셀)이며 알파는 불투명(255)으로 채우므로
+    불투명 알파를 돌려주는 백엔드(MSS, 합성)로 저장한 캡처의 해시와 일치합니다.
+
+    Args:
+        image: PIL 이미지
+
+    Returns:
+        str: blake2b 16진 문자열
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{image.width}x{image.height}:".encode('ascii'))
+    h.update(image.convert('RGBA').tobytes('raw', 'BGRA'))
+    return h.hexdigest()
+
+
+def _scan(directory: Path) -> Iterator[Tuple[Path, Optional[float], Optional[BBox], str]]:
+    """
+    캡처 디렉토리에서 카탈로그에 넣을 파일을 찾습니다.
+
+    capture_*.png는 파일명의 시각을, burst_*/regions_* 폴더의 PNG는
+    burst.json/regions.json에 기록된 시각과 영역을 사용합니다.
+
+    Yields:
+        Tuple: (파일, 시각 또는 None, 영역 또는 None, 캡처 모드)
+    """
+    for path in sorted(directory.glob('capture_*.png')):
+        match = _FILENAME.match(path.name)
+        timestamp = None
+        if match:
+            timestamp = datetime.datetime.strptime(match.group(1), '%Y%m%d_%H%M%S').timestamp()
+        yield (path, timestamp, None, 'file')
+
+    for folder in sorted(directory.glob('burst_*')):
+        try:
+            manifest = json.loads((folder / 'burst.json').read_text(encoding='utf-8'))
+            bbox = tuple(manifest['bbox'])
+            times = {item['index']: item['timestamp'] for item in manifest['frames']}
+        except (OSError, ValueError, KeyError, TypeError):
+            bbox, times = None, {}
+        for path in sorted(folder.glob('frame_*.png')):
+            try:
+                timestamp = times.get(int(path.stem.split('_')[1]))
+            except (IndexError, ValueError):
+                timestamp = None
+            yield (path, timestamp, bbox, 'burst')
+
+    for folder in sorted(directory.glob('regions_*')):
+        try:
+            manifest = json.loads((folder / 'regions.json').read_text(encoding='utf-8'))
+            timestamp = manifest['timestamp']
+            boxes = {
+                region['file']: tuple(region['bbox'])
+                for region in manifest['regions'].values() if region.get('file')
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            timestamp, boxes = None, {}
+        for path in sorted(folder.glob('*.png')):
+            yield (path, timestamp, boxes.get(path.name), 'region')
+
+
+def _inspect(job: Tuple[str, bool]) -> Tuple[Optional[Tuple[int, int, int, Optional[str], int]], Optional[str]]:
+    """
+    파일 하나를 디코딩하여 카탈로그 값을 계산합니다 (프로세스 풀 작업 함수).
+
+    Args:
+        job: (파일 경로, 내용 해시 계산 여부)
+
+    Returns:
+        Tuple: ((너비, 높이, 파일 크기, 내용 해시, 지각 해시), None) 또는 (None, 오류 메시지)
+    """
+    from PIL import Image
+
+    path, hash_content = job
+    try:
+        size = os.path.getsize(path)
+        with Image.open(path) as image:
+            image.load()
+            digest = image_digest(image) if hash_content else None
+            return ((image.width, image.height, size, digest, similar.dhash(image)), None)
+    except (OSError, ValueError) as e:
+        return (None, str(e))
+
+
+def _map_inspect(jobs: List[Tuple[str, bool]], workers: int) -> Iterator[Tuple[Any, Optional[str]]]:
+    """_inspect를 프로세스 풀에서 순서대로 실행합니다 (workers가 1이면 현재 프로세스)."""
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"캡처 디코딩: {len(jobs)}개, 프로세스 {workers}개")
+    if workers <= 1 or len(jobs) <= 1:
+        yield from map(_inspect, jobs)
+        return
+    chunksize = max(1, min(CatalogConfig.CHUNK_SIZE, len(jobs) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_inspect, jobs, chunksize=chunksize)
+
+
+def rebuild_catalog(
+    directory: Path,
+    hash_content: bool = True,
+    workers: int = CatalogConfig.WORKERS
+) -> int:
+    """
+    이미 있는 캡처 디렉토리로부터 카탈로그를 다시 만듭니다.
+
+    시각과 영역은 파일명과 burst/regions 매니페스트에서 (없으면 수정 시각),
+    크기와 해시는 프로세스 풀에서 파일을 디코딩하여 계산합니다.
+    단일 캡처의 영역과 단계별 시간은 파일에 남아 있지 않으므로 비워 둡니다.
+
+    Args:
+        directory: 캡처 디렉토리 (카탈로그는 directory / CatalogConfig.FILE_NAME)
+        hash_content: 내용 해시를 계산할지 여부 (지각 해시는 항상 계산)
+        workers: 프로세스 수 (0이면 CPU 수, 1이면 현재 프로세스에서 처리)
+
+    Returns:
+        int: 기록한 항목 수
+    """
+    files = list(_scan(directory))
+    jobs = [(str(path), hash_content) for path, _, _, _ in files]
+
+    catalog = CaptureCatalog(directory / CatalogConfig.FILE_NAME)
+    catalog.clear()
+    batch: List[CatalogEntry] = []
+    count = 0
+    try:
+        for (path, timestamp, bbox, mode), (info, error) in zip(files, _map_inspect(jobs, workers)):
+            if info is None:
+                logger.warning(f"카탈로그 rebuild 건너뜀: {path.name} ({error})")
+                continue
+            width, height, size, digest, phash = info
+            batch.append(CatalogEntry(
+                path=path.relative_to(directory).as_posix(),
+                timestamp=timestamp if timestamp is not None else path.stat().st_mtime,
+                bbox=bbox,
+                monitor=None,
+                mode=mode,
+                width=width,
+                height=height,
+                size=size,
+                hash=digest,
+                phash=phash,
+            ))
+            if len(batch) >= catalog.batch_size:
+                count += catalog.write(batch)
+                batch = []
+        if batch:
+            count += catalog.write(batch)
+    finally:
+        catalog.close()
+    logger.info(f"카탈로그 rebuild: {directory} ({count}개)")
+    return count
+
+
+def index_phashes(directory: Path, workers: int = CatalogConfig.WORKERS) -> int:
+    """
+    카탈로그에서 지각 해시가 없는 항목만 프로세스 풀에서 계산하여 채웁니다.
+
+    rebuild와 달리 기존 항목의 영역과 단계별 시간을 그대로 둡니다.
+
+    Args:
+        directory: 캡처 디렉토리 (카탈로그는 directory / CatalogConfig.FILE_NAME)
+        workers: 프로세스 수 (0이면 CPU 수, 1이면 현재 프로세스에서 처리)
+
+    Returns:
+        int: 지각 해시를 기록한 항목 수
+    """
+    catalog = CaptureCatalog(directory / CatalogConfig.FILE_NAME)
+    count = 0
+    try:
+        missing = catalog.missing_phashes()
+        jobs = [(str(directory / path), False) for _, path in missing]
+        phashes: Dict[int, int] = {}
+        for (row_id, path), (info, error) in zip(missing, _map_inspect(jobs, workers)):
+            if info is None:
+                logger.warning(f"지각 해시 계산 건너뜀: {path} ({error})")
+                continue
+            phashes[row_id] = info[4]
+            if len(phashes) >= catalog.batch_size:
+                count += catalog.set_phashes(phashes)
+                phashes = {}
+        if phashes:
+            count += catalog.set_phashes(phashes)
+    finally:
+        catalog.close()
+    logger.info(f"지각 해시 색인: {directory} ({count}개)")
+    return count
+
+
+# =============================================================================
+# 명령행
+# =============================================================================
+
+def _parse_time(value: str) -> float:
+    """ISO 시각 또는 epoch 초를 epoch 초로 변환합니다."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def _format_entry(entry: CatalogEntry) -> str:
+    """조회 결과 한 줄."""
+    bbox_text = ','.join(map(str, entry.bbox)) if entry.bbox else '-'
+    return (
+        f"{entry.captured_at:%Y-%m-%d %H:%M:%S}  {entry.width}x{entry.height}  "
+        f"bbox={bbox_text}  {entry.size}B  {entry.path}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령행 진입점.
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv)
+
+    Returns:
+        int: 종료 코드
+    """
+    parser = argparse.ArgumentParser(description="캡처 카탈로그")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rebuild = commands.add_parser('rebuild', help="캡처 디렉토리로부터 카탈로그 재구성")
+    rebuild.add_argument('directory', type=Path, help="캡처 디렉토리")
+    rebuild.add_argument('--no-hash', action='store_true', help="내용 해시 계산 생략 (빠름)")
+    rebuild.add_argument('--workers', type=int, default=CatalogConfig.WORKERS, help="프로세스 수 (0: CPU 수)")
+
+    index = commands.add_parser('index', help="지각 해시가 없는 항목만 색인")
+    index.add_argument('directory', type=Path, help="캡처 디렉토리")
+    index.add_argument('--workers', type=int, default=CatalogConfig.WORKERS, help="프로세스 수 (0: CPU 수)")
+
+    query = commands.add_parser('query', help="카탈로그 조회")
+    query.add_argument('directory', type=Path, help="캡처 디렉토리")
+    query.add_argument('--since', type=_parse_time, help="시작 시각 (ISO 또는 epoch)")
+    query.add_argument('--until', type=_parse_time, help="끝 시각 (ISO 또는 epoch)")
+    query.add_argument('--region', help="겹치는 영역 left,top,right,bottom")
+    query.add_argument('--hash', help="내용 해시")
+    query.add_argument('--limit', type=int, default=CatalogConfig.QUERY_LIMIT, help="최대 결과 수")
+
+    near = commands.add_parser('similar', help="비슷한 캡처 조회 (지각 해시)")
+    near.add_argument('directory', type=Path, help="캡처 디렉토리")
+    near.add_argument('target', help="기준 이미지 파일 또는 16진 지각 해시")
+    near.add_argument('--distance', '-d', type=int, default=CatalogConfig.SIMILAR_DISTANCE, help="최대 해밍 거리")
+    near.add_argument('--limit', type=int, default=CatalogConfig.QUERY_LIMIT, help="최대 결과 수")
+    args = parser.parse_args(argv)
+
+    if args.command in ('rebuild', 'index'):
+        start = time.perf_counter()
+        if args.command == 'rebuild':
+            count = rebuild_catalog(args.directory, hash_content=not args.no_hash, workers=args.workers)
+        else:
+            count = index_phashes(args.directory, workers=args.workers)
+        print(f"{count}개 기록 ({time.perf_counter() - start:.2f}s) → {args.directory / CatalogConfig.FILE_NAME}")
+        return 0
+
+    if args.command == 'similar':
+        if Path(args.target).is_file():
+            info, error = _inspect((args.target, False))
+            if info is None:
+                parser.error(f"이미지를 열 수 없습니다: {error}")
+            phash = info[4]
+        else:
+            try:
+                phash = similar.parse_hash(args.target)
+            except ValueError:
+                parser.error(f"파일도 16진 해시도 아닙니다: {args.target}")
+
+    catalog = CaptureCatalog(args.directory / CatalogConfig.FILE_NAME)
+    start = time.perf_counter()
+    if args.command == 'similar':
+        try:
+            matches = catalog.similar(phash, args.distance, args.limit)
+        except ValueError as e:
+            parser.error(str(e))
+        lines = [f"d={distance:2d}  {_format_entry(entry)}" for distance, entry in matches]
+    elif args.hash:
+        lines = [_format_entry(entry) for entry in catalog.by_hash(args.hash, args.limit)]
+    elif args.region:
+        try:
+            bbox = tuple(int(v) for v in args.region.split(','))
+        except ValueError:
+            bbox = ()
+        if len(bbox) != 4:
+            parser.error("--region은 left,top,right,bottom 형식이어야 합니다")
+        lines = [_format_entry(entry) for entry in catalog.overlapping(bbox, args.since, args.until, args.limit)]
+    else:
+        lines = [_format_entry(entry) for entry in catalog.by_time(args.since, args.until, args.limit)]
+    elapsed = (time.perf_counter() - start) * 1000.0
+    for line in lines:
+        print(line)
+    print(f"{len(lines)}개 ({elapsed:.1f}ms, 전체 {catalog.count()}개)")
+    catalog.close()
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+클립보드 MIME 데이터 모듈
+
+이 모듈은 캡처 이미지를 코덱 없이 클립보드에 올리고,
+PNG/JPEG/파일 URI 형식은 실제로 요청될 때만 만들어 제공하는
+지연 인코딩 QMimeData를 정의합니다.
+"""
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QMimeData, QUrl
+from PyQt5.QtGui import QImage
+
+from constants import CaptureConfig
+
+logger = logging.getLogger(__name__)
+
+
+class DeferredImageMimeData(QMimeData):
+    """
+    지연 인코딩 이미지 MIME 데이터.
+
+    원본 QImage(application/x-qt-image)는 즉시 제공하고,
+    image/png, image/jpeg은 붙여넣는 쪽이 해당 형식을 요청할 때
+    한 번만 인코딩하여 캐시합니다. 파일로 저장된 경우 text/uri-list도 제공합니다.
+
+    Attributes:
+        PNG_MIME: PNG MIME 타입
+        JPEG_MIME: JPEG MIME 타입
+        URI_MIME: 파일 URI 목록 MIME 타입
+
+    Example:
+        >>> mime = DeferredImageMimeData(qimage)
+        >>> QApplication.clipboard().setMimeData(mime)
+        >>> mime.set_file_path(Path("capture.png"))
+    """
+
+    PNG_MIME: str = "image/png"
+    JPEG_MIME: str = "image/jpeg"
+    URI_MIME: str = "text/uri-list"
+
+    _ENCODERS: Dict[str, str] = {
+        PNG_MIME: "PNG",
+        JPEG_MIME: "JPEG",
+    }
+
+    def __init__(self, image: QImage, file_path: Optional[Path] = None) -> None:
+        """
+        DeferredImageMimeData 인스턴스를 초기화합니다.
+
+        Args:
+            image: 클립보드에 올릴 이미지
+            file_path: 캡처가 저장된 파일 경로 (있는 경우)
+        """
+        super().__init__()
+        self._image: QImage = image
+        self._file_path: Optional[Path] = file_path
+        self._encoded: Dict[str, QByteArray] = {}
+        self.setImageData(image)
+
+    def set_file_path(self, file_path: Path) -> None:
+        """
+        저장된 파일 경로를 등록하여 파일 URI 형식을 제공합니다.
+
+        Args:
+            file_path: 캡처 파일 경로
+        """
+        self._file_path = file_path
+
+    def formats(self) -> List[str]:
+        """제공 가능한 MIME 형식 목록을 반환합니다."""
+        result = list(super().formats())
+        result.extend(mime for mime in self._ENCODERS if mime not in result)
+        if self._file_path is not None and self.URI_MIME not in result:
+            result.append(self.URI_MIME)
+        return result
+
+    def hasFormat(self, mime_type: str) -> bool:
+        """해당 MIME 형식 제공 여부를 반환합니다."""
+        return mime_type in self.formats()
+
+    def retrieveData(self, mime_type: str, preferred_type):
+        """
+        요청된 형식의 데이터를 반환합니다.
+
+        PNG/JPEG은 처음 요청될 때 인코딩합니다.
+
+        Args:
+            mime_type: 요청된 MIME 타입
+            preferred_type: 선호 데이터 타입 (QVariant.Type)
+        """
+        if mime_type in self._ENCODERS:
+            return self._encode(mime_type)
+        if mime_type == self.URI_MIME and self._file_path is not None:
+            url = QUrl.fromLocalFile(str(self._file_path.resolve()))
+            return QByteArray(url.toEncoded() + b"\r\n")
+        return super().retrieveData(mime_type, preferred_type)
+
+    def _encode(self, mime_type: str) -> QByteArray:
+        """
+        이미지를 지정 형식으로 인코딩하고 캐시합니다.
+
+        Args:
+            mime_type: PNG_MIME 또는 JPEG_MIME
+
+        Returns:
+            QByteArray: 인코딩된 바이트 (실패 시 빈 배열)
+        """
+        cached = self._encoded.get(mime_type)
+        if cached is not None:
+            return cached
+
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        quality = CaptureConfig.CLIPBOARD_JPEG_QUALITY if mime_type == self.JPEG_MIME else -1
+        if not self._image.save(buffer, self._ENCODERS[mime_type], quality):
+            logger.error(f"클립보드 {mime_type} 인코딩 실패")
+        buffer.close()
+
+        self._encoded[mime_type] = data
+        logger.debug(f"클립보드 {mime_type} 지연 인코딩 완료 ({data.size()} bytes)")
+        return data
@@ -0,0 +1,530 @@
+"""
+캡처 비교(visual diff) 모듈
+
+이 모듈은 ScreenCapture가 저장한 두 캡처(또는 두 디렉토리의 캡처 쌍)를 비교하여
+바뀐 픽셀 수와 영역을 보고하고, 변화를 표시한 히트맵 오버레이 이미지를 만듭니다.
+
+이미지를 고정 크기 타일로 나눠 타일 해시를 먼저 비교하고, 해시가 다른 타일 안에서만
+픽셀을 비교하므로 대부분이 같은 캡처 쌍은 해시 계산 비용만 듭니다.
+픽셀 비교는 채널별 허용 오차(안티에일리어싱 잡음)와 타일당 최소 변화 픽셀 수를 적용하며
+모두 PIL의 C 구현(ImageChops, point)으로 수행합니다.
+디렉토리 비교는 쌍마다 독립적이므로 프로세스 풀로 나눠 처리합니다.
+
+사용법:
+    python -m core.diff before.png after.png -o diff_out
+    python -m core.diff before_dir/ after_dir/ -o diff_out --tolerance 24 --workers 8
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from constants import DiffConfig
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+IMAGE_SUFFIXES: Tuple[str, ...] = ('.png', '.jpg', '.jpeg', '.bmp', '.webp')
+
+
+@dataclass(frozen=True)
+class DiffOptions:
+    """
+    비교 설정 (프로세스 풀로 전달되므로 불변 값 객체).
+
+    Attributes:
+        tile: 타일 한 변 크기 (픽셀)
+        tolerance: 변화로 보지 않을 채널별 최대 차이 (0~255)
+        min_tile_pixels: 타일을 변화로 볼 최소 변화 픽셀 수 (미만이면 잡음으로 무시)
+        overlay_alpha: 히트맵에서 변화 픽셀을 칠할 불투명도 (0~255)
+    """
+
+    tile: int = DiffConfig.TILE_SIZE
+    tolerance: int = DiffConfig.TOLERANCE
+    min_tile_pixels: int = DiffConfig.MIN_TILE_PIXELS
+    overlay_alpha: int = DiffConfig.OVERLAY_ALPHA
+
+
+@dataclass
+class DiffResult:
+    """
+    캡처 한 쌍의 비교 결과.
+
+    Attributes:
+        before: 기준 이미지 경로
+        after: 비교 이미지 경로
+        size: 이미지 크기 (너비, 높이)
+        changed_pixels: 허용 오차를 넘은 픽셀 수 (잡음으로 무시한 타일 제외)
+        total_pixels: 전체 픽셀 수
+        changed_tiles: 변화 타일 수
+        hashed_tiles: 해시가 달라 픽셀 비교를 수행한 타일 수
+        total_tiles: 전체 타일 수
+        regions: 인접한 변화 타일을 묶은 변화 영역 (left, top, right, bottom)
+        heatmap: 저장한 히트맵 경로 (변화가 없거나 저장하지 않았으면 None)
+        error: 비교 실패 시 오류 메시지 (크기 불일치 포함)
+    """
+
+    before: str
+    after: str
+    size: Tuple[int, int] = (0, 0)
+    changed_pixels: int = 0
+    total_pixels: int = 0
+    changed_tiles: int = 0
+    hashed_tiles: int = 0
+    total_tiles: int = 0
+    regions: List[BBox] = field(default_factory=list)
+    heatmap: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        """변화(또는 비교 실패) 여부."""
+        return self.error is not None or self.changed_tiles > 0
+
+    @property
+    def changed_fraction(self) -> float:
+        """변화 픽셀 비율 (0~1)."""
+        return self.changed_pixels / self.total_pixels if self.total_pixels else 0.0
+
+
+# =============================================================================
+# 이미지 비교
+# =============================================================================
+
+def _tiles(size: Tuple[int, int], tile: int) -> List[BBox]:
+    """이미지를 덮는 타일 영역 목록 (행 우선)."""
+    width, height = size
+    return [
+        (x, y, min(x + tile, width), min(y + tile, height))
+        for y in range(0, height, tile)
+        for x in range(0, width, tile)
+    ]
+
+
+def tile_hashes(image, tile: int = DiffConfig.TILE_SIZE) -> List[bytes]:
+    """
+    타일별 해시를 계산합니다.
+
+    Args:
+        image: RGB PIL 이미지
+        tile: 타일 한 변 크기 (픽셀)
+
+    Returns:
+        List[bytes]: 행 우선 순서의 타일 해시 (blake2b 8바이트)
+    """
+    return [
+        hashlib.blake2b(image.crop(box).tobytes(), digest_size=8).digest()
+        for box in _tiles(image.size, tile)
+    ]
+
+
+def change_mask(before, after, tolerance: int):
+    """
+    채널 차이가 tolerance를 넘는 픽셀의 마스크를 만듭니다.
+
+    Args:
+        before: RGB PIL 이미지
+        after: 같은 크기의 RGB PIL 이미지
+        tolerance: 변화로 보지 않을 채널별 최대 차이 (0~255)
+
+    Returns:
+        PIL.Image.Image: 변화 픽셀 255, 나머지 0인 'L' 이미지
+    """
+    from PIL import ImageChops
+
+    table = [0] * (tolerance + 1) + [255] * (255 - tolerance)
+    red, green, blue = ImageChops.difference(before, after).split()
+    return ImageChops.lighter(
+        ImageChops.lighter(red.point(table), green.point(table)),
+        blue.point(table)
+    )
+
+
+def _group_regions(tiles: Dict[Tuple[int, int], BBox]) -> List[BBox]:
+    """
+    인접한(대각선 포함) 변화 타일을 묶어 영역별 픽셀 bbox를 만듭니다.
+
+    Args:
+        tiles: (타일 열, 타일 행) → 타일 안 변화 픽셀의 bbox (이미지 좌표)
+
+    Returns:
+        List[BBox]: 위→아래, 왼쪽→오른쪽 순서의 변화 영역
+    """
+    regions: List[BBox] = []
+    seen = set()
+    for start in sorted(tiles, key=lambda key: (key[1], key[0])):
+        if start in seen:
+            continue
+        seen.add(start)
+        stack = [start]
+        left, top, right, bottom = tiles[start]
+        while stack:
+            tx, ty = stack.pop()
+            box = tiles[(tx, ty)]
+            left, top = min(left, box[0]), min(top, box[1])
+            right, bottom = max(right, box[2]), max(bottom, box[3])
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    neighbour = (tx + dx, ty + dy)
+                    if neighbour in tiles and neighbour not in seen:
+                        seen.add(neighbour)
+                        stack.append(neighbour)
+        regions.append((left, top, right, bottom))
+    return regions
+
+
+def diff_images(
+    before,
+    after,
+    options: DiffOptions = DiffOptions(),
+    before_name: str = '',
+    after_name: str = ''
+) -> Tuple[DiffResult, Optional[Any]]:
+    """
+    두 이미지를 타일 해시 → 타일 내부 픽셀 순서로 비교합니다.
+
+    Args:
+        before: 기준 PIL 이미지
+        after: 비교 PIL 이미지
+        options: 비교 설정
+        before_name: 결과에 기록할 기준 이미지 이름
+        after_name: 결과에 기록할 비교 이미지 이름
+
+    Returns:
+        Tuple[DiffResult, Optional[Image]]: (비교 결과, 전체 크기 변화 마스크 또는 None)
+    """
+    result = DiffResult(before=before_name, after=after_name, size=after.size)
+    if before.size != after.size:
+        result.error = (
+            f"크기 불일치: {before.size[0]}x{before.size[1]} → {after.size[0]}x{after.size[1]}"
+        )
+        return result, None
+
+    before = before.convert('RGB') if before.mode != 'RGB' else before
+    after = after.convert('RGB') if after.mode != 'RGB' else after
+    width, height = after.size
+    boxes = _tiles(after.size, options.tile)
+    cols = (width + options.tile - 1) // options.tile
+    result.total_pixels = width * height
+    result.total_tiles = len(boxes)
+
+    hashes_before = tile_hashes(before, options.tile)
+    hashes_after = tile_hashes(after, options.tile)
+
+    mask = None
+    changed: Dict[Tuple[int, int], BBox] = {}
+    for index, box in enumerate(boxes):
+        if hashes_before[index] == hashes_after[index]:
+            continue
+        result.hashed_tiles += 1
+        tile_mask = change_mask(before.crop(box), after.crop(box), options.tolerance)
+        count = tile_mask.histogram()[255]
+        if count < max(1, options.min_tile_pixels):
+            continue
+        left, top, right, bottom = tile_mask.getbbox()
+        changed[(index % cols, index // cols)] = (
+            box[0] + left, box[1] + top, box[0] + right, box[1] + bottom
+        )
+        result.changed_pixels += count
+        if mask is None:
+            from PIL import Image
+            mask = Image.new('L', after.size, 0)
+        mask.paste(tile_mask, box[:2])
+
+    result.changed_tiles = len(changed)
+    result.regions = _group_regions(changed)
+    return result, mask
+
+
+def write_heatmap(after, mask, regions: List[BBox], path: Path, alpha: int) -> None:
+    """
+    비교 이미지를 흐리게 깔고 변화 픽셀과 변화 영역을 표시한 오버레이를 저장합니다.
+
+    Args:
+        after: 비교 PIL 이미지
+        mask: 변화 마스크 ('L')
+        regions: 변화 영역 목록
+        path: 저장 경로
+        alpha: 변화 픽셀을 칠할 불투명도 (0~255)
+    """
+    from PIL import Image, ImageDraw
+
+    base = Image.blend(after.convert('RGB'), Image.new('RGB', after.size, (0, 0, 0)), 0.5)
+    highlight = Image.new('RGB', after.size, DiffConfig.HIGHLIGHT_COLOR)
+    base.paste(highlight, mask=mask.point([0] + [alpha] * 255))
+    draw = ImageDraw.Draw(base)
+    for left, top, right, bottom in regions:
+        draw.rectangle(
+            (left - 2, top - 2, right + 1, bottom + 1), outline=DiffConfig.REGION_COLOR, width=2
+        )
+    base.save(str(path), format='PNG')
+
+
+def diff_pair(
+    before_path: str,
+    after_path: str,
+    heatmap_path: Optional[str] = None,
+    options: DiffOptions = DiffOptions()
+) -> DiffResult:
+    """
+    저장된 캡처 한 쌍을 비교합니다 (프로세스 풀 작업 단위).
+
+    Args:
+        before_path: 기준 이미지 경로
+        after_path: 비교 이미지 경로
+        heatmap_path: 변화가 있을 때 히트맵을 저장할 경로 (None이면 저장 안 함)
+        options: 비교 설정
+
+    Returns:
+        DiffResult: 비교 결과 (예외는 error에 기록)
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(before_path) as before, Image.open(after_path) as after:
+            before, after = before.convert('RGB'), after.convert('RGB')
+        result, mask = diff_images(before, after, options, before_path, after_path)
+        if heatmap_path and mask is not None:
+            Path(heatmap_path).parent.mkdir(parents=True, exist_ok=True)
+            write_heatmap(after, mask, result.regions, Path(heatmap_path), options.overlay_alpha)
+            result.heatmap = heatmap_path
+        return result
+    except Exception as e:
+        return DiffResult(before=before_path, after=after_path, error=f"{type(e).__name__}: {e}")
+
+
+# =============================================================================
+# 디렉토리 비교
+# =============================================================================
+
+def _images(directory: Path) -> Dict[str, Path]:
+    """디렉토리 아래 이미지 파일 (상대 경로 → 경로)."""
+    return {
+        path.relative_to(directory).as_posix(): path
+        for path in sorted(directory.rglob('*'))
+        if path.suffix.lower() in IMAGE_SUFFIXES and path.is_file()
+    }
+
+
+def pair_files(
+    before_dir: Path,
+    after_dir: Path,
+    by_order: bool = False
+) -> Tuple[List[Tuple[str, Path, Path]], List[str], List[str]]:
+    """
+    두 디렉토리의 이미지를 짝짓습니다.
+
+    Args:
+        before_dir: 기준 디렉토리
+        after_dir: 비교 디렉토리
+        by_order: True면 이름 대신 정렬 순서로 짝지음 (시각이 붙은 캡처 파일명용)
+
+    Returns:
+        Tuple: ([(이름, 기준 경로, 비교 경로)], 기준에만 있는 이름, 비교에만 있는 이름)
+    """
+    before, after = _images(before_dir), _images(after_dir)
+    if by_order:
+        names_before, names_after = list(before), list(after)
+        count = min(len(names_before), len(names_after))
+        pairs = [
+            (names_after[i], before[names_before[i]], after[names_after[i]])
+            for i in range(count)
+        ]
+        return pairs, names_before[count:], names_after[count:]
+
+    pairs = [(name, before[name], after[name]) for name in before if name in after]
+    only_before = [name for name in before if name not in after]
+    only_after = [name for name in after if name not in before]
+    return pairs, only_before, only_after
+
+
+def _heatmap_path(output_dir: Path, name: str) -> str:
+    """비교 이름에 대응하는 히트맵 경로."""
+    return str(output_dir / Path(name).with_suffix('.diff.png'))
+
+
+def _diff_star(args: Tuple[str, str, Optional[str], DiffOptions]) -> DiffResult:
+    """executor.map용 인자 풀기."""
+    return diff_pair(*args)
+
+
+def diff_directories(
+    before_dir: Path,
+    after_dir: Path,
+    output_dir: Path,
+    options: DiffOptions = DiffOptions(),
+    workers: int = DiffConfig.WORKERS,
+    by_order: bool = False
+) -> Dict[str, Any]:
+    """
+    두 디렉토리의 캡처 쌍을 프로세스 풀에서 비교하고 보고서를 기록합니다.
+
+    Args:
+        before_dir: 기준 디렉토리
+        after_dir: 비교 디렉토리
+        output_dir: 히트맵과 보고서(DiffConfig.REPORT_FILE)를 저장할 디렉토리
+        options: 비교 설정
+        workers: 프로세스 수 (0이면 CPU 수, 1이면 현재 프로세스에서 처리)
+        by_order: 이름 대신 정렬 순서로 짝지을지 여부
+
+    Returns:
+        Dict[str, Any]: 보고서 (summary, results, only_before, only_after)
+    """
+    pairs, only_before, only_after = pair_files(before_dir, after_dir, by_order)
+    jobs = [
+        (str(before), str(after), _heatmap_path(output_dir, name), options)
+        for name, before, after in pairs
+    ]
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"캡처 비교: {len(jobs)}쌍, 프로세스 {workers}개")
+
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_diff_star(job) for job in jobs]
+    else:
+        chunksize = max(1, min(DiffConfig.CHUNK_SIZE, len(jobs) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_diff_star, jobs, chunksize=chunksize))
+
+    report = build_report(results, only_before, only_after, options)
+    report['before'], report['after'] = str(before_dir), str(after_dir)
+    write_report(report, output_dir / DiffConfig.REPORT_FILE)
+    return report
+
+
+def build_report(
+    results: List[DiffResult],
+    only_before: List[str],
+    only_after: List[str],
+    options: DiffOptions
+) -> Dict[str, Any]:
+    """
+    비교 결과 목록을 보고서로 만듭니다.
+
+    Args:
+        results: 비교 결과
+        only_before: 기준에만 있는 이름
+        only_after: 비교에만 있는 이름
+        options: 비교 설정
+
+    Returns:
+        Dict[str, Any]: JSON으로 기록할 보고서
+    """
+    errors = sum(1 for result in results if result.error is not None)
+    changed = sum(1 for result in results if result.changed and result.error is None)
+    return {
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'options': asdict(options),
+        'summary': {
+            'pairs': len(results),
+            'changed': changed,
+            'unchanged': len(results) - changed - errors,
+            'errors': errors,
+            'only_before': len(only_before),
+            'only_after': len(only_after),
+        },
+        'results': [
+            dict(asdict(result), changed_fraction=result.changed_fraction)
+            for result in results
+        ],
+        'only_before': only_before,
+        'only_after': only_after,
+    }
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    """
+    보고서를 JSON으로 기록합니다.
+
+    Args:
+        report: 보고서
+        path: 저장 경로
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+# =============================================================================
+# 명령행
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    명령행 진입점.
+
+    Args:
+        argv: 명령행 인자 (None이면 sys.argv)
+
+    Returns:
+        int: 종료 코드 (0: 변화 없음, 1: 변화 있음, 2: 오류)
+    """
+    parser = argparse.ArgumentParser(description="캡처 비교 (타일 해시 + 픽셀 diff)")
+    parser.add_argument('before', type=Path, help="기준 캡처 파일 또는 디렉토리")
+    parser.add_argument('after', type=Path, help="비교 캡처 파일 또는 디렉토리")
+    parser.add_argument(
+        '-o', '--output', type=Path, default=Path('diff_out'), help="히트맵/보고서 저장 디렉토리"
+    )
+    parser.add_argument('--tile', type=int, default=DiffConfig.TILE_SIZE, help="타일 크기 (픽셀)")
+    parser.add_argument(
+        '--tolerance', type=int, default=DiffConfig.TOLERANCE, help="채널별 허용 차이 (0~255)"
+    )
+    parser.add_argument(
+        '--min-pixels', type=int, default=DiffConfig.MIN_TILE_PIXELS,
+        help="타일을 변화로 볼 최소 변화 픽셀 수"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=DiffConfig.WORKERS, help="프로세스 수 (0: CPU 수)"
+    )
+    parser.add_argument(
+        '--by-order', action='store_true', help="디렉토리 비교 시 파일명 대신 정렬 순서로 짝지음"
+    )
+    args = parser.parse_args(argv)
+    if not 0 <= args.tolerance <= 255 or args.tile <= 0:
+        parser.error("tolerance는 0~255, tile은 1 이상이어야 합니다")
+
+    options = DiffOptions(
+        tile=args.tile, tolerance=args.tolerance, min_tile_pixels=args.min_pixels
+    )
+    if args.before.is_dir() and args.after.is_dir():
+        report = diff_directories(
+            args.before, args.after, args.output, options, args.workers, args.by_order
+        )
+        summary = report['summary']
+        print(
+            f"{summary['pairs']}쌍: 변화 {summary['changed']}, 같음 {summary['unchanged']}, "
+            f"오류 {summary['errors']}, 기준에만 {summary['only_before']}, "
+            f"비교에만 {summary['only_after']} → {args.output / DiffConfig.REPORT_FILE}"
+        )
+        if summary['errors']:
+            return 2
+        return 1 if summary['changed'] or summary['only_before'] or summary['only_after'] else 0
+
+    if args.before.is_dir() or args.after.is_dir():
+        parser.error("before와 after는 둘 다 파일이거나 둘 다 디렉토리여야 합니다")
+
+    result = diff_pair(
+        str(args.before), str(args.after),
+        _heatmap_path(args.output, args.after.name), options
+    )
+    write_report(build_report([result], [], [], options), args.output / DiffConfig.REPORT_FILE)
+    if result.error is not None:
+        print(f"오류: {result.error}")
+        return 2
+    print(
+        f"변화 픽셀 {result.changed_pixels} ({result.changed_fraction:.4%}), "
+        f"변화 타일 {result.changed_tiles}/{result.total_tiles}, 영역 {len(result.regions)}개"
+        + (f" → {result.heatmap}" if result.heatmap else "")
+    )
+    return 1 if result.changed else 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(message)s')
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+캡처 프레임 모듈
+
+이 모듈은 grab 결과의 BGRA 픽셀 버퍼를 복사 없이 감싸는
+경량 프레임 객체를 제공합니다. PIL/QImage 변환은 요청 시에만 수행되므로
+해시, 비교, 프로세스 간 전달처럼 이미지 객체가 필요 없는 소비자는
+추가 복사 없이 버퍼를 사용할 수 있습니다.
+"""
+import datetime
+import time
+from typing import Any, Optional, Tuple
+
+
+class CaptureFrame:
+    """
+    BGRA 캡처 프레임.
+
+    버퍼 프로토콜을 지원하므로 memoryview(frame), hashlib 등에
+    그대로 넘길 수 있습니다 (Python 3.12+). 이전 버전에서는 frame.buffer를 사용합니다.
+
+    Attributes:
+        width: 너비 (픽셀)
+        height: 높이 (픽셀)
+        stride: 한 행의 바이트 수
+        timestamp: 캡처 시각 (epoch 초)
+        bbox: 캡처 영역 (left, top, right, bottom)
+
+    Example:
+        >>> frame = capturer.grab_frame((0, 0, 800, 600))
+        >>> digest = hashlib.blake2b(frame.buffer).hexdigest()
+        >>> image = frame.to_pil()  # 필요할 때만 변환
+    """
+
+    BYTES_PER_PIXEL: int = 4
+
+    __slots__ = (
+        '_data', 'width', 'height', 'stride', 'timestamp', 'bbox',
+        '_offset', '_pil', '_qimage'
+    )
+
+    def __init__(
+        self,
+        data: Any,
+        width: int,
+        height: int,
+        stride: Optional[int] = None,
+        timestamp: Optional[float] = None,
+        bbox: Optional[Tuple[int, int, int, int]] = None,
+        offset: int = 0
+    ) -> None:
+        """
+        CaptureFrame 인스턴스를 초기화합니다.
+
+        Args:
+            data: BGRA 픽셀 버퍼 (bytes, bytearray, memoryview 등)
+            width: 너비 (픽셀)
+            height: 높이 (픽셀)
+            stride: 한 행의 바이트 수 (None이면 width * 4)
+            timestamp: 캡처 시각 (None이면 현재 시각)
+            bbox: 캡처 영역 (None이면 (0, 0, width, height))
+            offset: 버퍼 내 첫 픽셀의 바이트 위치
+        """
+        self._data = data
+        self.width: int = width
+        self.height: int = height
+        self.stride: int = stride or width * self.BYTES_PER_PIXEL
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.bbox: Tuple[int, int, int, int] = bbox or (0, 0, width, height)
+        self._offset: int = offset
+        self._pil = None
+        self._qimage = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(너비, 높이)."""
+        return (self.width, self.height)
+
+    @property
+    def nbytes(self) -> int:
+        """버퍼가 차지하는 바이트 수 (마지막 행은 실제 픽셀 길이까지)."""
+        if self.height == 0:
+            return 0
+        return self.stride * (self.height - 1) + self.width * self.BYTES_PER_PIXEL
+
+    @property
+    def is_contiguous(self) -> bool:
+        """행 사이에 여백이 없는지 여부."""
+        return self.stride == self.width * self.BYTES_PER_PIXEL
+
+    @property
+    def buffer(self) -> memoryview:
+        """BGRA 픽셀 버퍼에 대한 읽기 전용 memoryview (복사 없음)."""
+        view = memoryview(self._data).cast('B')
+        return view[self._offset:self._offset + self.nbytes].toreadonly()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """버퍼 프로토콜 (PEP 688)."""
+        return self.buffer
+
+    @property
+    def captured_at(self) -> datetime.datetime:
+        """캡처 시각 (로컬 datetime)."""
+        return datetime.datetime.fromtimestamp(self.timestamp)
+
+    def row(self, y: int) -> memoryview:
+        """
+        한 행의 BGRA 바이트를 반환합니다 (복사 없음).
+
+        Args:
+            y: 행 번호
+
+        Returns:
+            memoryview: width * 4 바이트
+        """
+        start = y * self.stride
+        return self.buffer[start:start + self.width * self.BYTES_PER_PIXEL]
+
+    def crop(self, bbox: Tuple[int, int, int, int]) -> 'CaptureFrame':
+        """
+        화면 좌표 영역을 잘라낸 프레임을 반환합니다 (복사 없음).
+
+        반환된 프레임은 같은 버퍼를 offset/stride로 가리키며, 영역은 프레임 범위로 제한됩니다.
+
+        Args:
+            bbox: 잘라낼 영역 (left, top, right, bottom), 화면 좌표
+
+        Returns:
+            CaptureFrame: 잘라낸 프레임 (겹치는 영역이 없으면 크기 0)
+        """
+        frame_left, frame_top, _, _ = self.bbox
+        left = min(max(bbox[0], frame_left), frame_left + self.width)
+        top = min(max(bbox[1], frame_top), frame_top + self.height)
+        right = min(max(bbox[2], left), frame_left + self.width)
+        bottom = min(max(bbox[3], top), frame_top + self.height)
+        offset = (
+            self._offset
+            + (top - frame_top) * self.stride
+            + (left - frame_left) * self.BYTES_PER_PIXEL
+        )
+        return CaptureFrame(
+            self._data,
+            right - left,
+            bottom - top,
+            stride=self.stride,
+            timestamp=self.timestamp,
+            bbox=(left, top, right, bottom),
+            offset=offset
+        )
+
+    def tobytes(self) -> bytes:
+        """
+        행 여백 없이 연속된 BGRA 바이트를 반환합니다 (복사).
+
+        Returns:
+            bytes: width * height * 4 바이트
+        """
+        if self.is_contiguous:
+            return self.buffer.tobytes()
+        return b''.join(self.row(y) for y in range(self.height))
+
+    def to_pil(self):
+        """
+        PIL RGB 이미지로 변환합니다 (최초 1회 변환 후 캐시).
+
+        Returns:
+            PIL.Image.Image: RGB 이미지
+        """
+        if self._pil is None:
+            from PIL import Image as PILImage
+
+            # BGRA → RGB 변환
+            self._pil = PILImage.frombuffer(
+                'RGB',
+                self.size,
+                self.buffer,
+                'raw',
+                'BGRX',
+                self.stride,
+                1
+            )
+        return self._pil
+
+    def to_qimage(self, copy: bool = True):
+        """
+        QImage(Format_RGB32)로 변환합니다 (코덱 없음).
+
+        리틀 엔디언에서 BGRA 바이트 배열은 Format_RGB32와 메모리 배치가 같습니다.
+
+        Args:
+            copy: True면 자체 버퍼를 가진 QImage(memcpy 1회),
+                False면 프레임 버퍼를 그대로 참조하는 QImage (프레임보다 오래 쓰면 안 됨)
+
+        Returns:
+            QImage: RGB32 이미지
+        """
+        if self._qimage is None:
+            from PyQt5 import sip
+            from PyQt5.QtGui import QImage
+
+            # QImage는 버퍼를 소유하지 않으므로 view를 함께 보관
+            view = self.buffer
+            qimage = QImage(
+                sip.voidptr(view),
+                self.width,
+                self.height,
+                self.stride,
+                QImage.Format_RGB32
+            )
+            self._qimage = (qimage, view)
+        qimage = self._qimage[0]
+        return qimage.copy() if copy else qimage
@@ -0,0 +1,311 @@
+"""
+단일 인스턴스 모듈
+
+이 모듈은 실행 중인 프로세스가 로컬 소켓(QLocalServer)으로 명령을 받고,
+이후 실행된 프로세스가 명령만 전달한 뒤 바로 종료하는 단일 인스턴스 모드를 제공합니다.
+전달 측(send_commands)은 표준 라이브러리만 사용하므로 PyQt5/PIL을 로드하지 않으며,
+로깅 설정보다 먼저 호출해도 됩니다.
+
+프로토콜: UTF-8 JSON 한 줄 {"commands": [{"command": ..., ...}, ...]}
+"""
+import getpass
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from constants import InstanceConfig
+
+logger = logging.getLogger(__name__)
+
+Command = Dict[str, Any]
+
+# 지원하는 명령 이름
+COMMANDS: Tuple[str, ...] = ('mode', 'show', 'capture')
+
+
+def server_name() -> str:
+    """
+    현재 사용자의 서버 이름을 반환합니다.
+
+    Unix에서는 소켓 파일의 전체 경로를, Windows에서는 named pipe 이름을 사용하므로
+    Qt 서버와 표준 라이브러리 클라이언트가 같은 주소를 계산합니다.
+
+    Returns:
+        str: QLocalServer.listen()에 넘길 이름
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = 'user'
+    name = f"{InstanceConfig.SERVER_NAME}-{user}"
+    if sys.platform == 'win32':
+        return name
+    return os.path.join(tempfile.gettempdir(), f"{name}.sock")
+
+
+def parse_region(text: str) -> Tuple[int, int, int, int]:
+    """
+    'x,y,w,h' 문자열을 영역으로 변환합니다.
+
+    Args:
+        text: 예) '100,200,800,600'
+
+    Returns:
+        Tuple[int, int, int, int]: (x, y, w, h)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 크기가 0 이하인 경우
+    """
+    parts = [int(part) for part in text.split(',')]
+    if len(parts) != 4:
+        raise ValueError(f"영역은 x,y,w,h 형식이어야 합니다: {text}")
+    x, y, w, h = parts
+    if w <= 0 or h <= 0:
+        raise ValueError(f"영역 크기는 0보다 커야 합니다: {text}")
+    return (x, y, w, h)
+
+
+def encode_commands(commands: List[Command]) -> bytes:
+    """
+    명령 목록을 전송용 한 줄 JSON으로 직렬화합니다.
+
+    Args:
+        commands: 명령 목록
+
+    Returns:
+        bytes: 개행으로 끝나는 UTF-8 바이트
+    """
+    return (json.dumps({'commands': commands}, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def decode_commands(data: bytes) -> List[Command]:
+    """
+    수신한 한 줄 JSON을 명령 목록으로 변환합니다.
+
+    Args:
+        data: 수신 바이트
+
+    Returns:
+        List[Command]: 명령 목록
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    message = json.loads(data.decode('utf-8'))
+    commands = message.get('commands') if isinstance(message, dict) else None
+    if not isinstance(commands, list):
+        raise ValueError("commands 목록이 없습니다")
+    for command in commands:
+        # 이름은 문자열만 허용 (리스트/딕셔너리는 해시할 수 없어 조회에서 TypeError)
+        name = command.get('command') if isinstance(command, dict) else None
+        if not isinstance(name, str) or name not in COMMANDS:
+            raise ValueError(f"알 수 없는 명령: {command}")
+        if name == 'mode' and not isinstance(command.get('mode'), str):
+            raise ValueError(f"mode는 문자열이어야 합니다: {command}")
+        if name == 'capture' and not _is_region(command.get('region')):
+            raise ValueError(f"region은 [x, y, w, h] 정수 목록이나 null이어야 합니다: {command}")
+    return commands
+
+
+def _is_region(value: Any) -> bool:
+    """None 또는 정수 4개로 된 목록인지 확인합니다 (bool 제외)."""
+    if value is None:
+        return True
+    return (
+        isinstance(value, list)
+        and len(value) == 4
+        and all(isinstance(v, int) and not isinstance(v, bool) for v in value)
+    )
+
+
+def send_commands(
+    commands: List[Command],
+    name: Optional[str] = None,
+    timeout: float = InstanceConfig.CONNECT_TIMEOUT
+) -> bool:
+    """
+    실행 중인 인스턴스에 명령을 전달합니다.
+
+    Args:
+        commands: 전달할 명령 목록 (비어 있으면 연결 여부만 확인)
+        name: 서버 이름 (None이면 server_name())
+        timeout: 연결 제한 시간 (초)
+
+    Returns:
+        bool: 실행 중인 인스턴스에 전달했으면 True, 인스턴스가 없으면 False
+    """
+    name = name or server_name()
+    payload = encode_commands(commands)
+    if sys.platform == 'win32':
+        return _send_pipe(name, payload, timeout)
+    return _send_unix(name, payload, timeout)
+
+
+def _send_unix(path: str, payload: bytes, timeout: float) -> bool:
+    """Unix 도메인 소켓으로 전달합니다."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        sock.sendall(payload)
+        return True
+    except OSError:
+        # 소켓 파일이 없거나 이전 프로세스가 남긴 파일(연결 거부)
+        return False
+    finally:
+        sock.close()
+
+
+def _send_pipe(name: str, payload: bytes, timeout: float) -> bool:
+    """Windows named pipe로 전달합니다 (서버가 바쁘면 timeout까지 재시도)."""
+    path = rf"\\.\pipe\{name}"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with open(path, 'r+b', buffering=0) as pipe:
+                pipe.write(payload)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError:
+            # ERROR_PIPE_BUSY: 서버가 다음 연결을 준비 중
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+
+class InstanceServer:
+    """
+    실행 중인 인스턴스의 명령 수신 서버.
+
+    수신한 명령은 GUI 스레드에서 handler로 전달됩니다.
+    handler는 실패 시 오류 메시지를, 성공 시 None을 반환합니다.
+
+    Example:
+        >>> server = InstanceServer(window.execute_command)
+        >>> server.listen()
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Command], Optional[str]],
+        name: Optional[str] = None
+    ) -> None:
+        """
+        InstanceServer 인스턴스를 초기화합니다.
+
+        Args:
+            handler: 명령 처리 함수
+            name: 서버 이름 (None이면 server_name())
+        """
+        from PyQt5.QtNetwork import QLocalServer
+
+        self.name: str = name or server_name()
+        self._handler = handler
+        self._server = QLocalServer()
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers: Dict[Any, bytearray] = {}
+
+    def listen(self) -> bool:
+        """
+        명령 수신을 시작합니다.
+
+        이전 프로세스가 비정상 종료하여 남긴 소켓은 제거 후 다시 시도합니다.
+        (send_commands가 False를 반환한 뒤 호출하므로 살아 있는 서버는 없음)
+
+        Returns:
+            bool: 수신 시작 여부
+        """
+        from PyQt5.QtNetwork import QAbstractSocket, QLocalServer
+
+        if self._server.listen(self.name):
+            logger.info(f"단일 인스턴스 서버 시작: {self.name}")
+            return True
+
+        if self._server.serverError() == QAbstractSocket.AddressInUseError:
+            QLocalServer.removeServer(self.name)
+            if self._server.listen(self.name):
+                logger.info(f"남은 소켓 제거 후 단일 인스턴스 서버 시작: {self.name}")
+                return True
+
+        logger.warning(f"단일 인스턴스 서버 시작 실패: {self._server.errorString()}")
+        return False
+
+    def close(self) -> None:
+        """서버를 닫습니다."""
+        self._server.close()
+
+    def _on_new_connection(self) -> None:
+        """새 연결을 받아 읽기 시그널을 연결합니다."""
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            self._buffers[conn] = bytearray()
+            conn.readyRead.connect(lambda c=conn: self._on_ready_read(c))
+            conn.disconnected.connect(lambda c=conn: self._on_disconnected(c))
+
+    def _on_ready_read(self, conn) -> None:
+        """
+        수신 데이터를 모아 한 줄이 완성되면 명령을 실행합니다.
+
+        Args:
+            conn: QLocalSocket
+        """
+        buffer = self._buffers.get(conn)
+        if buffer is None:
+            return
+        buffer.extend(bytes(conn.readAll()))
+        if len(buffer) > InstanceConfig.MAX_MESSAGE_BYTES:
+            logger.warning("단일 인스턴스 메시지가 너무 큼, 연결 종료")
+            # abort()가 disconnected를 바로 내보내므로 남은 데이터가 실행되지 않도록 먼저 버림
+            self._buffers.pop(conn, None)
+            conn.abort()
+            return
+
+        while b'\n' in buffer:
+            line, _, rest = bytes(buffer).partition(b'\n')
+            buffer[:] = rest
+            self._dispatch(line)
+
+    def _on_disconnected(self, conn) -> None:
+        """
+        연결 종료 시 남은 데이터(개행 없는 마지막 줄)를 처리하고 정리합니다.
+
+        Args:
+            conn: QLocalSocket
+        """
+        buffer = self._buffers.pop(conn, None)
+        if buffer:
+            self._dispatch(bytes(buffer))
+        conn.deleteLater()
+
+    def _dispatch(self, line: bytes) -> None:
+        """
+        한 줄의 명령 목록을 순서대로 실행합니다.
+
+        Args:
+            line: 수신한 JSON 한 줄
+        """
+        if not line.strip():
+            return
+        try:
+            commands = decode_commands(line)
+        except ValueError as e:
+            logger.warning(f"잘못된 단일 인스턴스 명령: {e}")
+            return
+
+        for command in commands:
+            logger.info(f"전달받은 명령 실행: {command}")
+            try:
+                error = self._handler(command)
+            except Exception as e:
+                # Qt 슬롯에서 예외가 전파되지 않도록 기록 후 다음 명령 진행
+                logger.error(f"명령 처리 중 오류 ({command.get('command')}): {e}")
+                continue
+            if error is not None:
+                logger.warning(f"명령 실패 ({command.get('command')}): {error}")
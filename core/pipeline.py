@@ -0,0 +1,502 @@
+"""
+캡처 처리 파이프라인 모듈
+
+이 모듈은 픽셀 grab 이후의 변환, 인코딩, 파일 쓰기를 작업 스레드 풀에서
+수행하고 완료 결과를 Qt 시그널로 GUI 스레드에 전달합니다.
+GUI 스레드에서는 grab과 클립보드 설정(BGRA 버퍼 memcpy)만 수행합니다.
+"""
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from constants import BurstConfig, CaptureConfig
+from core.burst import BurstRecorder, BurstResult, encode_burst
+from core.capture import ScreenCapture
+from core.clipboard import DeferredImageMimeData
+from core.frame import CaptureFrame
+from core.regions import MultiRegionResult, encode_regions
+from core.telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CaptureResult:
+    """
+    캡처 작업 결과.
+
+    Attributes:
+        job_id: 작업 번호
+        bbox: 캡처 영역 (left, top, right, bottom)
+        copy_to_clipboard: 클립보드 복사 요청 여부
+        save_to_file: 파일 저장 요청 여부
+        file_path: 저장된 파일 경로 (실패 또는 미요청 시 None)
+        clipboard_ok: 클립보드 복사 성공 여부
+        error: 실패 시 오류 메시지
+        timings: 단계 이름 → 소요 시간 (ms, 카탈로그에 함께 기록)
+    """
+
+    job_id: int
+    bbox: Tuple[int, int, int, int]
+    copy_to_clipboard: bool
+    save_to_file: bool
+    file_path: Optional[Path] = None
+    clipboard_ok: bool = False
+    error: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """요청된 모든 단계가 성공했는지 여부."""
+        return (
+            (not self.copy_to_clipboard or self.clipboard_ok)
+            and (not self.save_to_file or self.file_path is not None)
+        )
+
+
+class CapturePipeline(QObject):
+    """
+    비동기 캡처 파이프라인.
+
+    submit()은 GUI 스레드에서 grab만 수행한 뒤 즉시 반환하고,
+    변환/인코딩/쓰기는 작업 스레드 풀에서 진행됩니다.
+    대기 중인 작업이 max_pending에 도달하면 새 요청을 거부하여
+    단축키를 누르고 있어도 UI가 멈추지 않습니다.
+
+    Signals:
+        capture_finished: 작업 완료 시 CaptureResult 전달 (GUI 스레드)
+        queue_changed: 대기 중인 작업 수 변경 시 전달
+        burst_captured: 버스트 캡처 루프 종료 시 BurstResult 전달 (인코딩 전)
+        burst_finished: 버스트 인코딩/저장 완료 시 BurstResult 전달
+        regions_finished: 다중 영역 저장 완료 시 MultiRegionResult 전달
+
+    Example:
+        >>> pipeline = CapturePipeline(ScreenCapture())
+        >>> pipeline.capture_finished.connect(on_finished)
+        >>> pipeline.submit((0, 0, 800, 600))
+    """
+
+    capture_finished = pyqtSignal(object)
+    queue_changed = pyqtSignal(int)
+    burst_captured = pyqtSignal(object)
+    burst_finished = pyqtSignal(object)
+    regions_finished = pyqtSignal(object)
+
+    # 작업 스레드 → GUI 스레드 (내부용, QueuedConnection으로 전달됨)
+    _job_done = pyqtSignal(object)
+    _regions_done = pyqtSignal(object)
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        max_workers: int = CaptureConfig.WORKER_COUNT,
+        max_pending: int = CaptureConfig.MAX_PENDING,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        CapturePipeline 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab 및 인코딩에 사용할 ScreenCapture
+            max_workers: 작업 스레드 수
+            max_pending: 동시에 대기할 수 있는 최대 작업 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self._capturer: ScreenCapture = capturer
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='capture-worker'
+        )
+        self._max_pending: int = max_pending
+        self._pending: int = 0
+        self._job_ids = itertools.count(1)
+        self._shutdown: bool = False
+
+        # 파일 저장 후 파일 URI를 붙일 클립보드 MIME 데이터 (작업 번호별)
+        self._clipboard_mime: Dict[int, DeferredImageMimeData] = {}
+
+        # 전체 소요 시간 계측용 시작 시각 (작업 번호별, 계측 활성 시에만 사용)
+        self._started_at: Dict[int, float] = {}
+
+        self._burst_thread: Optional[threading.Thread] = None
+
+        self._job_done.connect(self._on_job_done)
+        self._regions_done.connect(self._on_regions_done)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """인코딩/저장 작업 스레드 풀 (타임랩스 등 다른 모드와 공유)."""
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        """대기 또는 처리 중인 작업 수."""
+        return self._pending
+
+    def is_full(self) -> bool:
+        """
+        대기열이 가득 찼는지 확인합니다.
+
+        Returns:
+            bool: 새 작업을 받을 수 없으면 True
+        """
+        return self._pending >= self._max_pending
+
+    def submit(
+        self,
+        bbox: Tuple[int, int, int, int],
+        copy_to_clipboard: bool = True,
+        save_to_file: bool = True,
+        started_at: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        영역을 grab하고 후처리를 작업 스레드에 예약합니다.
+
+        클립보드는 grab 직후 BGRA 버퍼로 바로 설정하며,
+        파일 저장이 없으면 작업 스레드를 거치지 않고 완료됩니다.
+        GUI 스레드에서 호출해야 합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            copy_to_clipboard: 클립보드에 복사 여부
+            save_to_file: 파일로 저장 여부
+            started_at: 전체 소요 시간 계측 시작 시각 (perf_counter, None이면 지금)
+
+        Returns:
+            Optional[int]: 작업 번호, 대기열이 가득 찼거나 grab 실패 시 None
+        """
+        if self._shutdown:
+            return None
+        if self.is_full():
+            logger.warning(f"캡처 대기열 가득 참 ({self._pending}/{self._max_pending})")
+            return None
+
+        if started_at is None:
+            started_at = time.perf_counter()
+        job_id = next(self._job_ids)
+
+        grab_start = time.perf_counter()
+        with telemetry.span('grab', job_id):
+            frame = self._capturer.grab_frame(bbox)
+        if frame is None:
+            return None
+        timings = {'grab': (time.perf_counter() - grab_start) * 1000.0}
+        return self._dispatch(job_id, frame, copy_to_clipboard, save_to_file, started_at, timings)
+
+    def submit_frame(
+        self,
+        frame: CaptureFrame,
+        copy_to_clipboard: bool = True,
+        save_to_file: bool = True,
+        started_at: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        이미 grab한 프레임(정지 화면에서 잘라낸 영역 등)의 후처리를 예약합니다.
+
+        GUI 스레드에서 호출해야 합니다.
+
+        Args:
+            frame: 처리할 프레임
+            copy_to_clipboard: 클립보드에 복사 여부
+            save_to_file: 파일로 저장 여부
+            started_at: 전체 소요 시간 계측 시작 시각 (perf_counter, None이면 지금)
+
+        Returns:
+            Optional[int]: 작업 번호, 대기열이 가득 찼거나 빈 프레임이면 None
+        """
+        if self._shutdown or frame.width <= 0 or frame.height <= 0:
+            return None
+        if self.is_full():
+            logger.warning(f"캡처 대기열 가득 참 ({self._pending}/{self._max_pending})")
+            return None
+
+        if started_at is None:
+            started_at = time.perf_counter()
+        return self._dispatch(
+            next(self._job_ids), frame, copy_to_clipboard, save_to_file, started_at
+        )
+
+    def _dispatch(
+        self,
+        job_id: int,
+        frame: CaptureFrame,
+        copy_to_clipboard: bool,
+        save_to_file: bool,
+        started_at: float,
+        timings: Optional[Dict[str, float]] = None
+    ) -> int:
+        """
+        클립보드를 설정하고 저장을 작업 스레드에 예약합니다 (GUI 스레드).
+
+        Args:
+            job_id: 작업 번호
+            frame: 처리할 프레임
+            copy_to_clipboard: 클립보드에 복사 여부
+            save_to_file: 파일로 저장 여부
+            started_at: 전체 소요 시간 계측 시작 시각 (perf_counter)
+            timings: 이미 측정한 단계 소요 시간 (ms)
+
+        Returns:
+            int: 작업 번호
+        """
+        result = CaptureResult(
+            job_id=job_id,
+            bbox=frame.bbox,
+            copy_to_clipboard=copy_to_clipboard,
+            save_to_file=save_to_file,
+            timings=dict(timings or {})
+        )
+
+        if copy_to_clipboard:
+            clipboard_start = time.perf_counter()
+            with telemetry.span('clipboard', job_id):
+                mime = self._capturer.set_clipboard_image(
+                    frame.to_qimage()
+                )
+            result.timings['clipboard'] = (time.perf_counter() - clipboard_start) * 1000.0
+            result.clipboard_ok = mime is not None
+            if mime is not None and save_to_file:
+                self._clipboard_mime[job_id] = mime
+
+        if not save_to_file:
+            telemetry.record(telemetry.TOTAL_STAGE, started_at, time.perf_counter(), job_id)
+            self.capture_finished.emit(result)
+            return job_id
+
+        self._pending += 1
+        self.queue_changed.emit(self._pending)
+
+        if telemetry.enabled:
+            self._started_at[job_id] = started_at
+        self._executor.submit(self._process, result, frame, time.perf_counter())
+        return job_id
+
+    def _process(
+        self,
+        result: CaptureResult,
+        frame: CaptureFrame,
+        queued_at: float
+    ) -> None:
+        """
+        작업 스레드에서 변환/인코딩/쓰기를 수행합니다.
+
+        Args:
+            result: 채워 넣을 작업 결과
+            frame: grab 결과
+            queued_at: 작업 예약 시각 (perf_counter, 대기 시간 계측용)
+        """
+        now = time.perf_counter()
+        telemetry.record('queue', queued_at, now, result.job_id)
+        result.timings['queue'] = (now - queued_at) * 1000.0
+        try:
+            with telemetry.bind(result.job_id):
+                result.file_path = self._capturer.save_frame(
+                    frame, 'both' if result.copy_to_clipboard else 'file', result.timings
+                )
+        except Exception as e:
+            logger.error(f"캡처 처리 실패 (job={result.job_id}): {e}")
+            result.error = str(e)
+        finally:
+            self._job_done.emit(result)
+
+    def _on_job_done(self, result: CaptureResult) -> None:
+        """
+        GUI 스레드에서 클립보드에 파일 URI를 붙이고 완료 시그널을 보냅니다.
+
+        Args:
+            result: 작업 결과
+        """
+        self._pending -= 1
+        self.queue_changed.emit(self._pending)
+
+        started_at = self._started_at.pop(result.job_id, None)
+        if started_at is not None:
+            telemetry.record(
+                telemetry.TOTAL_STAGE, started_at, time.perf_counter(), result.job_id
+            )
+
+        mime = self._clipboard_mime.pop(result.job_id, None)
+        if mime is not None and result.file_path is not None:
+            try:
+                mime.set_file_path(result.file_path)
+            except RuntimeError:
+                # 이미 다른 내용으로 클립보드가 교체되어 삭제된 경우
+                pass
+
+        self.capture_finished.emit(result)
+
+    # =========================================================================
+    # 다중 영역 캡처
+    # =========================================================================
+
+    def submit_regions(
+        self,
+        regions: Dict[str, Tuple[int, int, int, int]]
+    ) -> Optional[MultiRegionResult]:
+        """
+        여러 영역을 한 번에 grab하고 영역별 저장을 작업 스레드에 병렬로 예약합니다.
+
+        모든 영역이 저장되면 regions_finished가 발생합니다. GUI 스레드에서 호출해야 합니다.
+
+        Args:
+            regions: 이름 → 영역 (left, top, right, bottom)
+
+        Returns:
+            Optional[MultiRegionResult]: grab 결과 (error가 있으면 저장하지 않음),
+                대기열이 가득 찼으면 None
+        """
+        if self._shutdown:
+            return None
+        if self.is_full():
+            logger.warning(f"캡처 대기열 가득 참 ({self._pending}/{self._max_pending})")
+            return None
+
+        result = self._capturer.grab_regions(regions)
+        if not result.frames:
+            result.error = "grab 실패"
+            return result
+        try:
+            futures = encode_regions(
+                result, self._capturer.output_dir, self._executor, self._capturer.catalog
+            )
+        except OSError as e:
+            logger.error(f"다중 영역 저장 준비 실패: {e}")
+            result.error = str(e)
+            return result
+
+        self._pending += 1
+        self.queue_changed.emit(self._pending)
+
+        lock = threading.Lock()
+        remaining = [len(futures)]
+
+        def _on_saved(name: str, future) -> None:
+            # 작업 스레드에서 호출됨
+            try:
+                result.files[name] = future.result()
+            except Exception as e:
+                logger.error(f"영역 저장 실패 ({name}): {e}")
+                result.error = str(e)
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                result.frames = {}  # grab 버퍼 해제
+                self._regions_done.emit(result)
+
+        for name, future in futures.items():
+            future.add_done_callback(lambda f, n=name: _on_saved(n, f))
+        return result
+
+    def _on_regions_done(self, result: MultiRegionResult) -> None:
+        """
+        GUI 스레드에서 다중 영역 완료 시그널을 보냅니다.
+
+        Args:
+            result: 다중 영역 캡처 결과
+        """
+        self._pending -= 1
+        self.queue_changed.emit(self._pending)
+        self.regions_finished.emit(result)
+
+    # =========================================================================
+    # 버스트 캡처
+    # =========================================================================
+
+    @property
+    def burst_active(self) -> bool:
+        """버스트 캡처 또는 인코딩이 진행 중인지 여부."""
+        return self._burst_thread is not None and self._burst_thread.is_alive()
+
+    def start_burst(
+        self,
+        bbox: Tuple[int, int, int, int],
+        count: int = BurstConfig.FRAME_COUNT,
+        fps: float = BurstConfig.FPS
+    ) -> bool:
+        """
+        버스트 캡처를 별도 스레드에서 시작합니다.
+
+        캡처 루프가 끝나면 burst_captured, 모든 프레임이
+        작업 스레드 풀에서 저장되면 burst_finished가 발생합니다.
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+            count: 프레임 수
+            fps: 목표 프레임 속도
+
+        Returns:
+            bool: 시작 여부 (이미 진행 중이면 False)
+        """
+        if self._shutdown or self.burst_active:
+            return False
+
+        self._burst_thread = threading.Thread(
+            target=self._run_burst,
+            args=(bbox, count, fps),
+            name='capture-burst',
+            daemon=True
+        )
+        self._burst_thread.start()
+        return True
+
+    def _run_burst(
+        self,
+        bbox: Tuple[int, int, int, int],
+        count: int,
+        fps: float
+    ) -> None:
+        """
+        버스트 스레드 본체: 캡처 루프 → 병렬 인코딩.
+
+        Args:
+            bbox: 캡처 영역
+            count: 프레임 수
+            fps: 목표 프레임 속도
+        """
+        result = BurstResult(bbox=bbox, requested=count, fps=fps)
+        captured_sent = False
+        try:
+            recorder = BurstRecorder(self._capturer.grab_frame, self._capturer.grab_into)
+            result = recorder.record(bbox, count, fps)
+            self._capturer.release_thread_session()
+            self.burst_captured.emit(result)
+            captured_sent = True
+
+            futures = encode_burst(
+                result, self._capturer.output_dir, self._executor, self._capturer.catalog
+            )
+            for future in futures:
+                try:
+                    result.files.append(future.result())
+                except Exception as e:
+                    logger.error(f"버스트 프레임 저장 실패: {e}")
+        except Exception as e:
+            logger.error(f"버스트 캡처 실패: {e}")
+            result.error = str(e)
+        finally:
+            self._capturer.release_thread_session()
+            if not captured_sent:
+                self.burst_captured.emit(result)
+            result.ring = None  # 링 버퍼 메모리 해제
+            self.burst_finished.emit(result)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        파이프라인을 종료합니다.
+
+        Args:
+            wait: 진행 중인 인코딩/쓰기 완료를 기다릴지 여부
+        """
+        self._shutdown = True
+        if wait and self._burst_thread is not None:
+            self._burst_thread.join()
+        self._executor.shutdown(wait=wait)
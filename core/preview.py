@@ -0,0 +1,384 @@
+"""
+실시간 미리보기(MJPEG) 모듈
+
+이 모듈은 캡처 영역을 localhost HTTP로 multipart MJPEG 스트리밍하는 서버를 제공합니다.
+브라우저나 다른 도구에서 http://127.0.0.1:<port>/ 로 열면 실시간으로 볼 수 있습니다.
+
+경로:
+    /            <img>로 스트림을 표시하는 HTML 페이지
+    /stream      multipart/x-mixed-replace MJPEG 스트림
+    /frame.jpg   최신 프레임 한 장
+
+동작:
+    - 생산자 스레드 하나가 grab과 JPEG 인코딩을 수행하고, 프레임마다 한 번만 인코딩하여
+      모든 클라이언트가 같은 바이트를 공유합니다.
+    - 클라이언트마다 최신 프레임만 보내므로 느린 클라이언트는 중간 프레임을 건너뛰며
+      서버에 프레임이 쌓이지 않습니다.
+    - 프레임 주기는 인코딩 시간과 가장 빠른 클라이언트의 전송 시간에 맞춰 조정되며
+      (MIN_FPS~MAX_FPS), 연결된 클라이언트가 없으면 grab을 멈춥니다.
+"""
+import logging
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+from constants import PreviewConfig
+from core.capture import ScreenCapture
+
+logger = logging.getLogger(__name__)
+
+_BOUNDARY: str = 'frame'
+
+_INDEX_HTML: bytes = (
+    '<!DOCTYPE html><html><head><meta charset="utf-8"><title>캡처 미리보기</title>'
+    '<style>body{margin:0;background:#1e1e1e}img{display:block;margin:auto;max-width:100%}</style>'
+    '</head><body><img src="/stream" alt="preview"></body></html>'
+).encode('utf-8')
+
+
+class _PreviewHandler(BaseHTTPRequestHandler):
+    """HTTP 요청 하나를 처리하는 핸들러 (연결마다 스레드 1개)."""
+
+    server: '_PreviewHttpServer'
+
+    def do_GET(self) -> None:
+        preview = self.server.preview
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            self._send_body('text/html; charset=utf-8', _INDEX_HTML)
+        elif path == '/frame.jpg':
+            data = preview.snapshot(timeout=PreviewConfig.CLIENT_TIMEOUT)
+            if data is None:
+                self.send_error(503, "프레임 없음")
+                return
+            self._send_body('image/jpeg', data)
+        elif path == '/stream':
+            self._stream(preview)
+        else:
+            self.send_error(404)
+
+    def _send_body(self, content_type: str, body: bytes) -> None:
+        """단일 응답 본문을 전송합니다."""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, preview: 'PreviewServer') -> None:
+        """
+        연결이 끊길 때까지 최신 프레임을 multipart로 전송합니다.
+
+        Args:
+            preview: 프레임을 제공하는 PreviewServer
+        """
+        self.send_response(200)
+        self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={_BOUNDARY}')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        # 전송이 막힌 클라이언트가 스레드를 붙잡지 않도록 제한
+        self.connection.settimeout(PreviewConfig.CLIENT_TIMEOUT)
+
+        preview.client_connected()
+        sequence = 0
+        try:
+            while not preview.closing:
+                sequence, data = preview.wait_frame(sequence, timeout=1.0)
+                if data is None:
+                    continue
+                start = time.perf_counter()
+                self.wfile.write(
+                    f'--{_BOUNDARY}\r\nContent-Type: image/jpeg\r\n'
+                    f'Content-Length: {len(data)}\r\n\r\n'.encode('ascii')
+                )
+                self.wfile.write(data)
+                self.wfile.write(b'\r\n')
+                self.wfile.flush()
+                preview.record_drain(time.perf_counter() - start)
+        except (ConnectionError, socket.timeout):
+            pass
+        finally:
+            preview.client_disconnected()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"미리보기 {self.address_string()} - {format % args}")
+
+
+class _PreviewHttpServer(ThreadingHTTPServer):
+    """PreviewServer 인스턴스를 참조하는 HTTP 서버."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Tuple[str, int], preview: 'PreviewServer') -> None:
+        self.preview = preview
+        super().__init__(address, _PreviewHandler)
+
+
+class PreviewServer:
+    """
+    캡처 영역 MJPEG 미리보기 서버.
+
+    grab과 인코딩은 전용 생산자 스레드에서, 전송은 연결 스레드에서 수행하므로
+    GUI 스레드를 막지 않습니다.
+
+    Example:
+        >>> server = PreviewServer(capturer, bbox)
+        >>> server.start()
+        >>> print(server.url)
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        bbox: Tuple[int, int, int, int],
+        port: int = PreviewConfig.PORT,
+        max_fps: float = PreviewConfig.MAX_FPS,
+        min_fps: float = PreviewConfig.MIN_FPS,
+        quality: int = PreviewConfig.JPEG_QUALITY
+    ) -> None:
+        """
+        PreviewServer 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            bbox: 캡처 영역 (left, top, right, bottom)
+            port: 포트 (0이면 임의 포트)
+            max_fps: 최대 프레임 주기
+            min_fps: 최소 프레임 주기 (인코딩/전송이 느려도 이 이상은 늦추지 않음)
+            quality: JPEG 품질 (1~95)
+        """
+        self.capturer: ScreenCapture = capturer
+        self.closing: bool = False
+        self._bbox: Tuple[int, int, int, int] = bbox
+        self._port: int = port
+        self._min_interval: float = 1.0 / max_fps
+        self._max_interval: float = 1.0 / min_fps
+        self._quality: int = quality
+
+        # 최신 프레임 (순번, JPEG 바이트)과 대기 중인 클라이언트 깨우기
+        self._cond = threading.Condition()
+        self._sequence: int = 0
+        self._data: Optional[bytes] = None
+        self._clients: int = 0
+
+        # 지수 이동 평균 (초)
+        self._encode_time: float = 0.0
+        self._drain_time: float = 0.0
+
+        self._server: Optional[_PreviewHttpServer] = None
+        self._threads: Tuple[threading.Thread, ...] = ()
+
+    @property
+    def url(self) -> str:
+        """미리보기 페이지 주소."""
+        port = self._server.server_address[1] if self._server is not None else self._port
+        return f"http://127.0.0.1:{port}/"
+
+    @property
+    def clients(self) -> int:
+        """연결된 스트림 클라이언트 수."""
+        return self._clients
+
+    @property
+    def interval(self) -> float:
+        """
+        현재 프레임 주기 (초).
+
+        인코딩 시간의 1.25배 (인코딩이 CPU를 독점하지 않도록)와 가장 빠른 클라이언트의
+        전송 시간 중 큰 값을 [1/MAX_FPS, 1/MIN_FPS] 범위로 제한합니다.
+        """
+        interval = max(self._encode_time * 1.25, self._drain_time)
+        return min(self._max_interval, max(self._min_interval, interval))
+
+    def set_bbox(self, bbox: Tuple[int, int, int, int]) -> None:
+        """
+        캡처 영역을 변경합니다 (다음 프레임부터 적용).
+
+        Args:
+            bbox: 새 캡처 영역
+        """
+        self._bbox = bbox
+
+    def start(self) -> None:
+        """
+        서버와 생산자 스레드를 시작합니다.
+
+        Raises:
+            OSError: 포트를 사용할 수 없는 경우
+        """
+        if self._server is not None:
+            return
+        self.closing = False
+        self._server = _PreviewHttpServer(('127.0.0.1', self._port), self)
+        self._threads = (
+            threading.Thread(
+                target=self._server.serve_forever, name='preview-http', daemon=True
+            ),
+            threading.Thread(target=self._produce, name='preview-producer', daemon=True),
+        )
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"미리보기 서버 시작: {self.url}")
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        서버를 중지합니다.
+
+        Returns:
+            Dict[str, Any]: frames, fps(마지막 주기 기준), encode_ms
+        """
+        summary = self.summary()
+        self.closing = True
+        with self._cond:
+            self._cond.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = ()
+        logger.info("미리보기 서버 중지")
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: frames, fps, encode_ms, drain_ms
+        """
+        return {
+            'frames': self._sequence,
+            'fps': 1.0 / self.interval,
+            'encode_ms': self._encode_time * 1000.0,
+            'drain_ms': self._drain_time * 1000.0,
+        }
+
+    # =========================================================================
+    # 클라이언트 (연결 스레드)
+    # =========================================================================
+
+    def client_connected(self) -> None:
+        """스트림 클라이언트 연결을 등록하고 생산자를 깨웁니다."""
+        with self._cond:
+            self._clients += 1
+            self._cond.notify_all()
+
+    def client_disconnected(self) -> None:
+        """스트림 클라이언트 연결 해제를 등록합니다."""
+        with self._cond:
+            self._clients -= 1
+            if self._clients == 0:
+                self._drain_time = 0.0
+
+    def wait_frame(self, after: int, timeout: float) -> Tuple[int, Optional[bytes]]:
+        """
+        after보다 새로운 프레임이 나올 때까지 기다립니다.
+
+        중간 프레임은 건너뛰고 항상 최신 프레임을 반환합니다.
+
+        Args:
+            after: 마지막으로 받은 프레임 순번 (처음이면 0)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Tuple[int, Optional[bytes]]: (순번, JPEG 바이트), 시간 초과 시 (after, None)
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._sequence > after or self.closing, timeout)
+            if self._sequence <= after:
+                return (after, None)
+            return (self._sequence, self._data)
+
+    def snapshot(self, timeout: float) -> Optional[bytes]:
+        """
+        지금 이후에 만들어진 프레임 한 장을 반환합니다.
+
+        스트림 클라이언트가 없으면 생산자가 멈춰 있으므로 잠시 클라이언트로 등록합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[bytes]: JPEG 바이트 (시간 초과 시 None)
+        """
+        with self._cond:
+            current = self._sequence
+            self._clients += 1
+            self._cond.notify_all()
+        try:
+            return self.wait_frame(current, timeout)[1]
+        finally:
+            with self._cond:
+                self._clients -= 1
+
+    def record_drain(self, elapsed: float) -> None:
+        """
+        클라이언트가 프레임 하나를 전송하는 데 걸린 시간을 기록합니다.
+
+        가장 빠른 클라이언트를 기준으로 삼기 위해 더 빠른 값은 즉시, 느린 값은 천천히 반영합니다.
+
+        Args:
+            elapsed: 전송 시간 (초)
+        """
+        with self._cond:
+            if elapsed < self._drain_time:
+                self._drain_time = elapsed
+            else:
+                self._drain_time += (elapsed - self._drain_time) * 0.05
+
+    # =========================================================================
+    # 생산자 스레드
+    # =========================================================================
+
+    def _produce(self) -> None:
+        """클라이언트가 있는 동안 grab → JPEG 인코딩 → 게시를 반복합니다."""
+        try:
+            while not self.closing:
+                with self._cond:
+                    self._cond.wait_for(lambda: self._clients > 0 or self.closing)
+                if self.closing:
+                    break
+
+                start = time.perf_counter()
+                data = self._encode_latest()
+                elapsed = time.perf_counter() - start
+                if data is not None:
+                    self._encode_time += (elapsed - self._encode_time) * 0.2
+                    with self._cond:
+                        self._sequence += 1
+                        self._data = data
+                        self._cond.notify_all()
+
+                delay = self.interval - (time.perf_counter() - start)
+                if delay > 0:
+                    with self._cond:
+                        self._cond.wait_for(lambda: self.closing, delay)
+        finally:
+            self.capturer.release_thread_session()
+
+    def _encode_latest(self) -> Optional[bytes]:
+        """
+        현재 영역을 grab하여 JPEG으로 인코딩합니다.
+
+        Returns:
+            Optional[bytes]: JPEG 바이트 (실패 시 None)
+        """
+        frame = self.capturer.grab_frame(self._bbox)
+        if frame is None:
+            return None
+        buffer = BytesIO()
+        try:
+            frame.to_pil().save(buffer, format='JPEG', quality=self._quality)
+        except (OSError, ValueError) as e:
+            logger.error(f"미리보기 인코딩 실패: {e}")
+            return None
+        return buffer.getvalue()
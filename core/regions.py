@@ -0,0 +1,247 @@
+"""
+다중 영역 캡처 모듈
+
+이 모듈은 이름 붙인 여러 영역을 같은 순간에 캡처하는 기능을 제공합니다.
+영역을 모니터별로 묶어 모니터마다 영역들을 덮는 최소 사각형을 한 번만 grab하고,
+각 영역은 그 프레임의 복사 없는 crop으로 만듭니다. 모든 영역은 같은 타임스탬프를 가지며
+인코딩/쓰기는 작업 스레드 풀에서 병렬로 수행합니다.
+"""
+import datetime
+import json
+import logging
+import re
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from core.frame import CaptureFrame
+
+if TYPE_CHECKING:
+    from core.catalog import CaptureCatalog
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+
+def _overlap(a: BBox, b: BBox) -> int:
+    """두 영역이 겹치는 넓이를 반환합니다."""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    return width * height if width > 0 and height > 0 else 0
+
+
+def plan_grabs(regions: Dict[str, BBox], monitors: List[BBox]) -> List[Tuple[BBox, List[str]]]:
+    """
+    영역을 모니터별로 묶고 묶음마다 grab할 최소 사각형을 계산합니다.
+
+    각 영역은 가장 많이 겹치는 모니터에 속하며 (어느 모니터와도 겹치지 않으면 단독),
+    묶음의 grab 영역은 소속 영역들의 합집합 사각형입니다.
+
+    Args:
+        regions: 이름 → 영역 (left, top, right, bottom)
+        monitors: 모니터 영역 목록
+
+    Returns:
+        List[Tuple[BBox, List[str]]]: (grab 영역, 포함된 영역 이름) 목록
+    """
+    groups: Dict[object, List[str]] = {}
+    for name, bbox in regions.items():
+        overlaps = [_overlap(bbox, monitor) for monitor in monitors]
+        best = max(range(len(overlaps)), key=overlaps.__getitem__) if overlaps else -1
+        key: object = best if best >= 0 and overlaps[best] > 0 else ('off', name)
+        groups.setdefault(key, []).append(name)
+
+    plan: List[Tuple[BBox, List[str]]] = []
+    for names in groups.values():
+        boxes = [regions[name] for name in names]
+        union = (
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            max(b[2] for b in boxes),
+            max(b[3] for b in boxes),
+        )
+        plan.append((union, names))
+    return plan
+
+
+def safe_name(name: str) -> str:
+    """
+    영역 이름을 파일명에 쓸 수 있게 바꿉니다.
+
+    Args:
+        name: 영역 이름
+
+    Returns:
+        str: 글자/숫자/-/_ 외의 문자를 _로 바꾼 이름
+    """
+    return re.sub(r'[^\w\-]+', '_', name).strip('_') or 'region'
+
+
+@dataclass
+class MultiRegionResult:
+    """
+    다중 영역 캡처 결과.
+
+    Attributes:
+        regions: 요청한 영역 (이름 → bbox)
+        frames: 캡처된 영역 프레임 (이름 → CaptureFrame, 인코딩 후 비움)
+        timestamp: 모든 영역에 공통인 캡처 시각 (epoch 초)
+        grabs: 실제 grab 횟수
+        files: 저장된 파일 (이름 → 경로)
+        missing: grab에 실패한 영역 이름
+        error: 실패 시 오류 메시지
+    """
+
+    regions: Dict[str, BBox]
+    frames: Dict[str, CaptureFrame] = field(default_factory=dict)
+    timestamp: float = 0.0
+    grabs: int = 0
+    files: Dict[str, Path] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """모든 영역이 저장되었는지 여부."""
+        return self.error is None and len(self.files) == len(self.regions)
+
+
+def encode_regions(
+    result: MultiRegionResult,
+    output_dir: Path,
+    executor: Executor,
+    catalog: Optional['CaptureCatalog'] = None
+) -> Dict[str, Future]:
+    """
+    영역 프레임을 작업 스레드 풀에서 병렬로 PNG 인코딩/저장합니다.
+
+    영역은 `regions_<시각>/<이름>.png`로 저장되고,
+    공통 타임스탬프와 영역 좌표는 같은 폴더의 `regions.json`에 기록됩니다.
+
+    Args:
+        result: 다중 영역 캡처 결과
+        output_dir: 저장 상위 디렉토리
+        executor: 인코딩에 사용할 Executor
+        catalog: 저장한 영역을 기록할 카탈로그 (None이면 기록 안 함)
+
+    Returns:
+        Dict[str, Future]: 영역별 저장 작업 (결과는 저장된 Path)
+    """
+    captured_at = datetime.datetime.fromtimestamp(result.timestamp)
+    stamp = captured_at.strftime('%Y%m%d_%H%M%S')
+    regions_dir = output_dir / f"regions_{stamp}"
+    suffix = 0
+    while regions_dir.exists():
+        suffix += 1
+        regions_dir = output_dir / f"regions_{stamp}_{suffix}"
+    regions_dir.mkdir(parents=True)
+
+    filenames: Dict[str, str] = {}
+    for name in result.frames:
+        base = safe_name(name)
+        filename, count = f"{base}.png", 0
+        while filename in filenames.values():
+            count += 1
+            filename = f"{base}_{count}.png"
+        filenames[name] = filename
+
+    manifest = {
+        'timestamp': result.timestamp,
+        'captured_at': captured_at.isoformat(),
+        'grabs': result.grabs,
+        'regions': {
+            name: {'bbox': list(bbox), 'file': filenames.get(name)}
+            for name, bbox in result.regions.items()
+        },
+        'missing': result.missing,
+    }
+    (regions_dir / 'regions.json').write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False), encoding='utf-8'
+    )
+
+    def _save(frame: CaptureFrame, path: Path) -> Path:
+        start = time.perf_counter()
+        frame.to_pil().save(str(path), format='PNG')
+        if catalog is not None:
+            catalog.add(
+                path, frame.timestamp, frame.bbox, 'region', (frame.width, frame.height),
+                timings={'encode': (time.perf_counter() - start) * 1000.0},
+                frame=frame
+            )
+        return path
+
+    return {
+        name: executor.submit(_save, frame, regions_dir / filenames[name])
+        for name, frame in result.frames.items()
+    }
+
+
+class RegionSet:
+    """
+    이름 붙인 캡처 영역 목록 (JSON 파일로 유지).
+
+    Example:
+        >>> regions = RegionSet(output_dir / 'regions.json')
+        >>> regions.add('status', (0, 0, 400, 300))
+        >>> capturer.grab_regions(regions.items())
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        RegionSet 인스턴스를 초기화하고 저장된 영역을 불러옵니다.
+
+        Args:
+            path: 영역 목록 JSON 경로
+        """
+        self.path: Path = path
+        self._regions: Dict[str, BBox] = {}
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def items(self) -> Dict[str, BBox]:
+        """이름 → 영역 사본."""
+        return dict(self._regions)
+
+    def load(self) -> None:
+        """파일에서 영역 목록을 불러옵니다 (없거나 손상되었으면 빈 목록)."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            self._regions = {str(name): tuple(int(v) for v in bbox) for name, bbox in data.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"영역 목록을 읽지 못함 ({self.path}): {e}")
+            self._regions = {}
+
+    def save(self) -> None:
+        """영역 목록을 파일에 저장합니다."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps({name: list(bbox) for name, bbox in self._regions.items()},
+                           indent=2, ensure_ascii=False),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            logger.error(f"영역 목록 저장 실패 ({self.path}): {e}")
+
+    def add(self, name: str, bbox: BBox) -> None:
+        """
+        영역을 추가합니다 (같은 이름이 있으면 덮어씀).
+
+        Args:
+            name: 영역 이름
+            bbox: 영역 (left, top, right, bottom)
+        """
+        self._regions[name] = tuple(bbox)
+        self.save()
+
+    def clear(self) -> None:
+        """모든 영역을 지웁니다."""
+        self._regions.clear()
+        self.save()
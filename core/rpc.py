@@ -0,0 +1,523 @@
+"""
+로컬 캡처 RPC 모듈
+
+이 모듈은 테스트 하네스 등이 실행 중인 도구에 캡처를 요청할 수 있는
+로컬 요청/응답 서버(JSON Lines, Unix 도메인 소켓)와 최소 클라이언트를 제공합니다.
+Unix 소켓이 없는 플랫폼(Windows)에서는 127.0.0.1 TCP로 대체합니다.
+
+프로토콜:
+    요청 (한 줄 JSON):
+        {"id": 1, "op": "capture", "regions": [[x, y, w, h], ...], "format": "png"}
+        {"id": 2, "op": "monitors"}
+        {"id": 3, "op": "ping"}
+    응답 (요청마다 여러 줄, 프레임이 끝나는 순서대로 전송):
+        {"id": 1, "index": 0, "ok": true, "format": "png", "width": w, "height": h, "size": n}
+        <n 바이트 페이로드>  (format이 png/jpeg/raw일 때만)
+        {"id": 1, "done": true, "count": 5, "elapsed_ms": 12.3}
+
+format:
+    png, jpeg: 인코딩된 이미지 바이트
+    raw: 행 여백 없는 BGRA 바이트 (width * height * 4)
+    file: 저장 폴더에 PNG로 저장하고 경로만 반환 (페이로드 없음)
+"""
+import getpass
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from constants import CaptureConfig, RpcConfig
+from core.capture import ScreenCapture
+from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+Address = Union[str, Tuple[str, int]]
+
+FORMATS: Tuple[str, ...] = ('png', 'jpeg', 'raw', 'file')
+
+
+def rpc_address() -> Address:
+    """
+    현재 사용자의 RPC 서버 주소를 반환합니다.
+
+    Returns:
+        Address: Unix 소켓 경로 또는 (host, port)
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return ('127.0.0.1', RpcConfig.TCP_PORT)
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = 'user'
+    return os.path.join(tempfile.gettempdir(), f"{RpcConfig.SOCKET_NAME}-{user}.sock")
+
+
+class TokenBucket:
+    """
+    클라이언트별 요청 속도 제한 (토큰 버킷).
+
+    초당 rate개의 토큰이 최대 burst개까지 쌓이며, 프레임 하나가 토큰 하나를 소비합니다.
+
+    Example:
+        >>> bucket = TokenBucket(rate=60.0, burst=120)
+        >>> ok, retry_after = bucket.take(5)
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        TokenBucket 인스턴스를 초기화합니다.
+
+        Args:
+            rate: 초당 충전 토큰 수
+            burst: 최대 토큰 수
+        """
+        self.rate: float = rate
+        self.burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+
+    def take(self, count: int) -> Tuple[bool, float]:
+        """
+        토큰을 소비합니다.
+
+        Args:
+            count: 필요한 토큰 수
+
+        Returns:
+            Tuple[bool, float]: (허용 여부, 거부 시 다시 시도할 때까지의 시간(초))
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if count <= self._tokens:
+            self._tokens -= count
+            return (True, 0.0)
+        if count > self.burst:
+            return (False, float('inf'))
+        return (False, (count - self._tokens) / self.rate)
+
+
+class _RpcHandler(socketserver.StreamRequestHandler):
+    """클라이언트 연결 하나를 처리하는 핸들러 (연결마다 스레드 1개)."""
+
+    server: '_RpcSocketServer'
+
+    def setup(self) -> None:
+        super().setup()
+        rpc = self.server.rpc
+        self.bucket = TokenBucket(rpc.rate_limit, rpc.burst)
+
+    def handle(self) -> None:
+        rpc = self.server.rpc
+        try:
+            while not rpc.closing:
+                line = self.rfile.readline(RpcConfig.MAX_LINE_BYTES + 1)
+                if not line:
+                    break
+                if len(line) > RpcConfig.MAX_LINE_BYTES:
+                    self.send({'ok': False, 'error': 'request_too_large'})
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("요청은 JSON 객체여야 합니다")
+                except ValueError as e:
+                    self.send({'ok': False, 'error': f'bad_request: {e}'})
+                    continue
+                rpc.handle_request(request, self)
+        except (ConnectionError, BrokenPipeError):
+            pass
+        finally:
+            # 이 스레드의 캡처 세션(mss 핸들) 반환
+            rpc.capturer.release_thread_session()
+
+    def send(self, header: Dict[str, Any], payload: Optional[bytes] = None) -> None:
+        """
+        응답 헤더(한 줄 JSON)와 선택적 페이로드를 전송합니다.
+
+        Args:
+            header: 응답 헤더
+            payload: 헤더 뒤에 보낼 바이트
+        """
+        self.wfile.write(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n')
+        if payload is not None:
+            self.wfile.write(payload)
+        self.wfile.flush()
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    _BaseServer = socketserver.ThreadingUnixStreamServer
+else:
+    _BaseServer = socketserver.ThreadingTCPServer
+
+
+class _RpcSocketServer(_BaseServer):
+    """RPC 서버 인스턴스를 참조하는 소켓 서버."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: Address, rpc: 'CaptureRpcServer') -> None:
+        self.rpc = rpc
+        super().__init__(address, _RpcHandler)
+
+
+class CaptureRpcServer:
+    """
+    로컬 캡처 RPC 서버.
+
+    연결마다 스레드 하나가 요청을 읽고 grab을 수행하며,
+    인코딩은 공유 Executor에서 병렬로 진행하고 끝나는 순서대로 응답을 보냅니다.
+
+    Example:
+        >>> server = CaptureRpcServer(capturer, executor=pipeline.executor)
+        >>> server.start()
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        executor: Optional[Executor] = None,
+        address: Optional[Address] = None,
+        rate_limit: float = RpcConfig.RATE_LIMIT,
+        burst: int = RpcConfig.BURST
+    ) -> None:
+        """
+        CaptureRpcServer 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab/저장에 사용할 ScreenCapture
+            executor: 인코딩 Executor (None이면 전용 스레드 풀 생성)
+            address: 서버 주소 (None이면 rpc_address())
+            rate_limit: 클라이언트별 초당 허용 프레임 수
+            burst: 클라이언트별 순간 최대 프레임 수
+        """
+        self.capturer: ScreenCapture = capturer
+        self.address: Address = address or rpc_address()
+        self.rate_limit: float = rate_limit
+        self.burst: int = burst
+        self.closing: bool = False
+        self._own_executor = executor is None
+        self._executor: Executor = executor or ThreadPoolExecutor(
+            max_workers=CaptureConfig.WORKER_COUNT,
+            thread_name_prefix='rpc-encoder'
+        )
+        self._server: Optional[_RpcSocketServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """서버 실행 여부."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        서버를 시작합니다.
+
+        Raises:
+            OSError: 주소를 사용할 수 없는 경우 (다른 인스턴스가 실행 중 등)
+        """
+        if self.running:
+            return
+        if isinstance(self.address, str):
+            self._remove_stale_socket(self.address)
+
+        self.closing = False
+        self._server = _RpcSocketServer(self.address, self)
+        if isinstance(self.address, str):
+            os.chmod(self.address, 0o600)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='capture-rpc',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"캡처 RPC 서버 시작: {self.address}")
+
+    def stop(self) -> None:
+        """서버를 중지합니다 (진행 중인 요청은 현재 프레임까지 처리)."""
+        self.closing = True
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if isinstance(self.address, str):
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+        logger.info("캡처 RPC 서버 중지")
+
+    @staticmethod
+    def _remove_stale_socket(path: str) -> None:
+        """
+        이전 프로세스가 남긴 소켓 파일을 제거합니다.
+
+        Raises:
+            OSError: 다른 서버가 이미 해당 주소에서 실행 중인 경우
+        """
+        if not os.path.exists(path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise OSError(f"RPC 서버가 이미 실행 중입니다: {path}")
+
+    # =========================================================================
+    # 요청 처리 (연결 스레드)
+    # =========================================================================
+
+    def handle_request(self, request: Dict[str, Any], handler: _RpcHandler) -> None:
+        """
+        요청 하나를 처리하고 응답을 전송합니다.
+
+        Args:
+            request: 요청 객체
+            handler: 응답을 보낼 연결 핸들러
+        """
+        request_id = request.get('id')
+        op = request.get('op')
+        if op == 'ping':
+            handler.send({'id': request_id, 'ok': True, 'done': True})
+        elif op == 'monitors':
+            handler.send({
+                'id': request_id,
+                'ok': True,
+                'done': True,
+                'monitors': [list(m) for m in self.capturer.monitors()],
+            })
+        elif op == 'capture':
+            self._handle_capture(request_id, request, handler)
+        else:
+            handler.send({'id': request_id, 'ok': False, 'error': f'unknown_op: {op}'})
+
+    def _handle_capture(
+        self,
+        request_id: Any,
+        request: Dict[str, Any],
+        handler: _RpcHandler
+    ) -> None:
+        """
+        배치 캡처: 영역을 차례로 grab하고 인코딩이 끝나는 순서대로 응답합니다.
+
+        Args:
+            request_id: 요청 번호
+            request: 요청 객체
+            handler: 응답을 보낼 연결 핸들러
+        """
+        start = time.perf_counter()
+        fmt = request.get('format', 'png')
+        regions = request.get('regions')
+        error = None
+        bboxes: List[Tuple[int, int, int, int]] = []
+        if fmt not in FORMATS:
+            error = f'bad_format: {fmt}'
+        elif not isinstance(regions, list) or not regions:
+            error = 'bad_regions'
+        elif len(regions) > RpcConfig.MAX_REGIONS:
+            error = f'too_many_regions: max {RpcConfig.MAX_REGIONS}'
+        else:
+            try:
+                for region in regions:
+                    x, y, w, h = (int(v) for v in region)
+                    if w <= 0 or h <= 0:
+                        raise ValueError
+                    bboxes.append((x, y, x + w, y + h))
+            except (TypeError, ValueError, OverflowError):
+                error = f'bad_region: {region}'
+        if error is not None:
+            handler.send({'id': request_id, 'ok': False, 'error': error})
+            return
+
+        allowed, retry_after = handler.bucket.take(len(bboxes))
+        if not allowed:
+            handler.send({
+                'id': request_id,
+                'ok': False,
+                'error': 'rate_limited',
+                'retry_after': retry_after if retry_after != float('inf') else None,
+            })
+            return
+
+        # grab은 연결 스레드에서 순서대로, 인코딩은 Executor에서 병렬로
+        futures: Dict[Future, int] = {}
+        for index, bbox in enumerate(bboxes):
+            frame = self.capturer.grab_frame(bbox)
+            if frame is None:
+                handler.send({
+                    'id': request_id, 'index': index, 'ok': False, 'error': 'grab_failed'
+                })
+                continue
+            futures[self._executor.submit(self._encode, frame, fmt)] = index
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                header, payload = future.result()
+            except Exception as e:
+                logger.error(f"RPC 인코딩 실패 (id={request_id}, index={index}): {e}")
+                handler.send({'id': request_id, 'index': index, 'ok': False, 'error': str(e)})
+                continue
+            header.update({'id': request_id, 'index': index, 'ok': True})
+            handler.send(header, payload)
+
+        handler.send({
+            'id': request_id,
+            'done': True,
+            'count': len(bboxes),
+            'elapsed_ms': (time.perf_counter() - start) * 1000.0,
+        })
+
+    def _encode(self, frame: CaptureFrame, fmt: str) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """
+        프레임을 요청 형식으로 변환합니다 (Executor 스레드).
+
+        Args:
+            frame: grab 결과
+            fmt: png, jpeg, raw, file
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[bytes]]: (응답 헤더, 페이로드)
+        """
+        header: Dict[str, Any] = {
+            'format': fmt,
+            'width': frame.width,
+            'height': frame.height,
+            'timestamp': frame.timestamp,
+        }
+        if fmt == 'raw':
+            payload = frame.tobytes()
+            header.update({'pixel_format': 'BGRA', 'stride': frame.width * 4, 'size': len(payload)})
+            return (header, payload)
+
+        if fmt == 'file':
+            path = self.capturer.save_frame(frame, 'rpc')
+            if path is None:
+                raise OSError("파일 저장 실패")
+            header['path'] = str(path)
+            return (header, None)
+
+        buffer = BytesIO()
+        if fmt == 'jpeg':
+            frame.to_pil().save(buffer, format='JPEG', quality=CaptureConfig.CLIPBOARD_JPEG_QUALITY)
+        else:
+            frame.to_pil().save(buffer, format='PNG')
+        payload = buffer.getvalue()
+        header['size'] = len(payload)
+        return (header, payload)
+
+
+class RpcClient:
+    """
+    최소 RPC 클라이언트 (테스트 하네스/스크립트용).
+
+    Example:
+        >>> with RpcClient() as client:
+        ...     for result in client.capture([(0, 0, 800, 600)], fmt='png'):
+        ...         open(f"{result['index']}.png", 'wb').write(result['data'])
+    """
+
+    def __init__(self, address: Optional[Address] = None, timeout: float = 30.0) -> None:
+        """
+        RpcClient 인스턴스를 초기화하고 서버에 연결합니다.
+
+        Args:
+            address: 서버 주소 (None이면 rpc_address())
+            timeout: 소켓 제한 시간 (초)
+        """
+        address = address or rpc_address()
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address)
+        self._file = self._sock.makefile('rwb')
+        self._next_id = 1
+
+    def close(self) -> None:
+        """연결을 닫습니다."""
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> 'RpcClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def request(self, op: str, **params: Any) -> Iterator[Dict[str, Any]]:
+        """
+        요청을 보내고 응답을 도착하는 대로 반환합니다.
+
+        페이로드가 있는 응답은 'data' 키에 바이트가 담깁니다.
+        'done' 응답 또는 요청 전체 오류를 받으면 끝납니다.
+
+        Args:
+            op: 요청 종류 (capture, monitors, ping)
+            **params: 요청 인자
+
+        Yields:
+            Dict[str, Any]: 응답
+        """
+        request_id = self._next_id
+        self._next_id += 1
+        message = dict(params, id=request_id, op=op)
+        self._file.write(json.dumps(message).encode('utf-8') + b'\n')
+        self._file.flush()
+
+        while True:
+            line = self._file.readline()
+            if not line:
+                raise ConnectionError("서버 연결이 끊어졌습니다")
+            response = json.loads(line)
+            if 'size' in response:
+                response['data'] = self._file.read(response['size'])
+            yield response
+            if response.get('done') or ('index' not in response and not response.get('ok', True)):
+                return
+
+    def capture(
+        self,
+        regions: List[Tuple[int, int, int, int]],
+        fmt: str = 'png'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        영역들을 캡처합니다 (x, y, w, h).
+
+        Args:
+            regions: 캡처 영역 목록
+            fmt: png, jpeg, raw, file
+
+        Yields:
+            Dict[str, Any]: 프레임별 응답 (마지막은 done 응답)
+        """
+        return self.request('capture', regions=[list(r) for r in regions], format=fmt)
+
+    def ping(self) -> bool:
+        """
+        서버 응답 여부를 확인합니다.
+
+        Returns:
+            bool: 응답하면 True
+        """
+        return all(r.get('ok') for r in self.request('ping'))
@@ -0,0 +1,215 @@
+"""
+주기 실행 스케줄러 모듈
+
+이 모듈은 monotonic 시계 기반의 고정 주기 스케줄러와 틱 통계를 제공합니다.
+각 틱의 목표 시각은 시작 시각 + k * interval로 계산하므로 오차가 누적되지 않고,
+콜백이 길어져 여러 틱을 놓치면 밀린 틱을 몰아서 실행하지 않고 건너뜁니다.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TickStats:
+    """
+    틱 지연(latency) 및 지터(jitter) 통계.
+
+    평균/분산은 Welford 방식으로 누적하므로 장시간 실행해도 메모리가 늘지 않으며,
+    백분위수는 최근 window개의 표본으로 계산합니다.
+
+    Attributes:
+        ticks: 실행된 틱 수
+        missed: 건너뛴 틱 수
+        max_latency: 최대 지연 (초)
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        """
+        TickStats 인스턴스를 초기화합니다.
+
+        Args:
+            window: 백분위수 계산에 사용할 최근 표본 수
+        """
+        self.ticks: int = 0
+        self.missed: int = 0
+        self.max_latency: float = 0.0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """
+        틱 한 번의 지연을 기록합니다.
+
+        Args:
+            latency: 실제 실행 시각 - 목표 시각 (초)
+        """
+        with self._lock:
+            self.ticks += 1
+            delta = latency - self._mean
+            self._mean += delta / self.ticks
+            self._m2 += delta * (latency - self._mean)
+            self.max_latency = max(self.max_latency, latency)
+            self._recent.append(latency)
+
+    def record_missed(self, count: int) -> None:
+        """
+        건너뛴 틱 수를 기록합니다.
+
+        Args:
+            count: 건너뛴 틱 수
+        """
+        with self._lock:
+            self.missed += count
+
+    @property
+    def mean_latency(self) -> float:
+        """평균 지연 (초)."""
+        return self._mean
+
+    @property
+    def jitter(self) -> float:
+        """지연의 표준편차 (초)."""
+        if self.ticks < 2:
+            return 0.0
+        return math.sqrt(self._m2 / (self.ticks - 1))
+
+    def percentile(self, q: float) -> float:
+        """
+        최근 표본의 지연 백분위수를 반환합니다.
+
+        Args:
+            q: 0~100 사이 백분위
+
+        Returns:
+            float: 지연 (초)
+        """
+        with self._lock:
+            samples = sorted(self._recent)
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(q / 100.0 * (len(samples) - 1))))
+        return samples[index]
+
+    def summary(self) -> Dict[str, float]:
+        """
+        통계 요약을 반환합니다 (지연 단위: 밀리초).
+
+        Returns:
+            Dict[str, float]: ticks, missed, mean/p50/p95/max latency, jitter
+        """
+        return {
+            'ticks': self.ticks,
+            'missed': self.missed,
+            'mean_latency_ms': self.mean_latency * 1000.0,
+            'p50_latency_ms': self.percentile(50) * 1000.0,
+            'p95_latency_ms': self.percentile(95) * 1000.0,
+            'max_latency_ms': self.max_latency * 1000.0,
+            'jitter_ms': self.jitter * 1000.0,
+        }
+
+
+class IntervalScheduler:
+    """
+    monotonic 시계 기반 고정 주기 스케줄러.
+
+    전용 스레드에서 콜백을 실행하므로 Qt 이벤트 루프를 막지 않습니다.
+    콜백은 (틱 순번, 목표 monotonic 시각)을 인자로 받습니다.
+
+    Example:
+        >>> scheduler = IntervalScheduler(60.0, on_tick)
+        >>> scheduler.start()
+        >>> scheduler.stop()
+        >>> print(scheduler.stats.summary())
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        callback: Callable[[int, float], None],
+        name: str = 'interval-scheduler',
+        on_exit: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        IntervalScheduler 인스턴스를 초기화합니다.
+
+        Args:
+            interval: 실행 주기 (초)
+            callback: 틱마다 호출할 함수 (tick, deadline)
+            name: 스레드 이름
+            on_exit: 스케줄러 스레드 종료 직전에 호출할 함수 (스레드 자원 정리용)
+
+        Raises:
+            ValueError: interval이 0 이하인 경우
+        """
+        if interval <= 0:
+            raise ValueError(f"interval은 0보다 커야 합니다: {interval}")
+        self.interval: float = interval
+        self.stats: TickStats = TickStats()
+        self._callback = callback
+        self._on_exit = on_exit
+        self._name: str = name
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """스케줄러 실행 여부."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """스케줄러를 시작합니다. 첫 틱은 즉시 실행됩니다."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        스케줄러를 중지합니다.
+
+        Args:
+            timeout: 실행 중인 콜백 종료 대기 시간 (None이면 무제한)
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """스케줄러 스레드 본체."""
+        try:
+            self._loop()
+        finally:
+            if self._on_exit is not None:
+                self._on_exit()
+
+    def _loop(self) -> None:
+        """틱 루프."""
+        start = time.monotonic()
+        tick = 0
+        while not self._stop_event.is_set():
+            deadline = start + tick * self.interval
+            remaining = deadline - time.monotonic()
+            if remaining > 0 and self._stop_event.wait(remaining):
+                break
+
+            self.stats.record(time.monotonic() - deadline)
+            try:
+                self._callback(tick, deadline)
+            except Exception as e:
+                logger.error(f"{self._name} 틱 {tick} 실패: {e}")
+
+            # 다음 목표 시각 계산 (놓친 틱은 몰아서 실행하지 않고 건너뜀)
+            next_tick = tick + 1
+            elapsed_ticks = int((time.monotonic() - start) / self.interval)
+            if elapsed_ticks > next_tick:
+                self.stats.record_missed(elapsed_ticks - next_tick)
+                next_tick = elapsed_ticks
+            tick = next_tick
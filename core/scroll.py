@@ -0,0 +1,647 @@
+"""
+스크롤 캡처 모듈
+
+이 모듈은 영역 안의 내용이 스크롤되는 동안 프레임을 계속 grab하여
+하나의 긴 이미지로 이어 붙이는 스크롤 캡처 기능을 제공합니다.
+
+연속된 두 프레임의 세로 겹침은 행마다 CRC를 구해 행 해시 열로 만든 뒤,
+기준 구간(anchor)의 다항식 해시를 이전 프레임 위에서 굴려(rolling hash)
+후보 위치를 찾고 행 해시 열 비교로 확정하므로 비용이 프레임 높이에 선형입니다.
+두 프레임에서 같은 위치에 그대로 남은 위/아래 행은 고정 헤더/푸터로 보고
+본문 비교와 이어 붙이기에서 제외합니다.
+
+이어 붙인 결과는 행 묶음(strip) 단위로 보관하며, 메모리 한도를 넘으면
+임시 파일로 옮겨 메모리 사용량이 결과 높이와 무관하게 유지됩니다.
+최종 PNG도 strip을 순서대로 읽으며 스트리밍으로 인코딩합니다.
+"""
+import datetime
+import logging
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from constants import ScrollConfig
+from core.capture import ScreenCapture
+from core.frame import CaptureFrame
+from core.scheduler import IntervalScheduler
+
+logger = logging.getLogger(__name__)
+
+_HASH_MOD: int = (1 << 61) - 1
+_HASH_BASE: int = 1_000_003
+
+
+# =============================================================================
+# 행 해시 / 겹침 탐색
+# =============================================================================
+
+def row_hashes(frame: CaptureFrame, margin: int = 0) -> List[int]:
+    """
+    프레임의 행별 해시를 계산합니다.
+
+    Args:
+        frame: BGRA 프레임
+        margin: 좌우에서 제외할 픽셀 수 (스크롤바 등 행과 함께 움직이지 않는 부분)
+
+    Returns:
+        List[int]: 행마다 CRC32 (복사 없이 행 버퍼에서 직접 계산)
+    """
+    margin = min(max(0, margin), max(0, (frame.width - 1) // 2))
+    start = margin * CaptureFrame.BYTES_PER_PIXEL
+    end = (frame.width - margin) * CaptureFrame.BYTES_PER_PIXEL
+    return [zlib.crc32(frame.row(y)[start:end]) for y in range(frame.height)]
+
+
+def static_edges(before: List[int], after: List[int]) -> Tuple[int, int]:
+    """
+    두 프레임에서 같은 위치에 그대로 남은 위/아래 행 수를 구합니다.
+
+    Args:
+        before: 이전 프레임의 행 해시
+        after: 현재 프레임의 행 해시 (길이가 같아야 함)
+
+    Returns:
+        Tuple[int, int]: (헤더 행 수, 푸터 행 수), 두 프레임이 같으면 (높이, 0)
+    """
+    height = len(after)
+    header = 0
+    while header < height and before[header] == after[header]:
+        header += 1
+    footer = 0
+    while footer < height - header and before[height - 1 - footer] == after[height - 1 - footer]:
+        footer += 1
+    return header, footer
+
+
+def _anchor_start(hashes: List[int], window: int) -> int:
+    """
+    서로 다른 행이 가장 많은 window 구간의 시작 위치를 찾습니다.
+
+    빈 줄처럼 반복되는 행으로만 된 구간은 후보가 너무 많이 맞으므로 피합니다.
+
+    Args:
+        hashes: 행 해시 열
+        window: 구간 길이
+
+    Returns:
+        int: 구간 시작 위치
+    """
+    counts = Counter(hashes[:window])
+    best, best_distinct = 0, len(counts)
+    for start in range(1, len(hashes) - window + 1):
+        leaving = hashes[start - 1]
+        counts[leaving] -= 1
+        if not counts[leaving]:
+            del counts[leaving]
+        counts[hashes[start + window - 1]] += 1
+        if len(counts) > best_distinct:
+            best, best_distinct = start, len(counts)
+            if best_distinct == window:
+                break
+    return best
+
+
+def find_scroll(
+    before: List[int],
+    after: List[int],
+    window: int = ScrollConfig.HASH_WINDOW,
+    min_overlap: int = ScrollConfig.MIN_OVERLAP,
+    max_candidates: int = ScrollConfig.MAX_CANDIDATES
+) -> Optional[int]:
+    """
+    내용이 아래로 스크롤된 거리(행)를 rolling hash로 찾습니다.
+
+    after의 기준 구간 해시를 before 위에서 굴려 일치하는 위치마다
+    `before[d:] == after[:n - d]`를 확인하고, 겹침이 가장 큰(가장 작은) d를 반환합니다.
+    기준 구간은 어떤 d에서도 겹침에 들어가는 after[:min_overlap] 안에서만 고릅니다
+    (그 아래 행은 새로 드러난 행일 수 있어 before에 없을 수 있음).
+
+    Args:
+        before: 이전 프레임 본문의 행 해시
+        after: 현재 프레임 본문의 행 해시 (길이가 같아야 함)
+        window: 기준 구간 길이 (행)
+        min_overlap: 인정할 최소 겹침 (행)
+        max_candidates: 확인할 최대 후보 수
+
+    Returns:
+        Optional[int]: 스크롤 거리 (0이면 이동 없음), 겹침을 찾지 못하면 None
+    """
+    height = len(after)
+    if height != len(before) or height < min_overlap:
+        return None
+    window = max(1, min(window, min_overlap, height))
+
+    anchor = _anchor_start(after[:min_overlap], window)
+    power = pow(_HASH_BASE, window - 1, _HASH_MOD)
+
+    def initial(seq: List[int]) -> int:
+        value = 0
+        for item in seq:
+            value = (value * _HASH_BASE + item) % _HASH_MOD
+        return value
+
+    target = initial(after[anchor:anchor + window])
+    rolling = initial(before[:window])
+    checked = 0
+    for position in range(height - window + 1):
+        if position:
+            rolling = (
+                (rolling - before[position - 1] * power) * _HASH_BASE
+                + before[position + window - 1]
+            ) % _HASH_MOD
+        shift = position - anchor
+        if rolling != target or shift < 0:
+            continue
+        if height - shift < min_overlap:
+            break
+        checked += 1
+        if before[shift:] == after[:height - shift]:
+            return shift
+        if checked >= max_candidates:
+            break
+    return None
+
+
+# =============================================================================
+# strip 저장소 / PNG 스트리밍
+# =============================================================================
+
+class StripStore:
+    """
+    이어 붙인 행을 strip 단위로 보관하는 저장소.
+
+    보관량이 memory_limit를 넘으면 모든 strip을 임시 파일로 옮기고
+    이후 strip은 파일에 바로 이어 씁니다.
+
+    Attributes:
+        row_bytes: 한 행의 바이트 수
+        height: 보관된 행 수
+    """
+
+    def __init__(self, row_bytes: int, memory_limit: int = ScrollConfig.MEMORY_LIMIT) -> None:
+        """
+        StripStore 인스턴스를 초기화합니다.
+
+        Args:
+            row_bytes: 한 행의 바이트 수
+            memory_limit: 메모리에 보관할 최대 바이트 수
+        """
+        self.row_bytes: int = row_bytes
+        self.height: int = 0
+        self._memory_limit: int = memory_limit
+        self._strips: List[bytes] = []
+        self._in_memory: int = 0
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def spilled(self) -> bool:
+        """임시 파일 사용 여부."""
+        return self._file is not None
+
+    def append(self, frame: CaptureFrame, top: int, bottom: int) -> None:
+        """
+        프레임의 [top, bottom) 행을 하나의 strip으로 추가합니다.
+
+        Args:
+            frame: 원본 프레임
+            top: 시작 행
+            bottom: 끝 행 (포함하지 않음)
+        """
+        if bottom <= top:
+            return
+        strip = b''.join(frame.row(y) for y in range(top, bottom))
+        self.height += bottom - top
+        if self._file is None and self._in_memory + len(strip) > self._memory_limit:
+            self._file = tempfile.TemporaryFile(prefix='scroll_')
+            for previous in self._strips:
+                self._file.write(previous)
+            self._strips = []
+            self._in_memory = 0
+            logger.debug(f"스크롤 strip을 임시 파일로 이동 ({self.height}행)")
+        if self._file is not None:
+            self._file.write(strip)
+        else:
+            self._strips.append(strip)
+            self._in_memory += len(strip)
+
+    def iter_rows(self, chunk_rows: int = 256) -> Iterator[memoryview]:
+        """
+        보관된 행을 위에서부터 순서대로 반환합니다.
+
+        Args:
+            chunk_rows: 임시 파일에서 한 번에 읽을 행 수
+
+        Yields:
+            memoryview: 한 행의 BGRA 바이트
+        """
+        if self._file is None:
+            for strip in self._strips:
+                view = memoryview(strip)
+                for start in range(0, len(strip), self.row_bytes):
+                    yield view[start:start + self.row_bytes]
+            return
+
+        self._file.flush()
+        self._file.seek(0)
+        while True:
+            chunk = self._file.read(self.row_bytes * chunk_rows)
+            if not chunk:
+                break
+            view = memoryview(chunk)
+            for start in range(0, len(chunk), self.row_bytes):
+                yield view[start:start + self.row_bytes]
+        self._file.seek(0, 2)
+
+    def close(self) -> None:
+        """보관된 strip과 임시 파일을 해제합니다."""
+        self._strips = []
+        self._in_memory = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """PNG 청크 하나를 만듭니다."""
+    return (
+        struct.pack('>I', len(data)) + kind + data
+        + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+    )
+
+
+def write_png(path: Path, width: int, height: int, rows: Iterator[memoryview]) -> None:
+    """
+    BGRA 행을 RGB PNG로 스트리밍 인코딩합니다 (전체 이미지를 메모리에 올리지 않음).
+
+    Args:
+        path: 저장 경로
+        width: 너비 (픽셀)
+        height: 행 수
+        rows: 위에서부터의 BGRA 행
+    """
+    compressor = zlib.compressobj(6)
+    line = bytearray(1 + width * 3)  # 필터 바이트(0) + RGB
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)))
+        pending: List[bytes] = []
+        pending_size = 0
+        for row in rows:
+            line[1::3] = row[2::4]
+            line[2::3] = row[1::4]
+            line[3::3] = row[0::4]
+            data = compressor.compress(line)
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+                if pending_size >= 1 << 20:
+                    f.write(_png_chunk(b'IDAT', b''.join(pending)))
+                    pending, pending_size = [], 0
+        pending.append(compressor.flush())
+        f.write(_png_chunk(b'IDAT', b''.join(pending)))
+        f.write(_png_chunk(b'IEND', b''))
+
+
+# =============================================================================
+# 이어 붙이기
+# =============================================================================
+
+class ScrollStitcher:
+    """
+    스크롤되는 프레임을 하나의 긴 이미지로 이어 붙이는 스티처.
+
+    첫 스크롤이 확인되면 그 두 프레임에서 고정 헤더/푸터 행 수를 정하고,
+    이후 프레임은 본문(헤더와 푸터 사이)끼리만 비교하여 새로 드러난 아래쪽 행만 추가합니다.
+    푸터는 finish()에서 마지막 프레임의 것을 한 번 붙입니다.
+    아래 방향 스크롤만 지원합니다. 겹침을 찾지 못한 프레임(너무 빠른 스크롤 등)은
+    lost로 집계하고, 그 프레임의 본문 전체를 이어 붙인 뒤 새 기준으로 삼습니다.
+    그 사이 내용은 빠졌을 수 있으므로 이어 붙인 위치를 gaps에 기록합니다.
+
+    Attributes:
+        header: 고정 헤더 행 수 (첫 스크롤 전에는 None)
+        footer: 고정 푸터 행 수 (첫 스크롤 전에는 None)
+        frames: 처리한 프레임 수
+        scrolls: 겹침으로 이어 붙인 횟수
+        lost: 겹침을 찾지 못한 프레임 수
+        gaps: 연속성이 끊긴 결과 이미지의 행 위치 (그 행부터 새 기준 프레임)
+
+    Example:
+        >>> stitcher = ScrollStitcher()
+        >>> for frame in frames:
+        ...     stitcher.feed(frame)
+        >>> stitcher.finish()
+        >>> stitcher.save(Path('long.png'))
+    """
+
+    def __init__(
+        self,
+        window: int = ScrollConfig.HASH_WINDOW,
+        min_overlap: int = ScrollConfig.MIN_OVERLAP,
+        margin: int = ScrollConfig.EDGE_IGNORE,
+        memory_limit: int = ScrollConfig.MEMORY_LIMIT
+    ) -> None:
+        """
+        ScrollStitcher 인스턴스를 초기화합니다.
+
+        Args:
+            window: rolling hash 기준 구간 길이 (행)
+            min_overlap: 연속 프레임 사이 최소 겹침 (행)
+            margin: 행 해시에서 제외할 좌우 픽셀 수
+            memory_limit: strip을 메모리에 보관할 최대 바이트 수
+        """
+        self.window: int = window
+        self.min_overlap: int = min_overlap
+        self.margin: int = margin
+        self.header: Optional[int] = None
+        self.footer: Optional[int] = None
+        self.frames: int = 0
+        self.scrolls: int = 0
+        self.lost: int = 0
+        self.gaps: List[int] = []
+        self._memory_limit: int = memory_limit
+        self._store: Optional[StripStore] = None
+        self._reference: Optional[CaptureFrame] = None
+        self._reference_hashes: List[int] = []
+        self._finished: bool = False
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """(너비, 현재까지 이어 붙인 높이), 첫 스크롤 전에는 첫 프레임 크기."""
+        if self._reference is None:
+            return (0, 0)
+        if self._store is None:
+            return self._reference.size
+        return (self._reference.width, self._store.height + (0 if self._finished else self.footer))
+
+    def feed(self, frame: CaptureFrame) -> int:
+        """
+        프레임 하나를 처리합니다.
+
+        Args:
+            frame: 스크롤 중 grab한 프레임 (첫 프레임과 크기가 같아야 함)
+
+        Returns:
+            int: 이번 프레임으로 추가된 행 수
+
+        Raises:
+            RuntimeError: finish() 이후 호출한 경우
+        """
+        if self._finished:
+            raise RuntimeError("이미 finish()된 스티처입니다")
+        self.frames += 1
+        hashes = row_hashes(frame, self.margin)
+
+        reference = self._reference
+        if reference is None:
+            self._set_reference(frame, hashes)
+            return 0
+        if frame.size != reference.size:
+            self.lost += 1
+            return 0
+        if hashes == self._reference_hashes:
+            return 0
+
+        height = frame.height
+        if self.header is None:
+            header, footer = static_edges(self._reference_hashes, hashes)
+        else:
+            header, footer = self.header, self.footer
+        body_end = height - footer
+        shift = find_scroll(
+            self._reference_hashes[header:body_end],
+            hashes[header:body_end],
+            self.window,
+            self.min_overlap
+        )
+        if shift == 0:
+            # 본문은 그대로이고 헤더/푸터만 바뀜 (스크롤 아님)
+            return 0
+
+        if self._store is None:
+            self._start_store(reference, header, footer)
+        if shift is None:
+            # 겹침을 잃으면 오래된 기준과 계속 비교하지 않도록 이 프레임으로 다시 고정
+            self.lost += 1
+            self.gaps.append(self._store.height)
+            self._store.append(frame, self.header, body_end)
+            self._set_reference(frame, hashes)
+            logger.warning(f"스크롤 겹침을 찾지 못함: 결과 {self.gaps[-1]}행에서 끊김")
+            return body_end - self.header
+
+        self._store.append(frame, body_end - shift, body_end)
+        self.scrolls += 1
+        self._set_reference(frame, hashes)
+        return shift
+
+    def _start_store(self, reference: CaptureFrame, header: int, footer: int) -> None:
+        """
+        헤더/푸터를 확정하고 기준 프레임의 푸터 위까지로 strip 저장소를 시작합니다.
+
+        Args:
+            reference: 첫 기준 프레임
+            header: 고정 헤더 행 수
+            footer: 고정 푸터 행 수
+        """
+        self.header, self.footer = header, footer
+        self._store = StripStore(
+            reference.width * CaptureFrame.BYTES_PER_PIXEL, self._memory_limit
+        )
+        self._store.append(reference, 0, reference.height - footer)
+        logger.debug(f"스크롤 캡처 헤더 {header}행, 푸터 {footer}행")
+
+    def _set_reference(self, frame: CaptureFrame, hashes: List[int]) -> None:
+        """
+        비교 기준 프레임을 바꿉니다 (grab마다 새 버퍼이므로 복사 없이 보관).
+
+        Args:
+            frame: 새 기준 프레임
+            hashes: 그 행 해시
+        """
+        self._reference = frame
+        self._reference_hashes = hashes
+
+    def finish(self) -> Tuple[int, int]:
+        """
+        마지막 프레임의 푸터를 붙이고 이어 붙이기를 끝냅니다.
+
+        스크롤이 한 번도 없었으면 첫 프레임 전체가 결과가 됩니다.
+
+        Returns:
+            Tuple[int, int]: 최종 (너비, 높이)
+        """
+        if self._finished or self._reference is None:
+            return self.size
+        reference = self._reference
+        if self._store is None:
+            self._store = StripStore(
+                reference.width * CaptureFrame.BYTES_PER_PIXEL, self._memory_limit
+            )
+            self._store.append(reference, 0, reference.height)
+        else:
+            self._store.append(reference, reference.height - self.footer, reference.height)
+        self._finished = True
+        return self.size
+
+    def save(self, path: Path) -> Path:
+        """
+        결과를 PNG로 저장합니다 (finish()되지 않았으면 먼저 finish()).
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            Path: 저장 경로
+
+        Raises:
+            ValueError: 프레임이 하나도 없는 경우
+        """
+        width, height = self.finish()
+        if self._store is None or not height:
+            raise ValueError("이어 붙일 프레임이 없습니다")
+        write_png(path, width, height, self._store.iter_rows())
+        return path
+
+    def close(self) -> None:
+        """strip 저장소와 기준 프레임을 해제합니다."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        self._reference = None
+
+
+# =============================================================================
+# 세션
+# =============================================================================
+
+class ScrollSession:
+    """
+    스크롤 캡처 세션.
+
+    interval마다 시작 시점의 영역을 grab하여 ScrollStitcher에 넘기고,
+    중지하면 결과를 `scroll_<시작시각>.png`로 저장할 수 있습니다.
+    사용자는 세션이 도는 동안 영역 안의 내용을 아래로 스크롤합니다.
+
+    Example:
+        >>> session = ScrollSession(capturer, bbox)
+        >>> session.start()
+        >>> summary = session.stop()
+        >>> executor.submit(session.save)
+    """
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        bbox: Tuple[int, int, int, int],
+        interval: float = ScrollConfig.INTERVAL,
+        stitcher: Optional[ScrollStitcher] = None
+    ) -> None:
+        """
+        ScrollSession 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            bbox: 캡처 영역 (left, top, right, bottom), 세션 중 고정
+            interval: grab 주기 (초)
+            stitcher: 이어 붙이기에 사용할 스티처 (None이면 기본 설정)
+        """
+        self.interval: float = interval
+        self.stitcher: ScrollStitcher = stitcher or ScrollStitcher()
+        self._capturer: ScreenCapture = capturer
+        self._bbox: Tuple[int, int, int, int] = bbox
+        self._lock = threading.Lock()
+
+        stamp = datetime.datetime.now().strftime(ScreenCapture.TIMESTAMP_FORMAT)
+        self.path: Path = capturer.output_dir / f"scroll_{stamp}.png"
+        self._started_at: float = time.time()
+
+        self._scheduler = IntervalScheduler(
+            interval,
+            self._on_tick,
+            name='capture-scroll',
+            on_exit=capturer.release_thread_session
+        )
+
+    @property
+    def running(self) -> bool:
+        """세션 실행 여부."""
+        return self._scheduler.running
+
+    def start(self) -> None:
+        """세션을 시작합니다."""
+        self._started_at = time.time()
+        self._scheduler.start()
+        logger.info(f"스크롤 캡처 시작: bbox={self._bbox}, interval={self.interval}s")
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        grab을 멈추고 통계를 반환합니다 (저장은 save()에서).
+
+        Returns:
+            Dict[str, Any]: 프레임/스크롤/lost 수와 현재 결과 크기
+        """
+        self._scheduler.stop()
+        summary = self.summary()
+        logger.info(f"스크롤 캡처 종료: {summary}")
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계 요약을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 프레임/스크롤/lost 수, 끊긴 행 위치(gaps), 헤더/푸터 행 수, 결과 크기
+        """
+        with self._lock:
+            stitcher = self.stitcher
+            width, height = stitcher.size
+            return {
+                'frames': stitcher.frames,
+                'scrolls': stitcher.scrolls,
+                'lost': stitcher.lost,
+                'gaps': list(stitcher.gaps),
+                'header': stitcher.header,
+                'footer': stitcher.footer,
+                'width': width,
+                'height': height,
+            }
+
+    def save(self) -> Optional[Path]:
+        """
+        이어 붙인 결과를 저장하고 스티처를 해제합니다 (작업 스레드에서 호출).
+
+        Returns:
+            Optional[Path]: 저장 경로 (프레임이 없거나 실패하면 None)
+        """
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                path = self.stitcher.save(self.path)
+                logger.info(f"스크롤 캡처 저장: {path} ({self.stitcher.size})")
+                catalog = self._capturer.catalog
+                if catalog is not None:
+                    catalog.add(path, self._started_at, self._bbox, 'scroll', self.stitcher.size)
+                return path
+            except Exception as e:
+                logger.error(f"스크롤 캡처 저장 실패: {self.path} ({e})")
+                return None
+            finally:
+                self.stitcher.close()
+
+    def _on_tick(self, tick: int, deadline: float) -> None:
+        """
+        스케줄러 스레드에서 호출되는 틱 처리.
+
+        Args:
+            tick: 틱 순번
+            deadline: 목표 monotonic 시각
+        """
+        frame = self._capturer.grab_frame(self._bbox)
+        if frame is None:
+            return
+        with self._lock:
+            self.stitcher.feed(frame)
@@ -0,0 +1,523 @@
+"""
+델타 프레임 시퀀스 컨테이너 모듈
+
+이 모듈은 거의 변하지 않는 화면을 주기적으로 캡처한 프레임을 작게 저장하는
+시퀀스 컨테이너(.cseq)의 writer/reader를 제공합니다.
+
+- keyframe_interval 프레임마다 전체 프레임(keyframe)을, 그 사이에는 직전 프레임과
+  달라진 타일만(delta) zlib으로 압축해 레코드로 이어 씁니다.
+- 레코드마다 CRC를 두고, 레코드를 다 쓴 뒤에만 인덱스(.cseq.idx)에 위치를 추가합니다.
+  이미 쓴 바이트는 다시 쓰지 않으므로 쓰기 도중 종료되어도 앞선 프레임은 손상되지 않으며,
+  다시 열 때 끝의 불완전한 레코드만 잘라 내고 인덱스를 복구합니다.
+- reader는 데이터 파일을 mmap하고 인덱스로 프레임 K의 직전 keyframe을 찾아
+  그 뒤 delta들을 적용해 복원합니다 (순차 접근은 직전 복원 결과에서 이어서 적용).
+
+파일 형식 (little endian):
+    헤더 (32B): magic 'CSEQ', version u16, tile u16, width u32, height u32,
+                keyframe_interval u32, 예약 12B
+    레코드: magic 'CSQR', kind u8 (0 key, 1 delta), 예약 3B, index u32,
+            timestamp f64, payload 길이 u32, payload CRC32 u32, payload
+        key payload:   zlib(BGRA 전체 프레임, 행 여백 없음)
+        delta payload: zlib(타일 수 u32, 타일 번호 u32 * 수, 타일 BGRA 바이트 순서대로)
+    인덱스 항목 (28B): 레코드 offset u64, 레코드 길이 u32, kind u8, 예약 3B,
+                       keyframe 번호 u32, timestamp f64
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from constants import SequenceConfig
+from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b'CSEQ'
+RECORD_MAGIC: bytes = b'CSQR'
+VERSION: int = 1
+
+KIND_KEY: int = 0
+KIND_DELTA: int = 1
+
+_HEADER = struct.Struct('<4sHHIII12x')
+_RECORD = struct.Struct('<4sB3xIdII')
+_INDEX = struct.Struct('<QIB3xId')
+_U32 = struct.Struct('<I')
+
+BYTES_PER_PIXEL: int = CaptureFrame.BYTES_PER_PIXEL
+
+
+class SequenceError(Exception):
+    """컨테이너 형식 오류 (헤더 불일치, 손상된 레코드 등)."""
+
+
+class IndexEntry:
+    """
+    인덱스 항목 하나.
+
+    Attributes:
+        offset: 레코드 시작 위치 (바이트)
+        length: 레코드 전체 길이 (헤더 포함)
+        kind: KIND_KEY 또는 KIND_DELTA
+        key_index: 이 프레임이 기대는 keyframe 번호
+        timestamp: 캡처 시각 (epoch 초)
+    """
+
+    __slots__ = ('offset', 'length', 'kind', 'key_index', 'timestamp')
+
+    def __init__(self, offset: int, length: int, kind: int, key_index: int, timestamp: float) -> None:
+        self.offset: int = offset
+        self.length: int = length
+        self.kind: int = kind
+        self.key_index: int = key_index
+        self.timestamp: float = timestamp
+
+    def pack(self) -> bytes:
+        """인덱스 파일에 쓸 바이트."""
+        return _INDEX.pack(self.offset, self.length, self.kind, self.key_index, self.timestamp)
+
+
+def tile_boxes(width: int, height: int, tile: int) -> List[Tuple[int, int, int, int]]:
+    """
+    프레임을 덮는 타일 영역 목록 (행 우선, 프레임 좌표).
+
+    Args:
+        width: 프레임 너비
+        height: 프레임 높이
+        tile: 타일 한 변 크기
+
+    Returns:
+        List[Tuple[int, int, int, int]]: (left, top, right, bottom) 목록
+    """
+    return [
+        (x, y, min(x + tile, width), min(y + tile, height))
+        for y in range(0, height, tile)
+        for x in range(0, width, tile)
+    ]
+
+
+def _index_path(path: Path) -> Path:
+    """데이터 파일에 대응하는 인덱스 경로."""
+    return path.with_name(path.name + '.idx')
+
+
+def _read_header(data, path: Path) -> Tuple[int, int, int, int]:
+    """
+    헤더를 해석합니다.
+
+    Returns:
+        Tuple[int, int, int, int]: (tile, width, height, keyframe_interval)
+
+    Raises:
+        SequenceError: 헤더가 없거나 형식이 다른 경우
+    """
+    if len(data) < _HEADER.size:
+        raise SequenceError(f"헤더가 불완전합니다: {path}")
+    magic, version, tile, width, height, interval = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise SequenceError(f"지원하지 않는 시퀀스 파일입니다: {path}")
+    return tile, width, height, interval
+
+
+def _valid_record(data, offset: int) -> Optional[Tuple[int, int, int, float]]:
+    """
+    offset 위치의 레코드가 완전하고 CRC가 맞는지 확인합니다.
+
+    Returns:
+        Optional[Tuple[int, int, int, float]]: (레코드 길이, kind, 프레임 번호, timestamp) 또는 None
+    """
+    if offset + _RECORD.size > len(data):
+        return None
+    magic, kind, index, timestamp, length, crc = _RECORD.unpack_from(data, offset)
+    end = offset + _RECORD.size + length
+    if magic != RECORD_MAGIC or kind not in (KIND_KEY, KIND_DELTA) or end > len(data):
+        return None
+    if zlib.crc32(data[offset + _RECORD.size:end]) != crc:
+        return None
+    return _RECORD.size + length, kind, index, timestamp
+
+
+def _load_index(path: Path, data) -> Tuple[List[IndexEntry], int]:
+    """
+    인덱스를 읽고, 인덱스 뒤에 완전히 기록된 레코드가 있으면 스캔하여 이어 붙입니다.
+
+    Args:
+        path: 데이터 파일 경로
+        data: 데이터 파일 내용 (mmap 또는 bytes)
+
+    Returns:
+        Tuple[List[IndexEntry], int]: (유효한 항목 목록, 디스크 인덱스에 이미 있는 항목 수)
+    """
+    entries: List[IndexEntry] = []
+    index_path = _index_path(path)
+    raw = index_path.read_bytes() if index_path.exists() else b''
+    for start in range(0, len(raw) - _INDEX.size + 1, _INDEX.size):
+        entry = IndexEntry(*_INDEX.unpack_from(raw, start))
+        expected = entries[-1].offset + entries[-1].length if entries else _HEADER.size
+        if entry.offset != expected or entry.offset + entry.length > len(data):
+            break
+        entries.append(entry)
+    indexed = len(entries)
+
+    # 레코드는 썼지만 인덱스 추가 전에 종료된 경우 데이터 파일에서 복구
+    offset = entries[-1].offset + entries[-1].length if entries else _HEADER.size
+    key_index = entries[-1].key_index if entries else 0
+    while True:
+        record = _valid_record(data, offset)
+        if record is None or record[2] != len(entries):
+            break
+        length, kind, index, timestamp = record
+        if kind == KIND_KEY:
+            key_index = index
+        elif not entries:
+            break
+        entries.append(IndexEntry(offset, length, kind, key_index, timestamp))
+        offset += length
+    if len(entries) > indexed:
+        logger.info(f"시퀀스 인덱스 복구: {path} ({len(entries) - indexed}개 레코드)")
+    return entries, indexed
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+class DeltaSequenceWriter:
+    """
+    델타 프레임 시퀀스 writer.
+
+    프레임마다 타일 해시를 직전 프레임과 비교해 바뀐 타일만 기록하고,
+    keyframe_interval마다 또는 바뀐 타일이 key_threshold 비율을 넘으면 keyframe을 기록합니다.
+    append()는 한 스레드에서 순서대로 호출해야 합니다.
+
+    Example:
+        >>> with DeltaSequenceWriter(path, 1280, 720) as writer:
+        ...     writer.append(frame)
+        >>> reader = DeltaSequenceReader(path)
+        >>> reader.frame(42).to_pil()
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        width: int,
+        height: int,
+        tile: int = SequenceConfig.TILE_SIZE,
+        keyframe_interval: int = SequenceConfig.KEYFRAME_INTERVAL,
+        key_threshold: float = SequenceConfig.KEY_THRESHOLD,
+        level: int = SequenceConfig.ZLIB_LEVEL,
+        fsync: bool = SequenceConfig.FSYNC
+    ) -> None:
+        """
+        DeltaSequenceWriter 인스턴스를 초기화합니다.
+
+        파일이 이미 있으면 헤더를 확인하고 끝의 불완전한 레코드를 잘라 낸 뒤 이어 씁니다
+        (이어 쓴 첫 프레임은 keyframe).
+
+        Args:
+            path: 데이터 파일 경로 (인덱스는 path + '.idx')
+            width: 프레임 너비
+            height: 프레임 높이
+            tile: 타일 한 변 크기 (픽셀)
+            keyframe_interval: keyframe 간격 (프레임)
+            key_threshold: 바뀐 타일 비율이 이 값을 넘으면 keyframe으로 기록
+            level: zlib 압축 수준
+            fsync: 레코드마다 디스크 동기화 여부
+
+        Raises:
+            SequenceError: 기존 파일의 형식이나 크기가 다른 경우
+        """
+        self.path: Path = path
+        self.width: int = width
+        self.height: int = height
+        self.tile: int = tile
+        self.keyframe_interval: int = max(1, keyframe_interval)
+        self.key_threshold: float = key_threshold
+        self._level: int = level
+        self._fsync: bool = fsync
+        self._boxes = tile_boxes(width, height, tile)
+        self._hashes: Optional[List[bytes]] = None
+        self._last_key: int = 0
+        self.bytes_raw: int = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: List[IndexEntry] = []
+        if path.exists() and path.stat().st_size > 0:
+            self._recover()
+        else:
+            with open(path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, tile, width, height, self.keyframe_interval))
+            _index_path(path).write_bytes(b'')
+        self._data: BinaryIO = open(path, 'r+b')
+        self._data.seek(0, os.SEEK_END)
+        self._index: BinaryIO = open(_index_path(path), 'ab')
+
+    def _recover(self) -> None:
+        """기존 파일을 확인하고 유효한 레코드 뒤를 잘라 냅니다."""
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        tile, width, height, _interval = _read_header(data, self.path)
+        if (tile, width, height) != (self.tile, self.width, self.height):
+            raise SequenceError(
+                f"기존 시퀀스와 설정이 다릅니다: {self.path} "
+                f"(tile={tile}, {width}x{height})"
+            )
+        entries, indexed = _load_index(self.path, data)
+        end = entries[-1].offset + entries[-1].length if entries else _HEADER.size
+        if end < len(data):
+            logger.warning(f"시퀀스 끝의 불완전한 레코드 제거: {self.path} ({len(data) - end}B)")
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+        with open(_index_path(self.path), 'r+b' if _index_path(self.path).exists() else 'wb') as f:
+            f.truncate(indexed * _INDEX.size)
+            f.seek(0, os.SEEK_END)
+            for entry in entries[indexed:]:
+                f.write(entry.pack())
+        self._entries = entries
+
+    def __enter__(self) -> 'DeltaSequenceWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes_written(self) -> int:
+        """데이터 파일 크기 (헤더 포함)."""
+        if not self._entries:
+            return _HEADER.size
+        last = self._entries[-1]
+        return last.offset + last.length
+
+    def _tile_hashes(self, frame: CaptureFrame) -> List[bytes]:
+        """타일별 해시 (행 조각을 복사 없이 해시에 넣음)."""
+        hashes: List[bytes] = []
+        for left, top, right, bottom in self._boxes:
+            h = hashlib.blake2b(digest_size=16)
+            start, end = left * BYTES_PER_PIXEL, right * BYTES_PER_PIXEL
+            for y in range(top, bottom):
+                h.update(frame.row(y)[start:end])
+            hashes.append(h.digest())
+        return hashes
+
+    def _tile_bytes(self, frame: CaptureFrame, index: int) -> bytes:
+        """타일 하나의 BGRA 바이트 (행 여백 없음)."""
+        left, top, right, bottom = self._boxes[index]
+        start, end = left * BYTES_PER_PIXEL, right * BYTES_PER_PIXEL
+        return b''.join(frame.row(y)[start:end] for y in range(top, bottom))
+
+    def append(self, frame: CaptureFrame) -> int:
+        """
+        프레임을 기록합니다.
+
+        Args:
+            frame: 컨테이너와 크기가 같은 프레임
+
+        Returns:
+            int: 기록된 프레임 번호
+
+        Raises:
+            ValueError: 프레임 크기가 다른 경우
+        """
+        if frame.size != (self.width, self.height):
+            raise ValueError(
+                f"프레임 크기 {frame.width}x{frame.height}가 시퀀스 크기 "
+                f"{self.width}x{self.height}와 다릅니다"
+            )
+        number = len(self._entries)
+        hashes = self._tile_hashes(frame)
+        changed: List[int] = []
+        if self._hashes is not None:
+            changed = [i for i, (a, b) in enumerate(zip(self._hashes, hashes)) if a != b]
+        is_key = (
+            self._hashes is None
+            or number - self._last_key >= self.keyframe_interval
+            or len(changed) > self.key_threshold * len(self._boxes)
+        )
+
+        if is_key:
+            raw = frame.tobytes()
+            kind = KIND_KEY
+            self._last_key = number
+        else:
+            parts = [_U32.pack(len(changed))]
+            parts.extend(_U32.pack(i) for i in changed)
+            parts.extend(self._tile_bytes(frame, i) for i in changed)
+            raw = b''.join(parts)
+            kind = KIND_DELTA
+        payload = zlib.compress(raw, self._level)
+        self.bytes_raw += frame.width * frame.height * BYTES_PER_PIXEL
+
+        record = _RECORD.pack(
+            RECORD_MAGIC, kind, number, frame.timestamp, len(payload), zlib.crc32(payload)
+        )
+        entry = IndexEntry(
+            self.bytes_written, len(record) + len(payload), kind, self._last_key, frame.timestamp
+        )
+        # 레코드를 끝까지 쓴 뒤에만 인덱스에 추가 (종료 시점과 무관하게 앞선 프레임 보존)
+        self._data.write(record)
+        self._data.write(payload)
+        self._data.flush()
+        if self._fsync:
+            os.fsync(self._data.fileno())
+        self._index.write(entry.pack())
+        self._index.flush()
+
+        self._entries.append(entry)
+        self._hashes = hashes
+        return number
+
+    def close(self) -> None:
+        """파일을 닫습니다."""
+        for f in (self._data, self._index):
+            if not f.closed:
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+class DeltaSequenceReader:
+    """
+    델타 프레임 시퀀스 reader (임의 접근).
+
+    데이터 파일을 mmap하고, frame(K)는 K 이전의 가장 가까운 keyframe부터 delta를 적용해
+    복원합니다. 직전에 복원한 프레임과 같은 keyframe 구간의 뒤쪽 프레임을 요청하면
+    그 결과에서 이어서 적용하므로 순차 재생은 프레임당 delta 하나만 처리합니다.
+
+    Attributes:
+        width: 프레임 너비
+        height: 프레임 높이
+        tile: 타일 한 변 크기
+        keyframe_interval: 기록 시 keyframe 간격
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        DeltaSequenceReader 인스턴스를 초기화합니다.
+
+        Args:
+            path: 데이터 파일 경로
+
+        Raises:
+            SequenceError: 형식이 다른 경우
+        """
+        self.path: Path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.tile, self.width, self.height, self.keyframe_interval = _read_header(
+                self._map, path
+            )
+            self._entries, _ = _load_index(path, self._map)
+        except Exception:
+            self.close()
+            raise
+        self._boxes = tile_boxes(self.width, self.height, self.tile)
+        self._cached: Optional[Tuple[int, bytearray]] = None
+
+    def __enter__(self) -> 'DeltaSequenceReader':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def timestamps(self) -> List[float]:
+        """프레임별 캡처 시각."""
+        return [entry.timestamp for entry in self._entries]
+
+    def stats(self) -> Dict[str, float]:
+        """
+        저장 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 프레임/keyframe 수, 파일 크기, 원본 대비 압축률
+        """
+        raw = len(self._entries) * self.width * self.height * BYTES_PER_PIXEL
+        size = len(self._map)
+        return {
+            'frames': len(self._entries),
+            'keyframes': sum(1 for entry in self._entries if entry.kind == KIND_KEY),
+            'bytes': size,
+            'ratio': raw / size if size else 0.0,
+        }
+
+    def _payload(self, number: int) -> bytes:
+        """프레임 레코드의 payload를 압축 해제합니다."""
+        entry = self._entries[number]
+        start = entry.offset + _RECORD.size
+        return zlib.decompress(self._map[start:entry.offset + entry.length])
+
+    def _apply_delta(self, canvas: bytearray, number: int) -> None:
+        """delta 레코드의 타일을 canvas에 덮어씁니다."""
+        payload = self._payload(number)
+        count = _U32.unpack_from(payload, 0)[0]
+        indices = struct.unpack_from(f'<{count}I', payload, _U32.size)
+        position = _U32.size * (count + 1)
+        stride = self.width * BYTES_PER_PIXEL
+        view = memoryview(payload)
+        for index in indices:
+            left, top, right, bottom = self._boxes[index]
+            row_len = (right - left) * BYTES_PER_PIXEL
+            for y in range(top, bottom):
+                start = y * stride + left * BYTES_PER_PIXEL
+                canvas[start:start + row_len] = view[position:position + row_len]
+                position += row_len
+
+    def frame(self, number: int) -> CaptureFrame:
+        """
+        프레임 하나를 복원합니다.
+
+        Args:
+            number: 프레임 번호 (음수면 끝에서부터)
+
+        Returns:
+            CaptureFrame: 복원된 BGRA 프레임
+
+        Raises:
+            IndexError: 범위를 벗어난 경우
+        """
+        if number < 0:
+            number += len(self._entries)
+        if not 0 <= number < len(self._entries):
+            raise IndexError(f"프레임 번호 범위 밖: {number} (0~{len(self._entries) - 1})")
+
+        entry = self._entries[number]
+        cached = self._cached
+        if (
+            cached is not None
+            and self._entries[cached[0]].key_index == entry.key_index
+            and cached[0] <= number
+        ):
+            current, canvas = cached
+        else:
+            current, canvas = entry.key_index, bytearray(self._payload(entry.key_index))
+        for following in range(current + 1, number + 1):
+            self._apply_delta(canvas, following)
+        self._cached = (number, canvas)
+
+        return CaptureFrame(
+            bytes(canvas), self.width, self.height,
+            timestamp=entry.timestamp, bbox=(0, 0, self.width, self.height)
+        )
+
+    def close(self) -> None:
+        """mmap과 파일을 닫습니다."""
+        self._cached = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
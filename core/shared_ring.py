@@ -0,0 +1,806 @@
+"""
+공유 메모리 프레임 링 모듈
+
+이 모듈은 grab한 BGRA 프레임을 multiprocessing.shared_memory 링에 게시하여
+같은 머신의 다른 프로세스가 PNG 인코딩/디스크 왕복 없이 프레임을 읽을 수 있게 합니다.
+
+메모리 배치 (리틀 엔디언):
+    제어 세그먼트 `<name>` (64B): magic, version, 생산자 PID, 세대(generation)
+    링 세그먼트 `<name>-<세대>`:
+        [전역 헤더 64B] magic, version, 슬롯 수, 슬롯 데이터 크기, 최신 순번
+        [슬롯 헤더 64B x N] seqlock, 순번, 타임스탬프, bbox(left, top), width, height, stride
+        [슬롯 데이터 x N] BGRA 픽셀 (64B 정렬)
+
+슬롯은 게시 영역 크기로 잡고, 영역이 슬롯보다 커지면 더 큰 링 세그먼트를 새 세대로 만든 뒤
+제어 세그먼트의 세대를 올립니다. 소비자는 세대가 바뀐 것을 보고 새 링에 다시 연결합니다.
+(Windows에서는 열린 매핑의 이름을 다시 만들 수 없으므로 세대마다 이름을 바꿉니다.)
+
+찢어진 읽기 방지 (seqlock):
+    생산자는 슬롯을 쓰기 전에 seqlock을 홀수로, 다 쓴 뒤 짝수로 올립니다.
+    소비자는 읽기 전후의 seqlock이 같고 짝수일 때만 프레임을 유효한 것으로 봅니다.
+    생산자는 소비자를 기다리지 않으며, 소비자가 느리면 해당 프레임만 무효가 됩니다.
+    (CPython에는 메모리 배리어가 없으므로 쓰기 순서는 x86/ARM64 기본 동작에 의존합니다.)
+"""
+import logging
+import os
+import struct
+import sys
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from constants import SharedRingConfig
+from core.capture import ScreenCapture
+from core.frame import CaptureFrame
+from core.scheduler import IntervalScheduler
+
+logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b'SCRING01'
+VERSION: int = 3
+
+# 제어 헤더: magic, version, (예약), 생산자 PID / 세대 (별도 갱신)
+_CONTROL = struct.Struct('<8sIIQ')
+_GENERATION = struct.Struct('<Q')
+_GENERATION_OFFSET: int = _CONTROL.size
+_CONTROL_SIZE: int = 64
+
+# 전역 헤더: magic, version, 슬롯 수, 슬롯 데이터 크기 / 최신 순번 (별도 갱신)
+_GLOBAL = struct.Struct('<8sIIQ')
+_LATEST = struct.Struct('<Q')
+_LATEST_OFFSET: int = _GLOBAL.size
+_GLOBAL_SIZE: int = 64
+
+# 이름이 남아 있는 세대를 건너뛸 최대 횟수
+_GENERATION_RETRIES: int = 16
+
+# 슬롯 헤더: seqlock / 순번, 타임스탬프, left, top, width, height, stride
+_LOCK = struct.Struct('<Q')
+_META = struct.Struct('<QdiiIII')
+_SLOT_HEADER_SIZE: int = 64
+
+_ALIGN: int = 64
+
+
+def _align(value: int) -> int:
+    """64바이트 경계로 올림합니다."""
+    return (value + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _process_alive(pid: int) -> bool:
+    """
+    프로세스가 실행 중인지 확인합니다.
+
+    Windows에서 os.kill()은 프로세스를 종료시키므로 OpenProcess로 확인합니다.
+    확인할 수 없는 경우(권한 부족 등)는 실행 중으로 봅니다.
+
+    Args:
+        pid: 프로세스 ID
+
+    Returns:
+        bool: 실행 중이거나 확인할 수 없으면 True
+    """
+    if sys.platform == 'win32':
+        import ctypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        ERROR_INVALID_PARAMETER = 87
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # 없는 PID는 ERROR_INVALID_PARAMETER, 그 외(접근 거부)는 살아 있는 것으로 간주
+            return kernel32.GetLastError() != ERROR_INVALID_PARAMETER
+        try:
+            code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return True
+            return code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _ring_name(name: str, generation: int) -> str:
+    """세대별 링 세그먼트 이름."""
+    return f"{name}-{generation}"
+
+
+def _stale_control(name: str) -> Optional[Tuple[int, int]]:
+    """
+    같은 이름의 제어 세그먼트가 종료된 생산자가 남긴 것이면 그 PID와 세대를 반환합니다.
+
+    형식이 다르거나 PID가 없거나 생산자가 아직 실행 중이면 None입니다.
+
+    Args:
+        name: 공유 메모리 이름
+
+    Returns:
+        Optional[Tuple[int, int]]: (종료된 생산자 PID, 마지막 세대), 회수 가능할 때만
+    """
+    try:
+        shm = _attach(name)
+    except FileNotFoundError:
+        return None
+    try:
+        if shm.size < _CONTROL_SIZE:
+            return None
+        magic, version, _, owner = _CONTROL.unpack_from(shm.buf, 0)
+        generation = _GENERATION.unpack_from(shm.buf, _GENERATION_OFFSET)[0]
+    finally:
+        shm.close()
+    if magic != MAGIC or version != VERSION or owner <= 0:
+        return None
+    if owner == os.getpid() or _process_alive(owner):
+        return None
+    return owner, generation
+
+
+def _unlink(name: str) -> None:
+    """이름의 세그먼트를 제거합니다 (없으면 무시)."""
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+class _RingLayout:
+    """링의 슬롯 헤더/데이터 위치 계산."""
+
+    def __init__(self, slots: int, slot_bytes: int) -> None:
+        self.slots: int = slots
+        self.slot_bytes: int = _align(slot_bytes)
+        self.data_start: int = _align(_GLOBAL_SIZE + _SLOT_HEADER_SIZE * slots)
+
+    @property
+    def total_size(self) -> int:
+        """공유 메모리 전체 크기."""
+        return self.data_start + self.slot_bytes * self.slots
+
+    def header_offset(self, index: int) -> int:
+        """슬롯 헤더 위치."""
+        return _GLOBAL_SIZE + _SLOT_HEADER_SIZE * index
+
+    def data_offset(self, index: int) -> int:
+        """슬롯 데이터 위치."""
+        return self.data_start + self.slot_bytes * index
+
+
+class SharedFrameWriter:
+    """
+    공유 메모리 링 생산자.
+
+    publish()는 다음 슬롯에 memcpy 1회로 프레임을 쓰고 절대 대기하지 않습니다.
+
+    Attributes:
+        name: 공유 메모리 이름 (소비자가 연결할 때 사용)
+        slots: 슬롯 수
+        slot_bytes: 슬롯당 최대 프레임 크기 (바이트)
+        generation: 현재 링 세대 (resize()마다 증가)
+
+    Example:
+        >>> writer = SharedFrameWriter('frames', slots=4, slot_bytes=800 * 600 * 4)
+        >>> writer.publish(capturer.grab_frame(bbox))
+        >>> writer.close()
+    """
+
+    def __init__(
+        self,
+        name: str = SharedRingConfig.NAME,
+        slots: int = SharedRingConfig.SLOTS,
+        slot_bytes: int = 0
+    ) -> None:
+        """
+        제어 세그먼트와 첫 세대의 링을 생성합니다.
+
+        같은 이름의 세그먼트가 남아 있으면 헤더의 생산자 PID가 종료된 경우
+        (이전 프로세스 비정상 종료)에만 제거 후 다시 만듭니다.
+
+        Args:
+            name: 공유 메모리 이름
+            slots: 슬롯 수 (2 이상)
+            slot_bytes: 슬롯당 최대 프레임 크기 (바이트)
+
+        Raises:
+            ValueError: slots가 2 미만이거나 slot_bytes가 0 이하인 경우
+            FileExistsError: 실행 중인 생산자나 다른 프로그램이 같은 이름을 사용 중인 경우
+        """
+        if slots < 2:
+            raise ValueError(f"slots는 2 이상이어야 합니다: {slots}")
+        if slot_bytes <= 0:
+            raise ValueError(f"slot_bytes는 0보다 커야 합니다: {slot_bytes}")
+
+        generation = 0
+        try:
+            self._control = shared_memory.SharedMemory(
+                name=name, create=True, size=_CONTROL_SIZE
+            )
+        except FileExistsError:
+            stale = _stale_control(name)
+            if stale is None:
+                raise FileExistsError(
+                    f"공유 메모리 '{name}'을(를) 다른 프로세스가 사용 중입니다 "
+                    f"(실행 중인 게시 세션이 있거나 형식이 다른 세그먼트)"
+                ) from None
+            owner, generation = stale
+            logger.warning(f"종료된 프로세스(PID {owner})가 남긴 공유 메모리 링 제거: {name}")
+            _unlink(_ring_name(name, generation))
+            _unlink(name)
+            self._control = shared_memory.SharedMemory(
+                name=name, create=True, size=_CONTROL_SIZE
+            )
+
+        self.name: str = name
+        self.slots: int = slots
+        self.slot_bytes: int = 0
+        self.generation: int = generation
+        self._control_buf: memoryview = self._control.buf
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._buf: Optional[memoryview] = None
+        self._layout: Optional[_RingLayout] = None
+        self._locks = [0] * slots
+        self._sequence: int = 0
+
+        try:
+            self._open_ring(slot_bytes)
+        except Exception:
+            self._control_buf.release()
+            self._control.close()
+            self._control.unlink()
+            raise
+        # magic은 마지막에 써서 소비자가 완성된 헤더만 보게 함
+        _CONTROL.pack_into(self._control_buf, 0, b'\0' * 8, VERSION, 0, os.getpid())
+        self._control_buf[:len(MAGIC)] = MAGIC
+
+    @property
+    def sequence(self) -> int:
+        """마지막으로 게시한 프레임 순번 (1부터, 없으면 0)."""
+        return self._sequence
+
+    def _open_ring(self, slot_bytes: int) -> None:
+        """
+        다음 세대의 링 세그먼트를 만들고, 제어 세그먼트의 세대를 올린 뒤 이전 링을 제거합니다.
+
+        이미 있는 이름(이전 실행이 남긴 세그먼트)은 지우지 않고 다음 세대로 건너뜁니다.
+
+        Args:
+            slot_bytes: 슬롯당 최대 프레임 크기 (바이트)
+
+        Raises:
+            FileExistsError: 사용할 수 있는 세대 이름이 없는 경우
+        """
+        layout = _RingLayout(self.slots, slot_bytes)
+        generation = self.generation
+        shm = None
+        for _ in range(_GENERATION_RETRIES):
+            generation += 1
+            try:
+                shm = shared_memory.SharedMemory(
+                    name=_ring_name(self.name, generation), create=True, size=layout.total_size
+                )
+                break
+            except FileExistsError:
+                logger.warning(f"공유 메모리 이름이 남아 있어 건너뜀: {_ring_name(self.name, generation)}")
+        if shm is None:
+            raise FileExistsError(f"공유 메모리 링 이름을 만들 수 없습니다: {self.name}-*")
+
+        buf = shm.buf
+        _GLOBAL.pack_into(buf, 0, MAGIC, VERSION, self.slots, layout.slot_bytes)
+        _LATEST.pack_into(buf, _LATEST_OFFSET, 0)
+        for index in range(self.slots):
+            _LOCK.pack_into(buf, layout.header_offset(index), 0)
+
+        previous, previous_buf = self._shm, self._buf
+        self._shm, self._buf, self._layout = shm, buf, layout
+        self._locks = [0] * self.slots
+        self.slot_bytes = layout.slot_bytes
+        self.generation = generation
+        _GENERATION.pack_into(self._control_buf, _GENERATION_OFFSET, generation)
+
+        if previous is not None:
+            # 소비자는 기존 매핑을 계속 쓸 수 있고, 세대가 바뀐 것을 보고 새 링에 연결함
+            previous_buf.release()
+            previous.close()
+            try:
+                previous.unlink()
+            except FileNotFoundError:
+                pass
+        logger.info(
+            f"공유 메모리 링 생성: {shm.name} ({self.slots}슬롯 x {self.slot_bytes / 1e6:.1f}MB)"
+        )
+
+    def resize(self, slot_bytes: int) -> None:
+        """
+        슬롯 크기를 바꾼 새 세대의 링으로 교체합니다 (publish()와 같은 스레드에서 호출).
+
+        Args:
+            slot_bytes: 새 슬롯당 최대 프레임 크기 (바이트)
+
+        Raises:
+            ValueError: slot_bytes가 0 이하인 경우
+        """
+        if slot_bytes <= 0:
+            raise ValueError(f"slot_bytes는 0보다 커야 합니다: {slot_bytes}")
+        if self._shm is None:
+            return
+        self._open_ring(slot_bytes)
+
+    def publish(self, frame: CaptureFrame) -> int:
+        """
+        프레임을 다음 슬롯에 게시합니다.
+
+        Args:
+            frame: BGRA 프레임
+
+        Returns:
+            int: 게시한 순번 (프레임이 슬롯보다 크면 0)
+        """
+        row_bytes = frame.width * CaptureFrame.BYTES_PER_PIXEL
+        size = row_bytes * frame.height
+        if size > self.slot_bytes:
+            logger.debug(f"프레임이 슬롯보다 큼 ({size} > {self.slot_bytes}), 게시 생략")
+            return 0
+
+        sequence = self._sequence + 1
+        index = sequence % self.slots
+        header = self._layout.header_offset(index)
+        data = self._layout.data_offset(index)
+        buf = self._buf
+
+        # seqlock 홀수: 쓰는 중
+        lock = self._locks[index] + 1
+        _LOCK.pack_into(buf, header, lock)
+
+        if frame.is_contiguous:
+            buf[data:data + size] = frame.buffer
+        else:
+            for y in range(frame.height):
+                start = data + y * row_bytes
+                buf[start:start + row_bytes] = frame.row(y)
+
+        left, top = frame.bbox[0], frame.bbox[1]
+        _META.pack_into(
+            buf, header + _LOCK.size,
+            sequence, frame.timestamp, left, top, frame.width, frame.height, row_bytes
+        )
+
+        # seqlock 짝수: 쓰기 완료 → 최신 순번 게시
+        lock += 1
+        _LOCK.pack_into(buf, header, lock)
+        self._locks[index] = lock
+        _LATEST.pack_into(buf, _LATEST_OFFSET, sequence)
+        self._sequence = sequence
+        return sequence
+
+    def close(self) -> None:
+        """링과 제어 세그먼트를 닫고 제거합니다 (연결된 소비자는 기존 매핑을 계속 사용 가능)."""
+        if self._shm is None:
+            return
+        for shm, buf in ((self._shm, self._buf), (self._control, self._control_buf)):
+            buf.release()
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+        self._buf = None
+        logger.info(f"공유 메모리 링 제거: {self.name}")
+
+
+class SharedFrame:
+    """
+    공유 메모리 슬롯을 복사 없이 가리키는 프레임 핸들.
+
+    frame은 공유 메모리를 직접 참조하므로 생산자가 같은 슬롯을 다시 쓰면 내용이 바뀝니다.
+    사용을 마친 뒤 valid()가 True일 때만 처리 결과를 신뢰해야 합니다.
+
+    Attributes:
+        sequence: 프레임 순번
+        frame: 공유 메모리를 감싼 CaptureFrame
+    """
+
+    __slots__ = ('sequence', 'frame', '_view', '_header', '_lock')
+
+    def __init__(
+        self,
+        view: memoryview,
+        sequence: int,
+        frame: CaptureFrame,
+        header: int,
+        lock: int
+    ) -> None:
+        self.sequence: int = sequence
+        self.frame: CaptureFrame = frame
+        self._view = view
+        self._header = header
+        self._lock = lock
+
+    def valid(self) -> bool:
+        """
+        읽기 시작 이후 슬롯이 다시 쓰이지 않았는지 확인합니다.
+
+        Returns:
+            bool: 프레임 내용이 일관되면 True
+        """
+        return _LOCK.unpack_from(self._view, self._header)[0] == self._lock
+
+
+class SharedFrameReader:
+    """
+    공유 메모리 링 소비자.
+
+    생산자가 링을 더 큰 새 세대로 바꾸면 다음 sequence/latest() 호출에서 새 링에 다시 연결합니다.
+    이전 링에서 받은 프레임은 그대로 유효하며, 그 매핑은 프레임을 모두 놓은 뒤 닫힙니다.
+
+    Example:
+        >>> reader = SharedFrameReader('screen-capture-frames')
+        >>> shared = reader.latest()
+        >>> result = analyze(shared.frame.buffer)  # 복사 없음
+        >>> if shared.valid():
+        ...     use(result)
+        >>> reader.close()
+    """
+
+    def __init__(self, name: str = SharedRingConfig.NAME) -> None:
+        """
+        기존 공유 메모리 링에 연결합니다.
+
+        Args:
+            name: 공유 메모리 이름
+
+        Raises:
+            FileNotFoundError: 링이 없는 경우 (생산자가 실행 중이 아님)
+            ValueError: 형식이 다른 세그먼트인 경우
+        """
+        self._control = _attach(name)
+        self._control_buf: memoryview = self._control.buf
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._buf: Optional[memoryview] = None
+        self._retired: List[Tuple[shared_memory.SharedMemory, memoryview]] = []
+        self.name: str = name
+        self.generation: int = 0
+        self.slots: int = 0
+
+        magic, version, _, _ = _CONTROL.unpack_from(self._control_buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"공유 메모리 링 형식이 아닙니다: {name}")
+        try:
+            self._open_ring()
+        except (FileNotFoundError, ValueError):
+            self.close()
+            raise
+
+    def _open_ring(self) -> None:
+        """
+        제어 세그먼트가 가리키는 세대의 링에 연결하고 이전 링은 닫습니다.
+
+        Raises:
+            FileNotFoundError: 링이 없는 경우
+            ValueError: 형식이 다른 세그먼트인 경우
+        """
+        generation = _GENERATION.unpack_from(self._control_buf, _GENERATION_OFFSET)[0]
+        shm = _attach(_ring_name(self.name, generation))
+        buf = shm.buf
+        magic, version, slots, slot_bytes = _GLOBAL.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            buf.release()
+            shm.close()
+            raise ValueError(f"공유 메모리 링 형식이 아닙니다: {shm.name}")
+
+        if self._shm is not None:
+            self._retired.append((self._shm, self._buf))
+        self._shm, self._buf = shm, buf
+        self.generation = generation
+        self.slots = slots
+        self._layout = _RingLayout(slots, slot_bytes)
+        self._release_retired()
+
+    def _release_retired(self) -> None:
+        """더 이상 프레임이 참조하지 않는 이전 세대 링을 닫습니다."""
+        remaining = []
+        for shm, buf in self._retired:
+            buf.release()
+            try:
+                shm.close()
+            except BufferError:
+                # 프레임이 아직 매핑을 참조함
+                remaining.append((shm, buf))
+        self._retired = remaining
+
+    def _follow_generation(self) -> None:
+        """생산자가 링을 바꿨으면 새 링에 연결합니다 (생성 중이면 다음 호출에 다시 시도)."""
+        generation = _GENERATION.unpack_from(self._control_buf, _GENERATION_OFFSET)[0]
+        if generation == self.generation:
+            return
+        try:
+            self._open_ring()
+        except (FileNotFoundError, ValueError) as e:
+            logger.debug(f"새 공유 메모리 링 연결 대기: {e}")
+
+    @property
+    def sequence(self) -> int:
+        """생산자가 마지막으로 게시한 순번 (없으면 0)."""
+        self._follow_generation()
+        return _LATEST.unpack_from(self._buf, _LATEST_OFFSET)[0]
+
+    def _read_lock(self, header: int) -> int:
+        """슬롯 seqlock 값을 읽습니다."""
+        return _LOCK.unpack_from(self._buf, header)[0]
+
+    def latest(self, retries: int = 3) -> Optional[SharedFrame]:
+        """
+        최신 프레임을 복사 없이 가리키는 핸들을 반환합니다.
+
+        Args:
+            retries: 생산자가 쓰는 중이어서 다시 시도할 횟수
+
+        Returns:
+            Optional[SharedFrame]: 프레임 핸들 (게시된 프레임이 없으면 None)
+        """
+        for _ in range(retries + 1):
+            sequence = self.sequence
+            if sequence == 0:
+                return None
+            shared = self.get(sequence)
+            if shared is not None:
+                return shared
+        return None
+
+    def get(self, sequence: int) -> Optional[SharedFrame]:
+        """
+        지정한 순번의 프레임 핸들을 반환합니다.
+
+        Args:
+            sequence: 프레임 순번
+
+        Returns:
+            Optional[SharedFrame]: 프레임 핸들 (이미 덮어써졌거나 쓰는 중이면 None)
+        """
+        index = sequence % self.slots
+        header = self._layout.header_offset(index)
+        lock = self._read_lock(header)
+        if lock % 2:
+            return None
+
+        stored, timestamp, left, top, width, height, stride = _META.unpack_from(
+            self._buf, header + _LOCK.size
+        )
+        if stored != sequence or self._read_lock(header) != lock:
+            return None
+
+        # 링이 새 세대로 바뀌어도 이 프레임은 이전 링을 계속 가리키도록 자체 view를 가짐
+        view = memoryview(self._buf)
+        frame = CaptureFrame(
+            view,
+            width,
+            height,
+            stride=stride,
+            timestamp=timestamp,
+            bbox=(left, top, left + width, top + height),
+            offset=self._layout.data_offset(index)
+        )
+        return SharedFrame(view, sequence, frame, header, lock)
+
+    def copy_latest(self, retries: int = 3) -> Optional[CaptureFrame]:
+        """
+        최신 프레임을 복사하여 반환합니다 (복사 도중 덮어쓰이면 다시 시도).
+
+        Args:
+            retries: 다시 시도할 횟수
+
+        Returns:
+            Optional[CaptureFrame]: 자체 버퍼를 가진 프레임 (실패 시 None)
+        """
+        for _ in range(retries + 1):
+            shared = self.latest()
+            if shared is None:
+                return None
+            frame = shared.frame
+            data = frame.tobytes()
+            if shared.valid():
+                return CaptureFrame(
+                    data, frame.width, frame.height,
+                    timestamp=frame.timestamp, bbox=frame.bbox
+                )
+        return None
+
+    def close(self) -> None:
+        """
+        연결을 닫습니다.
+
+        이 리더가 반환한 프레임을 아직 참조하고 있으면 BufferError가 발생하므로
+        프레임을 모두 해제한 뒤 호출해야 합니다.
+        """
+        if self._control is None:
+            return
+        if self._shm is not None:
+            self._retired.append((self._shm, self._buf))
+            self._shm = self._buf = None
+        self._release_retired()
+        if self._retired:
+            raise BufferError("공유 메모리 프레임을 아직 참조하고 있습니다")
+        self._control_buf.release()
+        self._control.close()
+        self._control = None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    소비자용으로 공유 메모리에 연결합니다.
+
+    Python 3.13 미만의 POSIX에서는 연결만 해도 resource_tracker가 세그먼트를
+    소유한 것으로 등록하여 소비자 종료 시 생산자의 링을 지워 버리므로 등록을 해제합니다.
+
+    Args:
+        name: 공유 메모리 이름
+
+    Returns:
+        shared_memory.SharedMemory: 연결된 세그먼트
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if sys.platform != 'win32':
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class PublishSession:
+    """
+    공유 메모리 게시 세션.
+
+    fps 주기로 현재 bbox를 grab하여 링에 게시합니다.
+    grab과 게시(memcpy)만 수행하므로 인코딩/디스크 비용이 없습니다.
+    슬롯은 시작 영역 크기로 잡고, 영역이 커지면 두 배씩(최대 MAX_SLOT_BYTES) 늘린 새 세대로 바꿉니다.
+
+    Example:
+        >>> session = PublishSession(capturer, bbox)
+        >>> session.start()
+        >>> print(session.stop())
+    """
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        bbox: Tuple[int, int, int, int],
+        fps: float = SharedRingConfig.FPS,
+        name: str = SharedRingConfig.NAME,
+        slots: int = SharedRingConfig.SLOTS
+    ) -> None:
+        """
+        PublishSession 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            bbox: 캡처 영역 (left, top, right, bottom)
+            fps: 게시 주기 (초당 프레임)
+            name: 공유 메모리 이름
+            slots: 슬롯 수
+        """
+        self._capturer: ScreenCapture = capturer
+        self._bbox: Tuple[int, int, int, int] = bbox
+        self._name: str = name
+        self._slots: int = slots
+        self._writer: Optional[SharedFrameWriter] = None
+        self._published: int = 0
+        self._failed: int = 0
+        self._resized: int = 0
+        self._oversized: bool = False
+        self._lock = threading.Lock()
+        self._scheduler = IntervalScheduler(
+            1.0 / fps,
+            self._on_tick,
+            name='shm-publish',
+            on_exit=capturer.release_thread_session
+        )
+
+    @property
+    def name(self) -> str:
+        """공유 메모리 이름."""
+        return self._name
+
+    def set_bbox(self, bbox: Tuple[int, int, int, int]) -> None:
+        """
+        캡처 영역을 변경합니다 (다음 틱부터 적용).
+
+        Args:
+            bbox: 새 캡처 영역
+        """
+        with self._lock:
+            self._bbox = bbox
+
+    def start(self) -> None:
+        """게시를 시작합니다 (슬롯 크기는 현재 영역 크기, 최대 MAX_SLOT_BYTES)."""
+        with self._lock:
+            left, top, right, bottom = self._bbox
+        slot_bytes = (right - left) * (bottom - top) * CaptureFrame.BYTES_PER_PIXEL
+        slot_bytes = max(1, min(slot_bytes, SharedRingConfig.MAX_SLOT_BYTES))
+        self._writer = SharedFrameWriter(self._name, self._slots, slot_bytes)
+        self._scheduler.start()
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        게시를 중지하고 링을 제거합니다.
+
+        Returns:
+            Dict[str, Any]: published, failed 및 틱 통계
+        """
+        self._scheduler.stop()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        return self.summary()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: published, failed, resized(링 교체 횟수) 및 틱 통계
+        """
+        summary: Dict[str, Any] = {
+            'published': self._published,
+            'failed': self._failed,
+            'resized': self._resized,
+        }
+        summary.update(self._scheduler.stats.summary())
+        return summary
+
+    def _on_tick(self, tick: int, deadline: float) -> None:
+        """
+        틱 한 번: grab → 링 게시.
+
+        Args:
+            tick: 틱 순번
+            deadline: 목표 monotonic 시각
+        """
+        with self._lock:
+            bbox = self._bbox
+        frame = self._capturer.grab_frame(bbox)
+        writer = self._writer
+        if frame is not None and writer is not None and frame.nbytes > writer.slot_bytes:
+            self._grow(writer, frame.nbytes)
+        if frame is None or writer is None or not writer.publish(frame):
+            self._failed += 1
+            return
+        self._published += 1
+
+    def _grow(self, writer: SharedFrameWriter, frame_bytes: int) -> None:
+        """
+        영역이 슬롯보다 커졌을 때 링을 더 큰 새 세대로 바꿉니다.
+
+        윈도우 크기를 끌어 바꾸는 동안 매 틱 교체하지 않도록 두 배 이상으로 늘리며,
+        MAX_SLOT_BYTES를 넘는 프레임은 게시하지 않습니다.
+
+        Args:
+            writer: 현재 생산자
+            frame_bytes: 게시할 프레임 크기 (바이트)
+        """
+        limit = SharedRingConfig.MAX_SLOT_BYTES
+        if frame_bytes > limit:
+            if not self._oversized:
+                logger.warning(
+                    f"게시 영역이 최대 슬롯 크기보다 큼 ({frame_bytes} > {limit}), 게시 생략"
+                )
+                self._oversized = True
+            return
+        self._oversized = False
+        try:
+            writer.resize(min(limit, max(frame_bytes, writer.slot_bytes * 2)))
+        except OSError as e:
+            logger.error(f"공유 메모리 링 확장 실패: {e}")
+            return
+        self._resized += 1
@@ -0,0 +1,175 @@
+"""
+지각 해시(perceptual hash) 모듈
+
+이 모듈은 "같아 보이는" 캡처(시계만 다른 같은 대화상자 등)를 찾기 위한
+64비트 dHash와 해밍 거리 검색에 쓰는 다중 인덱스 해싱(multi-index hashing) 도우미를 제공합니다.
+
+dHash는 이미지를 격자 표본(칸 중심 픽셀)으로 줄이고 다시 9x8 회색조로 평균한 뒤
+이웃 픽셀의 밝기 비교로 비트를 만들므로 작은 글자나 몇 픽셀의 변화에는 몇 비트만 달라집니다.
+저장 시에는 프레임 버퍼에서 같은 격자의 픽셀만 읽으므로 전체 해상도 변환이 없고,
+저장된 PNG에서 계산한 해시와 같은 값이 나옵니다.
+해시를 16비트 조각 4개로 나누면, 거리 d 이내인 두 해시는 적어도 한 조각이
+d // 4 비트 이내로 같으므로(비둘기집 원리) 조각별 인덱스 조회만으로 후보를 찾을 수 있습니다.
+"""
+import itertools
+from array import array
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from core.frame import CaptureFrame
+
+HASH_BITS: int = 64
+CHUNK_COUNT: int = 4
+CHUNK_BITS: int = HASH_BITS // CHUNK_COUNT
+_CHUNK_MASK: int = (1 << CHUNK_BITS) - 1
+_HASH_MASK: int = (1 << HASH_BITS) - 1
+
+# dHash 크기 (가로 9 → 비교 8개, 세로 8 → 64비트)
+_DHASH_SIZE: Tuple[int, int] = (9, 8)
+# 격자 표본 크기 (dHash 한 칸당 8x8 표본을 평균)
+_SAMPLE_SIZE: Tuple[int, int] = (_DHASH_SIZE[0] * 8, _DHASH_SIZE[1] * 8)
+
+
+def _sample_positions(length: int, count: int) -> List[int]:
+    """길이 length를 count칸으로 나눈 각 칸 중심의 픽셀 위치."""
+    scale = length / count
+    return [min(length - 1, int((i + 0.5) * scale)) for i in range(count)]
+
+
+def _dhash_sample(sample) -> int:
+    """격자 표본 RGB 이미지로부터 dHash를 계산합니다."""
+    from PIL import Image
+
+    small = sample.resize(_DHASH_SIZE, Image.BOX).convert('L')
+    pixels = small.tobytes()
+    width, height = _DHASH_SIZE
+    value = 0
+    for y in range(height):
+        row = pixels[y * width:(y + 1) * width]
+        for x in range(width - 1):
+            value = (value << 1) | (row[x] > row[x + 1])
+    return value
+
+
+def dhash(image) -> int:
+    """
+    이미지의 64비트 dHash를 계산합니다.
+
+    Args:
+        image: PIL 이미지
+
+    Returns:
+        int: 부호 없는 64비트 해시
+    """
+    from PIL import Image
+
+    rgb = image if image.mode == 'RGB' else image.convert('RGB')
+    pixels = rgb.load()
+    columns = _sample_positions(rgb.width, _SAMPLE_SIZE[0])
+    data = bytes(
+        channel
+        for y in _sample_positions(rgb.height, _SAMPLE_SIZE[1])
+        for x in columns
+        for channel in pixels[x, y]
+    )
+    return _dhash_sample(Image.frombytes('RGB', _SAMPLE_SIZE, data))
+
+
+def frame_dhash(frame: 'CaptureFrame') -> int:
+    """
+    프레임의 64비트 dHash를 격자 표본 픽셀만 읽어 계산합니다 (변환/복사 없음).
+
+    같은 픽셀의 PNG에 dhash()를 적용한 값과 같습니다.
+
+    Args:
+        frame: BGRA 프레임
+
+    Returns:
+        int: 부호 없는 64비트 해시
+    """
+    from PIL import Image
+
+    columns = _sample_positions(frame.width, _SAMPLE_SIZE[0])
+    parts = []
+    for y in _sample_positions(frame.height, _SAMPLE_SIZE[1]):
+        pixels = frame.row(y).cast('I')
+        parts.append(array('I', [pixels[x] for x in columns]).tobytes())
+    sample = Image.frombuffer('RGB', _SAMPLE_SIZE, b''.join(parts), 'raw', 'BGRX', 0, 1)
+    return _dhash_sample(sample)
+
+
+def hamming(a: int, b: int) -> int:
+    """두 해시의 해밍 거리."""
+    return bin((a ^ b) & _HASH_MASK).count('1')
+
+
+def split(value: int) -> List[int]:
+    """
+    해시를 상위 비트부터 CHUNK_COUNT개의 조각으로 나눕니다.
+
+    Args:
+        value: 부호 없는 64비트 해시
+
+    Returns:
+        List[int]: CHUNK_BITS비트 조각 목록
+    """
+    return [
+        (value >> (CHUNK_BITS * (CHUNK_COUNT - 1 - i))) & _CHUNK_MASK
+        for i in range(CHUNK_COUNT)
+    ]
+
+
+def chunk_variants(chunk: int, radius: int) -> Iterator[int]:
+    """
+    조각과 해밍 거리 radius 이내인 모든 값을 만듭니다.
+
+    Args:
+        chunk: CHUNK_BITS비트 조각
+        radius: 최대 거리
+
+    Yields:
+        int: 조각 값 (chunk 자신 포함)
+    """
+    for flips in range(min(radius, CHUNK_BITS) + 1):
+        for positions in itertools.combinations(range(CHUNK_BITS), flips):
+            value = chunk
+            for position in positions:
+                value ^= 1 << position
+            yield value
+
+
+def variant_count(radius: int) -> int:
+    """chunk_variants가 만드는 값의 수."""
+    total, term = 0, 1
+    for flips in range(min(radius, CHUNK_BITS) + 1):
+        total += term
+        term = term * (CHUNK_BITS - flips) // (flips + 1)
+    return total
+
+
+def to_signed(value: int) -> int:
+    """부호 없는 64비트 해시를 SQLite INTEGER(부호 있는 64비트)로 변환합니다."""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def from_signed(value: int) -> int:
+    """to_signed의 역변환."""
+    return value & _HASH_MASK
+
+
+def format_hash(value: int) -> str:
+    """해시를 16자리 16진 문자열로 표시합니다."""
+    return f"{value:016x}"
+
+
+def parse_hash(text: str) -> int:
+    """
+    16진 문자열을 해시로 변환합니다.
+
+    Raises:
+        ValueError: 16진수가 아니거나 64비트를 넘는 경우
+    """
+    value = int(text, 16)
+    if not 0 <= value <= _HASH_MASK:
+        raise ValueError(f"64비트 해시가 아님: {text}")
+    return value
@@ -0,0 +1,237 @@
+"""
+내용 주소 기반 캡처 저장소 모듈
+
+이 모듈은 같은 픽셀의 캡처를 다시 인코딩하지 않도록 하는 중복 제거 저장소를 제공합니다.
+인코딩 전에 BGRA 픽셀 버퍼(와 크기)를 해시하고, 같은 내용이 이미 저장되어 있으면
+PNG 인코딩을 건너뛰고 새 파일명으로 하드링크를 만듭니다
+(하드링크를 지원하지 않는 파일 시스템에서는 manifest.jsonl에 별칭을 기록).
+
+인덱스는 해시 앞부분으로 나눈 디렉토리 아래 해시별 작은 JSON 파일이므로
+조회는 항목 수와 무관하게 파일 하나를 여는 비용(O(1))입니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from constants import StoreConfig
+from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+
+class ContentStore:
+    """
+    캡처 내용 해시 → 저장 파일 인덱스.
+
+    인덱스 항목은 `<root>/<해시 앞 2자>/<해시>.json`에 {"path", "size"}로 기록되며,
+    가리키는 파일이 지워졌거나 크기가 바뀌었으면 없는 것으로 간주합니다.
+    건너뛴 인코딩 수와 절약한 바이트는 `<root>/stats.json`에 누적됩니다.
+
+    Attributes:
+        root: 인덱스 디렉토리
+        output_dir: 캡처 파일이 저장되는 디렉토리 (인덱스의 상대 경로 기준)
+
+    Example:
+        >>> store = ContentStore(output_dir)
+        >>> digest = store.digest(frame)
+        >>> with store.claim(digest) as existing:
+        ...     if existing is None:
+        ...         path = encode_and_save(frame)
+        ...         store.record(digest, path)
+    """
+
+    def __init__(self, output_dir: Path, root: Optional[Path] = None) -> None:
+        """
+        ContentStore 인스턴스를 초기화합니다.
+
+        Args:
+            output_dir: 캡처 파일 저장 디렉토리
+            root: 인덱스 디렉토리 (None이면 output_dir / StoreConfig.DIR_NAME)
+        """
+        self.output_dir: Path = output_dir
+        self.root: Path = root or output_dir / StoreConfig.DIR_NAME
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
+        self._stats: Dict[str, int] = self._load_stats()
+
+    # =========================================================================
+    # 해시 / 인덱스
+    # =========================================================================
+
+    @staticmethod
+    def digest(frame: CaptureFrame) -> str:
+        """
+        프레임 내용의 해시를 계산합니다 (행 버퍼를 복사 없이 해시).
+
+        Args:
+            frame: BGRA 프레임
+
+        Returns:
+            str: 크기와 픽셀로 정해지는 blake2b 16진 문자열
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{frame.width}x{frame.height}:".encode('ascii'))
+        if frame.is_contiguous:
+            h.update(frame.buffer)
+        else:
+            for y in range(frame.height):
+                h.update(frame.row(y))
+        return h.hexdigest()
+
+    def _entry_path(self, digest: str) -> Path:
+        """해시의 인덱스 항목 경로."""
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def lookup(self, digest: str) -> Optional[Path]:
+        """
+        같은 내용으로 저장된 파일을 찾습니다.
+
+        Args:
+            digest: 내용 해시
+
+        Returns:
+            Optional[Path]: 존재하고 크기가 기록과 같은 파일, 없으면 None
+        """
+        try:
+            entry = json.loads(self._entry_path(digest).read_text(encoding='utf-8'))
+            path = self.output_dir / entry['path']
+            if path.stat().st_size == entry['size']:
+                return path
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def record(self, digest: str, path: Path) -> None:
+        """
+        새로 저장한 파일을 인덱스에 기록합니다 (원자적 교체).
+
+        Args:
+            digest: 내용 해시
+            path: 저장된 파일
+        """
+        entry_path = self._entry_path(digest)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            relative = os.path.relpath(path, self.output_dir)
+            temp = entry_path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp.write_text(
+                json.dumps({'path': Path(relative).as_posix(), 'size': path.stat().st_size}),
+                encoding='utf-8'
+            )
+            os.replace(temp, entry_path)
+            self._count(stored=1)
+        except OSError as e:
+            logger.warning(f"저장소 인덱스 기록 실패 ({digest[:12]}): {e}")
+
+    @contextmanager
+    def claim(self, digest: str) -> Iterator[Optional[Path]]:
+        """
+        해시 하나를 처리하는 동안 같은 해시의 다른 작업을 기다리게 합니다.
+
+        같은 내용의 캡처가 여러 작업 스레드에서 동시에 저장될 때
+        한 번만 인코딩되도록, 먼저 들어온 작업이 끝난 뒤 나머지가 인덱스를 조회합니다.
+
+        Args:
+            digest: 내용 해시
+
+        Yields:
+            Optional[Path]: 이미 저장된 같은 내용의 파일 (없으면 None, 호출자가 저장 후 record)
+        """
+        while True:
+            with self._lock:
+                waiting = self._inflight.get(digest)
+                if waiting is None:
+                    done = self._inflight[digest] = threading.Event()
+                    break
+            waiting.wait()
+        try:
+            yield self.lookup(digest)
+        finally:
+            with self._lock:
+                del self._inflight[digest]
+            done.set()
+
+    # =========================================================================
+    # 중복 저장
+    # =========================================================================
+
+    def link(self, existing: Path, path: Path) -> Path:
+        """
+        기존 파일을 새 파일명으로 연결합니다 (인코딩 생략).
+
+        하드링크를 만들 수 없으면 manifest.jsonl에 별칭을 기록하고 기존 파일 경로를 반환합니다.
+
+        Args:
+            existing: 같은 내용으로 저장된 파일
+            path: 새 파일 경로 (예약용 빈 파일이 있으면 대체)
+
+        Returns:
+            Path: 사용할 파일 경로 (하드링크면 path, 아니면 existing)
+        """
+        size = existing.stat().st_size
+        try:
+            path.unlink(missing_ok=True)
+            os.link(existing, path)
+            self._count(skipped_encodes=1, bytes_saved=size, hardlinks=1)
+            logger.info(f"중복 캡처 하드링크: {path.name} → {existing.name} ({size}B 절약)")
+            return path
+        except OSError as e:
+            logger.debug(f"하드링크 실패, manifest에 기록: {e}")
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            line = json.dumps({
+                'name': path.name,
+                'target': Path(os.path.relpath(existing, self.output_dir)).as_posix(),
+                'time': time.time(),
+            }, ensure_ascii=False)
+            with self._lock, open(self.root / StoreConfig.MANIFEST_FILE, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        except OSError as e:
+            logger.warning(f"manifest 기록 실패: {e}")
+        self._count(skipped_encodes=1, bytes_saved=size, aliases=1)
+        logger.info(f"중복 캡처 별칭: {path.name} → {existing.name} ({size}B 절약)")
+        return existing
+
+    # =========================================================================
+    # 통계
+    # =========================================================================
+
+    def stats(self) -> Dict[str, int]:
+        """
+        누적 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: stored, skipped_encodes, bytes_saved, hardlinks, aliases
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _load_stats(self) -> Dict[str, int]:
+        """stats.json에서 누적 통계를 읽습니다."""
+        stats = {'stored': 0, 'skipped_encodes': 0, 'bytes_saved': 0, 'hardlinks': 0, 'aliases': 0}
+        try:
+            saved: Any = json.loads((self.root / StoreConfig.STATS_FILE).read_text(encoding='utf-8'))
+            stats.update({key: int(saved[key]) for key in stats if key in saved})
+        except (OSError, ValueError, TypeError):
+            pass
+        return stats
+
+    def _count(self, **deltas: int) -> None:
+        """통계를 갱신하고 stats.json에 기록합니다."""
+        with self._lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                (self.root / StoreConfig.STATS_FILE).write_text(
+                    json.dumps(self._stats, indent=2), encoding='utf-8'
+                )
+            except OSError as e:
+                logger.debug(f"저장소 통계 기록 실패: {e}")
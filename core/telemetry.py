@@ -0,0 +1,346 @@
+"""
+캡처 단계 계측 모듈
+
+이 모듈은 캡처 한 건의 각 단계(unmask, grab, clipboard, convert, encode,
+write, restore 등)에 걸린 시간을 메모리 링 버퍼에 기록하고,
+JSON Lines 또는 Chrome 트레이스(chrome://tracing, Perfetto) 형식으로 내보냅니다.
+비활성 상태에서 span()은 공유 no-op 컨텍스트를 반환하므로
+계측 지점의 비용은 속성 확인 한 번뿐입니다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from constants import TelemetryConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SpanRecord(NamedTuple):
+    """
+    단계 한 번의 측정 기록.
+
+    Attributes:
+        capture_id: 캡처 작업 번호 (없으면 0)
+        stage: 단계 이름
+        start: 시작 시각 (perf_counter 초)
+        duration: 소요 시간 (초)
+        thread_id: 실행 스레드 식별자
+        thread_name: 실행 스레드 이름
+    """
+
+    capture_id: int
+    stage: str
+    start: float
+    duration: float
+    thread_id: int
+    thread_name: str
+
+
+class _NullSpan:
+    """비활성 상태에서 반환되는 no-op 컨텍스트."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """활성 상태의 단계 측정 컨텍스트."""
+
+    __slots__ = ('_telemetry', '_stage', '_capture_id', '_start')
+
+    def __init__(self, telemetry: 'Telemetry', stage: str, capture_id: Optional[int]) -> None:
+        self._telemetry = telemetry
+        self._stage = stage
+        self._capture_id = capture_id
+        self._start = 0.0
+
+    def __enter__(self) -> '_Span':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._telemetry.record(
+            self._stage, self._start, time.perf_counter(), self._capture_id
+        )
+
+
+class _Binding:
+    """현재 스레드의 캡처 번호를 임시로 지정하는 컨텍스트."""
+
+    __slots__ = ('_local', '_capture_id', '_previous')
+
+    def __init__(self, local: threading.local, capture_id: int) -> None:
+        self._local = local
+        self._capture_id = capture_id
+        self._previous = 0
+
+    def __enter__(self) -> '_Binding':
+        self._previous = getattr(self._local, 'capture_id', 0)
+        self._local.capture_id = self._capture_id
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._local.capture_id = self._previous
+
+
+class Telemetry:
+    """
+    캡처 단계 계측기.
+
+    기록은 고정 크기 deque에 추가되며 (GIL 하에서 원자적) 가장 오래된 기록부터
+    밀려납니다. 작업 스레드에서 실행되는 단계는 bind()로 캡처 번호를 지정하면
+    span()에 번호를 따로 넘기지 않아도 같은 캡처로 묶입니다.
+
+    Attributes:
+        enabled: 계측 활성 여부
+
+    Example:
+        >>> telemetry.enabled = True
+        >>> with telemetry.span('grab', capture_id=1):
+        ...     frame = capturer.grab_frame(bbox)
+        >>> telemetry.breakdown(1)
+        {'grab': 3.2}
+    """
+
+    TOTAL_STAGE: str = 'total'
+
+    def __init__(
+        self,
+        capacity: int = TelemetryConfig.CAPACITY,
+        enabled: bool = TelemetryConfig.ENABLED
+    ) -> None:
+        """
+        Telemetry 인스턴스를 초기화합니다.
+
+        Args:
+            capacity: 링 버퍼에 보관할 최대 기록 수
+            enabled: 계측 활성 여부
+        """
+        self.enabled: bool = enabled
+        self._records: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._local = threading.local()
+
+    def span(self, stage: str, capture_id: Optional[int] = None):
+        """
+        단계 소요 시간을 측정하는 컨텍스트를 반환합니다.
+
+        Args:
+            stage: 단계 이름
+            capture_id: 캡처 작업 번호 (None이면 bind()로 지정된 번호)
+
+        Returns:
+            컨텍스트 매니저 (비활성 상태면 공유 no-op 객체)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage, capture_id)
+
+    def bind(self, capture_id: int):
+        """
+        현재 스레드에서 실행되는 span의 기본 캡처 번호를 지정합니다.
+
+        Args:
+            capture_id: 캡처 작업 번호
+
+        Returns:
+            컨텍스트 매니저 (비활성 상태면 공유 no-op 객체)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Binding(self._local, capture_id)
+
+    def record(
+        self,
+        stage: str,
+        start: float,
+        end: float,
+        capture_id: Optional[int] = None
+    ) -> None:
+        """
+        이미 측정한 구간을 기록합니다.
+
+        작업 번호가 정해지기 전에 측정한 구간(예: 십자선 제거 확인)을
+        나중에 붙일 때 사용합니다.
+
+        Args:
+            stage: 단계 이름
+            start: 시작 시각 (perf_counter 초)
+            end: 종료 시각 (perf_counter 초)
+            capture_id: 캡처 작업 번호 (None이면 bind()로 지정된 번호)
+        """
+        if not self.enabled:
+            return
+        if capture_id is None:
+            capture_id = getattr(self._local, 'capture_id', 0)
+        thread = threading.current_thread()
+        self._records.append(
+            SpanRecord(capture_id, stage, start, end - start, thread.ident or 0, thread.name)
+        )
+
+    def clear(self) -> None:
+        """모든 기록을 삭제합니다."""
+        self._records.clear()
+
+    def records(self) -> List[SpanRecord]:
+        """
+        현재 보관 중인 기록의 스냅샷을 반환합니다.
+
+        Returns:
+            List[SpanRecord]: 오래된 순서의 기록
+        """
+        while True:
+            try:
+                return list(self._records)
+            except RuntimeError:
+                # 다른 스레드가 복사 도중 추가한 경우 재시도
+                continue
+
+    # =========================================================================
+    # 집계
+    # =========================================================================
+
+    def last_capture_id(self) -> Optional[int]:
+        """
+        전체 소요 시간(total)이 기록된 마지막 캡처 번호를 반환합니다.
+
+        Returns:
+            Optional[int]: 캡처 번호 (없으면 None)
+        """
+        for record in reversed(self.records()):
+            if record.stage == self.TOTAL_STAGE:
+                return record.capture_id
+        return None
+
+    def breakdown(self, capture_id: int) -> Dict[str, float]:
+        """
+        캡처 한 건의 단계별 소요 시간을 반환합니다.
+
+        Args:
+            capture_id: 캡처 작업 번호
+
+        Returns:
+            Dict[str, float]: 단계 이름 → 소요 시간 (밀리초, 시작 시각 순서)
+        """
+        matched = [r for r in self.records() if r.capture_id == capture_id]
+        matched.sort(key=lambda r: r.start)
+        result: Dict[str, float] = {}
+        for record in matched:
+            result[record.stage] = result.get(record.stage, 0.0) + record.duration * 1000.0
+        return result
+
+    def percentiles(
+        self,
+        stage: str = TOTAL_STAGE,
+        window: int = TelemetryConfig.ROLLING_WINDOW
+    ) -> Dict[str, float]:
+        """
+        최근 window개 기록에 대한 단계 소요 시간 p50/p95를 계산합니다.
+
+        Args:
+            stage: 단계 이름
+            window: 집계할 최근 기록 수
+
+        Returns:
+            Dict[str, float]: count, p50_ms, p95_ms (기록이 없으면 count=0)
+        """
+        samples = [r.duration for r in self.records() if r.stage == stage][-window:]
+        if not samples:
+            return {'count': 0, 'p50_ms': 0.0, 'p95_ms': 0.0}
+        samples.sort()
+
+        def pick(q: float) -> float:
+            return samples[min(len(samples) - 1, int(round(q / 100.0 * (len(samples) - 1))))]
+
+        return {
+            'count': len(samples),
+            'p50_ms': pick(50) * 1000.0,
+            'p95_ms': pick(95) * 1000.0,
+        }
+
+    # =========================================================================
+    # 내보내기
+    # =========================================================================
+
+    def export_jsonl(self, path: Path) -> int:
+        """
+        기록을 JSON Lines 형식으로 저장합니다.
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            int: 저장한 기록 수
+        """
+        records = self.records()
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps({
+                    'capture_id': record.capture_id,
+                    'stage': record.stage,
+                    'start_ms': record.start * 1000.0,
+                    'duration_ms': record.duration * 1000.0,
+                    'thread': record.thread_name,
+                }, ensure_ascii=False))
+                f.write('\n')
+        logger.info(f"계측 기록 저장 (JSON Lines, {len(records)}건): {path}")
+        return len(records)
+
+    def export_chrome_trace(self, path: Path) -> int:
+        """
+        기록을 Chrome 트레이스 형식(Trace Event Format)으로 저장합니다.
+
+        chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있습니다.
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            int: 저장한 기록 수
+        """
+        records = self.records()
+        pid = os.getpid()
+        events: List[Dict] = []
+        threads: Dict[int, str] = {}
+        for record in records:
+            threads[record.thread_id] = record.thread_name
+            events.append({
+                'name': record.stage,
+                'cat': 'capture',
+                'ph': 'X',
+                'ts': record.start * 1e6,
+                'dur': record.duration * 1e6,
+                'pid': pid,
+                'tid': record.thread_id,
+                'args': {'capture_id': record.capture_id},
+            })
+        for thread_id, name in threads.items():
+            events.append({
+                'name': 'thread_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': thread_id,
+                'args': {'name': name},
+            })
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        logger.info(f"계측 기록 저장 (Chrome 트레이스, {len(records)}건): {path}")
+        return len(records)
+
+
+# 애플리케이션 전역 계측기 (logging 모듈의 로거처럼 모든 계층에서 공유)
+telemetry = Telemetry()
@@ -0,0 +1,367 @@
+"""
+타임랩스 캡처 모듈
+
+이 모듈은 지정된 영역을 일정 주기로 캡처하여 순번이 매겨진
+시리즈로 저장하는 타임랩스 세션을 제공합니다.
+grab은 스케줄러 스레드에서, 인코딩/저장은 작업 스레드 풀에서 수행합니다.
+DeltaTimelapseSession은 프레임별 PNG 대신 바뀐 타일만 기록하는
+델타 프레임 시퀀스(core.sequence)로 저장합니다.
+"""
+import datetime
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from constants import SequenceConfig, TimelapseConfig
+from core.capture import ScreenCapture
+from core.frame import CaptureFrame
+from core.scheduler import IntervalScheduler
+from core.sequence import DeltaSequenceWriter
+
+logger = logging.getLogger(__name__)
+
+
+class TimelapseSession:
+    """
+    타임랩스 캡처 세션.
+
+    틱마다 현재 bbox를 grab하고 `timelapse_<시작시각>/frame_<순번>.png`로 저장합니다.
+    인코딩 대기열이 max_pending을 넘으면 해당 틱의 저장을 건너뛰고 기록하여
+    느린 디스크 때문에 작업이 쌓이지 않도록 합니다.
+    틱 지연/지터 통계는 주기적으로 timelapse.json에 기록됩니다.
+
+    Attributes:
+        interval: 캡처 주기 (초)
+        output_dir: 시리즈 저장 디렉토리
+
+    Example:
+        >>> session = TimelapseSession(capturer, executor, bbox, interval=60.0)
+        >>> session.start()
+        >>> session.set_bbox(new_bbox)  # 윈도우 이동 시
+        >>> summary = session.stop()
+    """
+
+    DIR_PREFIX: str = "timelapse"
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        executor: Executor,
+        bbox: Tuple[int, int, int, int],
+        interval: float = TimelapseConfig.INTERVAL,
+        max_pending: int = TimelapseConfig.MAX_PENDING
+    ) -> None:
+        """
+        TimelapseSession 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            executor: 인코딩/저장에 사용할 Executor
+            bbox: 캡처 영역 (left, top, right, bottom)
+            interval: 캡처 주기 (초)
+            max_pending: 최대 인코딩 대기 수
+        """
+        self.interval: float = interval
+        self._capturer: ScreenCapture = capturer
+        self._executor: Executor = executor
+        self._bbox: Tuple[int, int, int, int] = bbox
+        self._max_pending: int = max_pending
+
+        stamp = datetime.datetime.now().strftime(ScreenCapture.TIMESTAMP_FORMAT)
+        self.output_dir: Path = capturer.output_dir / f"{self.DIR_PREFIX}_{stamp}"
+
+        self._pending: int = 0
+        self._saved: int = 0
+        self._failed: int = 0
+        self._skipped: int = 0
+        self._counter_lock = threading.Lock()
+        self._started_at: float = 0.0
+
+        self._scheduler = IntervalScheduler(
+            interval,
+            self._on_tick,
+            name=f'capture-{self.DIR_PREFIX}',
+            on_exit=capturer.release_thread_session
+        )
+
+    @property
+    def running(self) -> bool:
+        """세션 실행 여부."""
+        return self._scheduler.running
+
+    def set_bbox(self, bbox: Tuple[int, int, int, int]) -> None:
+        """
+        캡처 영역을 변경합니다 (다음 틱부터 적용, 스레드 안전).
+
+        Args:
+            bbox: 캡처 영역 (left, top, right, bottom)
+        """
+        self._bbox = bbox
+
+    def start(self) -> None:
+        """세션을 시작합니다."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._started_at = time.time()
+        self._scheduler.start()
+        logger.info(
+            f"{self.DIR_PREFIX} 시작: interval={self.interval}s, dir={self.output_dir}"
+        )
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        세션을 중지하고 통계를 기록합니다.
+
+        진행 중인 인코딩은 작업 스레드 풀에서 계속 완료됩니다.
+
+        Returns:
+            Dict[str, Any]: 통계 요약
+        """
+        self._scheduler.stop()
+        summary = self.summary()
+        self._write_summary(summary)
+        logger.info(f"{self.DIR_PREFIX} 종료: {summary}")
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계 요약을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 틱 통계 + 저장/실패/건너뜀 수
+        """
+        summary: Dict[str, Any] = dict(self._scheduler.stats.summary())
+        with self._counter_lock:
+            summary.update({
+                'interval': self.interval,
+                'saved': self._saved,
+                'failed': self._failed,
+                'skipped_encodes': self._skipped,
+                'pending': self._pending,
+            })
+        summary['started_at'] = self._started_at
+        return summary
+
+    def _on_tick(self, tick: int, deadline: float) -> None:
+        """
+        스케줄러 스레드에서 호출되는 틱 처리.
+
+        Args:
+            tick: 틱 순번 (시리즈 번호로 사용)
+            deadline: 목표 monotonic 시각
+        """
+        if not self._reserve(tick):
+            return
+
+        frame = self._capturer.grab_frame(self._bbox)
+        if frame is None:
+            self._finish(False)
+            return
+
+        self._executor.submit(self._save, tick, frame)
+        self._maybe_write_summary(tick)
+
+    def _reserve(self, tick: int) -> bool:
+        """
+        인코딩 대기열 자리를 예약합니다.
+
+        Args:
+            tick: 틱 순번
+
+        Returns:
+            bool: 예약 성공 여부 (가득 찼으면 건너뜀으로 기록하고 False)
+        """
+        with self._counter_lock:
+            if self._pending >= self._max_pending:
+                self._skipped += 1
+                logger.warning(
+                    f"{self.DIR_PREFIX} 틱 {tick}: 인코딩 대기열 가득 참, 건너뜀"
+                )
+                return False
+            self._pending += 1
+            return True
+
+    def _maybe_write_summary(self, tick: int) -> None:
+        """
+        SUMMARY_EVERY 틱마다 통계 파일을 갱신합니다.
+
+        Args:
+            tick: 틱 순번
+        """
+        if tick and tick % TimelapseConfig.SUMMARY_EVERY == 0:
+            self._write_summary(self.summary())
+
+    def _save(self, tick: int, frame: CaptureFrame) -> None:
+        """
+        작업 스레드에서 프레임을 저장합니다.
+
+        Args:
+            tick: 틱 순번
+            frame: 캡처 프레임
+        """
+        path = self.output_dir / f"frame_{tick:06d}.png"
+        try:
+            start = time.perf_counter()
+            frame.to_pil().save(str(path), format='PNG')
+            catalog = self._capturer.catalog
+            if catalog is not None:
+                catalog.add(
+                    path, frame.timestamp, frame.bbox, self.DIR_PREFIX, frame.size,
+                    timings={'encode': (time.perf_counter() - start) * 1000.0},
+                    frame=frame
+                )
+            self._finish(True)
+        except Exception as e:
+            logger.error(f"타임랩스 프레임 저장 실패: {path} ({e})")
+            self._finish(False)
+
+    def _finish(self, ok: bool) -> None:
+        """
+        인코딩 완료를 기록합니다.
+
+        Args:
+            ok: 성공 여부
+        """
+        with self._counter_lock:
+            self._pending -= 1
+            if ok:
+                self._saved += 1
+            else:
+                self._failed += 1
+
+    def _write_summary(self, summary: Dict[str, Any]) -> None:
+        """
+        통계를 timelapse.json에 기록합니다.
+
+        Args:
+            summary: 통계 요약
+        """
+        try:
+            path = self.output_dir / f"{self.DIR_PREFIX}.json"
+            path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"타임랩스 통계 기록 실패: {e}")
+
+
+class DeltaTimelapseSession(TimelapseSession):
+    """
+    델타 프레임 시퀀스로 저장하는 타임랩스 세션.
+
+    프레임은 `timelapse_<시작시각>/frames.cseq` 하나에 keyframe과 바뀐 타일 패치로 기록되며,
+    DeltaSequenceReader로 임의의 프레임을 복원할 수 있습니다.
+    레코드는 순서대로 이어 써야 하므로 인코딩은 세션 전용 단일 작업 스레드에서 수행합니다.
+    영역 크기가 바뀌면 새 컨테이너(frames_001.cseq, ...)로 이어 갑니다.
+
+    Example:
+        >>> session = DeltaTimelapseSession(capturer, bbox, interval=10.0)
+        >>> session.start()
+        >>> print(session.stop()['ratio'])
+    """
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        bbox: Tuple[int, int, int, int],
+        interval: float = TimelapseConfig.INTERVAL,
+        max_pending: int = TimelapseConfig.MAX_PENDING
+    ) -> None:
+        """
+        DeltaTimelapseSession 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            bbox: 캡처 영역 (left, top, right, bottom)
+            interval: 캡처 주기 (초)
+            max_pending: 최대 인코딩 대기 수
+        """
+        super().__init__(
+            capturer,
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix='timelapse-delta'),
+            bbox,
+            interval=interval,
+            max_pending=max_pending
+        )
+        self._writer: Optional[DeltaSequenceWriter] = None
+        # 현재 컨테이너 첫 프레임의 (시각, 영역), 카탈로그 기록용
+        self._segment_origin: Optional[Tuple[float, Tuple[int, int, int, int]]] = None
+        self._segments: int = 0
+        self._bytes_written: int = 0
+        self._bytes_raw: int = 0
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        세션을 중지하고 남은 프레임을 모두 기록한 뒤 컨테이너를 닫습니다.
+
+        Returns:
+            Dict[str, Any]: 통계 요약 (컨테이너 크기/압축률 포함)
+        """
+        self._scheduler.stop()
+        self._executor.shutdown(wait=True)
+        self._close_writer()
+        summary = self.summary()
+        self._write_summary(summary)
+        logger.info(f"{self.DIR_PREFIX} 종료: {summary}")
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계 요약을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 타임랩스 통계 + 컨테이너 수/바이트/압축률
+        """
+        summary = super().summary()
+        writer = self._writer
+        written = self._bytes_written + (writer.bytes_written if writer else 0)
+        raw = self._bytes_raw + (writer.bytes_raw if writer else 0)
+        summary.update({
+            'segments': self._segments,
+            'bytes_written': written,
+            'ratio': raw / written if written else 0.0,
+        })
+        return summary
+
+    def _close_writer(self) -> None:
+        """현재 컨테이너를 닫고 통계에 합산한 뒤 카탈로그에 컨테이너 하나로 기록합니다."""
+        if self._writer is None:
+            return
+        writer, origin = self._writer, self._segment_origin
+        writer.close()
+        self._bytes_written += writer.bytes_written
+        self._bytes_raw += writer.bytes_raw
+        self._writer = None
+        self._segment_origin = None
+
+        catalog = self._capturer.catalog
+        if catalog is not None and origin is not None:
+            catalog.add(
+                writer.path, origin[0], origin[1], f"{self.DIR_PREFIX}-delta",
+                (writer.width, writer.height)
+            )
+
+    def _save(self, tick: int, frame: CaptureFrame) -> None:
+        """
+        세션 작업 스레드에서 프레임을 컨테이너에 이어 씁니다.
+
+        Args:
+            tick: 틱 순번
+            frame: 캡처 프레임
+        """
+        try:
+            if self._writer is not None and frame.size != (self._writer.width, self._writer.height):
+                self._close_writer()
+            if self._writer is None:
+                name = Path(SequenceConfig.FILE_NAME)
+                if self._segments:
+                    name = name.with_name(f"{name.stem}_{self._segments:03d}{name.suffix}")
+                self._writer = DeltaSequenceWriter(self.output_dir / name, frame.width, frame.height)
+                self._segment_origin = (frame.timestamp, frame.bbox)
+                self._segments += 1
+            self._writer.append(frame)
+            self._finish(True)
+        except Exception as e:
+            logger.error(f"타임랩스 프레임 기록 실패 (틱 {tick}): {e}")
+            self._finish(False)
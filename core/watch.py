@@ -0,0 +1,324 @@
+"""
+변화 감지 캡처 모듈
+
+이 모듈은 영역을 주기적으로 폴링하여 이전 저장 프레임과 비교하고,
+변화가 임계값을 넘을 때만 저장하는 감시(watch) 모드를 제공합니다.
+
+영역을 cols x rows 타일로 나누고, 폴링마다 다음 두 가지를 계산합니다.
+    - 띠 해시: 타일 한 줄(띠)이 차지하는 연속 메모리를 CRC32 한 번으로 해시 (rows번 호출)
+      → 모든 바이트를 덮으므로 시계 숫자 하나처럼 작은 변화도 놓치지 않음
+    - 표본 해시: 타일마다 고르게 뽑은 SAMPLE_ROWS개 행만 해시 (cols x rows x SAMPLE_ROWS번 호출)
+      → 변화가 어느 타일인지 좁힘
+따라서 Python 수준 호출 수는 해상도와 무관하게 타일 수에 비례하고,
+해상도에 비례하는 부분은 C(zlib)에서 프레임을 한 번 읽는 비용뿐입니다 (1080p 약 5ms).
+표본 해시가 다른 타일, 또는 띠 해시만 다르면 그 띠의 모든 타일만
+Pillow(C 구현)로 픽셀 차이를 계산합니다.
+"""
+import logging
+import zlib
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from constants import WatchConfig
+from core.capture import ScreenCapture
+from core.diff import change_mask
+from core.frame import CaptureFrame
+from core.timelapse import TimelapseSession
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+
+@dataclass
+class ChangeReport:
+    """
+    두 프레임 서명의 비교 결과.
+
+    Attributes:
+        changed_tiles: 허용 오차를 넘는 픽셀이 min_pixels개 이상인 타일 수
+        total_tiles: 전체 타일 수
+        max_delta: 변화 타일 중 최대 채널 차이 (0~255)
+    """
+
+    changed_tiles: int
+    total_tiles: int
+    max_delta: float
+
+    @property
+    def changed_fraction(self) -> float:
+        """변화 타일 비율 (0~1)."""
+        return self.changed_tiles / self.total_tiles if self.total_tiles else 0.0
+
+
+@dataclass
+class FrameSignature:
+    """
+    변화 비교용 프레임 서명.
+
+    Attributes:
+        size: 프레임 크기 (너비, 높이)
+        bands: 타일 띠(가로 한 줄)별 전체 바이트 CRC32 (위에서부터)
+        hashes: 타일별 표본 행 CRC32 (행 우선 순서)
+        frame: 해시가 다른 타일의 픽셀 차이 계산에 쓰는 원본 프레임
+    """
+
+    size: Tuple[int, int]
+    bands: List[int]
+    hashes: List[int]
+    frame: CaptureFrame
+
+
+class ChangeDetector:
+    """
+    타일 해시 기반 변화 감지기.
+
+    띠 해시로 모든 변화를 잡고 표본 해시로 변화 타일을 좁힌 뒤(모듈 설명 참고),
+    후보 타일만 채널 차이가 pixel_tolerance를 넘는 픽셀 수를 세어
+    min_pixels 이상이면 변화로 봅니다 (안티에일리어싱 잡음 무시).
+
+    Example:
+        >>> detector = ChangeDetector()
+        >>> before = detector.signature(frame_a)
+        >>> report = detector.compare(before, detector.signature(frame_b))
+        >>> detector.is_significant(report)
+    """
+
+    def __init__(
+        self,
+        cols: int = WatchConfig.GRID_COLS,
+        rows: int = WatchConfig.GRID_ROWS,
+        pixel_tolerance: float = WatchConfig.PIXEL_TOLERANCE,
+        min_pixels: int = WatchConfig.MIN_TILE_PIXELS,
+        area_threshold: float = WatchConfig.AREA_THRESHOLD,
+        sample_rows: int = WatchConfig.SAMPLE_ROWS
+    ) -> None:
+        """
+        ChangeDetector 인스턴스를 초기화합니다.
+
+        Args:
+            cols: 가로 타일 수
+            rows: 세로 타일 수
+            pixel_tolerance: 변화 픽셀로 보지 않을 채널별 최대 차이 (0~255)
+            min_pixels: 타일을 변화로 볼 최소 변화 픽셀 수
+            area_threshold: 저장을 트리거할 최소 변화 타일 비율 (0~1)
+            sample_rows: 타일마다 표본 해시에 쓸 행 수
+        """
+        self.cols: int = cols
+        self.rows: int = rows
+        self.pixel_tolerance: float = pixel_tolerance
+        self.min_pixels: int = min_pixels
+        self.area_threshold: float = area_threshold
+        self.sample_rows: int = max(1, sample_rows)
+
+    def _boxes(self, size: Tuple[int, int]) -> List[BBox]:
+        """프레임 크기에 대한 타일 영역 (행 우선 순서)."""
+        width, height = size
+        boxes: List[BBox] = []
+        for ty in range(self.rows):
+            y0 = ty * height // self.rows
+            y1 = max(y0 + 1, (ty + 1) * height // self.rows)
+            for tx in range(self.cols):
+                x0 = tx * width // self.cols
+                x1 = max(x0 + 1, (tx + 1) * width // self.cols)
+                boxes.append((x0, y0, min(x1, width), min(y1, height)))
+        return boxes
+
+    def _sample_rows(self, top: int, bottom: int) -> List[int]:
+        """타일 [top, bottom) 행에서 첫 행과 끝 행을 포함해 고르게 뽑은 표본 행."""
+        height = bottom - top
+        if height <= self.sample_rows:
+            return list(range(top, bottom))
+        if self.sample_rows == 1:
+            return [top + height // 2]
+        last = self.sample_rows - 1
+        return [top + i * (height - 1) // last for i in range(self.sample_rows)]
+
+    @staticmethod
+    def _tile(frame: CaptureFrame, box: BBox) -> CaptureFrame:
+        """프레임 기준 타일 영역을 복사 없이 잘라냅니다."""
+        left, top = frame.bbox[0], frame.bbox[1]
+        return frame.crop((box[0] + left, box[1] + top, box[2] + left, box[3] + top))
+
+    def signature(self, frame: CaptureFrame) -> FrameSignature:
+        """
+        프레임의 타일별 해시 서명을 만듭니다.
+
+        Args:
+            frame: BGRA 프레임
+
+        Returns:
+            FrameSignature: 크기, 타일 해시, 원본 프레임
+        """
+        buffer = frame.buffer
+        stride = frame.stride
+        boxes = self._boxes(frame.size)
+
+        bands: List[int] = []
+        for ty in range(self.rows):
+            top, bottom = boxes[ty * self.cols][1], boxes[ty * self.cols][3]
+            if frame.is_contiguous:
+                bands.append(zlib.crc32(buffer[top * stride:bottom * stride]))
+            else:
+                # crop 등 행 사이 여백이 있는 프레임은 행마다 이어서 해시
+                crc = 0
+                for y in range(top, bottom):
+                    crc = zlib.crc32(frame.row(y), crc)
+                bands.append(crc)
+
+        hashes: List[int] = []
+        for left, top, right, bottom in boxes:
+            crc = 0
+            start, end = left * CaptureFrame.BYTES_PER_PIXEL, right * CaptureFrame.BYTES_PER_PIXEL
+            for y in self._sample_rows(top, bottom):
+                offset = y * stride
+                crc = zlib.crc32(buffer[offset + start:offset + end], crc)
+            hashes.append(crc)
+        return FrameSignature(frame.size, bands, hashes, frame)
+
+    def compare(self, before: FrameSignature, after: FrameSignature) -> ChangeReport:
+        """
+        두 서명을 비교합니다.
+
+        Args:
+            before: 기준 서명
+            after: 비교 서명
+
+        Returns:
+            ChangeReport: 비교 결과 (크기가 다르면 전체 변화로 간주)
+        """
+        total = len(after.hashes)
+        if (
+            before.size != after.size
+            or len(before.hashes) != total
+            or len(before.bands) != len(after.bands)
+        ):
+            return ChangeReport(total, total, 255.0)
+
+        candidates: List[int] = []
+        for ty, (band_a, band_b) in enumerate(zip(before.bands, after.bands)):
+            if band_a == band_b:
+                continue
+            row = range(ty * self.cols, (ty + 1) * self.cols)
+            sampled = [i for i in row if before.hashes[i] != after.hashes[i]]
+            # 표본 행 밖의 변화는 어느 타일인지 모르므로 띠 전체를 비교
+            candidates.extend(sampled or row)
+        if not candidates:
+            return ChangeReport(0, total, 0.0)
+
+        from PIL import ImageChops
+
+        tolerance = int(self.pixel_tolerance)
+        boxes = self._boxes(after.size)
+        changed = 0
+        max_delta = 0.0
+        for index in candidates:
+            # 바뀐 타일만 복사 없는 crop에서 RGB로 변환 (프레임 전체 변환 없음)
+            tile_a = self._tile(before.frame, boxes[index]).to_pil()
+            tile_b = self._tile(after.frame, boxes[index]).to_pil()
+            count = change_mask(tile_a, tile_b, tolerance).histogram()[255]
+            if count < self.min_pixels:
+                continue
+            changed += 1
+            extrema = ImageChops.difference(tile_a, tile_b).getextrema()
+            max_delta = max(max_delta, float(max(high for _, high in extrema)))
+        return ChangeReport(changed, total, max_delta)
+
+    def is_significant(self, report: ChangeReport) -> bool:
+        """
+        저장을 트리거할 만한 변화인지 판단합니다.
+
+        Args:
+            report: 비교 결과
+
+        Returns:
+            bool: 변화 타일 비율이 area_threshold 이상이고 최소 1개 타일이 바뀌었으면 True
+        """
+        return report.changed_tiles > 0 and report.changed_fraction >= self.area_threshold
+
+
+class WatchSession(TimelapseSession):
+    """
+    변화 감지 캡처 세션.
+
+    poll_interval마다 영역을 grab하여 마지막으로 저장한 프레임의 서명과 비교하고,
+    변화가 임계값을 넘을 때만 전체 인코딩/저장을 수행합니다.
+    저장하지 않은 폴링 수는 suppressed로 집계됩니다.
+
+    Example:
+        >>> session = WatchSession(capturer, executor, bbox)
+        >>> session.start()
+        >>> print(session.stop()['suppressed'])
+    """
+
+    DIR_PREFIX: str = "watch"
+
+    def __init__(
+        self,
+        capturer: ScreenCapture,
+        executor: Executor,
+        bbox: Tuple[int, int, int, int],
+        interval: float = WatchConfig.POLL_INTERVAL,
+        detector: Optional[ChangeDetector] = None
+    ) -> None:
+        """
+        WatchSession 인스턴스를 초기화합니다.
+
+        Args:
+            capturer: grab에 사용할 ScreenCapture
+            executor: 인코딩/저장에 사용할 Executor
+            bbox: 캡처 영역 (left, top, right, bottom)
+            interval: 폴링 주기 (초)
+            detector: 변화 감지기 (None이면 기본 설정)
+        """
+        super().__init__(capturer, executor, bbox, interval=interval)
+        self.detector: ChangeDetector = detector or ChangeDetector()
+        self._reference: Optional[FrameSignature] = None
+        self._suppressed: int = 0
+        self._last_report: Optional[ChangeReport] = None
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재까지의 통계 요약을 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 타임랩스 통계 + suppressed 수
+        """
+        summary = super().summary()
+        summary['suppressed'] = self._suppressed
+        if self._last_report is not None:
+            summary['last_changed_fraction'] = self._last_report.changed_fraction
+        return summary
+
+    def _on_tick(self, tick: int, deadline: float) -> None:
+        """
+        폴링 한 번: grab → 서명 비교 → 변화 시에만 저장 예약.
+
+        Args:
+            tick: 틱 순번
+            deadline: 목표 monotonic 시각
+        """
+        frame = self._capturer.grab_frame(self._bbox)
+        if frame is None:
+            return
+
+        signature = self.detector.signature(frame)
+        if self._reference is not None:
+            report = self.detector.compare(self._reference, signature)
+            self._last_report = report
+            if not self.detector.is_significant(report):
+                self._suppressed += 1
+                return
+            logger.debug(
+                f"변화 감지 (틱 {tick}): {report.changed_tiles}/{report.total_tiles} 타일, "
+                f"max_delta={report.max_delta:.1f}"
+            )
+
+        if not self._reserve(tick):
+            return
+
+        # 저장이 예약된 프레임을 새 기준으로 삼음
+        self._reference = signature
+        self._executor.submit(self._save, tick, frame)
+        self._maybe_write_summary(tick)
@@ -4,10 +4,93 @@
 PyQt5 기반의 프레임리스 스크린 캡처 도구입니다.
 Qt 플랫폼 초기화 문제(SessionStart:startup hook error)를 방지하기 위한
 환경 설정을 수행한 후 애플리케이션을 시작합니다.
+
+이미 실행 중인 인스턴스가 있으면 명령(--capture, --mode, --show)만
+전달하고 바로 종료합니다. `--profile-startup` 옵션을 주면
+import/초기화 단계별 시간을 첫 화면 표시 직후 출력합니다.
+
+사용법:
+    python main.py
+    python main.py --mode clipboard --capture 100,100,800,600
+    python main.py --show
 """
+import argparse
 import os
 import sys
 import logging
+from typing import Any, Dict, List, Tuple
+
+from startup_profile import profiler
+from core.instance import InstanceServer, parse_region, send_commands
+
+
+def parse_args(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """
+    명령행 인자를 해석합니다.
+
+    Args:
+        argv: 프로그램 이름을 제외한 인자
+
+    Returns:
+        Tuple[argparse.Namespace, List[str]]: (해석된 인자, Qt에 넘길 나머지 인자)
+    """
+    parser = argparse.ArgumentParser(description="스크린 캡처 도구")
+    parser.add_argument(
+        '--capture', nargs='?', const='', metavar='x,y,w,h',
+        help="캡처 실행 (영역 생략 시 현재 윈도우 영역)"
+    )
+    parser.add_argument(
+        '--mode', choices=('clipboard', 'file', 'both'), help="캡처 모드 변경"
+    )
+    parser.add_argument('--show', action='store_true', help="윈도우를 앞으로 가져옴")
+    parser.add_argument(
+        '--new-instance', action='store_true', help="실행 중인 인스턴스에 전달하지 않고 새로 실행"
+    )
+    parser.add_argument(
+        '--rpc', action='store_true', help="로컬 캡처 RPC 서버 실행"
+    )
+    parser.add_argument(
+        '--profile-startup', action='store_true', help="시작 단계별 시간 출력"
+    )
+    args, rest = parser.parse_known_args(argv)
+    if args.capture:
+        try:
+            args.capture = parse_region(args.capture)
+        except ValueError as e:
+            parser.error(str(e))
+    return args, rest
+
+
+def build_commands(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    인자를 실행 순서(mode → show → capture)의 명령 목록으로 변환합니다.
+
+    Args:
+        args: 해석된 인자
+
+    Returns:
+        List[Dict[str, Any]]: 명령 목록
+    """
+    commands: List[Dict[str, Any]] = []
+    if args.mode:
+        commands.append({'command': 'mode', 'mode': args.mode})
+    if args.show:
+        commands.append({'command': 'show'})
+    if args.capture is not None:
+        region = list(args.capture) if args.capture else None
+        commands.append({'command': 'capture', 'region': region})
+    return commands
+
+
+_args, _qt_argv = parse_args(sys.argv[1:])
+_commands = build_commands(_args)
+if _args.profile_startup:
+    profiler.start()
+
+# 실행 중인 인스턴스가 있으면 명령만 전달하고 종료
+# (실행 중인 인스턴스의 로그 파일을 덮어쓰지 않도록 로깅 설정 전에 수행)
+if not _args.new_instance and send_commands(_commands or [{'command': 'show'}]):
+    sys.exit(0)
 
 # 로깅 설정 (가장 먼저 설정하여 모든 로그 캡처)
 _log_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'capture.log')
@@ -21,15 +104,26 @@ logging.root.setLevel(logging.DEBUG)
 
 logger = logging.getLogger(__name__)
 logger.info('로깅 초기화 완료')
-
-# Qt 환경 초기화 (PyQt5 import 전에 수행해야 함)
-from qt_env_setup import initialize_qt_environment  # noqa: E402
-
-initialize_qt_environment(opengl_mode='angle')
-logger.info('Qt 환경 초기화 완료')
-
+profiler.mark('로깅 설정')
+
+# Qt 환경 초기화 (PyQt5 import 전에 수행해야 함, 배포 환경에만 존재)
+try:
+    from qt_env_setup import initialize_qt_environment  # noqa: E402
+except ImportError:
+    logger.info('qt_env_setup 없음, 기본 Qt 환경 사용')
+else:
+    initialize_qt_environment(opengl_mode='angle')
+    logger.info('Qt 환경 초기화 완료')
+profiler.mark('Qt 환경 설정')
+
+from constants import RpcConfig  # noqa: E402
+from PyQt5.QtCore import QTimer  # noqa: E402
 from PyQt5.QtWidgets import QApplication  # noqa: E402
+profiler.mark('PyQt5 import')
+
+# PIL, mss, 인코더는 첫 캡처 시점에 로드됨
 from ui.capture_window import FinalCaptureWindow  # noqa: E402
+profiler.mark('UI 모듈 import')
 
 logger.info('모든 모듈 import 완료')
 
@@ -44,17 +138,34 @@ def main() -> int:
         int: 애플리케이션 종료 코드
     """
     logger.info('QApplication 생성 시작')
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + _qt_argv)
+    profiler.mark('QApplication 생성')
 
     logger.info('FinalCaptureWindow 생성 시작')
     window = FinalCaptureWindow()
 
+    # 이후 실행되는 프로세스의 명령 수신 (--new-instance는 기존 서버를 건드리지 않음)
+    server = None
+    if not _args.new_instance:
+        server = InstanceServer(window.execute_command)
+        server.listen()
+
+    if _args.rpc or RpcConfig.ENABLED:
+        window.start_rpc_server()
+
     logger.info('윈도우 표시')
+    profiler.finish_on_first_paint(window)
     window.show()
 
+    # 첫 실행 시 전달된 명령은 이벤트 루프 시작 직후 실행
+    for command in _commands:
+        QTimer.singleShot(0, lambda c=command: window.execute_command(c))
+
     logger.info('이벤트 루프 시작')
     exit_code = app.exec_()
 
+    if server is not None:
+        server.close()
     logger.info(f'애플리케이션 정상 종료 (exit_code={exit_code})')
     return exit_code
 
@@ -0,0 +1,148 @@
+"""
+시작 시간 프로파일링 모듈
+
+`python main.py --profile-startup`으로 실행하면 모듈 import 시간과
+초기화 단계별 시간을 측정하여 첫 화면 표시(first paint) 직후 출력합니다.
+비활성 상태에서 mark()는 속성 확인 한 번만 수행합니다.
+"""
+import builtins
+import logging
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 첫 화면 표시 시점에 로드 여부를 확인할 무거운 모듈 (첫 캡처 시 로드되어야 함)
+DEFERRED_MODULES: Tuple[str, ...] = ('PIL', 'mss')
+
+
+class StartupProfiler:
+    """
+    시작 단계 및 import 시간 측정기.
+
+    start()는 builtins.__import__를 감싸 처음 로드되는 모듈마다
+    누적(inclusive) 시간과 자체(self) 시간을 기록합니다.
+
+    Attributes:
+        enabled: 측정 활성 여부
+
+    Example:
+        >>> profiler.start()
+        >>> from PyQt5.QtWidgets import QApplication
+        >>> profiler.mark('PyQt5 import')
+        >>> print(profiler.report())
+    """
+
+    def __init__(self) -> None:
+        """StartupProfiler 인스턴스를 초기화합니다."""
+        self.enabled: bool = False
+        self._origin: float = time.perf_counter()
+        self._last: float = self._origin
+        self._marks: List[Tuple[str, float]] = []
+        # 모듈 이름 → (누적 시간, 자체 시간)
+        self._imports: Dict[str, Tuple[float, float]] = {}
+        self._child_time: List[float] = []
+        self._original_import: Optional[Callable[..., Any]] = None
+
+    def start(self) -> None:
+        """측정을 시작하고 import 훅을 설치합니다."""
+        self.enabled = True
+        self._origin = self._last = time.perf_counter()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop(self) -> None:
+        """import 훅을 제거합니다."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def mark(self, label: str) -> None:
+        """
+        직전 mark 이후 경과 시간을 단계로 기록합니다.
+
+        Args:
+            label: 단계 이름
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._marks.append((label, now - self._last))
+        self._last = now
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """처음 로드되는 모듈의 import 시간을 기록하는 __import__ 대체 함수."""
+        original = self._original_import
+        if level == 0 and name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        self._child_time.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._child_time.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+            if name and name not in self._imports:
+                self._imports[name] = (elapsed, elapsed - children)
+
+    def report(self, top: int = 15) -> str:
+        """
+        측정 결과를 사람이 읽을 수 있는 표로 만듭니다.
+
+        Args:
+            top: 출력할 import 항목 수 (자체 시간 순)
+
+        Returns:
+            str: 보고서 텍스트
+        """
+        total = self._last - self._origin
+        lines = [f"=== 시작 프로파일 (총 {total * 1000.0:.1f}ms) ==="]
+        for label, elapsed in self._marks:
+            lines.append(f"  {label:<28} {elapsed * 1000.0:8.1f}ms")
+
+        lines.append(f"--- import 상위 {top}개 (자체 / 누적) ---")
+        ranked = sorted(self._imports.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (inclusive, own) in ranked[:top]:
+            lines.append(f"  {name:<28} {own * 1000.0:8.1f}ms {inclusive * 1000.0:8.1f}ms")
+
+        loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+        lines.append(
+            f"--- 첫 화면 시점 지연 로드 대상 로드됨: {', '.join(loaded) if loaded else '없음'}"
+        )
+        return "\n".join(lines)
+
+    def finish_on_first_paint(self, widget) -> None:
+        """
+        위젯의 첫 Paint 이벤트에서 측정을 마치고 보고서를 출력합니다.
+
+        Args:
+            widget: 첫 화면 표시를 감지할 QWidget
+        """
+        if not self.enabled:
+            return
+
+        from PyQt5.QtCore import QEvent, QObject
+
+        profiler = self
+
+        class _FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event) -> bool:
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.mark('첫 화면 표시 (paint)')
+                    profiler.stop()
+                    text = profiler.report()
+                    print(text, flush=True)
+                    logger.info(f"\n{text}")
+                return False
+
+        widget._startup_paint_filter = _FirstPaintFilter(widget)
+        widget.installEventFilter(widget._startup_paint_filter)
+
+
+# 애플리케이션 전역 프로파일러
+profiler = StartupProfiler()
@@ -2,6 +2,7 @@
 UI 컴포넌트 패키지
 
 이 패키지는 PyQt5 기반의 UI 위젯과 윈도우를 제공합니다.
+위젯 클래스는 처음 접근할 때 해당 모듈을 import합니다 (PEP 562).
 
 Modules:
     styles: 스타일시트 정의
@@ -9,12 +10,31 @@ Modules:
     toast: 토스트 알림 위젯
     capture_window: 메인 캡처 윈도우
 """
+import importlib
+from typing import Any, Dict, List
 
 __version__ = "0.0.1"
 __author__ = "andflower"
 
-from ui.widgets import SilentLineEdit
-from ui.toast import Toast
-from ui.capture_window import FinalCaptureWindow
+# 공개 이름 → 정의 모듈
+_EXPORTS: Dict[str, str] = {
+    'SilentLineEdit': 'ui.widgets',
+    'Toast': 'ui.toast',
+    'FinalCaptureWindow': 'ui.capture_window',
+}
 
-__all__ = ['SilentLineEdit', 'Toast', 'FinalCaptureWindow']
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """위젯 클래스를 처음 접근할 때 import합니다."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'ui' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
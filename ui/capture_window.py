@@ -4,27 +4,70 @@
 이 모듈은 화면 캡처를 위한 메인 윈도우를 제공합니다.
 프레임리스 오버레이 윈도우로 리사이즈 및 이동이 가능합니다.
 """
+import datetime
 import logging
-from typing import Optional, Tuple
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFrame, QSizePolicy, QShortcut
+    QLabel, QPushButton, QFrame, QSizePolicy, QShortcut, QInputDialog
 )
-from PyQt5.QtCore import Qt, QRect, QPoint, QEvent
+from PyQt5.QtCore import Qt, QRect, QPoint, QEvent, QEventLoop, QTimer
 from PyQt5.QtGui import QPainter, QPen, QColor, QRegion, QMouseEvent, QKeySequence, QIcon
 
-from constants import WindowConfig, InputConfig, ButtonConfig, CaptureMode, CaptureConfig
+from constants import (
+    WindowConfig, InputConfig, ButtonConfig, CaptureMode, CaptureConfig, TimelapseConfig,
+    TelemetryConfig, RegionsConfig
+)
 from ui.styles import Styles, Colors
 from ui.widgets import SilentLineEdit
 from ui.toast import Toast
-from ui.help_dialog import HelpDialog
-from ui.icons import create_move_icon, create_clipboard_icon, create_file_icon, create_both_icon
+from ui.freeze_overlay import FreezeSelector
+from ui.icons import (
+    create_move_icon, create_clipboard_icon, create_file_icon, create_both_icon, clear_icon_cache
+)
 from core.capture import ScreenCapture
+from core.backends import create_backend
+from core.burst import BurstResult
+from core.pipeline import CapturePipeline, CaptureResult
+from core.regions import MultiRegionResult, RegionSet
+from core.telemetry import telemetry
+from core.timelapse import DeltaTimelapseSession, TimelapseSession
+from core.watch import WatchSession
+from core.scroll import ScrollSession
+from startup_profile import profiler
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _mask_region(w: int, h: int, cap_h: int, bw: int, crosshair: bool) -> QRegion:
+    """
+    윈도우 마스크 영역을 만듭니다 (크기별 캐시).
+
+    Args:
+        w: 윈도우 너비
+        h: 윈도우 높이
+        cap_h: 캡처 영역(하단 바 제외) 높이
+        bw: 테두리 두께
+        crosshair: 십자선 포함 여부
+
+    Returns:
+        QRegion: 테두리 + 하단 바 (+ 십자선) 영역
+    """
+    # 전체 영역에서 테두리 안쪽을 파냄 (클릭 투과 영역)
+    region = QRegion(0, 0, w, h).subtracted(QRegion(bw, bw, w - 2 * bw, cap_h - 2 * bw))
+
+    # 십자선 영역 추가
+    if crosshair:
+        cx, cy = w // 2, cap_h // 2
+        region = region.united(QRegion(cx, 0, 1, cap_h))
+        region = region.united(QRegion(0, cy, w, 1))
+    return region
+
+
 class FinalCaptureWindow(QWidget):
     """
     메인 캡처 윈도우 위젯.
@@ -40,6 +83,13 @@ class FinalCaptureWindow(QWidget):
         min_h: 최소 윈도우 높이 (픽셀)
     """
 
+    # 외부 명령의 모드 이름 → 캡처 모드
+    _MODE_NAMES = {
+        'clipboard': CaptureMode.CLIPBOARD_ONLY,
+        'file': CaptureMode.FILE_ONLY,
+        'both': CaptureMode.BOTH,
+    }
+
     def __init__(self) -> None:
         """FinalCaptureWindow 인스턴스를 초기화합니다."""
         super().__init__()
@@ -56,21 +106,83 @@ class FinalCaptureWindow(QWidget):
         self.drag_start_pos: QPoint = QPoint()
         self.move_start_pos: QPoint = QPoint()
 
+        # 드래그 중 geometry 변경은 화면 프레임당 한 번만 적용
+        self._pending_geometry: Optional[QRect] = None
+        self._geometry_timer = QTimer(self)
+        self._geometry_timer.setSingleShot(True)
+        self._geometry_timer.setTimerType(Qt.PreciseTimer)
+        self._geometry_timer.timeout.connect(self._flush_geometry)
+
+        # 마지막으로 적용한 마스크 (같은 크기/상태면 setMask 생략)
+        self._mask_key: Optional[Tuple[int, int, int, int, bool]] = None
+
+        # 그리기 도구 (paintEvent마다 새로 만들지 않음)
+        self._border_pen = QPen(QColor(Colors.CAPTURE_BORDER), self.border_width)
+        self._border_pen.setJoinStyle(Qt.MiterJoin)
+        self._cross_pen = QPen(QColor(Colors.CAPTURE_BORDER), 1)
+
         # 캡처 헬퍼 및 모드
-        self._capturer: ScreenCapture = ScreenCapture()
+        self._capturer: ScreenCapture = self._create_capturer()
+        self._pipeline: CapturePipeline = CapturePipeline(self._capturer, parent=self)
+        self._pipeline.capture_finished.connect(self._on_capture_finished)
+        self._pipeline.burst_captured.connect(self._on_burst_captured)
+        self._pipeline.burst_finished.connect(self._on_burst_finished)
+        self._pipeline.regions_finished.connect(self._on_regions_finished)
         self._capture_mode: CaptureMode = CaptureConfig.DEFAULT_MODE
+        self._timelapse: Optional[TimelapseSession] = None
+        self._watch: Optional[WatchSession] = None
+        self._rpc = None  # start_rpc_server() 호출 시 생성 (CaptureRpcServer)
+        self._publish = None  # Ctrl+P 시 생성 (PublishSession)
+        self._scroll: Optional[ScrollSession] = None
+        self._preview = None  # Ctrl+L 시 생성 (PreviewServer)
+        self._freeze: Optional[FreezeSelector] = None
+        self._region_set: Optional[RegionSet] = None  # 처음 사용할 때 불러옴
+        profiler.mark('윈도우: 캡처/파이프라인')
+
+        # 십자선을 숨기도록 요청한 기능 목록 (비어 있으면 십자선 표시)
+        self._crosshair_holds: Set[str] = set()
 
         # UI 위젯 참조 (initUI에서 설정)
         self.edit_width: Optional[SilentLineEdit] = None
         self.edit_height: Optional[SilentLineEdit] = None
         self._toast: Optional[Toast] = None
         self._mode_btn: Optional[QPushButton] = None
+        self._hud_label: Optional[QLabel] = None
+        self._help_dialog = None  # 처음 열 때 생성 (HelpDialog)
 
         # 윈도우 설정
         self._setup_window()
         self._init_ui()
+        profiler.mark('윈도우: UI 구성')
         self._setup_shortcuts()
+        self._watch_screen_changes()
         self._update_mask()
+        profiler.mark('윈도우: 단축키/마스크')
+
+        # 'auto' 백엔드는 첫 화면 표시 이후 측정 (mss 로드가 첫 화면을 늦추지 않도록)
+        if CaptureConfig.BACKEND == "auto":
+            QTimer.singleShot(CaptureConfig.PROBE_DELAY_MS, self._probe_backends)
+
+    @staticmethod
+    def _create_capturer() -> ScreenCapture:
+        """
+        설정된 백엔드로 ScreenCapture를 생성합니다.
+
+        Returns:
+            ScreenCapture: 캡처 헬퍼 ('auto' 또는 사용할 수 없는 백엔드면 MSS)
+        """
+        if CaptureConfig.BACKEND != "auto":
+            try:
+                return ScreenCapture(backend=create_backend(CaptureConfig.BACKEND))
+            except ValueError as e:
+                logger.warning(f"{e}, MSS 백엔드 사용")
+        return ScreenCapture()
+
+    def _probe_backends(self) -> None:
+        """사용 가능한 백엔드를 측정하여 가장 빠른 백엔드를 선택합니다."""
+        timings = self._capturer.probe_backends(self._calculate_capture_bbox())
+        if timings:
+            logger.info(f"선택된 캡처 백엔드: {self._capturer.backend.name}")
 
     def _setup_window(self) -> None:
         """윈도우 기본 설정을 수행합니다."""
@@ -121,6 +233,13 @@ class FinalCaptureWindow(QWidget):
         # 크기 정보 위젯 추가
         self._add_size_info_widgets(layout)
 
+        # 계측 HUD (F3으로 표시, 남는 폭만 사용)
+        self._hud_label = QLabel()
+        self._hud_label.setStyleSheet(Styles.LABEL_HUD)
+        self._hud_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+        self._hud_label.hide()
+        layout.addWidget(self._hud_label, 1)
+
         layout.addStretch()
 
         # 컨트롤 버튼 추가
@@ -189,6 +308,7 @@ class FinalCaptureWindow(QWidget):
         move_btn.setStyleSheet(Styles.MOVE_BUTTON)
         move_btn.mousePressEvent = self._move_btn_press
         move_btn.mouseMoveEvent = self._move_btn_move
+        move_btn.mouseReleaseEvent = self._move_btn_release
         layout.addWidget(move_btn)
 
         # 캡처 버튼
@@ -205,60 +325,154 @@ class FinalCaptureWindow(QWidget):
         close_btn.setStyleSheet(Styles.CLOSE_BUTTON)
         layout.addWidget(close_btn)
 
+    def _watch_screen_changes(self) -> None:
+        """모니터 추가/제거/해상도 변경 시 캡처 세션을 무효화하도록 연결합니다."""
+        app = QApplication.instance()
+        if app is None:
+            return
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screen_layout_changed)
+        for screen in app.screens():
+            self._on_screen_added(screen, invalidate=False)
+        self._sync_catalog_monitors()
+
+    def _on_screen_added(self, screen, invalidate: bool = True) -> None:
+        """
+        새 모니터의 geometry 변경 시그널을 연결합니다.
+
+        Args:
+            screen: 추가된 QScreen
+            invalidate: 캡처 세션 무효화 여부
+        """
+        screen.geometryChanged.connect(self._on_screen_layout_changed)
+        if invalidate:
+            self._capturer.invalidate_sessions()
+            self._sync_catalog_monitors()
+
+    def _on_screen_layout_changed(self, *_args) -> None:
+        """모니터 레이아웃 변경 시 캡처 세션을 무효화합니다."""
+        self._capturer.invalidate_sessions()
+        self._sync_catalog_monitors()
+
+    def _sync_catalog_monitors(self) -> None:
+        """카탈로그의 모니터 번호 계산에 현재 모니터 배치를 반영합니다."""
+        app = QApplication.instance()
+        if app is None:
+            return
+        monitors = []
+        for screen in app.screens():
+            geometry = screen.geometry()
+            monitors.append((
+                geometry.x(), geometry.y(),
+                geometry.x() + geometry.width(), geometry.y() + geometry.height()
+            ))
+        self._capturer.set_monitor_layout(monitors)
+
+    def closeEvent(self, event) -> None:
+        """윈도우 종료 시 남은 저장 작업을 마치고 캡처 세션을 정리합니다."""
+        if self._timelapse is not None:
+            self._timelapse.stop()
+            self._timelapse = None
+        if self._watch is not None:
+            self._watch.stop()
+            self._watch = None
+        if self._publish is not None:
+            self._publish.stop()
+            self._publish = None
+        if self._scroll is not None:
+            self._scroll.stop()
+            self._scroll = None
+        if self._preview is not None:
+            self._preview.stop()
+            self._preview = None
+        if self._rpc is not None:
+            self._rpc.stop()
+            self._rpc = None
+        self._pipeline.shutdown(wait=True)
+        if self._capturer.store is not None:
+            logger.info(f"중복 제거 저장 통계: {self._capturer.store.stats()}")
+        self._capturer.close()
+        clear_icon_cache()
+        super().closeEvent(event)
+
     # =========================================================================
     # 마스크 및 그리기
     # =========================================================================
 
-    def _update_mask(self) -> None:
-        """윈도우 마스크를 업데이트합니다."""
-        w = self.width()
-        h = self.height()
-        cap_h = h - self.bottom_height
-        bw = self.border_width
-
-        # 전체 영역
-        full_region = QRegion(0, 0, w, h)
+    def _update_mask(self) -> bool:
+        """
+        윈도우 마스크를 업데이트합니다.
 
-        # 테두리 안쪽을 파냄 (클릭 투과 영역)
-        inner_rect = QRect(bw, bw, w - 2 * bw, cap_h - 2 * bw)
-        hole_region = QRegion(inner_rect)
-        mask_region = full_region.subtracted(hole_region)
+        마스크 영역은 크기별로 캐시하며, 크기와 십자선 상태가 그대로면 아무것도 하지 않습니다.
 
-        # 십자선 영역 추가
-        cx, cy = w // 2, cap_h // 2
-        mask_region = mask_region.united(QRegion(cx, 0, 1, cap_h))
-        mask_region = mask_region.united(QRegion(0, cy, w, 1))
+        Returns:
+            bool: 마스크가 바뀌었는지 여부
+        """
+        w = self.width()
+        h = self.height()
+        key = (w, h, h - self.bottom_height, self.border_width, self._crosshair_visible)
+        if key == self._mask_key:
+            return False
 
-        self.setMask(mask_region)
+        self._mask_key = key
+        self.setMask(_mask_region(*key))
         self._update_info_text()
+        return True
 
     def paintEvent(self, event) -> None:
         """
         윈도우를 그립니다.
 
-        빨간 테두리와 십자선을 그립니다.
+        빨간 테두리와 십자선을 그리며, 다시 그릴 영역에 걸친 것만 그립니다.
         """
         painter = QPainter(self)
         w = self.width()
-        h = self.height()
-        cap_h = h - self.bottom_height
+        cap_h = self.height() - self.bottom_height
         bw = self.border_width
+        dirty = event.rect()
 
-        # 빨간 테두리
-        border_color = QColor(Colors.CAPTURE_BORDER)
-        pen = QPen(border_color, bw)
-        pen.setJoinStyle(Qt.MiterJoin)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        rect_draw = QRect(bw // 2, bw // 2, w - bw, cap_h - bw)
-        painter.drawRect(rect_draw)
+        # 빨간 테두리 (다시 그릴 영역이 테두리 안쪽에만 있으면 생략)
+        if not QRect(bw, bw, w - 2 * bw, cap_h - 2 * bw).contains(dirty):
+            painter.setPen(self._border_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(QRect(bw // 2, bw // 2, w - bw, cap_h - bw))
 
         # 십자선 (빨간색 1px)
-        cross_pen = QPen(border_color, 1)
-        painter.setPen(cross_pen)
-        cx, cy = w // 2, cap_h // 2
-        painter.drawLine(cx, 0, cx, cap_h)
-        painter.drawLine(0, cy, w, cy)
+        if self._crosshair_visible:
+            painter.setPen(self._cross_pen)
+            cx, cy = w // 2, cap_h // 2
+            painter.drawLine(cx, 0, cx, cap_h)
+            painter.drawLine(0, cy, w, cy)
+
+    @property
+    def _crosshair_visible(self) -> bool:
+        """십자선 표시 여부 (숨김 요청이 하나도 없을 때만 표시)."""
+        return not self._crosshair_holds
+
+    def _hold_crosshair(self, owner: str, hidden: bool) -> None:
+        """
+        십자선 숨김을 요청하거나 해제합니다.
+
+        캡처하는 동안 십자선이 캡처 영역에 찍히지 않도록
+        마스크와 그리기에서 제외합니다 (윈도우는 숨기지 않음).
+
+        Args:
+            owner: 요청한 기능 이름
+            hidden: True면 숨김 요청, False면 해제
+        """
+        if hidden:
+            self._crosshair_holds.add(owner)
+        else:
+            self._crosshair_holds.discard(owner)
+        if self._update_mask():
+            self._update_crosshair_area()
+
+    def _update_crosshair_area(self) -> None:
+        """십자선이 지나는 두 줄만 다시 그리도록 요청합니다."""
+        w = self.width()
+        cap_h = self.height() - self.bottom_height
+        region = QRegion(w // 2, 0, 1, cap_h).united(QRegion(0, cap_h // 2, w, 1))
+        self.update(region)
 
     # =========================================================================
     # 정보창 업데이트 및 크기 적용
@@ -273,10 +487,12 @@ class FinalCaptureWindow(QWidget):
         current_cap_h = self.height() - self.bottom_height
 
         # 사용자가 입력 중이 아닐 때만 업데이트
-        if not self.edit_width.hasFocus():
-            self.edit_width.setText(str(current_w))
-        if not self.edit_height.hasFocus():
-            self.edit_height.setText(str(current_cap_h))
+        # 값이 바뀐 경우에만 설정 (setText는 레이아웃/다시 그리기를 유발)
+        width_text, height_text = str(current_w), str(current_cap_h)
+        if not self.edit_width.hasFocus() and self.edit_width.text() != width_text:
+            self.edit_width.setText(width_text)
+        if not self.edit_height.hasFocus() and self.edit_height.text() != height_text:
+            self.edit_height.setText(height_text)
 
     def _apply_size_from_edit(self) -> None:
         """입력된 크기 값을 윈도우에 적용합니다."""
@@ -292,7 +508,6 @@ class FinalCaptureWindow(QWidget):
             new_h = max(self.min_h, new_h)
 
             self.resize(new_w, new_h + self.bottom_height)
-            self._update_mask()
 
         except ValueError as e:
             logger.warning(f"유효하지 않은 크기 입력: {e}")
@@ -325,8 +540,9 @@ class FinalCaptureWindow(QWidget):
             self._handle_resize(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
-        """마우스 버튼 해제 이벤트를 처리합니다."""
+        """마우스 버튼 해제 이벤트를 처리합니다 (남은 크기 변경은 즉시 적용)."""
         self.resize_mode = None
+        self._flush_geometry(throttle=False)
 
     def leaveEvent(self, event) -> None:
         """마우스가 윈도우를 벗어날 때 커서를 복원합니다."""
@@ -374,7 +590,8 @@ class FinalCaptureWindow(QWidget):
         diff = global_pos - self.drag_start_pos
         self.drag_start_pos = global_pos
 
-        geo = self.geometry()
+        # 아직 적용하지 않은 변경이 있으면 그 위에 누적
+        geo = self._pending_geometry or self.geometry()
         new_rect = QRect(geo)
 
         # 가로 조절
@@ -395,8 +612,54 @@ class FinalCaptureWindow(QWidget):
             if new_h != geo.height():
                 new_rect.setTop(geo.top() + diff.y())
 
-        self.setGeometry(new_rect)
-        self._update_mask()
+        self._schedule_geometry(new_rect)
+
+    def _schedule_geometry(self, rect: QRect) -> None:
+        """
+        geometry 변경을 화면 프레임 단위로 묶어 적용합니다.
+
+        프레임의 첫 변경은 바로 적용하고, 같은 프레임 안에서 들어온 변경은
+        마지막 값만 남겨 두었다가 프레임이 끝날 때 한 번 적용합니다.
+        geometry/마스크/다시 그리기는 resizeEvent/moveEvent에서 한 번씩만 일어납니다.
+
+        Args:
+            rect: 새 윈도우 geometry
+        """
+        self._pending_geometry = rect
+        if not WindowConfig.COALESCE_GEOMETRY:
+            self._flush_geometry(throttle=False)
+        elif not self._geometry_timer.isActive():
+            self._flush_geometry()
+
+    def _flush_geometry(self, throttle: bool = True) -> None:
+        """
+        보류 중인 geometry를 적용합니다.
+
+        Args:
+            throttle: True면 적용 후 한 프레임 동안 다음 변경을 보류
+        """
+        rect = self._pending_geometry
+        self._pending_geometry = None
+        if not throttle:
+            self._geometry_timer.stop()
+        if rect is None or rect == self.geometry():
+            return
+        self.setGeometry(rect)
+        if throttle:
+            self._geometry_timer.start(self._frame_interval_ms())
+
+    def _frame_interval_ms(self) -> int:
+        """
+        현재 모니터의 화면 갱신 주기를 반환합니다.
+
+        Returns:
+            int: 한 프레임 시간 (밀리초, 알 수 없으면 60Hz 기준)
+        """
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        if rate <= 0:
+            rate = 60.0
+        return max(1, int(1000.0 / rate))
 
     def _get_resize_mode(self, pos: QPoint) -> Optional[str]:
         """
@@ -435,10 +698,22 @@ class FinalCaptureWindow(QWidget):
         return mode if mode else None
 
     def resizeEvent(self, event) -> None:
-        """윈도우 크기 변경 이벤트를 처리합니다."""
+        """윈도우 크기 변경 이벤트를 처리합니다 (마스크는 크기당 한 번만 갱신)."""
         self._update_mask()
+        self._on_region_changed()
         super().resizeEvent(event)
 
+    def moveEvent(self, event) -> None:
+        """윈도우 이동 시 진행 중인 주기 캡처의 영역을 갱신합니다."""
+        self._on_region_changed()
+        super().moveEvent(event)
+
+    def _on_region_changed(self) -> None:
+        """캡처 영역 변경을 진행 중인 주기 캡처에 전달합니다."""
+        for session in (self._timelapse, self._watch, self._publish, self._preview):
+            if session is not None:
+                session.set_bbox(self._calculate_capture_bbox())
+
     # =========================================================================
     # 이동 버튼 및 캡처
     # =========================================================================
@@ -452,7 +727,14 @@ class FinalCaptureWindow(QWidget):
     def _move_btn_move(self, event: QMouseEvent) -> None:
         """이동 버튼 마우스 이동 이벤트를 처리합니다."""
         if self.is_moving and event.buttons() & Qt.LeftButton:
-            self.move(event.globalPos() - self.move_start_pos)
+            rect = QRect(self._pending_geometry or self.geometry())
+            rect.moveTopLeft(event.globalPos() - self.move_start_pos)
+            self._schedule_geometry(rect)
+
+    def _move_btn_release(self, event: QMouseEvent) -> None:
+        """이동 버튼 마우스 해제 이벤트를 처리합니다 (남은 이동은 즉시 적용)."""
+        self.is_moving = False
+        self._flush_geometry(throttle=False)
 
     def _calculate_capture_bbox(self) -> Tuple[int, int, int, int]:
         """
@@ -470,69 +752,246 @@ class FinalCaptureWindow(QWidget):
 
     def _capture_screen(self) -> None:
         """현재 캡처 모드에 따라 캡처를 수행합니다."""
-        self.hide()
-        QApplication.processEvents()
+        self._start_capture(*self._mode_options())
+
+    def _mode_options(self) -> Tuple[bool, bool]:
+        """
+        현재 캡처 모드의 옵션을 반환합니다.
 
-        # 현재 모드에 따른 옵션 설정
+        Returns:
+            Tuple[bool, bool]: (클립보드 복사 여부, 파일 저장 여부)
+        """
         copy_clipboard = self._capture_mode in (
             CaptureMode.CLIPBOARD_ONLY, CaptureMode.BOTH
         )
         save_file = self._capture_mode in (
             CaptureMode.FILE_ONLY, CaptureMode.BOTH
         )
+        return (copy_clipboard, save_file)
+
+    def _start_capture(
+        self,
+        copy_clipboard: bool,
+        save_file: bool,
+        bbox: Optional[Tuple[int, int, int, int]] = None
+    ) -> bool:
+        """
+        grab만 동기적으로 수행하고 나머지 처리는 파이프라인에 맡깁니다.
 
-        bbox = self._calculate_capture_bbox()
-        file_path, clipboard_ok = self._capturer.capture_and_save(
+        Args:
+            copy_clipboard: 클립보드 복사 여부
+            save_file: 파일 저장 여부
+            bbox: 캡처 영역 (None이면 현재 윈도우 영역)
+
+        Returns:
+            bool: 캡처 작업이 시작되었는지 여부
+        """
+        if self._pipeline.is_full():
+            if self._toast:
+                self._toast.show_message(
+                    f"처리 대기 중... ({self._pipeline.pending})",
+                    duration=1000,
+                    success=False
+                )
+            return False
+
+        # 윈도우는 그대로 두고 캡처 영역 안의 십자선만 뺀 뒤 grab
+        unmask_start = time.perf_counter()
+        self._hold_crosshair('capture', True)
+        self._wait_crosshair_cleared()
+        unmask_end = time.perf_counter()
+
+        if bbox is None:
+            bbox = self._calculate_capture_bbox()
+        job_id = self._pipeline.submit(
             bbox,
             copy_to_clipboard=copy_clipboard,
-            save_to_file=save_file
+            save_to_file=save_file,
+            started_at=unmask_start
+        )
+
+        restore_start = time.perf_counter()
+        self._hold_crosshair('capture', False)
+
+        if job_id is not None and telemetry.enabled:
+            telemetry.record('unmask', unmask_start, unmask_end, job_id)
+            telemetry.record('restore', restore_start, time.perf_counter(), job_id)
+            self._update_hud()
+
+        if job_id is None and self._toast:
+            self._toast.show_message("캡처 실패", duration=2000, success=False)
+            logger.error("캡처 실패")
+        return job_id is not None
+
+    def _wait_crosshair_cleared(self) -> bool:
+        """
+        숨김 요청한 십자선이 실제로 화면에서 사라졌는지 확인될 때까지 기다립니다.
+
+        추측성 processEvents() 대신 세로 십자선이 지나는 1픽셀 열을 grab하여
+        표본 픽셀이 모두 십자선 색이면 아직 표시 중인 것으로 보고 다시 확인합니다.
+        UNMASK_TIMEOUT_MS 안에 확인되지 않으면 경고를 남기고 그대로 진행합니다.
+
+        Returns:
+            bool: 사라진 것이 확인되었으면 True (시간 초과 시 False)
+        """
+        start = time.perf_counter()
+        self.repaint()
+        if not self.isVisible():
+            return True
+
+        bw = self.border_width
+        cap_h = self.height() - self.bottom_height
+        cx = self.x() + self.width() // 2
+        cy = self.y() + cap_h // 2
+        probe = (cx, self.y() + bw, cx + 1, self.y() + cap_h - bw)
+        color = QColor(Colors.CAPTURE_BORDER)
+        crosshair_bgr = bytes((color.blue(), color.green(), color.red()))
+        deadline = start + CaptureConfig.UNMASK_TIMEOUT_MS / 1000.0
+
+        polls = 0
+        while True:
+            polls += 1
+            frame = self._capturer.grab_frame(probe)
+            if frame is None:
+                return False
+            rows = [y for y in range(frame.height) if probe[1] + y != cy]
+            samples = rows[::max(1, len(rows) // 16)]
+            if not samples or any(frame.row(y)[:3] != crosshair_bgr for y in samples):
+                logger.debug(
+                    f"십자선 제거 확인: {(time.perf_counter() - start) * 1000:.1f}ms ({polls}회)"
+                )
+                return True
+            if time.perf_counter() >= deadline:
+                logger.warning(
+                    f"십자선 제거 확인 시간 초과 ({CaptureConfig.UNMASK_TIMEOUT_MS}ms), 그대로 캡처"
+                )
+                return False
+            QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+            time.sleep(0.001)
+
+    def _start_freeze(self) -> None:
+        """
+        전체 데스크톱을 즉시 grab하여 정지 화면을 띄웁니다.
+
+        윈도우를 숨기지 않고 바로 grab하므로 툴팁/메뉴/애니메이션도 그대로 담기며,
+        선택한 영역은 메모리 프레임에서 잘라 처리합니다 (두 번째 grab 없음).
+        윈도우 테두리는 정지 화면에 남지만 처음 선택 영역(현재 캡처 영역) 바깥에 있습니다.
+        """
+        if self._freeze is not None:
+            return
+        if self._pipeline.is_full():
+            if self._toast:
+                self._toast.show_message(
+                    f"처리 대기 중... ({self._pipeline.pending})",
+                    duration=1000,
+                    success=False
+                )
+            return
+
+        # 십자선만 마스크에서 빼고 곧바로 grab
+        self._hold_crosshair('freeze', True)
+        self._wait_crosshair_cleared()
+        frame = self._capturer.grab_frame(self._capturer.backend.virtual_bounds())
+        self._hold_crosshair('freeze', False)
+        if frame is None:
+            if self._toast:
+                self._toast.show_message("캡처 실패", duration=2000, success=False)
+            return
+
+        self.hide()
+        self._freeze = FreezeSelector(
+            frame, self._capturer.monitors(), self._calculate_capture_bbox(), parent=self
         )
+        self._freeze.selected.connect(self._on_freeze_selected)
+        self._freeze.cancelled.connect(self._close_freeze)
+        self._freeze.show()
 
+    def _on_freeze_selected(self, frame) -> None:
+        """
+        정지 화면에서 잘라낸 영역을 현재 모드로 처리합니다.
+
+        Args:
+            frame: 잘라낸 CaptureFrame
+        """
+        self._close_freeze()
+        copy_clipboard, save_file = self._mode_options()
+        job_id = self._pipeline.submit_frame(
+            frame, copy_to_clipboard=copy_clipboard, save_to_file=save_file
+        )
+        if job_id is None and self._toast:
+            self._toast.show_message("캡처 실패", duration=2000, success=False)
+
+    def _close_freeze(self) -> None:
+        """정지 화면 선택기를 정리하고 윈도우를 다시 표시합니다."""
+        if self._freeze is not None:
+            self._freeze.deleteLater()
+            self._freeze = None
         self.show()
 
-        # 결과에 따른 토스트 알림
-        if self._toast:
-            if self._capture_mode == CaptureMode.BOTH:
-                if file_path and clipboard_ok:
-                    self._toast.show_message(
-                        "캡처 완료! 클립보드 + 파일",
-                        duration=2000,
-                        success=True
-                    )
-                    logger.info(f"캡처 성공: {file_path}")
-                elif clipboard_ok:
-                    self._toast.show_message(
-                        "클립보드에 복사됨 (파일 저장 실패)",
-                        duration=2000,
-                        success=True
-                    )
-                elif file_path:
-                    self._toast.show_message(
-                        f"저장됨: {file_path.name} (클립보드 실패)",
-                        duration=2000,
-                        success=True
-                    )
-                else:
-                    self._toast.show_message("캡처 실패", duration=2000, success=False)
-                    logger.error("캡처 실패")
-            elif self._capture_mode == CaptureMode.CLIPBOARD_ONLY:
-                if clipboard_ok:
-                    self._toast.show_message(
-                        "클립보드에 복사됨",
-                        duration=2000,
-                        success=True
-                    )
-                else:
-                    self._toast.show_message("복사 실패", duration=2000, success=False)
-            elif self._capture_mode == CaptureMode.FILE_ONLY:
-                if file_path:
-                    self._toast.show_message(
-                        f"저장됨: {file_path.name}",
-                        duration=2000,
-                        success=True
-                    )
-                else:
-                    self._toast.show_message("저장 실패", duration=2000, success=False)
+    def _on_capture_finished(self, result: CaptureResult) -> None:
+        """
+        파이프라인 완료 결과에 따라 토스트 알림을 표시합니다.
+
+        Args:
+            result: 캡처 작업 결과
+        """
+        self._update_hud()
+
+        if not self._toast:
+            return
+
+        file_path = result.file_path
+        clipboard_ok = result.clipboard_ok
+
+        if result.copy_to_clipboard and result.save_to_file:
+            if file_path and clipboard_ok:
+                self._toast.show_message(
+                    "캡처 완료! 클립보드 + 파일",
+                    duration=2000,
+                    success=True
+                )
+                logger.info(f"캡처 성공: {file_path}")
+            elif clipboard_ok:
+                self._toast.show_message(
+                    "클립보드에 복사됨 (파일 저장 실패)",
+                    duration=2000,
+                    success=True
+                )
+            elif file_path:
+                self._toast.show_message(
+                    f"저장됨: {file_path.name} (클립보드 실패)",
+                    duration=2000,
+                    success=True
+                )
+            else:
+                self._toast.show_message("캡처 실패", duration=2000, success=False)
+                logger.error("캡처 실패")
+        elif result.copy_to_clipboard:
+            if clipboard_ok:
+                self._toast.show_message(
+                    "클립보드에 복사됨",
+                    duration=2000,
+                    success=True
+                )
+            else:
+                self._toast.show_message(
+                    "클립보드 복사 실패",
+                    duration=2000,
+                    success=False
+                )
+        elif result.save_to_file:
+            if file_path:
+                self._toast.show_message(
+                    f"저장됨: {file_path.name}",
+                    duration=2000,
+                    success=True
+                )
+            else:
+                self._toast.show_message(
+                    "파일 저장 실패",
+                    duration=2000,
+                    success=False
+                )
 
     # =========================================================================
     # 단축키 설정
@@ -547,7 +1006,20 @@ class FinalCaptureWindow(QWidget):
             - Space: 캡처 실행
             - Ctrl+C: 클립보드에만 복사 (일시 모드)
             - Ctrl+S: 파일로만 저장 (일시 모드)
+            - Ctrl+B: 버스트 캡처
+            - Ctrl+T: 타임랩스(주기 캡처) 시작/중지
+            - Ctrl+W: 변화 감지 캡처 시작/중지
+            - Ctrl+P: 공유 메모리 프레임 게시 시작/중지
+            - Ctrl+L: 실시간 미리보기(MJPEG) 서버 시작/중지
+            - Ctrl+F: 정지 화면에서 영역 선택 후 캡처
+            - Ctrl+R: 현재 영역을 이름 붙인 영역 목록에 추가
+            - Ctrl+Shift+R: 목록의 모든 영역을 같은 순간에 캡처
+            - Ctrl+Alt+R: 영역 목록 비우기
+            - Ctrl+D: 스크롤 캡처 시작/중지 (긴 이미지로 이어 붙이기)
+            - Ctrl+Shift+S: 중복 제거 저장 켜기/끄기
             - F1: 도움말 표시
+            - F3: 계측 HUD 표시/숨기기
+            - Shift+F3: 계측 기록 내보내기 (Chrome 트레이스 + JSON Lines)
         """
         # Enter: 캡처
         QShortcut(QKeySequence(Qt.Key_Return), self, self._capture_screen)
@@ -569,64 +1041,581 @@ class FinalCaptureWindow(QWidget):
             self._capture_file_only
         )
 
+        # Ctrl+B: 버스트 캡처
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_B),
+            self,
+            self._start_burst
+        )
+
+        # Ctrl+T: 타임랩스 시작/중지
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_T),
+            self,
+            self._toggle_timelapse
+        )
+
+        # Ctrl+W: 변화 감지 캡처 시작/중지
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_W),
+            self,
+            self._toggle_watch
+        )
+
+        # Ctrl+P: 공유 메모리 프레임 게시 시작/중지
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_P),
+            self,
+            self._toggle_publish
+        )
+
+        # Ctrl+L: 실시간 미리보기 서버 시작/중지
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_L),
+            self,
+            self._toggle_preview
+        )
+
+        # Ctrl+F: 정지 화면 캡처
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_F),
+            self,
+            self._start_freeze
+        )
+
+        # Ctrl+D: 스크롤 캡처 시작/중지
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_D),
+            self,
+            self._toggle_scroll
+        )
+
+        # Ctrl+Shift+S: 중복 제거 저장 켜기/끄기
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_S),
+            self,
+            self._toggle_store
+        )
+
+        # Ctrl+R / Ctrl+Shift+R / Ctrl+Alt+R: 다중 영역 추가 / 캡처 / 비우기
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.Key_R),
+            self,
+            self._add_region
+        )
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_R),
+            self,
+            self._capture_regions
+        )
+        QShortcut(
+            QKeySequence(Qt.CTRL + Qt.ALT + Qt.Key_R),
+            self,
+            self._clear_regions
+        )
+
         # F1: 도움말
         QShortcut(QKeySequence(Qt.Key_F1), self, self._show_help)
 
+        # F3: 계측 HUD
+        QShortcut(QKeySequence(Qt.Key_F3), self, self._toggle_hud)
+
+        # Shift+F3: 계측 기록 내보내기
+        QShortcut(
+            QKeySequence(Qt.SHIFT + Qt.Key_F3),
+            self,
+            self._export_telemetry
+        )
+
     def _capture_clipboard_only(self) -> None:
         """클립보드에만 복사하는 캡처를 실행합니다."""
-        self.hide()
-        QApplication.processEvents()
+        self._start_capture(copy_clipboard=True, save_file=False)
+
+    def _capture_file_only(self) -> None:
+        """파일로만 저장하는 캡처를 실행합니다."""
+        self._start_capture(copy_clipboard=False, save_file=True)
+
+    def _start_burst(self) -> None:
+        """현재 영역의 버스트 캡처를 시작합니다."""
+        if self._pipeline.burst_active:
+            if self._toast:
+                self._toast.show_message(
+                    "버스트 캡처 진행 중",
+                    duration=1000,
+                    success=False
+                )
+            return
+
+        self._hold_crosshair('burst', True)
+        self._wait_crosshair_cleared()
 
         bbox = self._calculate_capture_bbox()
-        _, clipboard_ok = self._capturer.capture_and_save(
-            bbox,
-            copy_to_clipboard=True,
-            save_to_file=False
+        if not self._pipeline.start_burst(bbox):
+            self._hold_crosshair('burst', False)
+
+    def _on_burst_captured(self, result: BurstResult) -> None:
+        """
+        버스트 캡처 루프가 끝나면 십자선을 다시 표시합니다.
+
+        Args:
+            result: 버스트 캡처 결과 (인코딩 전)
+        """
+        self._hold_crosshair('burst', False)
+        if self._toast and result.error is None:
+            self._toast.show_message(
+                f"버스트 {result.captured}장 캡처, 저장 중...",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    def _on_burst_finished(self, result: BurstResult) -> None:
+        """
+        버스트 저장 완료 결과를 토스트로 표시합니다.
+
+        Args:
+            result: 버스트 캡처 결과
+        """
+        if not self._toast:
+            return
+
+        if result.error is not None or not result.files:
+            self._toast.show_message("버스트 캡처 실패", duration=2000, success=False)
+            return
+
+        message = f"버스트 저장 완료: {len(result.files)}장"
+        if result.dropped:
+            message += f" (누락 {len(result.dropped)})"
+        self._toast.show_message(message, duration=2000, success=True)
+
+    @property
+    def _regions(self) -> RegionSet:
+        """이름 붙인 영역 목록 (저장 폴더의 RegionsConfig.SET_FILE)."""
+        if self._region_set is None:
+            self._region_set = RegionSet(self._capturer.output_dir / RegionsConfig.SET_FILE)
+        return self._region_set
+
+    def _add_region(self) -> None:
+        """현재 캡처 영역을 이름 붙여 영역 목록에 추가합니다."""
+        name, ok = QInputDialog.getText(
+            self,
+            "영역 추가",
+            "영역 이름:",
+            text=f"region{len(self._regions) + 1}"
         )
+        name = name.strip()
+        if not ok or not name:
+            return
 
-        self.show()
+        self._regions.add(name, self._calculate_capture_bbox())
+        if self._toast:
+            self._toast.show_message(
+                f"영역 '{name}' 추가 ({len(self._regions)}개, Ctrl+Shift+R로 캡처)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    def _capture_regions(self) -> None:
+        """영역 목록의 모든 영역을 같은 순간에 캡처하여 저장합니다."""
+        regions = self._regions.items()
+        if not regions:
+            if self._toast:
+                self._toast.show_message(
+                    "영역 목록이 비어 있음 (Ctrl+R로 추가)", duration=2000, success=False
+                )
+            return
 
+        self._hold_crosshair('regions', True)
+        self._wait_crosshair_cleared()
+        result = self._pipeline.submit_regions(regions)
+        self._hold_crosshair('regions', False)
+
+        if self._toast and (result is None or result.error is not None):
+            reason = "처리 대기 중" if result is None else result.error
+            self._toast.show_message(f"다중 영역 캡처 실패: {reason}", duration=2000, success=False)
+
+    def _clear_regions(self) -> None:
+        """영역 목록을 비웁니다."""
+        count = len(self._regions)
+        self._regions.clear()
         if self._toast:
-            if clipboard_ok:
+            self._toast.show_message(
+                f"영역 목록 비움 ({count}개)", duration=2000, success=True
+            )
+
+    def _on_regions_finished(self, result: MultiRegionResult) -> None:
+        """
+        다중 영역 저장 완료 알림을 표시합니다.
+
+        Args:
+            result: 다중 영역 캡처 결과
+        """
+        logger.info(
+            f"다중 영역 저장: {len(result.files)}/{len(result.regions)}개, grab {result.grabs}회"
+        )
+        if not self._toast:
+            return
+        message = f"영역 {len(result.files)}개 저장 (grab {result.grabs}회)"
+        if result.missing:
+            message += f", 실패 {len(result.missing)}"
+        self._toast.show_message(
+            message,
+            duration=CaptureConfig.NOTIFICATION_DURATION,
+            success=result.ok
+        )
+
+    def _toggle_timelapse(self) -> None:
+        """타임랩스 캡처를 시작하거나 중지합니다."""
+        if self._timelapse is not None:
+            summary = self._timelapse.stop()
+            self._timelapse = None
+            self._hold_crosshair('timelapse', False)
+            if self._toast:
                 self._toast.show_message(
-                    "클립보드에 복사됨",
-                    duration=2000,
+                    f"타임랩스 종료: {summary['saved'] + summary['pending']}장 "
+                    f"(p95 {summary['p95_latency_ms']:.1f}ms, "
+                    f"지터 {summary['jitter_ms']:.1f}ms)",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
                     success=True
                 )
-            else:
+            return
+
+        interval, ok = QInputDialog.getDouble(
+            self,
+            "타임랩스",
+            "캡처 주기 (초):",
+            TimelapseConfig.INTERVAL,
+            TimelapseConfig.MIN_INTERVAL,
+            86400.0,
+            1
+        )
+        if not ok:
+            return
+
+        # 스케줄러는 첫 틱을 바로 실행하므로 십자선이 사라진 것을 확인한 뒤 시작
+        self._hold_crosshair('timelapse', True)
+        self._wait_crosshair_cleared()
+        if TimelapseConfig.DELTA_STORAGE:
+            self._timelapse = DeltaTimelapseSession(
+                self._capturer,
+                self._calculate_capture_bbox(),
+                interval=interval
+            )
+        else:
+            self._timelapse = TimelapseSession(
+                self._capturer,
+                self._pipeline.executor,
+                self._calculate_capture_bbox(),
+                interval=interval
+            )
+        self._timelapse.start()
+        if self._toast:
+            self._toast.show_message(
+                f"타임랩스 시작: {interval:g}초 간격 (Ctrl+T로 중지)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    def _toggle_watch(self) -> None:
+        """변화 감지 캡처를 시작하거나 중지합니다."""
+        if self._watch is not None:
+            summary = self._watch.stop()
+            self._watch = None
+            self._hold_crosshair('watch', False)
+            if self._toast:
                 self._toast.show_message(
-                    "클립보드 복사 실패",
-                    duration=2000,
-                    success=False
+                    f"감시 종료: 저장 {summary['saved'] + summary['pending']}장, "
+                    f"생략 {summary['suppressed']}장",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
+                    success=True
                 )
+            return
 
-    def _capture_file_only(self) -> None:
-        """파일로만 저장하는 캡처를 실행합니다."""
-        self.hide()
-        QApplication.processEvents()
+        self._hold_crosshair('watch', True)
+        self._wait_crosshair_cleared()
+        self._watch = WatchSession(
+            self._capturer,
+            self._pipeline.executor,
+            self._calculate_capture_bbox()
+        )
+        self._watch.start()
+        if self._toast:
+            self._toast.show_message(
+                "변화 감지 시작 (Ctrl+W로 중지)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
 
-        bbox = self._calculate_capture_bbox()
-        file_path, _ = self._capturer.capture_and_save(
-            bbox,
-            copy_to_clipboard=False,
-            save_to_file=True
+    def _toggle_scroll(self) -> None:
+        """스크롤 캡처를 시작하거나 중지합니다 (중지 시 작업 스레드에서 저장)."""
+        if self._scroll is not None:
+            session, self._scroll = self._scroll, None
+            summary = session.stop()
+            self._hold_crosshair('scroll', False)
+            self._pipeline.executor.submit(session.save)
+            if self._toast:
+                message = (
+                    f"스크롤 캡처 종료: {summary['width']}x{summary['height']} "
+                    f"(스크롤 {summary['scrolls']}회) → {session.path.name}"
+                )
+                if summary['gaps']:
+                    rows = ', '.join(str(row) for row in summary['gaps'][:3])
+                    more = '...' if len(summary['gaps']) > 3 else ''
+                    message += (
+                        f"\n겹침을 놓쳐 {len(summary['gaps'])}곳이 끊겼습니다 "
+                        f"({rows}{more}행, 더 천천히 스크롤하세요)"
+                    )
+                self._toast.show_message(
+                    message,
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
+                    success=not summary['gaps']
+                )
+            return
+
+        # 첫 프레임이 이어 붙이기 기준이 되므로 십자선이 사라진 것을 확인한 뒤 시작
+        self._hold_crosshair('scroll', True)
+        self._wait_crosshair_cleared()
+        self._scroll = ScrollSession(self._capturer, self._calculate_capture_bbox())
+        self._scroll.start()
+        if self._toast:
+            self._toast.show_message(
+                "스크롤 캡처 시작: 영역 안의 내용을 천천히 아래로 스크롤 (Ctrl+D로 중지)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    def _toggle_store(self) -> None:
+        """중복 제거 저장을 켜거나 끄고 누적 절약량을 알립니다."""
+        enabled = self._capturer.store is None
+        self._capturer.enable_store(enabled)
+        if not self._toast:
+            return
+        if enabled:
+            stats = self._capturer.store.stats()
+            message = (
+                f"중복 제거 저장 켬 (누적 생략 {stats['skipped_encodes']}회, "
+                f"{stats['bytes_saved'] / 1024 / 1024:.1f}MB 절약)"
+            )
+        else:
+            message = "중복 제거 저장 끔"
+        self._toast.show_message(
+            message, duration=CaptureConfig.NOTIFICATION_DURATION, success=True
         )
 
-        self.show()
+    def _toggle_publish(self) -> None:
+        """공유 메모리 프레임 게시를 시작하거나 중지합니다."""
+        if self._publish is not None:
+            summary = self._publish.stop()
+            self._publish = None
+            self._hold_crosshair('publish', False)
+            if self._toast:
+                self._toast.show_message(
+                    f"게시 종료: {summary['published']}프레임",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
+                    success=True
+                )
+            return
+
+        from core.shared_ring import PublishSession
+
+        session = PublishSession(self._capturer, self._calculate_capture_bbox())
+        self._hold_crosshair('publish', True)
+        self._wait_crosshair_cleared()
+        try:
+            session.start()
+        except OSError as e:
+            self._hold_crosshair('publish', False)
+            logger.error(f"공유 메모리 링 생성 실패: {e}")
+            if self._toast:
+                self._toast.show_message(
+                    f"게시 시작 실패: {e}",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
+                    success=False
+                )
+            return
 
+        self._publish = session
         if self._toast:
-            if file_path:
+            self._toast.show_message(
+                f"게시 시작: {session.name} (Ctrl+P로 중지)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    def _toggle_preview(self) -> None:
+        """실시간 미리보기(MJPEG) 서버를 시작하거나 중지합니다."""
+        if self._preview is not None:
+            summary = self._preview.stop()
+            self._preview = None
+            self._hold_crosshair('preview', False)
+            if self._toast:
                 self._toast.show_message(
-                    f"저장됨: {file_path.name}",
-                    duration=2000,
+                    f"미리보기 종료: {summary['frames']}프레임",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
                     success=True
                 )
-            else:
+            return
+
+        from core.preview import PreviewServer
+
+        server = PreviewServer(self._capturer, self._calculate_capture_bbox())
+        self._hold_crosshair('preview', True)
+        self._wait_crosshair_cleared()
+        try:
+            server.start()
+        except OSError as e:
+            self._hold_crosshair('preview', False)
+            logger.error(f"미리보기 서버 시작 실패: {e}")
+            if self._toast:
                 self._toast.show_message(
-                    "파일 저장 실패",
-                    duration=2000,
+                    f"미리보기 시작 실패: {e}",
+                    duration=CaptureConfig.NOTIFICATION_DURATION,
                     success=False
                 )
+            return
+
+        self._preview = server
+        if self._toast:
+            self._toast.show_message(
+                f"미리보기: {server.url} (Ctrl+L로 중지)",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=True
+            )
+
+    # =========================================================================
+    # 외부 명령 (단일 인스턴스)
+    # =========================================================================
+
+    def execute_command(self, command: Dict[str, Any]) -> Optional[str]:
+        """
+        다른 프로세스에서 전달된 명령을 실행합니다.
+
+        명령 형식:
+            - {"command": "show"}: 윈도우를 앞으로 가져옴
+            - {"command": "mode", "mode": "clipboard" | "file" | "both"}: 캡처 모드 변경
+            - {"command": "capture", "region": [x, y, w, h] | null}: 캡처 (null이면 현재 영역)
+
+        Args:
+            command: 명령 딕셔너리
+
+        Returns:
+            Optional[str]: 실패 시 오류 메시지, 성공 시 None
+        """
+        name = command.get('command')
+        if name == 'show':
+            self.showNormal()
+            self.raise_()
+            self.activateWindow()
+            return None
+
+        if name == 'mode':
+            mode_name = command.get('mode')
+            mode = self._MODE_NAMES.get(mode_name) if isinstance(mode_name, str) else None
+            if mode is None:
+                return f"알 수 없는 모드: {command.get('mode')}"
+            self._capture_mode = mode
+            self._update_mode_button()
+            return None
+
+        if name == 'capture':
+            bbox = None
+            region = command.get('region')
+            if region is not None:
+                try:
+                    x, y, w, h = (int(v) for v in region)
+                except (TypeError, ValueError, OverflowError):
+                    return f"잘못된 영역: {region}"
+                if w <= 0 or h <= 0:
+                    return f"잘못된 영역: {region}"
+                bbox = (x, y, x + w, y + h)
+            if not self._start_capture(*self._mode_options(), bbox=bbox):
+                return "캡처 실패"
+            return None
+
+        return f"알 수 없는 명령: {name}"
+
+    def start_rpc_server(self) -> bool:
+        """
+        로컬 캡처 RPC 서버를 시작합니다 (인코딩은 파이프라인 스레드 풀 공유).
+
+        Returns:
+            bool: 시작 여부
+        """
+        if self._rpc is not None:
+            return True
+
+        from core.rpc import CaptureRpcServer
+
+        server = CaptureRpcServer(self._capturer, executor=self._pipeline.executor)
+        try:
+            server.start()
+        except OSError as e:
+            logger.error(f"캡처 RPC 서버 시작 실패: {e}")
+            return False
+        self._rpc = server
+        return True
+
+    # =========================================================================
+    # 계측 HUD
+    # =========================================================================
+
+    def _toggle_hud(self) -> None:
+        """계측 HUD를 표시하거나 숨깁니다 (표시 중에는 계측 활성)."""
+        if self._hud_label is None:
+            return
+
+        visible = not self._hud_label.isVisible()
+        self._hud_label.setVisible(visible)
+        telemetry.enabled = visible or TelemetryConfig.ENABLED
+        self._update_hud()
+
+    def _update_hud(self) -> None:
+        """마지막 캡처의 단계별 소요 시간과 최근 p50/p95를 HUD에 표시합니다."""
+        if self._hud_label is None or not self._hud_label.isVisible():
+            return
+
+        capture_id = telemetry.last_capture_id()
+        if capture_id is None:
+            self._hud_label.setText("계측 대기 중")
+            self._hud_label.setToolTip("")
+            return
+
+        stages = telemetry.breakdown(capture_id)
+        total = stages.pop(telemetry.TOTAL_STAGE, 0.0)
+        rolling = telemetry.percentiles()
+        parts = "  ".join(f"{name} {ms:.1f}" for name, ms in stages.items())
+        self._hud_label.setText(
+            f"{parts} | 합계 {total:.1f}ms "
+            f"p50 {rolling['p50_ms']:.1f} p95 {rolling['p95_ms']:.1f}"
+        )
+        self._hud_label.setToolTip("\n".join(
+            [f"캡처 #{capture_id}"]
+            + [f"{name}: {ms:.2f}ms" for name, ms in stages.items()]
+            + [
+                f"합계: {total:.2f}ms",
+                f"최근 {rolling['count']}건 p50 {rolling['p50_ms']:.2f}ms, "
+                f"p95 {rolling['p95_ms']:.2f}ms",
+            ]
+        ))
+
+    def _export_telemetry(self) -> None:
+        """계측 기록을 저장 폴더에 Chrome 트레이스와 JSON Lines로 내보냅니다."""
+        stamp = datetime.datetime.now().strftime(ScreenCapture.TIMESTAMP_FORMAT)
+        base = self._capturer.output_dir / f"capture_trace_{stamp}"
+        try:
+            count = telemetry.export_chrome_trace(base.with_suffix('.json'))
+            telemetry.export_jsonl(base.with_suffix('.jsonl'))
+        except OSError as e:
+            logger.error(f"계측 기록 내보내기 실패: {e}")
+            if self._toast:
+                self._toast.show_message("계측 기록 내보내기 실패", duration=2000, success=False)
+            return
+
+        if self._toast:
+            self._toast.show_message(
+                f"계측 기록 {count}건 저장: {base.name}.json",
+                duration=CaptureConfig.NOTIFICATION_DURATION,
+                success=count > 0
+            )
 
     # =========================================================================
     # 캡처 모드 관리
@@ -697,6 +1686,8 @@ class FinalCaptureWindow(QWidget):
     # =========================================================================
 
     def _show_help(self) -> None:
-        """단축키 도움말 다이얼로그를 표시합니다."""
-        dialog = HelpDialog(self)
-        dialog.exec_()
+        """단축키 도움말 다이얼로그를 표시합니다 (처음 열 때 생성)."""
+        if self._help_dialog is None:
+            from ui.help_dialog import HelpDialog
+            self._help_dialog = HelpDialog(self)
+        self._help_dialog.exec_()
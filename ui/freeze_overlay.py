@@ -0,0 +1,275 @@
+"""
+정지 화면(freeze) 영역 선택 모듈
+
+전체 데스크톱을 한 번 grab한 프레임을 모니터별 전체 화면 오버레이로 보여 주고,
+사용자가 그 위에서 영역을 선택하면 메모리 프레임을 잘라 반환합니다 (두 번째 grab 없음).
+
+각 오버레이는 프레임 버퍼를 복사 없이 감싼 QImage 하나에서 자신이 맡은 모니터
+부분만 그리므로, 다중 모니터 대형 프레임도 모니터별 QPixmap 복사가 필요 없습니다.
+"""
+import logging
+from typing import List, Optional, Tuple
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QObject, QPoint, QRect, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QColor, QKeyEvent, QMouseEvent
+
+from ui.styles import Colors
+from core.frame import CaptureFrame
+
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+
+class FreezeSelector(QObject):
+    """
+    정지 화면 위 영역 선택 컨트롤러.
+
+    모니터마다 FreezeOverlay를 하나씩 띄우고 선택 영역(화면 좌표)을 공유합니다.
+
+    조작:
+        - 드래그: 새 영역 선택
+        - 방향키: 영역 이동 (Shift: 크기 조절, Ctrl: 10px 단위)
+        - Enter / 더블클릭: 확정
+        - Esc / 오른쪽 클릭: 취소
+
+    Signals:
+        selected: 확정 시 잘라낸 CaptureFrame 전달
+        cancelled: 취소 시 발생
+
+    Example:
+        >>> selector = FreezeSelector(frame, capturer.monitors(), initial_bbox)
+        >>> selector.selected.connect(on_selected)
+        >>> selector.show()
+    """
+
+    selected = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+    def __init__(
+        self,
+        frame: CaptureFrame,
+        monitors: List[BBox],
+        initial: Optional[BBox] = None,
+        parent: Optional[QObject] = None
+    ) -> None:
+        """
+        FreezeSelector 인스턴스를 초기화합니다.
+
+        Args:
+            frame: 전체 가상 화면을 grab한 프레임
+            monitors: 모니터 영역 목록 (left, top, right, bottom)
+            initial: 처음 표시할 선택 영역 (None이면 선택 없음)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.frame: CaptureFrame = frame
+        # 프레임 버퍼를 그대로 참조 (selector가 frame을 보관하는 동안 유효)
+        self.image = frame.to_qimage(copy=False)
+        self.selection: QRect = QRect()
+        if initial is not None:
+            self.selection = QRect(
+                QPoint(initial[0], initial[1]), QPoint(initial[2] - 1, initial[3] - 1)
+            )
+        self._anchor: Optional[QPoint] = None
+        self._overlays: List[FreezeOverlay] = [
+            FreezeOverlay(self, QRect(QPoint(m[0], m[1]), QPoint(m[2] - 1, m[3] - 1)))
+            for m in monitors
+        ]
+
+    @property
+    def origin(self) -> QPoint:
+        """프레임 좌상단의 화면 좌표."""
+        return QPoint(self.frame.bbox[0], self.frame.bbox[1])
+
+    def show(self) -> None:
+        """모든 모니터에 오버레이를 표시합니다."""
+        for overlay in self._overlays:
+            overlay.showFullScreen()
+        if self._overlays:
+            self._overlays[0].activateWindow()
+            self._overlays[0].setFocus()
+
+    def close(self) -> None:
+        """오버레이를 닫고 프레임 참조를 해제합니다."""
+        for overlay in self._overlays:
+            overlay.close()
+            overlay.deleteLater()
+        self._overlays = []
+        self.image = None
+
+    def _refresh(self) -> None:
+        """모든 오버레이를 다시 그립니다."""
+        for overlay in self._overlays:
+            overlay.update()
+
+    # =========================================================================
+    # 입력 처리 (오버레이에서 호출)
+    # =========================================================================
+
+    def begin_drag(self, global_pos: QPoint) -> None:
+        """드래그 시작점을 기록합니다."""
+        self._anchor = global_pos
+        self.selection = QRect(global_pos, global_pos)
+        self._refresh()
+
+    def update_drag(self, global_pos: QPoint) -> None:
+        """드래그 중인 선택 영역을 갱신합니다."""
+        if self._anchor is None:
+            return
+        self.selection = QRect(self._anchor, global_pos).normalized()
+        self._refresh()
+
+    def end_drag(self) -> None:
+        """드래그를 끝냅니다."""
+        self._anchor = None
+
+    def nudge(self, dx: int, dy: int, resize: bool) -> None:
+        """
+        선택 영역을 이동하거나 크기를 조절합니다.
+
+        Args:
+            dx: 가로 변화량 (픽셀)
+            dy: 세로 변화량 (픽셀)
+            resize: True면 오른쪽/아래 가장자리만 이동 (크기 조절)
+        """
+        if self.selection.isNull():
+            return
+        if resize:
+            self.selection.setRight(max(self.selection.left(), self.selection.right() + dx))
+            self.selection.setBottom(max(self.selection.top(), self.selection.bottom() + dy))
+        else:
+            self.selection.translate(dx, dy)
+        self._refresh()
+
+    def accept(self) -> None:
+        """선택 영역을 잘라 selected를 발생시킵니다 (영역이 없으면 무시)."""
+        rect = self.selection
+        if rect.isNull() or rect.width() < 2 or rect.height() < 2:
+            return
+        bbox = (rect.left(), rect.top(), rect.right() + 1, rect.bottom() + 1)
+        frame = self.frame.crop(bbox)
+        logger.info(f"정지 화면 선택: bbox={frame.bbox}")
+        self.close()
+        self.selected.emit(frame)
+
+    def reject(self) -> None:
+        """선택을 취소합니다."""
+        self.close()
+        self.cancelled.emit()
+
+
+class FreezeOverlay(QWidget):
+    """
+    모니터 하나를 덮는 정지 화면 오버레이.
+
+    공유 QImage에서 자기 모니터 영역만 그리고, 선택 영역 바깥은 어둡게 표시합니다.
+    """
+
+    _DIM: QColor = QColor(0, 0, 0, 110)
+    _STEP: int = 1
+    _FAST_STEP: int = 10
+
+    def __init__(self, selector: FreezeSelector, geometry: QRect) -> None:
+        """
+        FreezeOverlay 인스턴스를 초기화합니다.
+
+        Args:
+            selector: 선택 상태를 가진 컨트롤러
+            geometry: 이 오버레이가 덮을 모니터 영역 (화면 좌표)
+        """
+        super().__init__(None)
+        self._selector: FreezeSelector = selector
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setCursor(Qt.CrossCursor)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setGeometry(geometry)
+
+    def paintEvent(self, event) -> None:
+        """정지 화면, 어둡게 처리한 바깥 영역, 선택 테두리를 그립니다."""
+        image = self._selector.image
+        if image is None:
+            return
+        painter = QPainter(self)
+        target = event.rect()
+
+        # 위젯 좌표 → 화면 좌표 → 이미지 좌표 (노출된 부분만, 복사 없음)
+        offset = self.geometry().topLeft() - self._selector.origin
+        painter.drawImage(target, image, target.translated(offset))
+
+        selection = self._selector.selection
+        local = selection.translated(-self.geometry().topLeft())
+        if selection.isNull():
+            painter.fillRect(target, self._DIM)
+            return
+
+        # 선택 영역 바깥 어둡게
+        outside = self.rect()
+        for rect in (
+            QRect(0, 0, outside.width(), max(0, local.top())),
+            QRect(0, local.bottom() + 1, outside.width(), outside.height()),
+            QRect(0, local.top(), max(0, local.left()), local.height()),
+            QRect(local.right() + 1, local.top(), outside.width(), local.height()),
+        ):
+            rect = rect.intersected(outside)
+            if not rect.isEmpty():
+                painter.fillRect(rect, self._DIM)
+
+        pen = QPen(QColor(Colors.CAPTURE_BORDER), 1)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(local.adjusted(-1, -1, 0, 0))
+
+        # 크기 표시
+        painter.setPen(QColor(Colors.TEXT_PRIMARY))
+        label_pos = local.topLeft() + QPoint(4, -6)
+        if label_pos.y() < 12:
+            label_pos = local.topLeft() + QPoint(4, 14)
+        painter.drawText(label_pos, f"{selection.width()} x {selection.height()}")
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """왼쪽: 드래그 시작, 오른쪽: 취소."""
+        if event.button() == Qt.LeftButton:
+            self._selector.begin_drag(event.globalPos())
+        elif event.button() == Qt.RightButton:
+            self._selector.reject()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """드래그 중 선택 영역을 갱신합니다 (다른 모니터로 넘어가도 유지)."""
+        if event.buttons() & Qt.LeftButton:
+            self._selector.update_drag(event.globalPos())
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """드래그를 끝냅니다."""
+        if event.button() == Qt.LeftButton:
+            self._selector.end_drag()
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        """더블클릭으로 확정합니다."""
+        if event.button() == Qt.LeftButton:
+            self._selector.accept()
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        """Enter: 확정, Esc: 취소, 방향키: 이동/크기 조절."""
+        key = event.key()
+        if key in (Qt.Key_Return, Qt.Key_Enter):
+            self._selector.accept()
+            return
+        if key == Qt.Key_Escape:
+            self._selector.reject()
+            return
+
+        step = self._FAST_STEP if event.modifiers() & Qt.ControlModifier else self._STEP
+        moves = {
+            Qt.Key_Left: (-step, 0),
+            Qt.Key_Right: (step, 0),
+            Qt.Key_Up: (0, -step),
+            Qt.Key_Down: (0, step),
+        }
+        if key in moves:
+            dx, dy = moves[key]
+            self._selector.nudge(dx, dy, bool(event.modifiers() & Qt.ShiftModifier))
+            return
+        super().keyPressEvent(event)
@@ -64,6 +64,19 @@ class HelpDialog(QDialog):
             ("Enter / Space", "캡처 실행"),
             ("Ctrl+C", "클립보드에만 복사"),
             ("Ctrl+S", "파일로만 저장"),
+            ("Ctrl+B", "버스트 캡처 (연속 촬영)"),
+            ("Ctrl+T", "타임랩스 시작/중지"),
+            ("Ctrl+W", "변화 감지 캡처 시작/중지"),
+            ("Ctrl+P", "공유 메모리 프레임 게시 시작/중지"),
+            ("Ctrl+L", "실시간 미리보기(MJPEG) 시작/중지"),
+            ("Ctrl+F", "정지 화면에서 영역 선택 후 캡처"),
+            ("Ctrl+R", "현재 영역을 영역 목록에 추가"),
+            ("Ctrl+Shift+R", "목록의 모든 영역 동시 캡처"),
+            ("Ctrl+Alt+R", "영역 목록 비우기"),
+            ("Ctrl+D", "스크롤 캡처 시작/중지"),
+            ("Ctrl+Shift+S", "중복 제거 저장 켜기/끄기"),
+            ("F3", "계측 HUD 표시/숨기기"),
+            ("Shift+F3", "계측 기록 내보내기"),
             ("모드 버튼", "저장 모드 변경"),
             ("테두리 드래그", "크기 조절"),
             ("이동 버튼", "윈도우 이동"),
@@ -3,11 +3,15 @@
 
 유니코드 이모지 및 심볼을 사용하여 아이콘을 관리합니다.
 QPainter를 사용한 커스텀 아이콘도 제공합니다.
+QPainter 아이콘은 (크기, 색상)별로 한 번만 그리고 캐시에서 재사용합니다.
 """
+from functools import lru_cache
+
 from PyQt5.QtGui import QIcon, QPixmap, QPainter, QPen, QColor
 from PyQt5.QtCore import Qt, QPoint
 
 
+@lru_cache(maxsize=None)
 def create_move_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     """
     이동 버튼용 외부 링크 스타일 아이콘을 생성합니다.
@@ -60,6 +64,7 @@ def create_move_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=None)
 def create_clipboard_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     """
     클립보드 아이콘을 생성합니다.
@@ -98,6 +103,7 @@ def create_clipboard_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=None)
 def create_file_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     """
     파일/폴더 아이콘을 생성합니다.
@@ -137,6 +143,7 @@ def create_file_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     return QIcon(pixmap)
 
 
+@lru_cache(maxsize=None)
 def create_both_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     """
     클립보드+파일 결합 아이콘을 생성합니다.
@@ -182,6 +189,16 @@ def create_both_icon(size: int = 24, color: str = "#FFFFFF") -> QIcon:
     return QIcon(pixmap)
 
 
+def clear_icon_cache() -> None:
+    """
+    캐시된 QPainter 아이콘을 모두 해제합니다.
+
+    QApplication 종료 전에 호출하여 픽스맵이 애플리케이션보다 오래 남지 않도록 합니다.
+    """
+    for factory in (create_move_icon, create_clipboard_icon, create_file_icon, create_both_icon):
+        factory.cache_clear()
+
+
 class Icons:
     """
     애플리케이션 아이콘 상수.
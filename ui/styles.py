@@ -144,6 +144,14 @@ class Styles:
         f"border: none;"
     )
 
+    # 계측 HUD 라벨
+    LABEL_HUD: str = (
+        f"color: {Colors.TEXT_ACCENT}; "
+        f"font-family: Consolas, monospace; "
+        f"font-size: 11px; "
+        f"border: none;"
+    )
+
     # 강조 라벨 (크기 표시용)
     LABEL_ACCENT: str = (
         f"color: {Colors.TERMINAL_GREEN}; "